@@ -0,0 +1,401 @@
+"""
+axo/cache/__init__.py
+~~~~~~~~~~~~~~~~~~~~~
+
+Process‑wide, content‑addressed cache of classes rebuilt from stored source.
+
+``Axo.from_bytes``, ``Axo.get_parts`` and ``AxoLoader`` all turn class source
+code into a live class. The cache keys that work by the sha256 of the source
+(plus a *namespace token* describing the injected globals), keeps the compiled
+code object and the resolved class, and evicts the least recently used entry
+once ``maxsize`` is reached. Only the first load of a class pays for
+``compile`` + ``exec``.
+
+It also memoizes, per class object, the class source, its utf‑8 bytes and its
+checksum (:func:`get_class_source`), so persisting many instances of a class
+reads and hashes its source only once.
+
+Finally it holds the results of read-only ``@axo_method(cache=...)`` calls
+(:class:`MethodCache`), keyed by object key *and version* so that persisting a
+new version of an object never serves results computed on the old one.
+"""
+from __future__ import annotations
+
+import hashlib as H
+import inspect
+import os
+import pickle
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from types import CodeType
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
+from weakref import WeakKeyDictionary, ref
+
+SourceLike = Union[str, bytes, bytearray, memoryview]
+Namespace  = Dict[str, Any]
+
+AXO_CLASS_CACHE_SIZE = int(os.environ.get("AXO_CLASS_CACHE_SIZE", "256"))
+
+
+@dataclass(frozen=True)
+class CachedClass:
+    checksum: str
+    code: CodeType
+    cls: type
+
+
+@dataclass(frozen=True)
+class ClassCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+
+def source_checksum(source: SourceLike) -> str:
+    """sha256 hex digest of *source* (utf‑8 encoded when given a str)."""
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+    return H.sha256(source).hexdigest()
+
+
+def namespace_token(namespace: Namespace) -> Tuple[Hashable, ...]:
+    """
+    Identity token for the globals a source is executed against. Two loaders
+    injecting the same objects share cache entries; different ones do not.
+    """
+    return tuple(sorted((k, id(v)) for k, v in namespace.items()))
+
+
+class ClassCache:
+    """Thread‑safe LRU of ``(checksum, token) -> CachedClass``."""
+
+    def __init__(self, maxsize: int = AXO_CLASS_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[str, Hashable], CachedClass]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # ------------------------------------------------------------------ #
+    # Lookup
+    # ------------------------------------------------------------------ #
+    def get(self, checksum: str, token: Hashable = ()) -> Optional[CachedClass]:
+        with self._lock:
+            entry = self._entries.get((checksum, token))
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end((checksum, token))
+            self.hits += 1
+            return entry
+
+    def put(self, entry: CachedClass, token: Hashable = ()) -> CachedClass:
+        with self._lock:
+            key = (entry.checksum, token)
+            current = self._entries.get(key)
+            if current is not None:
+                # Another thread compiled the same source first; keep a single class.
+                self._entries.move_to_end(key)
+                return current
+            self._entries[key] = entry
+            while self.maxsize > 0 and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return entry
+
+    def get_or_compile(
+        self,
+        source: SourceLike,
+        *,
+        namespace_factory: Callable[[], Namespace],
+        resolve: Callable[[Namespace], type],
+        token: Hashable = (),
+        filename: str = "<axo>",
+        checksum: Optional[str] = None,
+    ) -> type:
+        """
+        Return the class for *source*, compiling and executing it only on a miss.
+
+        *namespace_factory* builds the globals used for ``exec`` and *resolve*
+        picks the class out of them; both run only on a miss. Exceptions from
+        ``compile``/``exec``/``resolve`` propagate and nothing is cached.
+        """
+        checksum = checksum or source_checksum(source)
+        entry = self.get(checksum, token)
+        if entry is not None:
+            return entry.cls
+
+        src = source if isinstance(source, str) else str(source, "utf-8")
+        code = compile(src, filename, "exec")
+        namespace = namespace_factory()
+        exec(code, namespace)
+        cls = resolve(namespace)
+        return self.put(CachedClass(checksum=checksum, code=code, cls=cls), token).cls
+
+    # ------------------------------------------------------------------ #
+    # Introspection
+    # ------------------------------------------------------------------ #
+    def stats(self) -> ClassCacheStats:
+        with self._lock:
+            return ClassCacheStats(
+                hits      = self.hits,
+                misses    = self.misses,
+                evictions = self.evictions,
+                size      = len(self._entries),
+                maxsize   = self.maxsize,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_class_cache = ClassCache()
+
+
+def get_class_cache() -> ClassCache:
+    """Return the process‑wide :class:`ClassCache`."""
+    return _class_cache
+
+
+# =========================================================================== #
+# Per-class source memo
+# =========================================================================== #
+@dataclass(frozen=True)
+class ClassSource:
+    source: str
+    data: bytes
+    checksum: str
+
+    @staticmethod
+    def from_source(source: str, checksum: Optional[str] = None) -> "ClassSource":
+        data = source.encode("utf-8")
+        return ClassSource(source=source, data=data, checksum=checksum or source_checksum(data))
+
+
+# Keyed by the class object itself: redefining a class yields a new key and the
+# old entry disappears with the old class.
+_class_sources: "WeakKeyDictionary[type, ClassSource]" = WeakKeyDictionary()
+_class_sources_lock = threading.Lock()
+
+
+def get_class_source(cls: type) -> ClassSource:
+    """
+    Return the memoized :class:`ClassSource` of *cls*, reading it with
+    :func:`inspect.getsource` the first time.
+    """
+    entry = _class_sources.get(cls)
+    if entry is None:
+        entry = ClassSource.from_source(inspect.getsource(cls))
+        with _class_sources_lock:
+            entry = _class_sources.setdefault(cls, entry)
+    return entry
+
+
+def set_class_source(cls: type, source: str, checksum: Optional[str] = None) -> ClassSource:
+    """Register the source of a class whose code is not on disk (e.g. rebuilt ones)."""
+    entry = ClassSource.from_source(source, checksum)
+    with _class_sources_lock:
+        _class_sources[cls] = entry
+    return entry
+
+
+def invalidate_class_source(cls: type) -> None:
+    with _class_sources_lock:
+        _class_sources.pop(cls, None)
+
+
+# =========================================================================== #
+# Memoized read-only method results
+# =========================================================================== #
+AXO_METHOD_CACHE_SIZE  = int(os.environ.get("AXO_METHOD_CACHE_SIZE", "1024"))
+AXO_METHOD_CACHE_TTL   = float(os.environ.get("AXO_METHOD_CACHE_TTL", "0"))                  # seconds, 0 = no expiry
+AXO_METHOD_CACHE_BYTES = int(os.environ.get("AXO_METHOD_CACHE_BYTES", str(64 * 1024 * 1024)))
+
+# (axo_key, axo_version, method, args digest)
+MethodCacheKey = Tuple[str, int, str, bytes]
+
+
+@dataclass(frozen=True)
+class MethodCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    nbytes: int
+    maxsize: int
+    max_bytes: int
+
+
+def args_digest(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[bytes]:
+    """
+    Digest of a call's arguments, or ``None`` when they cannot be pickled
+    (such calls are simply not cached). Pickle, unlike ``hash``, tells
+    ``1``, ``1.0`` and ``True`` apart.
+    """
+    try:
+        data = pickle.dumps((args, sorted(kwargs.items())) if kwargs else (args,), protocol=5)
+    except Exception:
+        return None
+    # short argument lists are their own key
+    return data if len(data) <= 64 else H.blake2b(data, digest_size=16).digest()
+
+
+def _nbytes(value: Any) -> int:
+    # pickled size; out-of-band buffers (numpy, bytes-like) are counted, not copied
+    buffers: list = []
+    try:
+        data = pickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+    except Exception:
+        return sys.getsizeof(value)
+    return len(data) + sum(b.raw().nbytes for b in buffers)
+
+
+class MethodCache:
+    """
+    Thread‑safe LRU of ``(axo_key, axo_version, method, args digest) -> result``
+    bounded by entry count (*maxsize*) and by the pickled size of the results
+    (*max_bytes*); entries older than *ttl* seconds are dropped on access.
+    Cached values are returned by reference, as with :func:`functools.lru_cache`.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = AXO_METHOD_CACHE_SIZE,
+        ttl: Optional[float] = AXO_METHOD_CACHE_TTL,
+        max_bytes: int = AXO_METHOD_CACHE_BYTES,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl or None
+        self.max_bytes = max_bytes
+        # key -> (value, nbytes, expires_at)
+        self._entries: "OrderedDict[MethodCacheKey, Tuple[Any, int, Optional[float]]]" = OrderedDict()
+        self._by_object: Dict[str, set] = {}
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        _method_caches.append(ref(self, _method_caches.remove))
+
+    @staticmethod
+    def key(axo_key: str, axo_version: int, method: str, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[MethodCacheKey]:
+        digest = args_digest(args, kwargs)
+        return None if digest is None else (axo_key, axo_version, method, digest)
+
+    def get(self, key: MethodCacheKey, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry[2] is not None and entry[2] < time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: MethodCacheKey, value: Any) -> bool:
+        """Cache *value*; returns False when it alone exceeds ``max_bytes``."""
+        size = _nbytes(value)
+        if self.max_bytes > 0 and size > self.max_bytes:
+            return False
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self._by_object.setdefault(key[0], set()).add(key)
+            self.nbytes += size
+            while self._entries and (
+                (self.maxsize > 0 and len(self._entries) > self.maxsize)
+                or (self.max_bytes > 0 and self.nbytes > self.max_bytes)
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return True
+
+    def invalidate(self, axo_key: str) -> int:
+        """Drop every entry of object *axo_key*; returns how many were dropped."""
+        with self._lock:
+            keys = list(self._by_object.get(axo_key, ()))  # _remove empties the live set
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def _remove(self, key: MethodCacheKey) -> None:
+        _, size, _ = self._entries.pop(key)
+        self.nbytes -= size
+        keys = self._by_object.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_object[key[0]]
+
+    # ------------------------------------------------------------------ #
+    # Introspection
+    # ------------------------------------------------------------------ #
+    def stats(self) -> MethodCacheStats:
+        with self._lock:
+            return MethodCacheStats(
+                hits        = self.hits,
+                misses      = self.misses,
+                evictions   = self.evictions,
+                expirations = self.expirations,
+                size        = len(self._entries),
+                nbytes      = self.nbytes,
+                maxsize     = self.maxsize,
+                max_bytes   = self.max_bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_object.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# weak references to every MethodCache (a WeakSet is several times slower to
+# iterate, and invalidation runs on every attribute write of cached classes)
+_method_caches: "List[ref[MethodCache]]" = []
+_method_cache: Optional[MethodCache] = None
+_method_cache_lock = threading.Lock()
+
+
+def get_method_cache() -> MethodCache:
+    """Return the process‑wide :class:`MethodCache` (created on first use)."""
+    global _method_cache
+    if _method_cache is None:
+        with _method_cache_lock:
+            if _method_cache is None:
+                _method_cache = MethodCache()
+    return _method_cache
+
+
+def invalidate_method_cache(axo_key: str) -> int:
+    """Drop the cached results of object *axo_key* from every :class:`MethodCache`."""
+    dropped = 0
+    for cache_ref in tuple(_method_caches):
+        cache = cache_ref()
+        if cache is not None:
+            dropped += cache.invalidate(axo_key)
+    return dropped
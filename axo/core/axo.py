@@ -24,18 +24,20 @@ from __future__ import annotations
 import inspect
 import sys
 import os
-import struct
 import time as T
 import types
 from typing import (
     Any,
     Dict,
     Generator,
+    Iterable,
     Tuple,
     Type,
     TypeVar,
     List, 
-    Optional
+    Optional,
+    Set,
+    TYPE_CHECKING,
 )
 
 # ─────────────────────────────────────────────────────────────── 3rd‑party ──
@@ -44,11 +46,19 @@ from option import Err, Ok, Result
 import humanfriendly as HF
 # ──────────────────────────────────────────────────────────────── project ───
 from axo.log import get_logger
-from axo.core.decorators import axo_method
+from axo.core.decorators import axo_method,AXO_CALL_KWARGS,call_kwargs_for
+from axo.core.batch import AxoBatch
 from axo.runtime import get_runtime
-from axo.core.models import MetadataX
+from axo.core.models import MetadataX,AxoMethodSpec
 from axo.helpers import _generate_id
 from axo.environment import AXO_ID_SIZE
+import axo.serde.frames as FR
+import axo.serde.stream as SS
+from axo.cache import get_class_cache,get_class_source,set_class_source,invalidate_method_cache
+from axo.serde.lazy import materialize
+
+if TYPE_CHECKING:
+    from axo.runtime.runtime import PersistManyReport
 # ───────────────────────────────────────────────────────────────── constants ─
 # AXO_DEBUG                 = bool(int(os.getenv("AXO_DEBUG", "1")))
 # AXO_PROPERTY_PREFIX = "_acx_property_"
@@ -63,6 +73,8 @@ logger = get_logger(
 )
 
 R = TypeVar("R")  # generic return type for Axo.call
+# Per-instance bookkeeping kept in __dict__ but never serialised.
+_ACX_TRANSIENT = frozenset({"_acx_dirty", "_acx_persisted"})
 # =========================================================================== #
 # Small helpers
 # =========================================================================== #
@@ -71,10 +83,58 @@ R = TypeVar("R")  # generic return type for Axo.call
 
 
 
+
+def _observed_setattr(self: "Axo", name: str, value: Any) -> None:
+    object.__setattr__(self, name, value)
+    if not name.startswith("_acx_"):
+        self._acx_state_changed(name)
+
+
+def _observed_delattr(self: "Axo", name: str) -> None:
+    object.__delattr__(self, name)
+    if not name.startswith("_acx_"):
+        self._acx_state_changed(name)
+
+
 # =========================================================================== #
 # Base active‑object class
 # =========================================================================== #
 class AxoMeta(type):
+    """
+    Builds ``cls._acx_dispatch`` – ``{name: AxoMethodSpec}`` for every
+    ``@axo_method``/``@axo_task``/``@axo_stream`` of the class and its bases –
+    once, when the class is defined, so runtimes can dispatch without
+    introspecting the instance on every call.
+    """
+    def __init__(cls, name, bases, ns, **kwargs):
+        super().__init__(name, bases, ns, **kwargs)
+        table: Dict[str, AxoMethodSpec] = {}
+        for base in reversed(cls.__mro__[1:]):
+            table.update(base.__dict__.get("_acx_dispatch", {}))
+        for attr_name, value in ns.items():
+            try:
+                kind = getattr(value, "_acx_kind", None)
+            except Exception:
+                kind = None
+            if isinstance(kind, str):
+                fn = inspect.unwrap(value)
+                table[attr_name] = AxoMethodSpec(
+                    name      = attr_name,
+                    fn        = fn,
+                    kind      = kind,
+                    inject    = call_kwargs_for(fn),
+                    read_only = bool(getattr(fn, "_acx_read_only", False)),
+                    cache     = getattr(fn, "_acx_cache", None),
+                )
+            else:
+                table.pop(attr_name, None)  # overridden by a plain attribute
+        cls._acx_dispatch = table
+        cls._acx_cached = any(spec.cache is not None for spec in table.values())
+        # assignments are only observed by classes that need them
+        if (getattr(cls, "_acx_track_changes", False) or cls._acx_cached) and cls.__setattr__ is object.__setattr__:
+            cls.__setattr__ = _observed_setattr
+            cls.__delattr__ = _observed_delattr
+
     def __call__(cls, *args, **kwargs):
         # mutate / inject anything you want
 
@@ -93,6 +153,8 @@ class Axo(metaclass=AxoMeta):
     _acx_metadata: MetadataX
     _acx_local: bool = True
     _acx_remote: bool = False
+    _acx_track_changes: bool = False   # record assigned attributes (class keyword)
+    _acx_cached: bool = False          # some axo_method is memoized (set by AxoMeta)
 
     # ------------------------------------------------------------------ #
     # Fast dynamic invoker
@@ -114,6 +176,20 @@ class Axo(metaclass=AxoMeta):
         except Exception as exc:
             return Err(exc)
 
+    def batch(self, *, max_size: Optional[int] = None, flush_interval: Optional[float] = None) -> AxoBatch:
+        """
+        Queue ``@axo_method`` calls and send them in ``METHOD_EXEC_BATCH``
+        messages of up to *max_size* calls, waiting at most *flush_interval*
+        seconds for a batch to fill (defaults: ``AXO_BATCH_MAX_SIZE`` and
+        ``AXO_BATCH_FLUSH_INTERVAL``)::
+
+            with model.batch() as b:
+                calls = [b.predict(x) for x in xs]
+                b.of(other).fit(3)
+            results = [c.result() for c in calls]
+        """
+        return AxoBatch(self, max_size=max_size, flush_interval=flush_interval)
+
     # ------------------------------------------------------------------ #
     # Bucket & endpoint helpers
     # ------------------------------------------------------------------ #
@@ -162,6 +238,8 @@ class Axo(metaclass=AxoMeta):
     def __new__(cls, *args: Any, **kwargs: Any) -> "Axo":
         # print(kwargs)
         obj = super().__new__(cls)
+        object.__setattr__(obj, "_acx_dirty", set())
+        object.__setattr__(obj, "_acx_persisted", None)
         obj._acx_metadata = MetadataX(
             axo_class_name=cls.__name__, axo_module=cls.__module__,
         )
@@ -185,6 +263,50 @@ class Axo(metaclass=AxoMeta):
     
     def __init__(self,*args,**kwargs):
         pass
+
+    # ------------------------------------------------------------------ #
+    # Dirty-attribute tracking (incremental persistify)
+    # ------------------------------------------------------------------ #
+    def __init_subclass__(cls, track_changes: Optional[bool] = None, **kwargs: Any) -> None:
+        """``class Model(Axo, track_changes=True)`` records assignments for partial persists."""
+        super().__init_subclass__(**kwargs)
+        if track_changes is not None:
+            cls._acx_track_changes = bool(track_changes)
+
+    def _acx_state_changed(self, *names: str) -> None:
+        cls = type(self)
+        if cls._acx_track_changes:
+            self.__dict__.setdefault("_acx_dirty", set()).update(names)
+        if cls._acx_cached:
+            # memoized read-only results no longer hold
+            md = self.__dict__.get("_acx_metadata")
+            if md is not None:
+                invalidate_method_cache(md.axo_key)
+
+    def mark_dirty(self, *names: str) -> None:
+        """
+        Flag attributes changed in place (``self.xs.append(…)``,
+        ``self.w[0] = …``); plain assignments are tracked automatically on
+        classes declared with ``track_changes=True``.
+        """
+        self._acx_state_changed(*names)
+
+    def get_dirty_attrs(self) -> Set[str]:
+        """Attributes assigned or deleted since the last persist."""
+        return set(self.__dict__.get("_acx_dirty", ()))
+
+    def _acx_mark_persisted(self, target: Optional[Tuple[str, str]], names: Optional[Set[str]] = None) -> None:
+        """
+        Record a successful persist. *target* is ``(bucket_id, key)`` when
+        the object was stored one blob per attribute (so the next persist may
+        be partial), ``None`` otherwise. Only *names* are cleared (all if None).
+        """
+        dirty = self.__dict__.setdefault("_acx_dirty", set())
+        if names is None:
+            dirty.clear()
+        else:
+            dirty.difference_update(names)
+        object.__setattr__(self, "_acx_persisted", target)
     
     def append_dependency(self,dependency:str ):
         self._acx_metadata.axo_dependencies.append(dependency)
@@ -200,93 +322,115 @@ class Axo(metaclass=AxoMeta):
     def to_bytes(self) -> Result[bytes,Exception]:
         """
         Serialise *attributes*, and
-        *class source code* into a single byte‑buffer:
+        *class source code* into a single byte‑buffer (see :mod:`axo.serde.frames`):
+
+            [AXF2][n][len…][attrs][src][oob buffers…]
 
-            [len][attrs]  [len][src]
+        Large buffers (e.g. NumPy arrays) travel out‑of‑band and are copied
+        exactly once into the result.
         """
+        parts_result = self.get_frame_parts()
+        if parts_result.is_err:
+            return Err(parts_result.unwrap_err())
+        return Ok(FR.pack_frames(parts_result.unwrap()))
+
+    def to_buffers(self) -> Result[List[memoryview],Exception]:
+        """
+        Same frame as :meth:`to_bytes` but returned as a list of memoryviews
+        (header + parts) without concatenating them.
+        """
+        parts_result = self.get_frame_parts()
+        if parts_result.is_err:
+            return Err(parts_result.unwrap_err())
+        return Ok(FR.frame_buffers(parts_result.unwrap()))
+
+    def get_frame_parts(self) -> Result[List[FR.BytesLike],Exception]:
         raw_parts_result = self.get_raw_parts()
         if raw_parts_result.is_err:
             logger.error({"error":str(raw_parts_result.unwrap_err()),"detail":"Failed to get raw parts"})
             return Err(raw_parts_result.unwrap_err())
-        
-        attrs,class_code = raw_parts_result.unwrap()
-        
-
-        parts = [cp.dumps(attrs),  class_code.encode("utf-8")]
-        packed = b""
-        for part in parts:
-            packed += struct.pack("I", len(part)) + part
-        return Ok(packed)
+        try:
+            attrs = raw_parts_result.unwrap()[0]
+            return Ok(FR.encode_object(attrs, get_class_source(self.__class__).data))
+        except Exception as e:
+            return Err(e)
     
-    def  get_raw_parts(self)->Result[Tuple[Dict[str, Any], str]]:
+    def  get_raw_parts(self, materialize_lazy: bool = True)->Result[Tuple[Dict[str, Any], str]]:
+        """
+        ``(attrs, class source)``. Attributes still left in storage by a lazy
+        load are fetched unless *materialize_lazy* is False.
+        """
         try:
-            attrs = self.__dict__
-            class_code = inspect.getsource(self.__class__)
+            attrs = {k: v for k, v in self.__dict__.items() if k not in _ACX_TRANSIENT}
+            if materialize_lazy:
+                attrs = {k: materialize(v) for k, v in attrs.items()}
+            class_code = get_class_source(self.__class__).source
 
             return Ok((attrs,   class_code))
         except Exception as e:
             return Err(e)
     
     def to_stream(self,chunk_size: str = "1MB") -> Generator[bytes, None, None]:
-        """Yield ``self`` as (roughly) *chunk_size* byte blocks."""
-        try:
-            serialized_data_res = self.to_bytes()
-            if serialized_data_res.is_err:
-                raise Exception(f"Failed to convert AO to bytes: {serialized_data_res.unwrap_err()}")
-            serialized_data = serialized_data_res.unwrap()
-
-            total_size = len(serialized_data)
-            start = 0
-            chunk_size = HF.parse_size(chunk_size)
-            
-            while start < total_size:
-                end = min(start + chunk_size, total_size)
-                yield serialized_data[start:end]
-                start = end
-        except Exception as e:
-            raise e
-        # return serialize_and_yield_chunks(self, chunk_size=chunk_size)
+        """
+        Yield ``self`` as *chunk_size* byte blocks (see :mod:`axo.serde.stream`).
+
+        Attributes are pickled while the blocks are consumed, so the object is
+        never materialised as one buffer; feed the generator to
+        :meth:`StorageService.put_chunks` or :meth:`Axo.from_stream`.
+        """
+        attrs_res = self.get_raw_parts()
+        if attrs_res.is_err:
+            raise Exception(f"Failed to convert AO to bytes: {attrs_res.unwrap_err()}")
+        attrs = attrs_res.unwrap()[0]
+        yield from SS.iter_encode_object(
+            attrs,
+            get_class_source(self.__class__).data,
+            chunk_size = HF.parse_size(chunk_size),
+        )
     
     @staticmethod
-    def get_parts(raw_obj: bytes) -> Result[Tuple[Dict[str, Any], Dict[str, Any], Type[Axo], str], Exception]:
-        try:
-            index = 0
-            unpacked_data = []
-
-            # First, read lengths and raw segments
-            raw_parts = []
-            while index < len(raw_obj):
-                length = struct.unpack_from('I', raw_obj, index)[0]
-                index += 4
-                data = raw_obj[index:index+length]
-                index += length
-                raw_parts.append(data)
-
-            # The last part is the source code of the class (in bytes)
-            class_code_bytes = raw_parts[-1]
-            code_str = class_code_bytes.decode("utf-8")
-
-            # Dynamically evaluate the class code into a temporary module
-            module_name = "axo.dynamic"
+    def _rebuild_class(class_code: FR.BytesLike, *, module_name: str) -> Type[Axo]:
+        """
+        Return the :class:`Axo` subclass defined by *class_code*. The source is
+        compiled and executed only the first time its sha256 is seen.
+        """
+        def namespace() -> Dict[str, Any]:
             mod = types.ModuleType(module_name)
+            # ✅ Inject 'Axo' base class into the module's namespace
             mod.__dict__["Axo"] = Axo
             mod.__dict__["axo_method"] = axo_method
             sys.modules[module_name] = mod
+            return mod.__dict__
 
-            exec(code_str, mod.__dict__)
-
+        def resolve(ns: Dict[str, Any]) -> Type[Axo]:
             # Find the class that inherits from Axo
-            rebuilt_class = None
-            for obj in mod.__dict__.values():
+            for obj in ns.values():
                 if isinstance(obj, type) and issubclass(obj, Axo) and obj.__name__ != "Axo":
-                    rebuilt_class = obj
-                    break
-            if rebuilt_class is None:
-                raise Exception("No valid Axo class could be rebuilt")
-            rebuilt_class.__module__ = module_name
-            
+                    obj.__module__ = module_name
+                    # Rebuilt classes have no file for inspect.getsource
+                    set_class_source(obj, str(class_code, "utf-8"))
+                    return obj
+            raise Exception("No valid Axo class could be rebuilt")
+
+        return get_class_cache().get_or_compile(
+            class_code,
+            namespace_factory = namespace,
+            resolve           = resolve,
+            token             = (module_name, id(Axo), id(axo_method)),
+            filename          = f"<{module_name}>",
+        )
+
+    @staticmethod
+    def get_parts(raw_obj: bytes) -> Result[Tuple[Dict[str, Any], Dict[str, Any], Type[Axo], str], Exception]:
+        try:
+            raw_parts = FR.unpack_frames(raw_obj)
+            code_str  = str(raw_parts[1], "utf-8")
+
+            # Dynamically evaluate the class code (cached by content hash)
+            Axo._rebuild_class(raw_parts[1], module_name="axo.dynamic")
+
             # Now safely deserialize the rest
-            attrs = cp.loads(raw_parts[0])
+            attrs = FR.loads_oob(raw_parts[0], raw_parts[2:])
 
             return Ok((attrs, code_str))
 
@@ -299,59 +443,51 @@ class Axo(metaclass=AxoMeta):
         """
         Re‑create an :class:`Axo` instance from :pydata:`raw`.
 
+        *raw* may be ``bytes``, ``bytearray`` or a ``memoryview``; parts are
+        parsed in place and out‑of‑band buffers are never copied, so arrays
+        decoded from ``bytes`` are read‑only. Pass a ``bytearray`` for
+        mutable ones.
+
         If *include_original* is True and a method was decorated with
         :func:`axo_method` / :func:`axo_task` the undecorated function is bound.
         """
         try:
-            parts = []
-            idx = 0
-            while idx < len(raw):
-                length = struct.unpack_from("I", raw, idx)[0]
-                idx += 4
-                parts.append(raw[idx:idx+length])
-                idx += length
-
-            attrs = cp.loads(parts[0])
-            # methods = cp.loads(parts[1])
-            class_code_str = parts[1].decode("utf-8")
-            # Dynamically execute the class definition
-
-            module_name = "__axo_dynamic__"
-            mod = types.ModuleType(module_name)
-
-            # ✅ Inject 'Axo' base class into the module's namespace
-            mod.__dict__["Axo"] = Axo
-            mod.__dict__["axo_method"] = axo_method
-            sys.modules[module_name] = mod
-
-            # Now execute the class code with the proper Axo definition
-            exec(class_code_str, mod.__dict__)
-
-            # Find the subclass of Axo
-            rebuilt_class = None
-            for obj in mod.__dict__.values():
-                if isinstance(obj, type) and issubclass(obj, Axo) and obj.__name__ != "Axo":
-                    rebuilt_class = obj
-                    break
-
-            # if rebuilt_class is None:
-            #     return Err(Exception("No valid Axo subclass found in class definition"))
-
-            obj: Axo = rebuilt_class.__new__(rebuilt_class)
-            skip = {"__class__", "__dict__", "__module__", "__weakref__"}
-            for k, v in attrs.items():
-                if k not in skip:
-                    setattr(obj, k, v)
-            # for name, fn in methods.items():
-            #     if name not in skip:
-            #         fn = fn.original if include_original and hasattr(fn, "original") else fn
-            #         setattr(obj, name, types.MethodType(fn, obj))
-
-            return Ok(obj)
-
+            if SS.is_stream(raw):
+                attrs, class_code = SS.decode_stream([raw])
+            else:
+                attrs, class_code = FR.decode_object(raw)
+            return Ok(Axo._from_parts(attrs, class_code))
         except Exception as e:
             return Err(e)       
 
+    @staticmethod
+    def from_stream(chunks: Iterable[FR.BytesLike]) -> Result["Axo", Exception]:
+        """
+        Re‑create an :class:`Axo` instance from an iterable of chunks (e.g.
+        :meth:`to_stream` or :meth:`StorageService.get_chunks`), decoding them
+        as they arrive.
+        """
+        try:
+            attrs, class_code = SS.decode_stream(chunks)
+            return Ok(Axo._from_parts(attrs, class_code))
+        except Exception as e:
+            return Err(e)
+
+    @staticmethod
+    def _from_parts(attrs: Dict[str, Any], class_code: FR.BytesLike) -> "Axo":
+        # Dynamically execute the class definition (cached by content hash)
+        rebuilt_class = Axo._rebuild_class(class_code, module_name="__axo_dynamic__")
+
+        obj: Axo = rebuilt_class.__new__(rebuilt_class)
+        skip = {"__class__", "__dict__", "__module__", "__weakref__", *_ACX_TRANSIENT}
+        # restored, not assigned: nothing is dirty and no cached result is dropped
+        obj.__dict__.update((k, v) for k, v in attrs.items() if k not in skip)
+        # for name, fn in methods.items():
+        #     if name not in skip:
+        #         fn = fn.original if include_original and hasattr(fn, "original") else fn
+        #         setattr(obj, name, types.MethodType(fn, obj))
+        return obj
+
     # ------------------------------------------------------------------ #
     # Persistence
     # ------------------------------------------------------------------ #
@@ -367,14 +503,58 @@ class Axo(metaclass=AxoMeta):
             bucket_id = bucket_id or self.get_axo_bucket_id()
             if rt is None:
                 raise Exception("No runtime was initialized.")
+            previous = self._acx_next_version()
             # Persist via runtime helper
             res = await rt.persistify(instance=self, bucket_id=bucket_id, key=key)
-            self._acx_remote = res.is_ok
-            self._acx_local = not res.is_ok
+            self._acx_persist_done(res.is_ok, previous)
             return res
         except Exception as exc:
             return Err(exc)
 
+    @staticmethod
+    async def persistify_many(
+        instances: Iterable["Axo"], *, bucket_id: str = "", concurrency: Optional[int] = None
+    ) -> Result["PersistManyReport", Exception]:
+        """
+        Persist *instances* concurrently through the active runtime (see
+        :meth:`ActiveXRuntime.persistify_many`). Each object goes to its own
+        bucket unless *bucket_id* is given; the report holds one Result per
+        object, in order, plus the aggregate throughput.
+        """
+        try:
+            rt = get_runtime()
+            if rt is None:
+                raise Exception("No runtime was initialized.")
+            instances = list(instances)
+            kwargs = {} if concurrency is None else {"concurrency": concurrency}
+            previous = [instance._acx_next_version() for instance in instances]
+            report = await rt.persistify_many(instances, bucket_id=bucket_id or None, **kwargs)
+            for instance, res, version in zip(instances, report.results, previous):
+                instance._acx_persist_done(res.is_ok, version)
+            return Ok(report)
+        except Exception as exc:
+            return Err(exc)
+
+    def _acx_next_version(self) -> int:
+        """
+        Re-persisting an object with memoized methods stores a new
+        ``axo_version`` (part of the cache key); returns the current one.
+        """
+        version = self._acx_metadata.axo_version
+        if self._acx_remote and type(self)._acx_cached:
+            self._acx_metadata.axo_version = version + 1
+        return version
+
+    def _acx_persist_done(self, ok: bool, previous: int) -> None:
+        self._acx_remote = ok
+        self._acx_local = not ok
+        if not type(self)._acx_cached:
+            return
+        if ok:
+            invalidate_method_cache(self._acx_metadata.axo_key)
+        else:
+            self._acx_metadata.axo_version = previous
+
     # Convenience: fetch by key/bucket
     @staticmethod
     async def get_by_key(key: str, *, bucket_id: str = "") -> Result["Axo", Exception]:
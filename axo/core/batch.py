@@ -0,0 +1,305 @@
+"""
+axo/core/batch.py
+~~~~~~~~~~~~~~~~~
+
+Client-side batching of ``@axo_method`` calls, see :meth:`Axo.batch`.
+
+Calls queued on an :class:`AxoBatch` go to their endpoint as one
+``METHOD_EXEC_BATCH`` message per endpoint once ``max_size`` calls are
+pending, once the oldest one has waited ``flush_interval`` seconds, or when
+the batch is flushed or closed. Every queued call returns a
+:class:`BatchedCall` whose :meth:`~BatchedCall.result` is the same
+``Result`` the plain call would have returned.
+
+A :class:`BatchedCall` can be passed as an argument to a later call. On the
+same endpoint the dependency travels in the same message and is resolved
+there (promise pipelining); otherwise it is sent first and passed on as a
+:class:`~axo.core.models.ResultRef`. Either way its value stays on the
+endpoint side and its own ``result()`` is that reference.
+"""
+
+from __future__ import annotations
+
+import inspect
+import os
+import threading
+import time as T
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+from option import Err, Ok, Result
+
+from axo.core.decorators import _MISS, _AxoMethod, _MethodCall, _resolve_endpoint, _unspill, accepted_kwargs
+from axo.environment import AXO_BATCH_FLUSH_INTERVAL, AXO_BATCH_MAX_SIZE
+from axo.core.models import CallRef
+from axo.errors import AxoError, AxoErrorType
+from axo.log import get_logger
+from axo.runtime import get_runtime
+
+if TYPE_CHECKING:
+    from axo.core.axo import Axo
+
+logger = get_logger(
+    name  = __name__ ,
+    ltype = os.environ.get("AXO_LOG_TYPE","json") ,
+    debug = os.environ.get("AXO_DEBUG","1")== "1",
+    path  = os.environ.get("AXO_LOG_PATH","/log") ,
+)
+
+
+class BatchedCall:
+    """A queued call; :meth:`result` flushes its batch if it is still pending."""
+
+    __slots__ = ("_batch", "_result", "_event", "_queued")
+
+    def __init__(self, batch: "AxoBatch") -> None:
+        self._batch = batch
+        self._result: Optional[Result[Any, Exception]] = None
+        self._event = threading.Event()
+        self._queued: Optional[_Queued] = None  # while waiting to be sent
+
+    @property
+    def done(self) -> bool:
+        return self._event.is_set()
+
+    def result(self) -> Result[Any, Exception]:
+        if not self._event.is_set():
+            self._batch.flush()
+            self._event.wait()  # or another thread is flushing it
+        return self._result
+
+    def _set(self, res: Result[Any, Exception]) -> "BatchedCall":
+        self._result = res
+        self._queued = None
+        self._event.set()
+        return self
+
+
+@dataclass
+class _Queued:
+    handle: BatchedCall
+    endpoint: Any
+    ao: "Axo"
+    fname: str
+    fargs: tuple
+    fkwargs: Dict[str, Any]
+    call: _MethodCall
+    pure: bool
+    key: Any
+    result_mode: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _Dep:
+    """Argument placeholder: the result of *queued*, sent in the same message."""
+    queued: _Queued
+
+
+class _DepFailed(Exception):
+    def __init__(self, error: Any) -> None:
+        super().__init__(str(error))
+        self.error = error
+
+
+class _Target:
+    """``batch.of(obj).method(...)`` queues ``obj.method(...)``."""
+
+    def __init__(self, batch: "AxoBatch", ao: "Axo") -> None:
+        self._batch = batch
+        self._ao = ao
+
+    def __getattr__(self, fname: str):
+        if fname.startswith("__"):
+            raise AttributeError(fname)
+        return partial(self._batch.call, self._ao, fname)
+
+
+class AxoBatch:
+    """
+    Queue of ``@axo_method`` calls sent in batches. ``batch.method(...)``
+    queues a call on the object the batch was made from, ``batch.of(other)
+    .method(...)`` one on any other object. Use it as a context manager:
+    leaving the block sends what is still queued.
+
+    Cache hits are answered at once, and in-process runtimes run each call
+    right away since there is no round trip to save.
+    """
+
+    def __init__(
+        self,
+        ao: Optional["Axo"] = None,
+        *,
+        max_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+    ) -> None:
+        self._ao = ao
+        self.max_size = max(1, AXO_BATCH_MAX_SIZE if max_size is None else max_size)
+        self.flush_interval = AXO_BATCH_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self._pending: List[_Queued] = []
+        self._lock = threading.Lock()          # guards _pending and _timer
+        self._flush_lock = threading.Lock()    # batches leave one at a time, in order
+        self._timer: Optional[threading.Timer] = None
+        self.calls: List[BatchedCall] = []
+        self.messages = 0                      # batch messages sent
+
+    # ------------------------------------------------------------------ #
+    # Queueing
+    # ------------------------------------------------------------------ #
+    def of(self, ao: "Axo") -> _Target:
+        return _Target(self, ao)
+
+    def __getattr__(self, fname: str):
+        if fname.startswith("_") or self.__dict__.get("_ao") is None:
+            raise AttributeError(fname)
+        return partial(self.call, self._ao, fname)
+
+    def call(self, ao: "Axo", fname: str, *args: Any, **kwargs: Any) -> BatchedCall:
+        """Queue ``ao.fname(*args, **kwargs)``."""
+        handle = BatchedCall(self)
+        self.calls.append(handle)
+        try:
+            method = inspect.getattr_static(type(ao), fname, None)
+            if not isinstance(method, _AxoMethod):
+                return handle._set(Err(AxoError.make(AxoErrorType.BAD_REQUEST, f"{type(ao).__name__}.{fname} is not an @axo_method")))
+            rt = get_runtime()
+            if rt is None:
+                return handle._set(Err(AxoError.make(error_type=AxoErrorType.INTERNAL_ERROR, msg="No runtime started")))
+            if not rt.is_distributed:
+                linked = self._link(args, kwargs, None)
+                if linked.is_err:
+                    return handle._set(Err(linked.unwrap_err()))
+                args, kwargs = linked.unwrap()
+                return handle._set(getattr(ao, fname)(*args, **kwargs))
+            call: _MethodCall = method._self_call
+            ep = _resolve_endpoint(rt, ao, kwargs)
+            if ao._acx_local:
+                return handle._set(Err(Exception("First you must persistify the object.")))
+            linked = self._link(args, kwargs, ep)
+            if linked.is_err:
+                return handle._set(Err(linked.unwrap_err()))
+            args, kwargs = linked.unwrap()
+            pure, key, value = call._lookup(ao, fname, args, kwargs) if not self._has_deps(args, kwargs) else (call.read_only or ao._acx_metadata.axo_is_read_only, None, _MISS)
+            if value is not _MISS:
+                return handle._set(Ok(value))
+            queued = _Queued(handle, ep, ao, fname, args, accepted_kwargs(kwargs, call.accepts), call, pure, key)
+        except Exception as e:
+            return handle._set(Err(e))
+
+        with self._lock:
+            handle._queued = queued
+            self._pending.append(queued)
+            full = len(self._pending) >= self.max_size
+            if not full and self._timer is None and self.flush_interval > 0:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+        return handle
+
+    def _link(self, args: tuple, kwargs: Dict[str, Any], ep: Any) -> Result[tuple, Exception]:
+        """Replace the BatchedCall arguments: by a :class:`_Dep` when they go in
+        the same message to *ep*, by their (reference) result otherwise."""
+        def link(x: Any) -> Any:
+            if not isinstance(x, BatchedCall):
+                return x
+            queued = x._queued
+            if queued is not None and ep is not None:
+                queued.result_mode = "ref"  # keep the value on the endpoint side
+                if x._batch is self and queued.endpoint.endpoint_id == ep.endpoint_id:
+                    return _Dep(queued)
+            res = x.result()
+            if res.is_err:
+                raise _DepFailed(res.unwrap_err())
+            return res.unwrap()
+        try:
+            return Ok((tuple(link(a) for a in args), {k: link(v) for k, v in kwargs.items()}))
+        except _DepFailed as e:
+            return Err(AxoError.make(AxoErrorType.BAD_REQUEST, f"argument depends on a failed call: {getattr(e.error, 'message', e.error)}"))
+
+    @staticmethod
+    def _has_deps(args: tuple, kwargs: Dict[str, Any]) -> bool:
+        return any(isinstance(x, _Dep) for x in (*args, *kwargs.values()))
+
+    # ------------------------------------------------------------------ #
+    # Sending
+    # ------------------------------------------------------------------ #
+    def flush(self) -> None:
+        """Send every queued call, one message per endpoint."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+            if not pending:
+                return
+            by_endpoint: Dict[str, List[_Queued]] = {}
+            for q in pending:
+                by_endpoint.setdefault(q.endpoint.endpoint_id, []).append(q)
+            for queued in by_endpoint.values():
+                self._send(queued)
+
+    def _send(self, queued: List[_Queued]) -> None:
+        t1 = T.time()
+        position: Dict[int, int] = {}  # id(queued) -> index in the message
+        sent: List[_Queued] = []
+        calls: List[tuple] = []
+
+        def ref(x: Any) -> Any:
+            if not isinstance(x, _Dep):
+                return x
+            if id(x.queued) in position:
+                return CallRef(index=position[id(x.queued)])
+            # sent earlier by a timer flush (and answered), or failed here
+            res = x.queued.handle._result
+            if res is None or res.is_err:
+                raise _DepFailed(res.unwrap_err() if res is not None else "not sent")
+            return res.unwrap()
+
+        for q in queued:
+            try:
+                fargs, fkwargs = [ref(a) for a in q.fargs], {k: ref(v) for k, v in q.fkwargs.items()}
+            except _DepFailed as e:
+                q.handle._set(Err(AxoError.make(AxoErrorType.BAD_REQUEST, f"argument depends on a failed call: {getattr(e.error, 'message', e.error)}")))
+                continue
+            position[id(q)] = len(sent)
+            sent.append(q)
+            calls.append((q.ao, q.fname, fargs, fkwargs, q.result_mode))
+        if not sent:
+            return
+        try:
+            res = sent[0].endpoint.method_execution_batch(calls)
+        except Exception as e:
+            res = Err(e)
+        results = res.unwrap() if res.is_ok else [Err(res.unwrap_err())] * len(sent)
+        self.messages += 1
+        rt = get_runtime()
+        for q, r in zip(sent, results):
+            q.handle._set(q.call._done(q.ao, q.pure, None if q.result_mode else q.key, _unspill(rt, r)))
+        logger.info({
+            "event": "METHOD.EXEC.BATCH",
+            "endpoint_id": sent[0].endpoint.endpoint_id,
+            "calls": len(sent),
+            "ok": res.is_ok,
+            "response_time": T.time() - t1,
+        })
+
+    @property
+    def results(self) -> List[Result[Any, Exception]]:
+        """The Result of every call queued so far, in order (flushes first)."""
+        self.flush()
+        return [c.result() for c in self.calls]
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "AxoBatch":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+__all__ = ["AxoBatch", "BatchedCall"]
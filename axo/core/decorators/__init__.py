@@ -21,15 +21,18 @@ error handling and uses *cloudpickle* to (de)serialise user‑defined classes.
 from __future__ import annotations
 
 # ────────────────────────────────────────────────────────────────── stdlib ──
+import inspect
 import time as T
-from functools import wraps
+from functools import partial, wraps
 from dataclasses import dataclass
 from typing import (
     Any,
+    Awaitable,
     Callable,
     TypeVar,
     cast,
     Dict, 
+    FrozenSet,
     Literal, 
     Optional,
     Union
@@ -50,7 +53,9 @@ from axo.log import get_logger
 from axo.runtime import set_runtime,get_runtime
 from axo.protocols import AxoLike
 from axo.errors import AxoError,AxoErrorType
-from axo.core.models import AxoContext,DeserializeT,AckT
+from axo.core.models import AxoContext,AxoPointer,DeserializeT,AckT,ResultRef
+from axo.cache import MethodCache,get_method_cache,invalidate_method_cache
+from axo.endpoint.balancer import affinity_key
 # from axo.endpoint.endpoint import EndpointX
 import os
 
@@ -65,9 +70,44 @@ R = TypeVar("R")  # generic return type for Axo.call
 # ---------------------------------------------------------------------------
 # Config carried by the decorated method (runtime will read this)
 # ---------------------------------------------------------------------------
+def _mark(fn: Callable[..., Any], kind: str, *, read_only: bool = False, cache: Optional[MethodCache] = None) -> None:
+    # Read by AxoMeta to build the class dispatch table.
+    try:
+        fn._acx_kind = kind
+        fn._acx_read_only = read_only
+        fn._acx_cache = cache
+    except (AttributeError, TypeError):
+        pass
 
 
-    
+_MISS = object()
+
+# kwargs the runtime passes to every @axo_method call
+AXO_CALL_KWARGS = frozenset({
+    "axo_endpoint_id", "axo_key", "axo_bucket_id", "axo_sink_bucket_id", "axo_source_bucket_id", "storage",
+})
+
+
+def call_kwargs_for(fn: Callable[..., Any]) -> FrozenSet[str]:
+    """
+    The runtime kwargs a method receives: all of them if it takes
+    ``**kwargs``, otherwise only those it names as parameters.
+    """
+    try:
+        params = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return AXO_CALL_KWARGS
+    if any(p.kind is p.VAR_KEYWORD for p in params.values()):
+        return AXO_CALL_KWARGS
+    return AXO_CALL_KWARGS & {n for n, p in params.items() if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)}
+
+
+def accepted_kwargs(kwargs: Dict[str, Any], accepts: FrozenSet[str]) -> Dict[str, Any]:
+    """*kwargs* without the runtime kwargs outside *accepts*."""
+    if len(accepts) == len(AXO_CALL_KWARGS):
+        return kwargs
+    return {k: v for k, v in kwargs.items() if k in accepts or k not in AXO_CALL_KWARGS}
+
 
 # ---------------------------------------------------------------------------
 # Public decorators
@@ -105,7 +145,7 @@ def axo_task(
     )
 
     def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
-        
+        _mark(fn, "task")
         wrapped = __axo_task(fn,ctx=ctx)          # preserve normal Axo method semantics
         
 
@@ -150,6 +190,7 @@ def axo_stream(
     )
 
     def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        _mark(fn, "stream")
         wrapped = __axo_stream(fn)
         return wrapped
         # return _attach_config(wrapped, cfg)
@@ -171,7 +212,7 @@ def __axo_stream(wrapped: Callable[..., R]) -> Callable[..., Result[R, Exception
 
 
             e_id = kwargs.get("axo_endpoint_id", instance.get_endpoint_id()) 
-            ep = rt.endpoint_manager.get_endpoint(e_id)
+            ep = rt.endpoint_manager.get_endpoint(e_id, key=affinity_key(instance))
             
             instance.set_endpoint_id(ep.endpoint_id)
 
@@ -232,7 +273,7 @@ def __axo_task(wrapped: Callable[..., R], ctx:AxoContext) -> Callable[..., Resul
 
 
             e_id = kwargs.get("axo_endpoint_id", instance.get_endpoint_id()) 
-            ep = rt.endpoint_manager.get_endpoint(e_id)
+            ep = rt.endpoint_manager.get_endpoint(e_id, key=affinity_key(instance))
             
             instance.set_endpoint_id(ep.endpoint_id)
 
@@ -258,7 +299,6 @@ def __axo_task(wrapped: Callable[..., R], ctx:AxoContext) -> Callable[..., Resul
                 ctx   = ctx,
                 # fkwargs = kwargs
             )
-            print("RES",res)
             
 
             logger.info({
@@ -281,64 +321,246 @@ def __axo_task(wrapped: Callable[..., R], ctx:AxoContext) -> Callable[..., Resul
     return cast(Callable[..., Result[R, Exception]],_wrapper(wrapped))
 
 
-def axo_method(wrapped: Callable[..., R]) -> Callable[..., Result[R, Exception]]:
-    @wrapt.decorator
-    def _wrapper(wrapped_func, instance:AxoLike, args, kwargs):
+def _resolve_endpoint(rt, instance: AxoLike, kwargs: Dict[str, Any]):
+    """Pick the instance's endpoint and fill in the runtime kwargs of the call."""
+    e_id = kwargs.get("axo_endpoint_id", instance.get_endpoint_id()) 
+
+    ep = rt.endpoint_manager.get_endpoint(e_id, key=affinity_key(instance))
+    
+    instance.set_endpoint_id(ep.endpoint_id)
+
+    kwargs.setdefault("axo_endpoint_id", ep.endpoint_id)
+    kwargs.setdefault("axo_key", instance.get_axo_key())
+    kwargs.setdefault("axo_bucket_id", instance.get_axo_bucket_id())
+    kwargs.setdefault("axo_sink_bucket_id", instance.get_axo_sink_bucket_id())
+    kwargs.setdefault("axo_source_bucket_id", instance.get_axo_source_bucket_id())
+    # is_distributed =  rt.get_is_distributed
+    if not rt.is_distributed:
+        kwargs.setdefault("storage", rt.storage_service)
+    return ep
+
+
+def _log_method_exec(rt, fname: str, res: Result, t1: float) -> None:
+    logger.info({
+        "event": "METHOD.EXEC",
+        "mode":"DISTRIBUTED" if rt.is_distributed else "LOCAL",
+        "fname": fname,
+        "ok": res.is_ok,
+        "response_time": T.time() - t1,  # update this properly
+    })
+
+
+def _unspill(rt, res: Result) -> Result:
+    """A result the endpoint spilled to storage comes back as an :class:`AxoPointer`."""
+    if res.is_ok:
+        value = res.unwrap()
+        if isinstance(value, ResultRef) and value.spilled:
+            return Ok(value.to_pointer(rt.storage_service))
+    return res
+
+
+def _execute_via_endpoint(rt, wrapped_func, instance: AxoLike, args, kwargs, accepts: FrozenSet[str] = AXO_CALL_KWARGS) -> Result[Any, Exception]:
+    """Generic path: resolve the endpoint and let it execute the method."""
+    t1 = T.time()
+    ep = _resolve_endpoint(rt, instance, kwargs)
+    if rt.is_distributed and instance._acx_local:
+        return Err(Exception("First you must persistify the object."))
+    
+    fname = wrapped_func.__name__
+    
+    res = ep.method_execution(
+        key     = instance.get_axo_key(),
+        fname   = fname,
+        ao      = instance,
+        fargs   = args,
+        fkwargs = accepted_kwargs(kwargs, accepts),
+    )
+    _log_method_exec(rt, fname, res, t1)
+    return _unspill(rt, res)
+
+
+async def _aexecute_via_endpoint(rt, wrapped_func, instance: AxoLike, args, kwargs, accepts: FrozenSet[str] = AXO_CALL_KWARGS) -> Result[Any, Exception]:
+    """:func:`_execute_via_endpoint` awaiting ``EndpointX.amethod_execution``."""
+    t1 = T.time()
+    ep = _resolve_endpoint(rt, instance, kwargs)
+    if rt.is_distributed and instance._acx_local:
+        return Err(Exception("First you must persistify the object."))
+
+    fname = wrapped_func.__name__
+
+    res = await ep.amethod_execution(
+        key     = instance.get_axo_key(),
+        fname   = fname,
+        ao      = instance,
+        fargs   = args,
+        fkwargs = accepted_kwargs(kwargs, accepts),
+    )
+    _log_method_exec(rt, fname, res, t1)
+    return _unspill(rt, res)
+
+
+class _BoundAxoMethod(wrapt.BoundFunctionWrapper):
+    def aio(self, *args: Any, **kwargs: Any) -> Awaitable[Result[Any, Exception]]:
+        """
+        Awaitable form of the call, ``await obj.method.aio(...)``: same Result,
+        but a remote call does not block the event loop, so many can be in
+        flight at once (e.g. with :func:`asyncio.gather`).
+        """
+        return self._self_parent._self_call.ainvoke(self.__wrapped__, self._self_instance, args, kwargs)
+
+    def ref(self, *args: Any, **kwargs: Any) -> Result[Any, Exception]:
+        """
+        Run the method but leave its result on the endpoint:
+        ``obj.method.ref(...)`` returns a :class:`axo.core.models.ResultRef`
+        that other ``@axo_method`` calls take as an argument and the endpoint
+        resolves itself, so the value never comes back to the client.
+        In-process the value is returned as is.
+        """
+        return self._self_parent._self_call.invoke_ref(self.__wrapped__, self._self_instance, args, kwargs)
+
+
+class _AxoMethod(wrapt.FunctionWrapper):
+    __bound_function_wrapper__ = _BoundAxoMethod
+
+    def __init__(self, wrapped: Callable[..., Any], call: "_MethodCall") -> None:
+        super().__init__(wrapped, call.invoke)
+        self._self_call = call
+
+
+class _MethodCall:
+    """How an ``@axo_method`` is invoked, blocking or awaited."""
+
+    def __init__(self, method_cache: Optional[MethodCache], read_only: bool, accepts: FrozenSet[str] = AXO_CALL_KWARGS) -> None:
+        self.method_cache = method_cache
+        self.read_only = read_only
+        self.accepts = accepts  # runtime kwargs the method receives, on every path
+
+    def _lookup(self, instance: AxoLike, fname: str, args, kwargs):
+        # -> (pure, cache key or None, cached value or _MISS)
+        md = instance._acx_metadata
+        pure = self.read_only or md.axo_is_read_only
+        if self.method_cache is None or not pure:
+            return pure, None, _MISS
+        key = self.method_cache.key(md.axo_key, md.axo_version, fname, args, kwargs)
+        if key is None:
+            return pure, None, _MISS
+        return pure, key, self.method_cache.get(key, _MISS)
+
+    def _done(self, instance: AxoLike, pure: bool, key, res: Result) -> Result:
+        if key is not None and res.is_ok and not isinstance(res.unwrap(), AxoPointer):
+            self.method_cache.put(key, res.unwrap())
+        elif not pure and type(instance)._acx_cached:
+            invalidate_method_cache(instance._acx_metadata.axo_key)  # may have mutated the object
+        return res
+
+    def invoke(self, wrapped_func, instance: AxoLike, args, kwargs) -> Result[Any, Exception]:
         try:
-            t1 = T.time()
             rt = get_runtime()
             if rt is None:
                 logger.warning({"event":"RUNTIME.NOT.STARTED", "mode":"LOCAL"})
                 return Err(AxoError.make(error_type=AxoErrorType.INTERNAL_ERROR, msg="No runtime started"))
                 # set_runtime(_make_local_runtime())
                 # rt = get_runtime()
+            pure, key, value = self._lookup(instance, wrapped_func.__name__, args, kwargs)
+            if value is not _MISS:
+                return Ok(value)
+            res = None
+            if not rt.is_distributed:
+                # in-process: straight through the class dispatch table
+                res = rt.invoke_local(instance, wrapped_func, args, kwargs, self.accepts)
+            if res is None:
+                res = _execute_via_endpoint(rt, wrapped_func, instance, args, kwargs, self.accepts)
+            return self._done(instance, pure, key, res)
+        except Exception as e:
+            logger.error(f"METHOD.EXEC failed: {e}")
+            return Err(e)
 
-
-
-            e_id = kwargs.get("axo_endpoint_id", instance.get_endpoint_id()) 
-
-            ep = rt.endpoint_manager.get_endpoint(e_id)
-            
-            instance.set_endpoint_id(ep.endpoint_id)
-
-            kwargs.setdefault("axo_endpoint_id", ep.endpoint_id)
-            kwargs.setdefault("axo_key", instance.get_axo_key())
-            kwargs.setdefault("axo_bucket_id", instance.get_axo_bucket_id())
-            kwargs.setdefault("axo_sink_bucket_id", instance.get_axo_sink_bucket_id())
-            kwargs.setdefault("axo_source_bucket_id", instance.get_axo_source_bucket_id())
-            # is_distributed =  rt.get_is_distributed
+    def invoke_ref(self, wrapped_func, instance: AxoLike, args, kwargs) -> Result[Any, Exception]:
+        try:
+            rt = get_runtime()
+            if rt is None:
+                logger.warning({"event":"RUNTIME.NOT.STARTED", "mode":"LOCAL"})
+                return Err(AxoError.make(error_type=AxoErrorType.INTERNAL_ERROR, msg="No runtime started"))
+            if instance is None:
+                return Err(Exception(f"{wrapped_func.__name__}.ref must be called on an instance"))
             if not rt.is_distributed:
-                kwargs.setdefault("storage", rt.storage_service)
-            if rt.is_distributed and instance._acx_local:
+                return self.invoke(wrapped_func, instance, args, kwargs)
+            t1 = T.time()
+            kwargs = dict(kwargs)
+            pure = self.read_only or instance._acx_metadata.axo_is_read_only
+            ep = _resolve_endpoint(rt, instance, kwargs)
+            if instance._acx_local:
                 return Err(Exception("First you must persistify the object."))
-            
             fname = wrapped_func.__name__
-            print(instance.get_axo_bucket_id(), instance.get_axo_key())
-            
-            res = ep.method_execution(
+            res = ep.method_execution_ref(
                 key     = instance.get_axo_key(),
                 fname   = fname,
                 ao      = instance,
                 fargs   = args,
-                fkwargs = kwargs,
+                fkwargs = accepted_kwargs(kwargs, self.accepts),
             )
-            
-            # print("RES",res)
-            logger.info({
-                "event": "METHOD.EXEC",
-                "mode":"DISTRIBUTED" if rt.is_distributed else "LOCAL",
-                "fname": fname,
-                "ok": res.is_ok,
-                "response_time": T.time() - t1,  # update this properly
-            })
-            # if res.is_ok:S
-                # result = res.unwrap()
-                # if isinstance(result, Result):
-                    # return Ok(result.unwrap())
-            return res
+            _log_method_exec(rt, fname, res, t1)
+            return self._done(instance, pure, None, res)  # references are not memoized
         except Exception as e:
             logger.error(f"METHOD.EXEC failed: {e}")
             return Err(e)
 
-    return cast(Callable[..., Result[R, Exception]],_wrapper(wrapped))
+    async def ainvoke(self, wrapped_func, instance: AxoLike, args, kwargs) -> Result[Any, Exception]:
+        try:
+            rt = get_runtime()
+            if rt is None:
+                logger.warning({"event":"RUNTIME.NOT.STARTED", "mode":"LOCAL"})
+                return Err(AxoError.make(error_type=AxoErrorType.INTERNAL_ERROR, msg="No runtime started"))
+            if instance is None:
+                return Err(Exception(f"{wrapped_func.__name__}.aio must be called on an instance"))
+            kwargs = dict(kwargs)
+            pure, key, value = self._lookup(instance, wrapped_func.__name__, args, kwargs)
+            if value is not _MISS:
+                return Ok(value)
+            res = None
+            if not rt.is_distributed:
+                # nothing to wait for in-process
+                res = rt.invoke_local(instance, wrapped_func, args, kwargs, self.accepts)
+            if res is None:
+                res = await _aexecute_via_endpoint(rt, wrapped_func, instance, args, kwargs, self.accepts)
+            return self._done(instance, pure, key, res)
+        except Exception as e:
+            logger.error(f"METHOD.EXEC failed: {e}")
+            return Err(e)
 
+
+def axo_method(
+    wrapped: Optional[Callable[..., R]] = None,
+    *,
+    cache: Union[bool, MethodCache, None] = None,
+    read_only: bool = False,
+) -> Callable[..., Result[R, Exception]]:
+    """
+    Route a method call through the active runtime. Usable bare
+    (``@axo_method``) or with options:
+
+    ``read_only``
+        The method does not mutate the object. Calls to other methods drop the
+        object's cached results.
+    ``cache``
+        Memoize results on the caller side: ``True`` for the process-wide
+        :func:`axo.cache.get_method_cache`, or a :class:`axo.cache.MethodCache`
+        (classes rebuilt from stored source only see the loader's globals, so
+        prefer ``True`` for objects that are persisted and loaded back).
+        Results are cached per ``(axo_key, axo_version, method, args)`` and only
+        when the method is ``read_only`` or the object is
+        (``MetadataX.axo_is_read_only``); errors are never cached. Hits return
+        the cached object itself, not a copy: do not mutate it.
+
+    The method receives the runtime kwargs (``axo_key``, ``storage``…) it
+    names as parameters, or all of them if it takes ``**kwargs``.
+    ``obj.method(...)`` blocks until the result is back; ``await
+    obj.method.aio(...)`` is the non-blocking form and
+    ``obj.method.ref(...)`` leaves the result on the endpoint.
+    """
+    if wrapped is None:
+        return cast(Callable[..., Result[R, Exception]], partial(axo_method, cache=cache, read_only=read_only))
+    method_cache = get_method_cache() if cache is True else (cache if isinstance(cache, MethodCache) else None)
+    _mark(wrapped, "method", read_only=read_only, cache=method_cache)
+    call = _MethodCall(method_cache, read_only, call_kwargs_for(wrapped))
+    return cast(Callable[..., Result[R, Exception]], _AxoMethod(wrapped, call))
@@ -1,7 +1,9 @@
 
+import hashlib
+import cloudpickle as CP
 import humanfriendly as HF
 from pydantic import BaseModel,Field,field_validator,ConfigDict,model_validator
-from typing import ClassVar,Optional,List,Dict,Any,Tuple,Literal,Union,Iterable
+from typing import ClassVar,Optional,List,Dict,Any,Tuple,Literal,Union,Iterable,Iterator
 import os
 import re
 from dataclasses import dataclass,field
@@ -255,6 +257,17 @@ class AxoContext:
     # Field(default={}) # Extra metadata for the run
 
 
+@dataclass(frozen=True)
+class AxoMethodSpec:
+    """One entry of a class' dispatch table (built by ``AxoMeta``)."""
+    name: str
+    fn: Any                                        # the undecorated function
+    kind: Literal["method", "task", "stream"] = "method"
+    inject: frozenset = frozenset()                # runtime kwargs the function can observe
+    read_only: bool = False                        # does not mutate the object
+    cache: Any = None                              # axo.cache.MethodCache memoizing its results
+
+
 
 # axo/materialize.py
 
@@ -299,6 +312,21 @@ class BallRef(BaseModel):
     tags: Dict[str, str] = Field(default_factory=dict)
     chunks: Tuple[ChunkRef, ...] = Field(default_factory=tuple)
 
+    @classmethod
+    def for_data(cls, data: bytes, content_type: str, *, bucket_id: str, key: str, **fields: Any) -> "BallRef":
+        """Reference to *data*, stored in one chunk at *bucket_id*/*key*."""
+        checksum = hashlib.sha256(data).hexdigest()
+        return cls(
+            bucket_id    = bucket_id,
+            key          = key,
+            ball_id      = key,
+            size         = len(data),
+            checksum     = checksum,
+            content_type = content_type,
+            chunks       = (ChunkRef(index=0, size=len(data), checksum=checksum),),
+            **fields,
+        )
+
     # ---------- JSON helpers ----------
 
     def to_json(self, **kwargs) -> str:
@@ -451,6 +479,45 @@ class AxoPointer:
                 AxoErrorType.VALIDATION_FAILED,
                 f"invalid max_bytes='{max_bytes}': {e}",
             ))
+    async def value(self, chunk_size: str = "4MB") -> Result[Any, AxoError]:
+        """Like :meth:`into_bytes`, decoded: a stored method result comes back as the value."""
+        r = await self.into_bytes(chunk_size=chunk_size)
+        if r.is_err:
+            return r
+        try:
+            return Ok(decode_result(r.unwrap(), self._ref.content_type))
+        except Exception as e:
+            return Err(AxoError.make(AxoErrorType.GET_DATA_FAILED, f"{self._ref.bucket_id}/{self._ref.key}: {e}"))
+
+    async def chunks(self, chunk_size: str = "4MB") -> Result[Iterator[bytes], AxoError]:
+        """Stream the Ball as *chunk_size* blocks (does not consume the pointer)."""
+        err = self._ensure_alive()
+        if err is not None:
+            return err  # type: ignore[return-value]
+        r = await self._storage.get_chunks(bucket_id=self._ref.bucket_id, key=self._ref.key, chunk_size=chunk_size)
+        if r.is_err:
+            return Err(AxoError.make(AxoErrorType.GET_DATA_FAILED, str(r.unwrap_err())))
+        return r
+
+    async def read_range(self, start: int, end: Optional[int] = None, chunk_size: str = "4MB") -> Result[bytes, AxoError]:
+        """Bytes ``[start, end)`` of the Ball, read chunk by chunk (does not consume the pointer)."""
+        end = self._ref.size if end is None else min(end, self._ref.size)
+        if start < 0 or start > end:
+            return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"invalid range [{start}, {end}) of {self._ref.size} bytes"))
+        r = await self.chunks(chunk_size=chunk_size)
+        if r.is_err:
+            return r
+        out = bytearray()
+        offset = 0
+        for chunk in r.unwrap():
+            lo, hi = max(start - offset, 0), min(end - offset, len(chunk))
+            if lo < hi:
+                out += chunk[lo:hi]
+            offset += len(chunk)
+            if offset >= end:
+                break
+        return Ok(bytes(out))
+
     async def as_memoryview(
         self,
         max_bytes: Union[int,str] = "256kb",
@@ -526,3 +593,41 @@ def make_pointer(
 ) -> AxoPointer:
     return AxoPointer(storage, ref, consume=consume, delete_remote=delete_remote)
 
+
+
+# content type of a stored method result; raw ``bytes`` results are stored as is
+RESULT_PICKLE_CONTENT_TYPE = "application/vnd.axo.cloudpickle"
+
+
+def encode_result(value: Any) -> Tuple[bytes, str]:
+    """The stored form of a method result and its content type."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value), "application/octet-stream"
+    return CP.dumps(value), RESULT_PICKLE_CONTENT_TYPE
+
+
+def decode_result(data: bytes, content_type: str) -> Any:
+    return CP.loads(data) if content_type == RESULT_PICKLE_CONTENT_TYPE else data
+
+
+class ResultRef(BallRef):
+    """
+    A method result kept on the endpoint side: asked for with
+    ``obj.method.ref(...)``, or *spilled* to the object's sink bucket because
+    it was larger than the caller's inline limit. Passed as an argument to
+    another ``@axo_method`` call, the endpoint loads it itself, so the value
+    never goes through the client.
+    """
+    endpoint_id: Optional[str] = None
+    spilled: bool = False
+
+    async def aget(self, storage: StorageService) -> Result[Any, AxoError]:
+        """Fetch the value from *storage*."""
+        return await self.to_pointer(storage).value()
+
+
+class CallRef(BaseModel):
+    """The result of an earlier call of the same ``METHOD_EXEC_BATCH`` message."""
+    model_config = ConfigDict(frozen=True)
+
+    index: int = Field(ge=0)
@@ -0,0 +1,232 @@
+"""
+axo/endpoint/autoscaler.py
+~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Metric-driven scaling of the endpoints of a
+:class:`~axo.endpoint.manager.DistributedEndpointManager`.
+
+Every ``interval`` (or on each :meth:`Autoscaler.step`) the autoscaler reads
+what the clients of each endpoint see: requests in flight, requests queued
+for a socket and latency percentiles over the last ``window``. It sizes the
+pool so that each endpoint carries about ``target_outstanding`` requests,
+and adds one endpoint while the p99 latency of any of them is over
+``max_latency``. The new size goes to the middleware through
+:meth:`~axo.endpoint.endpoint.DistributedEndpoint.elasticity`, and the
+endpoints it reports are added to or removed from the manager.
+
+Scaling up waits ``scale_up_cooldown`` after the last scale up; scaling down
+waits ``scale_down_cooldown`` after any change and drops one endpoint at a
+time, so a burst never makes the pool flap.
+"""
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+import humanfriendly as hf
+from option import Err, Ok, Result
+
+from axo.endpoint.balancer import load_of
+from axo.errors import AxoError, AxoErrorType
+from axo.log import get_logger
+
+logger = get_logger(
+    name  = __name__ ,
+    ltype = os.environ.get("AXO_LOG_TYPE","json") ,
+    debug = os.environ.get("AXO_DEBUG","1")== "1",
+    path  = os.environ.get("AXO_LOG_PATH","/log") ,
+)
+
+
+@dataclass(frozen=True)
+class EndpointMetrics:
+    endpoint_id: str
+    outstanding: int           # requests in flight
+    queued: int                # blocking requests waiting for a socket
+    p50_s: Optional[float]     # None: no reply within the window
+    p99_s: Optional[float]
+
+
+class Autoscaler:
+    """
+    Scales *manager*'s endpoints between ``min_endpoints`` and
+    ``max_endpoints``. ``controller`` is the endpoint whose middleware
+    receives the ELASTICITY requests; by default the manager picks one.
+
+    Only endpoints the middleware has reported are ever removed; endpoints
+    added to the manager by hand are left alone.
+    """
+
+    def __init__(
+        self,
+        manager: Any,
+        *,
+        controller: Any = None,
+        min_endpoints: int = 1,
+        max_endpoints: int = 8,
+        target_outstanding: float = 4.0,
+        max_latency: str = "500ms",
+        window: str = "30s",
+        scale_up_cooldown: str = "10s",
+        scale_down_cooldown: str = "60s",
+        interval: str = "1s",
+    ) -> None:
+        if not 0 <= min_endpoints <= max_endpoints:
+            raise ValueError(f"Expected 0 <= min_endpoints <= max_endpoints, got {min_endpoints} and {max_endpoints}")
+        self.manager = manager
+        self.controller = controller
+        self.min_endpoints = min_endpoints
+        self.max_endpoints = max_endpoints
+        self.target_outstanding = target_outstanding
+        self.max_latency_s = hf.parse_timespan(max_latency)
+        self.window_s = hf.parse_timespan(window)
+        self.scale_up_cooldown_s = hf.parse_timespan(scale_up_cooldown)
+        self.scale_down_cooldown_s = hf.parse_timespan(scale_down_cooldown)
+        self.interval_s = hf.parse_timespan(interval)
+        self.elastic_ids: Set[str] = set()  # endpoints the middleware reported
+        self._last_up = self._last_down = -math.inf
+        self._lock = threading.Lock()       # one step at a time
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------ #
+    # Decisions
+    # ------------------------------------------------------------------ #
+    def metrics(self) -> Dict[str, EndpointMetrics]:
+        out: Dict[str, EndpointMetrics] = {}
+        for eid, ep in list(self.manager.endpoints.items()):
+            load = load_of(ep)
+            out[eid] = EndpointMetrics(
+                endpoint_id = eid,
+                outstanding = load.outstanding,
+                queued      = getattr(ep, "queued", 0),
+                p50_s       = load.percentile(50, self.window_s),
+                p99_s       = load.percentile(99, self.window_s),
+            )
+        return out
+
+    def desired(self, metrics: Dict[str, EndpointMetrics]) -> int:
+        """The pool size *metrics* call for, within the bounds."""
+        n = len(metrics)
+        want = math.ceil(sum(m.outstanding + m.queued for m in metrics.values()) / self.target_outstanding)
+        if any(m.p99_s is not None and m.p99_s > self.max_latency_s for m in metrics.values()):
+            want = max(want, n + 1)
+        return max(self.min_endpoints, min(self.max_endpoints, want))
+
+    def step(self) -> Result[int, Exception]:
+        """Scale once if the metrics and the cooldowns allow it; Ok(the pool size)."""
+        with self._lock:
+            metrics = self.metrics()
+            n = len(metrics)
+            want = self.desired(metrics)
+            now = time.monotonic()
+            if want > n and now - self._last_up >= self.scale_up_cooldown_s:
+                return self._scale_to(want, n, metrics)
+            if want < n and now - max(self._last_up, self._last_down) >= self.scale_down_cooldown_s:
+                return self._scale_to(n - 1, n, metrics)
+            return Ok(n)
+
+    # ------------------------------------------------------------------ #
+    # Scaling
+    # ------------------------------------------------------------------ #
+    def scale_to(self, rf: int) -> Result[int, Exception]:
+        """Ask for *rf* endpoints now, ignoring metrics and cooldowns."""
+        with self._lock:
+            return self._scale_to(rf, len(self.manager.endpoints), self.metrics())
+
+    def _scale_to(self, rf: int, n: int, metrics: Dict[str, EndpointMetrics]) -> Result[int, Exception]:
+        controller = self.controller or self.manager.get_endpoint()
+        if controller is None:
+            return Err(AxoError.make(AxoErrorType.NOT_FOUND, "Autoscaler: no endpoint to send ELASTICITY to"))
+        t1 = time.time()
+        res = controller.elasticity(rf=rf)
+        if res.is_err:
+            logger.error({"event": "AUTOSCALER.SCALE.FAILED", "from": n, "to": rf, "detail": str(res.unwrap_err())})
+            return Err(res.unwrap_err())
+        added, removed = self._sync(res.unwrap(), controller)
+        size = len(self.manager.endpoints)
+        now = time.monotonic()
+        if size > n:
+            self._last_up = now
+        elif size < n:
+            self._last_down = now
+        logger.info({
+            "event": "AUTOSCALER.SCALE",
+            "from": n,
+            "to": size,
+            "added": added,
+            "removed": removed,
+            "outstanding": sum(m.outstanding for m in metrics.values()),
+            "queued": sum(m.queued for m in metrics.values()),
+            "max_p99": max((m.p99_s for m in metrics.values() if m.p99_s is not None), default=None),
+            "response_time": time.time() - t1,
+        })
+        return Ok(size)
+
+    def _sync(self, running: List[Dict[str, Any]], controller: Any):
+        """Make the manager hold the endpoints the middleware runs."""
+        added: List[str] = []
+        removed: List[str] = []
+        ids: Set[str] = set()
+        new: List[Dict[str, Any]] = []
+        for desc in running:
+            eid = desc.get("endpoint_id", "")
+            req_res_port = int(desc.get("req_res_port", 0))
+            if not eid or req_res_port <= 0:
+                continue
+            ids.add(eid)
+            if not self.manager.exists(eid):
+                new.append({
+                    "endpoint_id" : eid,
+                    "hostname"    : desc.get("hostname") or controller.hostname,
+                    "req_res_port": req_res_port,
+                    "pubsub_port" : int(desc.get("pub_sub_port", -1)),
+                    "protocol"    : controller.protocol,
+                })
+                added.append(eid)
+        if new:
+            self.manager.add_endpoints(new)  # connected in parallel, sockets warm
+        for eid in self.elastic_ids - ids:
+            ep = self.manager.del_endpoint(eid)
+            if ep is not None:
+                removed.append(eid)
+                if ep is not controller:
+                    ep.close()
+        self.elastic_ids = ids
+        return added, removed
+
+    # ------------------------------------------------------------------ #
+    # Background loop
+    # ------------------------------------------------------------------ #
+    def start(self) -> "Autoscaler":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="axo-autoscaler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            try:
+                self.step()
+            except Exception as e:  # keep watching
+                logger.error({"event": "AUTOSCALER.STEP.FAILED", "detail": str(e)})
+
+    def __enter__(self) -> "Autoscaler":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+
+__all__ = ["Autoscaler", "EndpointMetrics"]
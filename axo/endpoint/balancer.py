@@ -0,0 +1,267 @@
+"""
+axo/endpoint/balancer.py
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Load-balancing policies of :class:`axo.endpoint.manager.DistributedEndpointManager`.
+
+Every :class:`~axo.endpoint.endpoint.DistributedEndpoint` keeps an
+:class:`EndpointLoad`: the requests it has in flight and an EWMA of their
+latency, measured around each request/reply. A :class:`BalancingPolicy`
+picks the endpoint of a call that names none from the manager's list of
+endpoint ids, without copying it:
+
+* ``round_robin`` – :class:`RoundRobin`, each endpoint in turn.
+* ``least_outstanding`` – :class:`LeastOutstanding`, fewest requests in flight.
+* ``ewma`` – :class:`EwmaLatency`, lowest latency EWMA.
+* ``p2c`` – :class:`PowerOfTwoChoices`, the less loaded of two random
+  endpoints (EWMA latency weighted by requests in flight), in O(1).
+* ``rendezvous`` – :class:`Rendezvous`, object affinity: the endpoint is a
+  function of the object's ``axo_bucket_id:axo_key`` (see :func:`affinity_key`),
+  so every client sends an object to the endpoint where it is already loaded.
+
+Endpoints not measured yet look idle, so they get traffic and samples early.
+Endpoints that are not :func:`available` (down, or behind an open circuit
+breaker) are skipped while any other one is.
+"""
+from __future__ import annotations
+
+import hashlib
+import itertools
+import math
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Mapping, Optional, Sequence, Tuple, Type, Union
+
+
+class EndpointLoad:
+    """
+    Requests in flight to one endpoint, an EWMA of their latency and the
+    latest ``window`` latencies, for percentiles.
+    """
+
+    __slots__ = ("alpha", "outstanding", "ewma_s", "requests", "errors", "_recent", "_lock")
+
+    def __init__(self, alpha: float = 0.3, window: int = 512) -> None:
+        self.alpha = alpha
+        self.outstanding = 0
+        self.ewma_s: Optional[float] = None  # None until the first reply
+        self.requests = 0
+        self.errors = 0
+        self._recent: Deque[Tuple[float, float]] = deque(maxlen=window)  # (done at, latency)
+        self._lock = threading.Lock()
+
+    def begin(self) -> None:
+        with self._lock:
+            self.outstanding += 1
+
+    def end(self, latency_s: float, ok: bool = True) -> None:
+        """One request done after *latency_s* seconds (failures and timeouts count too)."""
+        with self._lock:
+            self.outstanding -= 1
+            self.requests += 1
+            self.errors += not ok
+            self.ewma_s = latency_s if self.ewma_s is None else self.alpha * latency_s + (1 - self.alpha) * self.ewma_s
+            self._recent.append((time.monotonic(), latency_s))
+
+    def percentile(self, q: float, window_s: Optional[float] = None) -> Optional[float]:
+        """
+        The *q*-th percentile (0-100, nearest rank) of the latest latencies,
+        only those of the last *window_s* seconds if given; None without any.
+        """
+        with self._lock:
+            recent = list(self._recent)
+        if window_s is not None:
+            since = time.monotonic() - window_s
+            latencies = sorted(lat for t, lat in recent if t >= since)
+        else:
+            latencies = sorted(lat for _, lat in recent)
+        if not latencies:
+            return None
+        rank = max(1, math.ceil(q / 100 * len(latencies)))
+        return latencies[min(rank, len(latencies)) - 1]
+
+    @property
+    def latency_s(self) -> float:
+        return self.ewma_s or 0.0
+
+    @property
+    def cost(self) -> float:
+        """Expected wait of one more request: the EWMA times the requests it queues behind."""
+        return self.latency_s * (self.outstanding + 1)
+
+    def __repr__(self) -> str:
+        return f"EndpointLoad(outstanding={self.outstanding}, ewma_s={self.ewma_s}, requests={self.requests}, errors={self.errors})"
+
+
+_IDLE = EndpointLoad()
+
+
+def load_of(endpoint: Any) -> EndpointLoad:
+    """The :class:`EndpointLoad` of *endpoint*; endpoints that keep none look idle."""
+    return getattr(endpoint, "load", None) or _IDLE
+
+
+def available(endpoint: Any) -> bool:
+    return endpoint is not None and getattr(endpoint, "available", True)
+
+
+def _best(ids: Sequence[str], endpoints: Mapping[str, Any], score: Callable[[Any], float]) -> str:
+    """The available endpoint of lowest *score* (any endpoint if none is available)."""
+    best, best_score = None, math.inf
+    for eid in ids:
+        ep = endpoints.get(eid)
+        if available(ep):
+            value = score(ep)
+            if best is None or value < best_score:
+                best, best_score = eid, value
+    return best if best is not None else min(ids, key=lambda eid: score(endpoints.get(eid)))
+
+
+def affinity_key(ao: Any) -> str:
+    """The key an object is routed by: ``axo_bucket_id:axo_key``."""
+    return f"{ao.get_axo_bucket_id()}:{ao.get_axo_key()}"
+
+
+class BalancingPolicy(ABC):
+    """
+    Chooses one of *ids*, the keys of *endpoints*, for a call that names no
+    endpoint; *key* is the :func:`affinity_key` of the call's object, if any.
+    """
+
+    name: str = ""
+
+    @abstractmethod
+    def pick(self, ids: Sequence[str], endpoints: Mapping[str, Any], key: Optional[str] = None) -> str: ...
+
+
+class RoundRobin(BalancingPolicy):
+    name = "round_robin"
+
+    def __init__(self) -> None:
+        self._counter = itertools.count()
+
+    def pick(self, ids: Sequence[str], endpoints: Mapping[str, Any], key: Optional[str] = None) -> str:
+        n = len(ids)
+        start = next(self._counter)
+        for i in range(start, start + n):
+            eid = ids[i % n]
+            if available(endpoints.get(eid)):
+                return eid
+        return ids[start % n]
+
+
+class LeastOutstanding(BalancingPolicy):
+    name = "least_outstanding"
+
+    def pick(self, ids: Sequence[str], endpoints: Mapping[str, Any], key: Optional[str] = None) -> str:
+        return _best(ids, endpoints, lambda ep: load_of(ep).outstanding)
+
+
+class EwmaLatency(BalancingPolicy):
+    name = "ewma"
+
+    def pick(self, ids: Sequence[str], endpoints: Mapping[str, Any], key: Optional[str] = None) -> str:
+        return _best(ids, endpoints, lambda ep: load_of(ep).latency_s)
+
+
+class PowerOfTwoChoices(BalancingPolicy):
+    name = "p2c"
+
+    def __init__(self, rng: Optional[random.Random] = None) -> None:
+        self._rng = rng or random.Random()
+
+    def pick(self, ids: Sequence[str], endpoints: Mapping[str, Any], key: Optional[str] = None) -> str:
+        n = len(ids)
+        if n == 1:
+            return ids[0]
+        i = self._rng.randrange(n)
+        j = self._rng.randrange(n - 1)
+        a, b = ids[i], ids[j + (j >= i)]  # two distinct endpoints
+        ea, eb = endpoints.get(a), endpoints.get(b)
+        ok_a, ok_b = available(ea), available(eb)
+        if ok_a and ok_b:
+            return b if load_of(eb).cost < load_of(ea).cost else a
+        if ok_a or ok_b:
+            return a if ok_a else b
+        return _best(ids, endpoints, lambda ep: load_of(ep).cost)  # both out: look at all
+
+
+_M64 = (1 << 64) - 1
+
+
+def _hash64(s: str) -> int:
+    """Stable across processes, unlike :func:`hash`, so all clients agree."""
+    return int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "little")
+
+
+def _mix64(x: int) -> int:
+    """splitmix64 finalizer."""
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _M64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _M64
+    return x ^ (x >> 31)
+
+
+class Rendezvous(BalancingPolicy):
+    """
+    Rendezvous (highest random weight) hashing of the affinity key: each
+    endpoint gets a pseudo-random weight per key and the heaviest one wins.
+    Removing an endpoint moves only the objects it owned, and adding one
+    only the objects it now wins. Calls without a key go to *fallback*.
+    """
+
+    name = "rendezvous"
+
+    def __init__(self, fallback: Union[str, BalancingPolicy] = "round_robin") -> None:
+        self.fallback = make_policy(fallback)
+        self._endpoint_hashes: Dict[str, int] = {}
+
+    def pick(self, ids: Sequence[str], endpoints: Mapping[str, Any], key: Optional[str] = None) -> str:
+        if key is None:
+            return self.fallback.pick(ids, endpoints)
+        h = _hash64(key)
+        hashes = self._endpoint_hashes
+        best, best_weight = ids[0], -math.inf
+        for eid in ids:
+            eh = hashes.get(eid)
+            if eh is None:
+                eh = hashes[eid] = _hash64(eid)
+            weight = _mix64(h ^ eh)
+            if not available(endpoints.get(eid)):
+                weight -= _M64 + 1  # below every available endpoint: the next in line takes over
+            if weight > best_weight:
+                best, best_weight = eid, weight
+        return best
+
+
+POLICIES: Dict[str, Type[BalancingPolicy]] = {
+    p.name: p for p in (RoundRobin, LeastOutstanding, EwmaLatency, PowerOfTwoChoices, Rendezvous)
+}
+
+
+def make_policy(policy: Union[str, BalancingPolicy]) -> BalancingPolicy:
+    """A policy instance from its name, or *policy* itself."""
+    if isinstance(policy, BalancingPolicy):
+        return policy
+    try:
+        return POLICIES[policy]()
+    except KeyError:
+        raise ValueError(f"Unknown balancing policy {policy!r}, expected one of {sorted(POLICIES)}") from None
+
+
+__all__ = [
+    "BalancingPolicy",
+    "EndpointLoad",
+    "EwmaLatency",
+    "LeastOutstanding",
+    "POLICIES",
+    "PowerOfTwoChoices",
+    "Rendezvous",
+    "RoundRobin",
+    "affinity_key",
+    "available",
+    "load_of",
+    "make_policy",
+]
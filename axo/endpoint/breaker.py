@@ -0,0 +1,151 @@
+"""
+axo/endpoint/breaker.py
+~~~~~~~~~~~~~~~~~~~~~~~
+
+Per-endpoint circuit breaker.
+
+Every :class:`~axo.endpoint.endpoint.DistributedEndpoint` records the
+outcome of its requests – a timeout or transport error is a failure, an
+error reply from the endpoint is not – in a :class:`CircuitBreaker`:
+
+* ``closed`` – requests flow. Once ``min_calls`` of the last ``window``
+  requests have been seen and at least ``failure_rate`` of them failed, the
+  breaker opens.
+* ``open`` – requests fail at once and the manager routes new calls to
+  other endpoints. After ``open_for`` a background timer calls ``probe``
+  (a PING), off the request path; the breaker stays open until a probe
+  succeeds.
+* ``half_open`` – requests flow again as trials: ``half_open_successes``
+  successes in a row close the breaker, one failure opens it again.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+import humanfriendly as hf
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        probe: Optional[Callable[[], bool]] = None,
+        *,
+        failure_rate: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        open_for: str = "5s",
+        half_open_successes: int = 2,
+    ) -> None:
+        self.probe = probe
+        self.failure_rate = failure_rate
+        self.min_calls = max(1, min_calls)
+        self.open_for_s = hf.parse_timespan(open_for)
+        self.half_open_successes = max(1, half_open_successes)
+        self.state = CLOSED
+        self.opened_at: Optional[float] = None
+        self.trips = 0
+        self._outcomes: Deque[bool] = deque(maxlen=max(window, self.min_calls))  # True: failed
+        self._failures = 0
+        self._successes = 0  # in a row, while half open
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------ #
+    # Request path
+    # ------------------------------------------------------------------ #
+    def allow(self) -> bool:
+        return self.state != OPEN
+
+    def retry_after_s(self) -> float:
+        """Seconds until the next probe of an open breaker."""
+        if self.state != OPEN or self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.open_for_s - time.monotonic())
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            if self.state == OPEN:
+                return  # a late outcome of a request sent before it opened
+            if self.state == HALF_OPEN:
+                if not ok:
+                    self._open()
+                    return
+                self._successes += 1
+                if self._successes >= self.half_open_successes:
+                    self._close()
+                return
+            if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+                self._failures -= 1
+            self._outcomes.append(not ok)
+            self._failures += not ok
+            n = len(self._outcomes)
+            if n >= self.min_calls and self._failures / n >= self.failure_rate:
+                self._open()
+
+    def trip(self) -> None:
+        """Open now, e.g. when the endpoint is known to be down."""
+        with self._lock:
+            if self.state != OPEN:
+                self._open()
+
+    # ------------------------------------------------------------------ #
+    # Transitions (hold the lock)
+    # ------------------------------------------------------------------ #
+    def _open(self) -> None:
+        self.state = OPEN
+        self.opened_at = time.monotonic()
+        self.trips += 1
+        self._schedule_probe()
+
+    def _close(self) -> None:
+        self.state = CLOSED
+        self.opened_at = None
+        self._outcomes.clear()
+        self._failures = 0
+
+    def _schedule_probe(self) -> None:
+        if self.probe is None:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.open_for_s, self._run_probe)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _run_probe(self) -> None:
+        with self._lock:
+            if self._timer is None or self.state != OPEN:  # closed meanwhile
+                return
+        try:
+            ok = bool(self.probe())
+        except Exception:
+            ok = False
+        with self._lock:
+            if self._timer is None or self.state != OPEN:
+                return
+            if ok:
+                self.state = HALF_OPEN
+                self._successes = 0
+            else:
+                self.opened_at = time.monotonic()
+                self._schedule_probe()
+
+    def close(self) -> None:
+        """Cancel a pending probe."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(state={self.state}, trips={self.trips})"
+
+
+__all__ = ["CLOSED", "CircuitBreaker", "HALF_OPEN", "OPEN"]
@@ -17,17 +17,20 @@ The module uses :pymod:`option` (Ok / Err / Result) for explicit error handling.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import types,inspect
 import time
+from weakref import WeakKeyDictionary
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict,  TypeVar,TYPE_CHECKING,List
+from typing import Any, Callable, Dict,  TypeVar,TYPE_CHECKING,List,Optional,Tuple
 # from typing import TYPE_CHECKING,List
 # 
 import cloudpickle as cp
 import humanfriendly as hf
 import zmq
+import zmq.asyncio
 from option import Err, Ok, Result
 # 
 from axo.core.decorators import AxoContext
@@ -35,7 +38,11 @@ from axo.core.decorators import AxoContext
 import axo.models as AXOMODELS
 from axo.enums import AxoOperationType
 from axo.storage.types import AxoStorageMetadata
-from axo.core.models import BallRef
+from axo.core.models import BallRef, ResultRef
+from axo.errors import AxoError, AxoErrorType
+from axo.endpoint.balancer import EndpointLoad
+from axo.endpoint.breaker import CircuitBreaker
+from axo.endpoint.transport import DealerChannel, Heartbeat, SocketPool, dealer_request
 
 if TYPE_CHECKING:
     from axo.core.axo import Axo  # type-only; not executed at runtime
@@ -97,6 +104,10 @@ class EndpointX(ABC):
     @abstractmethod
     def put(self, key: str, value: AXOMODELS.MetadataX) -> Result[str, Exception]: ...
 
+    async def aput(self, key: str, value: AXOMODELS.MetadataX) -> Result[str, Exception]:
+        """Awaitable :meth:`put`; runs it inline unless overridden."""
+        return self.put(key=key, value=value)
+
     @abstractmethod
     def get(self, key: str) -> Result[AXOMODELS.MetadataX, Exception]: ...
 
@@ -112,6 +123,53 @@ class EndpointX(ABC):
         fkwargs: dict[str, Any] = {},
     ) -> Result[Any, Exception]: ...
 
+    async def amethod_execution(
+        self,
+        *,
+        key: str,
+        fname: str,
+        ao: Axo,
+        fargs: list[Any] | None = None,
+        fkwargs: dict[str, Any] | None = None,
+    ) -> Result[Any, Exception]:
+        """Awaitable :meth:`method_execution`; runs it inline unless overridden."""
+        return self.method_execution(key=key, fname=fname, ao=ao, fargs=fargs, fkwargs=fkwargs)
+
+    def method_execution_ref(
+        self,
+        *,
+        key: str,
+        fname: str,
+        ao: Axo,
+        fargs: list[Any] | None = None,
+        fkwargs: dict[str, Any] | None = None,
+    ) -> Result[Any, Exception]:
+        """
+        :meth:`method_execution` leaving the result on the endpoint: returns a
+        :class:`ResultRef` to it. Endpoints that cannot keep results (the
+        default) return the value itself.
+        """
+        return self.method_execution(key=key, fname=fname, ao=ao, fargs=fargs, fkwargs=fkwargs)
+
+    def method_execution_batch(
+        self, calls: List[Tuple[Axo, str, List[Any], Dict[str, Any], Optional[str]]]
+    ) -> Result[List[Result[Any, Exception]], Exception]:
+        """
+        Run ``(ao, fname, fargs, fkwargs, result_mode)`` *calls* and return
+        one Result per call, in order; a :class:`CallRef` argument stands for
+        the result of an earlier call. Calls them one by one unless overridden.
+        """
+        results: List[Result[Any, Exception]] = []
+        for ao, fname, fargs, fkwargs, result_mode in calls:
+            args = AXOMODELS.resolve_args(list(fargs or []), dict(fkwargs or {}), results=results)
+            if args.is_err:
+                results.append(Err(args.unwrap_err()))
+                continue
+            fargs, fkwargs = args.unwrap()
+            run = self.method_execution_ref if result_mode == "ref" else self.method_execution
+            results.append(run(key=ao.get_axo_key(), fname=fname, ao=ao, fargs=fargs, fkwargs=fkwargs))
+        return Ok(results)
+
     @abstractmethod
     def task_execution(
         self,
@@ -231,7 +289,24 @@ class DistributedEndpoint(EndpointX):
     """
     Endpoint that communicates with a remote Axo middleware via ZeroMQ.
 
-    * REQ/REP socket for RPC (metadata, code upload, elasticity, etc.).
+    * DEALER sockets for RPC (metadata, code upload, elasticity, etc.);
+      replies are matched by ``msg_id`` (see :mod:`axo.endpoint.transport`),
+      so a timeout never forces a reconnect. Blocking calls check a socket
+      out of a bounded pool, so threads can call in parallel; awaited calls
+      share one socket per event loop.
+    * A background :class:`~axo.endpoint.transport.Heartbeat` on a socket of
+      its own tracks liveness: it pings only when the endpoint has been quiet
+      for ``heartbeat_interval``, and after ``max_retries`` missed pings it
+      marks the endpoint down and reconnects with jittered exponential
+      backoff. Requests never wait for a ping once the endpoint is known to
+      be up, and fail at once while it is down.
+    * ``load`` – an :class:`~axo.endpoint.balancer.EndpointLoad` with the
+      requests in flight and their latency EWMA, for the manager's
+      balancing policy.
+    * ``breaker`` – a :class:`~axo.endpoint.breaker.CircuitBreaker` fed by
+      the transport outcome of every request. While it is open requests
+      fail at once and the manager skips the endpoint; it is probed with a
+      PING in the background.
     * PUB/SUB socket (future use) for streaming data or events.
     """
 
@@ -247,9 +322,15 @@ class DistributedEndpoint(EndpointX):
         publisher_hostname: str = "*",
         pubsub_port: int = 16666,
         req_res_port: int = 16667,
-        max_health_ping_time: str = "1h",
+        heartbeat_interval: str = "5s",
+        heartbeat_timeout: str = "2s",
+        max_backoff: str = "30s",
         max_recv_timeout: str = "120s",
-        max_retries: int = 10,
+        max_retries: int = 3,
+        max_sockets: int = 8,
+        socket_idle_timeout: str = "60s",
+        max_inline_result: str | None = "64MB",
+        circuit_breaker: CircuitBreaker | None = None,
     ) -> None:
         super().__init__(
             protocol=protocol,
@@ -272,94 +353,195 @@ class DistributedEndpoint(EndpointX):
             else f"{protocol}://{hostname}"
         )
 
-        # ZMQ sockets
-        self._ctx: zmq.Context | None = None
-        self._req: zmq.Socket | None = None
-
-        # Health / retry
-        self._last_ping_at: float = -1
-        self._ping_interval = hf.parse_timespan(max_health_ping_time)
-        self._max_retries = max_retries
+        # blocking DEALER sockets, one per thread in flight
+        self._pool = SocketPool(self.reqres_uri, maxsize=max_sockets, idle_timeout_s=hf.parse_timespan(socket_idle_timeout))
+
+        # liveness, shared by every socket of the endpoint
+        self._heartbeat = Heartbeat(
+            self.reqres_uri,
+            self._probe,
+            interval_s    = hf.parse_timespan(heartbeat_interval),
+            timeout_s     = hf.parse_timespan(heartbeat_timeout),
+            max_misses    = max_retries,
+            max_backoff_s = hf.parse_timespan(max_backoff),
+        )
         self._recv_timeout_ms = int(hf.parse_timespan(max_recv_timeout) * 1000)
-        self._connected = False
+        # larger results stay in the object's sink bucket; the reply carries a ResultRef
+        self._max_inline_bytes = None if max_inline_result is None else int(hf.parse_size(max_inline_result))
+
+        # multiplexed zmq.asyncio channel for the awaitable calls, one per event loop
+        self._actx: zmq.asyncio.Context | None = None
+        self._channels: "WeakKeyDictionary[asyncio.AbstractEventLoop, DealerChannel]" = WeakKeyDictionary()
+
+        # requests in flight & latency, measured around every request/reply
+        self.load = EndpointLoad()
+        # transport failures open it; probed off the request path
+        self.breaker = circuit_breaker or CircuitBreaker()
+        if self.breaker.probe is None:
+            self.breaker.probe = self._breaker_probe
 
     # ------------------------------------------------------------------ #
     # Connection management
     # ------------------------------------------------------------------ #
     def _ensure_connection(self) -> bool:
-        """Try to (re)connect the REQ socket. Returns True on success."""
-        tries = 0
-        while not self._connected and tries < self._max_retries:
-            try:
-                if self._ctx is None:
-                    self._ctx = zmq.Context()
-                if self._req is None:
-                    self._req = self._ctx.socket(zmq.REQ)
-                    self._req.setsockopt(zmq.RCVTIMEO, self._recv_timeout_ms)
-                    self._req.connect(self.reqres_uri)
-
-                # Ping
-                if (
-                    self._last_ping_at == -1
-                    or time.time() - self._last_ping_at >= self._ping_interval
-                ):
-                    self._req.send_multipart(AXOMODELS.Ping().to_frames() )
-                    _ = self._req.recv_multipart()
-                    self._last_ping_at = time.time()
-                    self._connected = True
-                    logger.debug("Connected to %s", self.reqres_uri)
-            except Exception as exc:
-                logger.warning("Retry %d/%d: %s", tries + 1, self._max_retries, exc)
-                self._cleanup()
-            finally:
-                tries += 1
-        return self._connected
+        """True when the heartbeat says the endpoint is up; the first call waits for its verdict."""
+        return bool(self._heartbeat.alive or self._heartbeat.wait())
+
+    def connect(self, *, timeout_s: Optional[float] = None, sockets: int = 1) -> Result[float, Exception]:
+        """
+        Open up to *sockets* pooled sockets at once and PING on each within
+        *timeout_s*, so the first requests find them connected. Ok(seconds to
+        the first PONG). Starts the heartbeat; an endpoint that does not
+        answer has its circuit opened, so it is skipped until it does.
+        """
+        timeout_s = self._heartbeat.timeout_s if timeout_s is None else timeout_s
+        t1 = time.monotonic()
+        deadline = t1 + timeout_s
+        socks: List[zmq.Socket] = []
+        for _ in range(max(1, min(sockets, self._pool.maxsize))):
+            sock_res = self._pool.acquire(max(0.0, deadline - time.monotonic()))
+            if sock_res.is_err:
+                break
+            socks.append(sock_res.unwrap())  # zmq connects them in the background, in parallel
+        res: Result[Any, Exception] = Err(AxoError.make(AxoErrorType.TIMEOUT, f"no socket to {self.reqres_uri} within {timeout_s}s"))
+        latency: Optional[float] = None
+        for i, sock in enumerate(socks):
+            discard = False
+            if i == 0 or latency is not None:  # the others only once the first one answered
+                msg = AXOMODELS.Ping()
+                remaining = max(0.0, deadline - time.monotonic())
+                res = dealer_request(sock, msg.to_frames(), msg_id=msg.envelope.msg_id, timeout_s=remaining, what=f"PING on {self.endpoint_id}")
+                discard = res.is_err and isinstance(res.unwrap_err(), zmq.ZMQError)
+                if res.is_ok:
+                    res = AXOMODELS.Ping.parse_pong(res.unwrap())
+                if res.is_ok and latency is None:
+                    latency = time.monotonic() - t1
+            self._pool.release(sock, discard=discard)
+        if latency is None:
+            self.breaker.trip()
+        else:
+            self._heartbeat.beat()
+        self._heartbeat.start()
+        return Ok(latency) if latency is not None else Err(res.unwrap_err())
+
+    def _healthy(self) -> bool:
+        return self._heartbeat.alive is True
+
+    @property
+    def available(self) -> bool:
+        """Neither known to be down nor behind an open circuit breaker."""
+        return self.breaker.allow() and self._heartbeat.alive is not False
+
+    def _circuit_open(self, what: str) -> AxoError:
+        return AxoError.make(
+            AxoErrorType.TRANSPORT_ERROR,
+            f"{what} on {self.endpoint_id}: circuit open",
+            retry_after_ms = int(self.breaker.retry_after_s() * 1000),
+        )
+
+    @property
+    def queued(self) -> int:
+        """Blocking requests waiting for a free socket (client-side queue depth)."""
+        return self._pool.waiting
+
+    def _probe(self, sock: zmq.Socket, timeout_s: float) -> bool:
+        """One PING on the heartbeat's own socket."""
+        msg = AXOMODELS.Ping()
+        res = dealer_request(sock, msg.to_frames(), msg_id=msg.envelope.msg_id, timeout_s=timeout_s, what=f"PING on {self.endpoint_id}")
+        if res.is_ok and AXOMODELS.Ping.parse_pong(res.unwrap()).is_ok:
+            if self._heartbeat.alive is not True:
+                logger.debug("Connected to %s", self.reqres_uri)
+            return True
+        logger.warning("Heartbeat to %s failed: %s", self.reqres_uri, res.unwrap_err() if res.is_err else "bad PONG")
+        return False
+
+    def _breaker_probe(self) -> bool:
+        """A PING on a pooled socket, as short as the heartbeat's."""
+        res = self._send(AXOMODELS.Ping(), what="PING", check=False, timeout_s=self._heartbeat.timeout_s)
+        return res.is_ok and AXOMODELS.Ping.parse_pong(res.unwrap()).is_ok
+
+    def _send(self, msg: AXOMODELS.AxoRequestMsg, *, what: str, check: bool = True, timeout_s: Optional[float] = None) -> Result[List[bytes], Exception]:
+        """
+        Blocking request/reply of *msg*. Unless *check* is False it fails at
+        once while the endpoint is down or its circuit is open, and its
+        outcome feeds the circuit breaker.
+        """
+        if check and not self._ensure_connection():
+            return Err(Exception("Unable to connect"))
+        if check and not self.breaker.allow():
+            return Err(self._circuit_open(what))
+        timeout_s = self._recv_timeout_ms / 1000 if timeout_s is None else timeout_s
+        deadline = time.monotonic() + timeout_s  # waiting for a socket counts against it
+        sock_res = self._pool.acquire(timeout_s)
+        if sock_res.is_err:
+            return Err(sock_res.unwrap_err())
+        sock = sock_res.unwrap()
+        # load & latency are the endpoint's: measured from the moment the request can go out
+        self.load.begin()
+        t1 = time.monotonic()
+        res = dealer_request(sock, msg.to_frames(), msg_id=msg.envelope.msg_id, timeout_s=max(0.0, deadline - t1), what=f"{what} on {self.endpoint_id}")
+        self.load.end(time.monotonic() - t1, ok=res.is_ok)
+        if check:
+            self.breaker.record(res.is_ok)
+        # a ZMQ error discards only this socket
+        self._pool.release(sock, discard=res.is_err and isinstance(res.unwrap_err(), zmq.ZMQError))
+        if res.is_ok:
+            self._heartbeat.beat()
+        return res
 
     def _cleanup(self) -> None:
-        """Close sockets & context on error."""
-        if self._req is not None:
-            self._req.close(linger=1)
-        if self._ctx is not None:
-            self._ctx.destroy()
-        self._req = None
-        self._ctx = None
-        self._connected = False
+        """Stop the heartbeat & breaker probes, close the pooled blocking sockets & their context."""
+        self._heartbeat.stop()
+        self.breaker.close()
+        self._pool.close()
+
+    def close(self) -> None:
+        """Close the blocking and the asyncio sockets."""
+        self._cleanup()
+        for channel in list(self._channels.values()):
+            channel.close()
+        self._channels.clear()
+        if self._actx is not None:
+            self._actx.term()
+            self._actx = None
 
 
     def ping(self):
-        try:
-            if not self._ensure_connection():
-                return Err(Exception("Unable to connect"))
-            ping_msg = AXOMODELS.Ping()
-            self._req.send_multipart(ping_msg.to_frames())
-            # self._req.send_multipart([b"axo", b"PING", b"{}"])
-            
-            frames = self._req.recv_multipart()
-            req = AXOMODELS.AxoReplyMsg.from_frames(frames)
-            print("PING_RES",req)
-            return Ok(True)
-        except Exception as e:
-            return Err(e)
+        res = self._send(AXOMODELS.Ping(), what="PING", check=False)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        pong = AXOMODELS.Ping.parse_pong(res.unwrap())
+        if pong.is_err:
+            return Err(pong.unwrap_err())
+        return Ok(True)
     # ------------------------------------------------------------------ #
     # CRUD
     # ------------------------------------------------------------------ #
     def put(self, key: str, value: AXOMODELS.MetadataX) -> Result[str, Exception]:
-        if not self._ensure_connection():
-            return Err(Exception("Unable to connect"))
-
         # payload = json.dumps(value.model_dump()).encode(self.encoding)
         try:
             msg = AXOMODELS.PutMetadata(metadata=value)
-            self._req.send_multipart(msg.to_frames())
-            frames = self._req.recv_multipart()
-            reply_res = AXOMODELS.AxoReplyMsg.from_frames(frames=frames,expect_operation=AxoOperationType.PUT_METADATA)
-            if reply_res.is_err:
-                return Err(reply_res.unwrap_err())
-            (reply,_) = reply_res.unwrap()
-            return Ok(key)
         except Exception as exc:
-            self._cleanup()
             return Err(exc)
+        frames_res = self._send(msg, what="PUT_METADATA")
+        if frames_res.is_err:
+            return Err(frames_res.unwrap_err())
+        reply_res = AXOMODELS.AxoReplyMsg.from_frames(frames=frames_res.unwrap(),expect_operation=AxoOperationType.PUT_METADATA)
+        if reply_res.is_err:
+            return Err(reply_res.unwrap_err())
+        return Ok(key)
+
+    async def aput(self, key: str, value: AXOMODELS.MetadataX) -> Result[str, Exception]:
+        """Non-blocking :meth:`put` on the shared DEALER channel (see :meth:`amethod_execution`)."""
+        if not await self._aensure_connection():
+            return Err(Exception("Unable to connect"))
+        frames_res = await self._arequest(AXOMODELS.PutMetadata(metadata=value), what="PUT_METADATA")
+        if frames_res.is_err:
+            return Err(frames_res.unwrap_err())
+        reply_res = AXOMODELS.AxoReplyMsg.from_frames(frames=frames_res.unwrap(), expect_operation=AxoOperationType.PUT_METADATA)
+        if reply_res.is_err:
+            return Err(reply_res.unwrap_err())
+        return Ok(key)
 
     def get(self, key: str) -> Result[AXOMODELS.MetadataX, Exception]:
         return Err(Exception("GET not implemented yet"))
@@ -378,36 +560,138 @@ class DistributedEndpoint(EndpointX):
         fargs: list[Any] | None = [],
         fkwargs: Dict[str, Any] | None = {},
     ) -> Result[Any, Exception]:
-        if not self._ensure_connection():
-            return Err(Exception("Unable to connect"))
-
         # payload = json.dumps({"key": key, "fname": fname}).encode(self.encoding)
         try:
-            # print("METHO EXECUTION!",fkwargs,fargs)
-            if "storage" in fkwargs:
-                del fkwargs["storage"]
-            msg = AXOMODELS.MethodExecution(
-                method= fname,
-                fargs=fargs,
-                fkwargs=fkwargs,
-                metadata= ao._acx_metadata,
+            msg = self._method_exec_msg(fname=fname, ao=ao, fargs=fargs, fkwargs=fkwargs)
+        except Exception as exc:
+            return Err(exc)
+        frames_res = self._send(msg, what=fname)
+        if frames_res.is_err:
+            return Err(frames_res.unwrap_err())
+        return self._method_exec_result(frames_res.unwrap())
 
+    def method_execution_ref(
+        self,
+        *,
+        key: str,
+        fname: str,
+        ao: Axo,
+        fargs: list[Any] | None = None,
+        fkwargs: Dict[str, Any] | None = None,
+    ) -> Result[Any, Exception]:
+        """METHOD_EXEC with ``result_mode="ref"``: the endpoint keeps the result and replies with a :class:`ResultRef`."""
+        try:
+            msg = self._method_exec_msg(fname=fname, ao=ao, fargs=fargs, fkwargs=fkwargs, result_mode="ref")
+        except Exception as exc:
+            return Err(exc)
+        frames_res = self._send(msg, what=fname)
+        if frames_res.is_err:
+            return Err(frames_res.unwrap_err())
+        return self._method_exec_result(frames_res.unwrap())
+
+    def method_execution_batch(
+        self, calls: List[Tuple[Axo, str, List[Any], Dict[str, Any], Optional[str]]]
+    ) -> Result[List[Result[Any, Exception]], Exception]:
+        """All *calls* in one METHOD_EXEC_BATCH round trip; one Result per call."""
+        if not calls:
+            return Ok([])
+        try:
+            msg = AXOMODELS.MethodExecutionBatch(
+                calls           = [
+                    AXOMODELS.BatchCall(ao._acx_metadata, fname, fargs, self._shipped_kwargs(fkwargs), result_mode)
+                    for ao, fname, fargs, fkwargs, result_mode in calls
+                ],
+                axo_endpoint_id  = self.endpoint_id,
+                max_inline_bytes = self._max_inline_bytes,
             )
-            # print("FRAMES",len(frames))
-            self._req.send_multipart(msg.to_frames())
-            frames = self._req.recv_multipart()
-            reply_res = AXOMODELS.AxoReplyMsg.from_frames(frames=frames,expect_operation=AxoOperationType.METHOD_EXEC)
-            if reply_res.is_err:
-                return Err(reply_res.unwrap_err())
-            (reply,payload) = reply_res.unwrap()
-            f_result = Ok(None)
-            if len(payload) >0:
-                f_result = Ok(cp.loads(payload[0]))
-            return f_result
-  
         except Exception as exc:
-            self._cleanup()
             return Err(exc)
+        frames_res = self._send(msg, what=f"batch of {len(calls)}")
+        if frames_res.is_err:
+            return Err(frames_res.unwrap_err())
+        return AXOMODELS.MethodExecutionBatch.parse_reply(frames_res.unwrap(), len(calls))
+
+    async def amethod_execution(
+        self,
+        *,
+        key: str,
+        fname: str,
+        ao: Axo,
+        fargs: list[Any] | None = None,
+        fkwargs: Dict[str, Any] | None = None,
+    ) -> Result[Any, Exception]:
+        """
+        Non-blocking :meth:`method_execution` over ``zmq.asyncio``. All calls
+        of an event loop share one DEALER channel, so any number of them can
+        be in flight at once.
+        """
+        if not await self._aensure_connection():
+            return Err(Exception("Unable to connect"))
+        try:
+            msg = self._method_exec_msg(fname=fname, ao=ao, fargs=fargs, fkwargs=fkwargs)
+        except Exception as exc:
+            return Err(exc)
+        frames_res = await self._arequest(msg, what=fname)
+        if frames_res.is_err:
+            return Err(frames_res.unwrap_err())
+        return self._method_exec_result(frames_res.unwrap())
+
+    async def _aensure_connection(self) -> bool:
+        """:meth:`_ensure_connection` without blocking the loop while the first verdict is pending."""
+        if self._heartbeat.alive is not None:
+            return self._heartbeat.alive
+        return bool(await asyncio.get_running_loop().run_in_executor(None, self._heartbeat.wait))
+
+    async def _arequest(self, msg: AXOMODELS.AxoRequestMsg, *, what: str) -> Result[List[bytes], Exception]:
+        """Send *msg* on this loop's DEALER channel and await its reply (see :meth:`_send`)."""
+        if not self.breaker.allow():
+            return Err(self._circuit_open(what))
+        try:
+            loop = asyncio.get_running_loop()
+            channel = self._channels.get(loop)
+            if channel is None or channel.closed:
+                if self._actx is None:
+                    self._actx = zmq.asyncio.Context()
+                channel = self._channels[loop] = DealerChannel(self._actx, self.reqres_uri)
+        except Exception as exc:
+            return Err(exc)
+        self.load.begin()
+        t1 = time.monotonic()
+        res = await channel.request(msg.to_frames(), msg_id=msg.envelope.msg_id, timeout_s=self._recv_timeout_ms / 1000, what=f"{what} on {self.endpoint_id}")
+        self.load.end(time.monotonic() - t1, ok=res.is_ok)
+        self.breaker.record(res.is_ok)
+        if res.is_ok:
+            self._heartbeat.beat()
+        return res
+
+    def _method_exec_msg(self, *, fname: str, ao: Axo, fargs: list[Any] | None, fkwargs: Dict[str, Any] | None, result_mode: Optional[str] = None) -> AXOMODELS.MethodExecution:
+        return AXOMODELS.MethodExecution(
+            method           = fname,
+            fargs            = fargs,
+            fkwargs          = self._shipped_kwargs(fkwargs),
+            metadata         = ao._acx_metadata,
+            result_mode      = result_mode,
+            max_inline_bytes = self._max_inline_bytes,
+        )
+
+    @staticmethod
+    def _shipped_kwargs(fkwargs: Dict[str, Any] | None) -> Dict[str, Any]:
+        return {k: v for k, v in (fkwargs or {}).items() if k != "storage"}  # not shipped
+
+    @staticmethod
+    def _method_exec_result(frames: List[bytes]) -> Result[Any, Exception]:
+        reply_res = AXOMODELS.AxoReplyMsg.from_frames(frames=frames,expect_operation=AxoOperationType.METHOD_EXEC)
+        if reply_res.is_err:
+            return Err(reply_res.unwrap_err())
+        (reply,payload) = reply_res.unwrap()
+        if reply.envelope.status != "ok":
+            detail = (reply.envelope.error or {}).get("message", f"{reply.envelope.method} failed")
+            return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, detail))
+        if reply.envelope.result_mode == "ref":
+            return Ok(ResultRef.model_validate_json(payload[0]))
+        if len(payload) >0:
+            return Ok(cp.loads(payload[0]))
+        return Ok(None)
 
     # ------------------------------------------------------------------ #
     # Code / class upload
@@ -425,9 +709,6 @@ class DistributedEndpoint(EndpointX):
     # ------------------------------------------------------------------ #
     
     def task_execution(self,fname:str, ao:Axo, ctx:AxoContext, fargs:List[Any] = [], fkwargs:Dict[str,Any] = {})->Result[Any,Exception]:
-        if not self._ensure_connection():
-            return Err(Exception("Unable to connect"))
-
         try:
             msg = AXOMODELS.TaskExecution(
                 method   = fname,
@@ -438,13 +719,17 @@ class DistributedEndpoint(EndpointX):
             )
 
             
-            self._req.send_multipart(msg.to_frames())
-            frames = self._req.recv_multipart()
+            frames_res = self._send(msg, what=fname)
+            if frames_res.is_err:
+                return Err(frames_res.unwrap_err())
+            frames = frames_res.unwrap()
             reply_res = AXOMODELS.AxoReplyMsg.from_frames(frames=frames,expect_operation=AxoOperationType.TASK_EXEC)
             if reply_res.is_err:
                 return Err(reply_res.unwrap_err())
             (reply,payload) = reply_res.unwrap()
-            print(reply,payload)
+            if reply.envelope.status != "ok":
+                detail = (reply.envelope.error or {}).get("message", f"{reply.envelope.method} failed")
+                return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, detail))
             if len(payload) >0:
                 ball_ref = BallRef.model_validate_json(payload[0])
 
@@ -456,7 +741,6 @@ class DistributedEndpoint(EndpointX):
             # return Ok("TASK_EXCECUTION")
 
         except Exception as exc:
-            self._cleanup()
             return Err(exc)
         # return Ok(2)
         # return super().task_execution(ao, config, fargs, fkwargs)
@@ -466,8 +750,18 @@ class DistributedEndpoint(EndpointX):
     
 
 
-    def elasticity(self, rf: int) -> Result[Any, Exception]:
-        return Err(Exception("ELASTICITY not implemented yet"))
+    def elasticity(self, rf: int) -> Result[List[Dict[str, Any]], Exception]:
+        """
+        Ask the middleware behind this endpoint to run *rf* endpoints in
+        total; Ok(the endpoints it runs afterwards, see
+        :class:`~axo.models.Elasticity`).
+        """
+        if rf < 0:
+            return Err(AxoError.make(AxoErrorType.BAD_REQUEST, f"rf must be >= 0, got {rf}"))
+        frames_res = self._send(AXOMODELS.Elasticity(rf=rf), what="ELASTICITY")
+        if frames_res.is_err:
+            return Err(frames_res.unwrap_err())
+        return AXOMODELS.Elasticity.parse_reply(frames_res.unwrap())
 
     # ------------------------------------------------------------------ #
     # Utility
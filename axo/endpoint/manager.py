@@ -1,6 +1,12 @@
 import random 
-from typing import Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Union
+import humanfriendly as hf
+from option import Ok, Result
 from axo.endpoint.endpoint import LocalEndpoint,DistributedEndpoint
+from axo.endpoint.balancer import BalancingPolicy, make_policy
+from axo.environment import AXO_BALANCING_POLICY
 from abc import ABC 
 import logging
 from axo.types import EndpointManagerP
@@ -21,7 +27,6 @@ class _BaseEndpointManager(ABC):
 
     def __init__(self, *, endpoint_manager_id: str = "") -> None:
         self.endpoint_manager_id = endpoint_manager_id
-        self._rr_counter = 0  # used by round‑robin fallback
 
     # ------------------------------------------------------------------ #
     # Utility
@@ -60,7 +65,7 @@ class LocalEndpointManager(_BaseEndpointManager,EndpointManagerP[LocalEndpoint])
     def exists(self, endpoint_id: str) -> bool:
         return endpoint_id in self.endpoints
 
-    def get_endpoint(self, endpoint_id: str = "") -> LocalEndpoint:
+    def get_endpoint(self, endpoint_id: str = "", key: Optional[str] = None) -> LocalEndpoint:
         # Always return the requested ID (or the *only* one we have)
         if len(self.endpoints) ==0:
             return None
@@ -68,19 +73,26 @@ class LocalEndpointManager(_BaseEndpointManager,EndpointManagerP[LocalEndpoint])
             self.n+= 1 
             return self.endpoints.get(endpoint_id)
         # print("ENDPOITNS",self.endpoints)
-        return list(self.endpoints.values())[self.n % len(self.endpoints)]
+        ep = list(self.endpoints.values())[self.n % len(self.endpoints)]
+        self.n += 1
+        return ep
         # next(iter(self.endpoints.values()))  # first/only element
 
 
 # ============================================================================ #
-# 2. DISTRIBUTED Endpoint manager  (keeps round‑robin behaviour)
+# 2. DISTRIBUTED Endpoint manager
 # ============================================================================ #
 class DistributedEndpointManager(_BaseEndpointManager,EndpointManagerP[DistributedEndpoint]):
     """
     Registry for :class:`DistributedEndpoint` objects.
 
-    * `get_endpoint()` cycles through the list if no ID is provided
-      (simple round‑robin load‑balancing).
+    * `get_endpoint()` asks the balancing ``policy`` (see
+      :mod:`axo.endpoint.balancer`) if no known ID is provided:
+      ``"round_robin"`` (default, ``AXO_BALANCING_POLICY``),
+      ``"least_outstanding"``, ``"ewma"``, ``"p2c"`` or ``"rendezvous"``.
+      ``key`` is the object's affinity key, used by ``"rendezvous"``.
+    * `add_endpoints()` connects to many endpoints at once, within one
+      deadline, and leaves warm sockets in their pools.
     * Port helpers guarantee we never re‑use a port already allocated
       in the same manager instance.
     """
@@ -89,9 +101,12 @@ class DistributedEndpointManager(_BaseEndpointManager,EndpointManagerP[Distribut
         self,
         endpoints: Dict[str, DistributedEndpoint]= {},
         endpoint_manager_id: str = "",
+        policy: Union[str, BalancingPolicy] = AXO_BALANCING_POLICY,
     ) -> None:
         super().__init__(endpoint_manager_id=endpoint_manager_id)
         self.endpoints: Dict[str, DistributedEndpoint] = endpoints 
+        self.policy: BalancingPolicy = make_policy(policy)
+        self._ids: List[str] = list(endpoints)  # what the policy picks from
 
     # ---------------------------- CRUD ---------------------------------
     def add_endpoint(
@@ -103,38 +118,84 @@ class DistributedEndpointManager(_BaseEndpointManager,EndpointManagerP[Distribut
         req_res_port: int,
         protocol: str = "tcp",
     ) -> None:
-        ep = DistributedEndpoint(
-            endpoint_id=endpoint_id,
-            hostname=hostname,
-            pubsub_port=pubsub_port,
-            req_res_port=req_res_port,
-            protocol=protocol,
-        )
-        # Try a ping upfront so we fail fast if unreachable
-        if endpoint_id != self.endpoint_manager_id and not ep._ensure_connection():
-            logger.error(
-                {
-                    "event": "ENDPOINT.UNREACHABLE",
-                    "endpoint_id": endpoint_id,
-                    "hostname": hostname,
-                    "req_res_port": req_res_port,
+        self.add_endpoints([{
+            "endpoint_id": endpoint_id,
+            "hostname": hostname,
+            "pubsub_port": pubsub_port,
+            "req_res_port": req_res_port,
+            "protocol": protocol,
+        }])
+
+    def add_endpoints(
+        self,
+        endpoints: List[Dict[str, Any]],
+        *,
+        timeout: str = "5s",
+        warm_sockets: int = 1,
+    ) -> Dict[str, Result[float, Exception]]:
+        """
+        Register *endpoints* (``DistributedEndpoint`` keyword arguments, as
+        for :meth:`add_endpoint`) after connecting to all of them in
+        parallel: each one PINGs on ``warm_sockets`` pooled sockets, all
+        within ``timeout``. Returns the connect latency in seconds of each
+        endpoint, or why it did not answer; those are registered anyway,
+        with their circuit open until they do.
+        """
+        eps = [DistributedEndpoint(**desc) for desc in endpoints]
+        to_connect = [ep for ep in eps if ep.endpoint_id != self.endpoint_manager_id]
+        timeout_s = hf.parse_timespan(timeout)
+        t1 = time.monotonic()
+        results: Dict[str, Result[float, Exception]] = {}
+        if to_connect:
+            # each connect() stops at the deadline, so none outlives it
+            with ThreadPoolExecutor(max_workers=min(32, len(to_connect)), thread_name_prefix="axo-connect") as pool:
+                futures = {
+                    ep.endpoint_id: pool.submit(ep.connect, timeout_s=max(0.0, t1 + timeout_s - time.monotonic()), sockets=warm_sockets)
+                    for ep in to_connect
                 }
-            )
-        self.endpoints[endpoint_id] = ep
+            results = {eid: f.result() for eid, f in futures.items()}
+        for ep in eps:
+            res = results.get(ep.endpoint_id, Ok(0.0))
+            if res.is_err:
+                logger.error(
+                    {
+                        "event": "ENDPOINT.UNREACHABLE",
+                        "endpoint_id": ep.endpoint_id,
+                        "hostname": ep.hostname,
+                        "req_res_port": ep.req_res_port,
+                        "detail": str(res.unwrap_err()),
+                    }
+                )
+            self.endpoints[ep.endpoint_id] = ep
+        self._ids = list(self.endpoints)
+        logger.debug(
+            {
+                "event": "ENDPOINTS.ADDED",
+                "n": len(eps),
+                "connected": sum(res.is_ok for res in results.values()),
+                "latencies": {eid: res.unwrap() for eid, res in results.items() if res.is_ok},
+                "response_time": time.monotonic() - t1,
+            }
+        )
+        return results
 
     def del_endpoint(self, endpoint_id: str) -> DistributedEndpoint :
-        return self.endpoints.pop(endpoint_id, None)
+        ep = self.endpoints.pop(endpoint_id, None)
+        self._ids = list(self.endpoints)
+        return ep
 
     def exists(self, endpoint_id: str) -> bool:
         return endpoint_id in self.endpoints
 
-    def get_endpoint(self, endpoint_id: str = "") -> DistributedEndpoint:
+    def get_endpoint(self, endpoint_id: str = "", key: Optional[str] = None) -> DistributedEndpoint:
         if endpoint_id and endpoint_id in self.endpoints:
             return self.endpoints[endpoint_id]
-        # Round‑robin fallback
-        ep = list(self.endpoints.values())[self._rr_counter % len(self.endpoints)]
-        self._rr_counter += 1
-        return ep
+        ids = self._ids
+        if len(ids) != len(self.endpoints):  # the dict was changed directly
+            ids = self._ids = list(self.endpoints)
+        if not ids:
+            return None
+        return self.endpoints.get(self.policy.pick(ids, self.endpoints, key))
 
     # -------------------------- Port helpers ---------------------------
     def get_available_req_res_port(self) -> int:
@@ -0,0 +1,391 @@
+"""
+axo/endpoint/server.py
+~~~~~~~~~~~~~~~~~~~~~~
+
+In-process implementation of the endpoint side of the axo wire protocol,
+for tests and benchmarks of the distributed path without the middleware.
+
+:class:`AxoEndpointServer` binds a ZMQ ROUTER (loopback by default) and
+serves ``PING``, ``PUT_METADATA``, ``METHOD_EXEC``, ``METHOD_EXEC_BATCH``
+and ``TASK_EXEC``. One I/O thread owns the ROUTER; requests run on a pool of
+*max_workers* threads, whose replies come back to it over an ``inproc``
+PULL socket. Objects are loaded from storage with an :class:`AxoLoader` on
+first use, kept in memory and reloaded when a request names a newer
+version. Calls on one object run one at a time unless the method (or the
+object) is read-only.
+
+Usage::
+
+    with AxoEndpointServer(storage=storage, max_workers=8) as srv:
+        dem.add_endpoint(endpoint_id=srv.endpoint_id, hostname="127.0.0.1",
+                         req_res_port=srv.port, pubsub_port=-1)
+"""
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+import threading
+import time as T
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import cloudpickle as CP
+import zmq
+from option import Err, Ok, Result
+
+import axo.models as AXOMODELS
+from axo.core.axo import Axo
+from axo.core.decorators import axo_method, axo_stream, axo_task, accepted_kwargs
+from axo.core.models import RESULT_PICKLE_CONTENT_TYPE, AxoContext, BallRef, MetadataX, ResultRef, encode_result
+from axo.enums import AxoOperationType
+from axo.errors import AxoError, AxoErrorType
+from axo.log import get_logger
+from axo.storage import AxoStorage
+from axo.storage.loader import AxoLoader
+from axo.storage.types import StorageService
+
+logger = get_logger(
+    name  = __name__ ,
+    ltype = os.environ.get("AXO_LOG_TYPE","json") ,
+    debug = os.environ.get("AXO_DEBUG","1")== "1",
+    path  = os.environ.get("AXO_LOG_PATH","/log") ,
+)
+
+
+@dataclass
+class _Served:
+    """A loaded object and the lock its mutating calls hold."""
+    instance: Any
+    version: Optional[int]
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def _as_axo_error(e: Any) -> AxoError:
+    if isinstance(e, AxoError):
+        return e
+    return AxoError.make(AxoErrorType.INTERNAL_ERROR, f"{type(e).__name__}: {e}")
+
+
+class AxoEndpointServer:
+    """
+    ROUTER server for :class:`~axo.endpoint.endpoint.DistributedEndpoint`
+    clients, backed by *storage* (the one the clients persist to).
+    ``req_res_port=0`` binds a free port, see :attr:`port`.
+    """
+
+    def __init__(
+        self,
+        *,
+        storage: StorageService,
+        endpoint_id: str = "axo-endpoint-0",
+        protocol: str = "tcp",
+        hostname: str = "127.0.0.1",
+        req_res_port: int = 0,
+        max_workers: int = 4,
+        api_globals: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.endpoint_id = endpoint_id
+        self.storage = storage
+        self.max_workers = max(1, max_workers)
+        self.loader = AxoLoader(
+            AxoStorage(storage=storage),
+            api_globals={**(api_globals or {}), "Axo": Axo, "axo_method": axo_method, "axo_task": axo_task, "axo_stream": axo_stream},
+        )
+        self.metadata: Dict[str, MetadataX] = {}          # PUT_METADATA, by axo_key
+        self.served = 0
+        self._objects: Dict[Tuple[str, str], _Served] = {}
+        self._load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._objects_lock = threading.Lock()
+
+        self._ctx = zmq.Context()
+        self._router = self._ctx.socket(zmq.ROUTER)
+        self._router.setsockopt(zmq.LINGER, 0)
+        if req_res_port:
+            self._router.bind(f"{protocol}://{hostname}:{req_res_port}")
+            self.port = req_res_port
+        else:
+            self.port = self._router.bind_to_random_port(f"{protocol}://{hostname}")
+        self.uri = f"{protocol}://{hostname}:{self.port}"
+        self._replies_uri = f"inproc://axo-server-{id(self)}"
+        self._replies = self._ctx.socket(zmq.PULL)
+        self._replies.bind(self._replies_uri)
+        self._push = threading.local()          # one PUSH socket per worker thread
+        self._push_socks: List[zmq.Socket] = []
+
+        self._loop = asyncio.new_event_loop()   # storage I/O of every worker
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._io_thread: Optional[threading.Thread] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._running = False
+
+    # ------------------------------------------------------------------ #
+    # Lifecycle
+    # ------------------------------------------------------------------ #
+    def start(self) -> "AxoEndpointServer":
+        if self._running:
+            return self
+        self._running = True
+        self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=f"axo-server-{self.endpoint_id}")
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, name=f"axo-server-{self.endpoint_id}-storage", daemon=True)
+        self._io_thread = threading.Thread(target=self._serve, name=f"axo-server-{self.endpoint_id}", daemon=True)
+        self._loop_thread.start()
+        self._io_thread.start()
+        logger.info({"event": "ENDPOINT.SERVER.STARTED", "endpoint_id": self.endpoint_id, "uri": self.uri, "max_workers": self.max_workers})
+        return self
+
+    def stop(self) -> None:
+        """Stop serving, wait for the running requests and close every socket."""
+        if not self._running:
+            return
+        self._running = False
+        self._io_thread.join()
+        self._pool.shutdown(wait=True)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop_thread.join()
+        self._loop.close()
+        for sock in self._push_socks:
+            sock.close(linger=0)
+        self._replies.close(linger=0)
+        self._router.close(linger=0)
+        self._ctx.term()
+
+    def __enter__(self) -> "AxoEndpointServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------ #
+    # I/O thread
+    # ------------------------------------------------------------------ #
+    def _serve(self) -> None:
+        poller = zmq.Poller()
+        poller.register(self._router, zmq.POLLIN)
+        poller.register(self._replies, zmq.POLLIN)
+        while self._running:
+            events = dict(poller.poll(50))
+            if self._replies in events:
+                while True:
+                    try:
+                        self._router.send_multipart(self._replies.recv_multipart(zmq.NOBLOCK))
+                        self.served += 1
+                    except zmq.Again:
+                        break
+            if self._router in events:
+                while True:
+                    try:
+                        frames = self._router.recv_multipart(zmq.NOBLOCK)
+                    except zmq.Again:
+                        break
+                    self._pool.submit(self._work, frames)
+        # replies of requests still running at stop are dropped
+
+    def _work(self, frames: List[bytes]) -> None:
+        # [identity…, b"", *request] -> [identity…, b"", *reply]
+        n = frames.index(b"") + 1 if b"" in frames else 1
+        reply = self.handle(frames[n:])
+        push = getattr(self._push, "sock", None)
+        if push is None:
+            push = self._push.sock = self._ctx.socket(zmq.PUSH)
+            push.connect(self._replies_uri)
+            self._push_socks.append(push)
+        push.send_multipart([*frames[:n], *reply.to_frames()])
+
+    # ------------------------------------------------------------------ #
+    # Requests
+    # ------------------------------------------------------------------ #
+    def handle(self, frames: List[bytes]) -> AXOMODELS.AxoReplyMsg:
+        """The reply to one request (without its routing frames)."""
+        parsed = AXOMODELS.AxoRequestMsg.from_frames(frames)
+        if parsed.is_err:
+            return self._reply(None, "UNKNOWN", Err(AxoError.make(AxoErrorType.BAD_REQUEST, str(parsed.unwrap_err()))))
+        req, payload = parsed.unwrap()
+        env = req.envelope
+        op = env.operation
+        t1 = T.time()
+        try:
+            if op == AxoOperationType.PING:
+                return self._reply(env, "PONG", Ok(None))
+            if op == AxoOperationType.PUT_METADATA:
+                return self._reply(env, op, self._put_metadata(env.get_metadatax()))
+            if op == AxoOperationType.METHOD_EXEC:
+                res = self._method_exec(env, CP.loads(payload[0]), CP.loads(payload[1]))
+                return self._reply(env, op, res, t1=t1)
+            if op == AxoOperationType.METHOD_EXEC_BATCH:
+                return self._method_exec_batch(env, payload, t1)
+            if op == AxoOperationType.TASK_EXEC:
+                res = self._task_exec(env, CP.loads(payload[0]), CP.loads(payload[1]), CP.loads(payload[2]))
+                return self._reply(env, op, res, t1=t1)
+            return self._reply(env, op, Err(AxoError.make(AxoErrorType.UNKNOWN_OPERATION, f"{op} is not served here")))
+        except Exception as e:
+            logger.error({"event": "ENDPOINT.SERVER.REQUEST.FAILED", "operation": op, "detail": str(e)})
+            return self._reply(env, op, Err(e), t1=t1)
+
+    def _reply(self, env: Optional[AXOMODELS.AxoRequestEnvelope], op: str, res: Result[Any, Any], *, t1: Optional[float] = None) -> AXOMODELS.AxoReplyMsg:
+        payload: List[bytes] = []
+        error = None
+        status_code = 0
+        result_mode = None
+        if res.is_err:
+            err = _as_axo_error(res.unwrap_err())
+            error, status_code = err.model_dump(mode="json"), int(err.code)
+        elif isinstance(res.unwrap(), BallRef):
+            result_mode = "ref" if isinstance(res.unwrap(), ResultRef) else None
+            payload = [res.unwrap().to_json().encode("utf-8")]
+        elif op == AxoOperationType.METHOD_EXEC:
+            value = res.unwrap()
+            payload = [value.data if isinstance(value, AXOMODELS.PickledResult) else CP.dumps(value)]
+        return AXOMODELS.AxoReplyMsg(
+            envelope=AXOMODELS.AxoReplyEnvelope(
+                msg_id       = env.msg_id if env else None,
+                task_id      = env.task_id if env else None,
+                operation    = op,
+                status       = "ok" if error is None else "error",
+                status_code  = status_code,
+                axo_uri      = env.axo_uri if env else None,
+                method       = env.method if env else None,
+                service_time = 0 if t1 is None else T.time() - t1,
+                result_mode  = result_mode,
+                error        = error,
+            ),
+            payload=payload,
+        )
+
+    def _put_metadata(self, md: MetadataX) -> Result[str, AxoError]:
+        self.metadata[md.axo_key] = md
+        with self._objects_lock:
+            served = self._objects.get((md.axo_bucket_id, md.axo_key))
+            if served is not None and served.version != md.axo_version:
+                del self._objects[(md.axo_bucket_id, md.axo_key)]  # reloaded on its next call
+        return Ok(md.axo_key)
+
+    def _method_exec(self, env: AXOMODELS.AxoRequestEnvelope, fargs: List[Any], fkwargs: Dict[str, Any]) -> Result[Any, AxoError]:
+        md = env.get_metadatax()
+        args = AXOMODELS.resolve_args(fargs, fkwargs, load=self._load_ref)
+        if args.is_err:
+            return args
+        res = self._call(md, env.method, *args.unwrap())
+        return self._shape(res, md, key=f"{md.axo_key}-{env.msg_id}", result_mode=env.result_mode, max_inline_bytes=env.max_inline_bytes)
+
+    def _method_exec_batch(self, env: AXOMODELS.AxoRequestEnvelope, payload: List[bytes], t1: float) -> AXOMODELS.AxoReplyMsg:
+        calls = AXOMODELS.MethodExecutionBatch.unpack(payload)
+        if calls.is_err:
+            return self._reply(env, env.operation, calls, t1=t1)
+        values: List[Result[Any, Any]] = []   # what CallRefs resolve to
+        replies: List[Result[Any, Any]] = []
+        for i, (md, method, fargs, fkwargs, result_mode) in enumerate(calls.unwrap()):
+            args = AXOMODELS.resolve_args(fargs, fkwargs, results=values, load=self._load_ref)
+            res = args if args.is_err else self._call(md, method, *args.unwrap())
+            values.append(res)
+            replies.append(self._shape(res, md, key=f"{md.axo_key}-{env.msg_id}-{i}", result_mode=result_mode, max_inline_bytes=env.max_inline_bytes))
+        return AXOMODELS.MethodExecutionBatch.reply(env.msg_id, replies)
+
+    def _task_exec(self, env: AXOMODELS.AxoRequestEnvelope, fargs: List[Any], fkwargs: Dict[str, Any], ctx: AxoContext) -> Result[BallRef, AxoError]:
+        """Run the task and store its result in the sink bucket; the reply is its BallRef."""
+        md = env.get_metadatax()
+        res = self._call(md, env.method, fargs, fkwargs, ctx=ctx)
+        if res.is_err:
+            return res
+        sink = (md.axo_sink_bucket_id if ctx.ignore_ss else ctx.sink_bucket) or md.axo_sink_bucket_id or ctx.sink_bucket
+        return self._store(res.unwrap(), bucket_id=sink, key=f"{md.axo_key}-{env.method}-{env.msg_id}", ref_type=BallRef)
+
+    # ------------------------------------------------------------------ #
+    # Objects & calls
+    # ------------------------------------------------------------------ #
+    def _object(self, md: MetadataX) -> Result[_Served, AxoError]:
+        k = (md.axo_bucket_id, md.axo_key)
+        with self._objects_lock:
+            served = self._objects.get(k)
+            if served is not None and (md.axo_version is None or served.version is None or served.version >= md.axo_version):
+                return Ok(served)
+            load_lock = self._load_locks.setdefault(k, threading.Lock())
+        with load_lock:  # one load per object, the other callers wait for it
+            with self._objects_lock:
+                served = self._objects.get(k)
+            if served is not None and (md.axo_version is None or served.version is None or served.version >= md.axo_version):
+                return Ok(served)
+            loaded = self._await(self.loader.load_object(bucket_id=md.axo_bucket_id, key=md.axo_key, class_name=md.axo_class_name or None))
+            if loaded.is_err:
+                return Err(loaded.unwrap_err())
+            served = _Served(loaded.unwrap(), md.axo_version)
+            with self._objects_lock:
+                self._objects[k] = served
+            logger.debug({"event": "ENDPOINT.SERVER.LOADED", "bucket_id": md.axo_bucket_id, "key": md.axo_key, "version": md.axo_version})
+            return Ok(served)
+
+    def _call(self, md: MetadataX, method: str, fargs: List[Any], fkwargs: Dict[str, Any], *, ctx: Optional[AxoContext] = None) -> Result[Any, AxoError]:
+        served = self._object(md)
+        if served.is_err:
+            return served
+        served = served.unwrap()
+        spec = getattr(type(served.instance), "_acx_dispatch", {}).get(method)
+        if spec is None:
+            return Err(AxoError.make(AxoErrorType.NOT_FOUND, f"{type(served.instance).__name__} has no @axo_method {method}"))
+        runtime_kwargs = {
+            "axo_endpoint_id"     : self.endpoint_id,
+            "axo_key"             : md.axo_key,
+            "axo_bucket_id"       : md.axo_bucket_id,
+            "axo_sink_bucket_id"  : md.axo_sink_bucket_id,
+            "axo_source_bucket_id": md.axo_source_bucket_id,
+            "storage"             : self.storage,
+        }
+        kwargs = {k: v for k, v in runtime_kwargs.items() if k in spec.inject}
+        kwargs.update(accepted_kwargs(fkwargs, spec.inject))
+        if ctx is not None and self._takes(spec.fn, "ctx"):
+            kwargs["ctx"] = ctx
+        lock = nullcontext() if spec.read_only or md.axo_is_read_only else served.lock
+        try:
+            with lock:
+                return Ok(spec.fn(served.instance, *fargs, **kwargs))
+        except Exception as e:
+            return Err(_as_axo_error(e))
+
+    @staticmethod
+    def _takes(fn: Any, name: str) -> bool:
+        try:
+            params = inspect.signature(fn).parameters
+        except (TypeError, ValueError):
+            return False
+        return name in params or any(p.kind is p.VAR_KEYWORD for p in params.values())
+
+    # ------------------------------------------------------------------ #
+    # Results kept in storage
+    # ------------------------------------------------------------------ #
+    def _shape(self, res: Result[Any, Any], md: MetadataX, *, key: str, result_mode: Optional[str], max_inline_bytes: Optional[int]) -> Result[Any, Any]:
+        """The reply value of a call: the result, or a ResultRef to it in the sink bucket."""
+        if res.is_err:
+            return res
+        value = res.unwrap()
+        if result_mode == "ref":
+            return self._store(value, bucket_id=md.axo_sink_bucket_id, key=key)
+        if max_inline_bytes is None:
+            return res
+        if isinstance(value, (bytes, bytearray, memoryview)):  # sized without pickling, stored as is
+            if memoryview(value).nbytes > max_inline_bytes:
+                return self._store(value, bucket_id=md.axo_sink_bucket_id, key=key, spilled=True)
+            return res
+        data = CP.dumps(value)  # the reply frame, pickled once
+        if len(data) > max_inline_bytes:
+            return self._store(value, bucket_id=md.axo_sink_bucket_id, key=key, encoded=(data, RESULT_PICKLE_CONTENT_TYPE), spilled=True)
+        return Ok(AXOMODELS.PickledResult(data))
+
+    def _store(self, value: Any, *, bucket_id: str, key: str, encoded: Optional[Tuple[bytes, str]] = None, ref_type: type = ResultRef, **fields: Any) -> Result[BallRef, AxoError]:
+        data, content_type = encoded or encode_result(value)
+        put = self._await(self.storage.put(bucket_id=bucket_id, key=key, data=data, tags={"content_type": content_type}))
+        if put.is_err:
+            return Err(put.unwrap_err())
+        if ref_type is ResultRef:
+            fields.setdefault("endpoint_id", self.endpoint_id)
+        return Ok(ref_type.for_data(data, content_type, bucket_id=bucket_id, key=key, **fields))
+
+    def _load_ref(self, ref: ResultRef) -> Result[Any, AxoError]:
+        return self._await(ref.aget(self.storage))
+
+    def _await(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+
+__all__ = ["AxoEndpointServer"]
@@ -0,0 +1,353 @@
+"""
+axo/endpoint/transport.py
+~~~~~~~~~~~~~~~~~~~~~~~~~
+
+DEALER transports used by :class:`axo.endpoint.endpoint.DistributedEndpoint`.
+
+Requests go out as ``[b"", *frames]`` – the framing a REQ socket produces, so
+ROUTER servers need no change – and replies are matched to their request by
+the envelope ``msg_id`` instead of by lockstep. A request that times out is
+simply forgotten: its late reply is dropped when it arrives and the socket
+keeps working, so no failure tears the connection down.
+
+* :class:`DealerChannel` – one ``zmq.asyncio`` DEALER with a reader task that
+  routes replies to the awaiting coroutines; any number of requests can be
+  outstanding on it.
+* :func:`dealer_request` – one blocking request on a plain DEALER socket.
+* :class:`SocketPool` – bounded pool of blocking DEALER sockets, each one
+  checked out by a single thread per request.
+* :class:`Heartbeat` – background liveness check on a socket of its own,
+  so requests to a healthy server never wait for a ping.
+"""
+from __future__ import annotations
+
+import asyncio
+import json as J
+import random
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+import zmq
+import zmq.asyncio
+from option import Err, Ok, Result
+
+from axo.errors import AxoError, AxoErrorType
+
+_DELIMITER = b""
+
+
+def _strip(frames: List[bytes]) -> List[bytes]:
+    return frames[1:] if frames and frames[0] == _DELIMITER else frames
+
+
+def reply_msg_id(frames: List[bytes]) -> Optional[str]:
+    """The ``msg_id`` of a reply (``None`` if the server did not echo it)."""
+    try:
+        return J.loads(frames[4]).get("msg_id")
+    except Exception:
+        return None
+
+
+def timeout_error(what: str, timeout_s: float) -> AxoError:
+    return AxoError.make(AxoErrorType.TIMEOUT, f"{what}: no reply after {int(timeout_s * 1000)}ms")
+
+
+def dealer_request(
+    sock: zmq.Socket, frames: List[bytes], *, msg_id: str, timeout_s: float, what: str = "request"
+) -> Result[List[bytes], Exception]:
+    """
+    Send *frames* on a blocking DEALER *sock* and wait for the reply to
+    *msg_id*, skipping late replies of earlier requests that timed out.
+    """
+    try:
+        sock.send_multipart([_DELIMITER, *frames])
+        deadline = time.monotonic() + timeout_s
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not sock.poll(remaining * 1000):
+                return Err(timeout_error(what, timeout_s))
+            reply = _strip(sock.recv_multipart())
+            rid = reply_msg_id(reply)
+            if rid is None or rid == msg_id:
+                return Ok(reply)
+    except Exception as exc:
+        return Err(exc)
+
+
+class DealerChannel:
+    """Many outstanding requests over one ``zmq.asyncio`` DEALER socket."""
+
+    def __init__(self, ctx: zmq.asyncio.Context, uri: str) -> None:
+        self.uri = uri
+        self._sock = ctx.socket(zmq.DEALER)
+        self._sock.setsockopt(zmq.LINGER, 0)
+        self._sock.connect(uri)
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._reader: Optional[asyncio.Task] = None
+        self.closed = False
+
+    @property
+    def outstanding(self) -> int:
+        return len(self._pending)
+
+    async def request(
+        self, frames: List[bytes], *, msg_id: str, timeout_s: float, what: str = "request"
+    ) -> Result[List[bytes], Exception]:
+        """Send *frames* and await the reply carrying *msg_id*."""
+        if self.closed:
+            return Err(AxoError.make(AxoErrorType.TRANSPORT_ERROR, f"{what}: channel to {self.uri} is closed"))
+        loop = asyncio.get_running_loop()
+        fut = loop.create_future()
+        self._pending[msg_id] = fut
+        if self._reader is None or self._reader.done():
+            self._reader = loop.create_task(self._read())
+        try:
+            await self._sock.send_multipart([_DELIMITER, *frames])
+            return Ok(await asyncio.wait_for(fut, timeout_s))
+        except asyncio.TimeoutError:
+            return Err(timeout_error(what, timeout_s))
+        except Exception as exc:
+            return Err(exc)
+        finally:
+            self._pending.pop(msg_id, None)
+
+    async def _read(self) -> None:
+        # runs while requests are outstanding; replies nobody waits for are dropped
+        try:
+            while self._pending:
+                reply = _strip(await self._sock.recv_multipart())
+                rid = reply_msg_id(reply)
+                if rid is None and len(self._pending) == 1:
+                    rid = next(iter(self._pending))  # server does not echo msg_id
+                fut = self._pending.get(rid)
+                if fut is not None and not fut.done():
+                    fut.set_result(reply)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            for fut in self._pending.values():
+                if not fut.done():
+                    fut.set_exception(exc)
+
+    def close(self) -> None:
+        self.closed = True
+        if self._reader is not None and not self._reader.done():
+            try:
+                self._reader.cancel()
+            except RuntimeError:  # its loop is already closed
+                pass
+        self._sock.close(linger=0)
+
+
+class SocketPool:
+    """
+    Bounded pool of blocking DEALER sockets to *uri*.
+
+    zmq sockets must not be shared between threads, so every request checks a
+    socket out with :meth:`acquire` and gives it back with :meth:`release`.
+    Sockets are created on demand up to *maxsize*; callers beyond that wait.
+    Sockets left idle for *idle_timeout_s* are closed.
+    """
+
+    def __init__(self, uri: str, *, maxsize: int = 8, idle_timeout_s: float = 60.0) -> None:
+        self.uri = uri
+        self.maxsize = max(1, maxsize)
+        self.idle_timeout_s = idle_timeout_s
+        self._ctx: Optional[zmq.Context] = None
+        self._idle: List[Tuple[float, zmq.Socket]] = []  # (released at, socket), oldest first
+        self._size = 0  # idle + checked out
+        self._waiting = 0  # callers blocked in acquire()
+        self._cond = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    def acquire(self, timeout_s: Optional[float] = None) -> Result[zmq.Socket, Exception]:
+        """Check out an idle socket, or a new one while the pool is not full."""
+        deadline = None if timeout_s is None else time.monotonic() + timeout_s
+        with self._cond:
+            while True:
+                self._reap(time.monotonic())
+                if self._idle:
+                    return Ok(self._idle.pop()[1])  # most recently used first
+                if self._size < self.maxsize:
+                    break
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return Err(AxoError.make(AxoErrorType.TIMEOUT, f"no free socket to {self.uri} ({self.maxsize} in use)"))
+                self._waiting += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+            self._size += 1
+            try:
+                if self._ctx is None:
+                    self._ctx = zmq.Context()
+                sock = self._ctx.socket(zmq.DEALER)
+                sock.setsockopt(zmq.LINGER, 0)
+                sock.connect(self.uri)
+                return Ok(sock)
+            except Exception as exc:
+                self._size -= 1
+                self._cond.notify()
+                return Err(exc)
+
+    def release(self, sock: zmq.Socket, *, discard: bool = False) -> None:
+        """Give *sock* back; *discard* closes it instead (e.g. after a ZMQ error)."""
+        with self._cond:
+            if sock.context is not self._ctx:
+                return  # the pool was closed while it was checked out
+            if discard or sock.closed:
+                sock.close(linger=0)
+                self._size -= 1
+            else:
+                self._idle.append((time.monotonic(), sock))
+            self._cond.notify()
+
+    def _reap(self, now: float) -> None:
+        while self._idle and now - self._idle[0][0] >= self.idle_timeout_s:
+            _, sock = self._idle.pop(0)
+            sock.close(linger=0)
+            self._size -= 1
+
+    def close(self) -> None:
+        """Close every socket and the context; the pool can be used again afterwards."""
+        with self._cond:
+            for _, sock in self._idle:
+                sock.close(linger=0)
+            self._idle.clear()
+            if self._ctx is not None:
+                self._ctx.destroy(linger=0)
+            self._ctx = None
+            self._size = 0
+            self._cond.notify_all()
+
+
+class Heartbeat:
+    """
+    Background liveness check of *uri*.
+
+    A daemon thread calls ``probe(sock, timeout_s)`` on a DEALER socket of its
+    own whenever nothing was heard from the server for *interval_s*; any reply
+    counts, so callers report theirs with :meth:`beat` and a busy server is
+    never pinged. After *max_misses* failed probes in a row the server is
+    down (:attr:`alive` is False) and is probed again with exponential
+    backoff and full jitter, capped at *max_backoff_s*, until it answers.
+    :attr:`alive` is None until the first verdict.
+    """
+
+    def __init__(
+        self,
+        uri: str,
+        probe: Callable[[zmq.Socket, float], bool],
+        *,
+        interval_s: float = 5.0,
+        timeout_s: float = 2.0,
+        max_misses: int = 3,
+        backoff_base_s: float = 0.1,
+        max_backoff_s: float = 30.0,
+    ) -> None:
+        self.uri = uri
+        self.interval_s = interval_s
+        self.timeout_s = timeout_s
+        self.max_misses = max(1, max_misses)
+        self.backoff_base_s = backoff_base_s
+        self.max_backoff_s = max_backoff_s
+        self.alive: Optional[bool] = None
+        self.probes = 0
+        self._probe = probe
+        self._last_seen = float("-inf")
+        self._verdict = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start the thread unless it is running (again after :meth:`stop`)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=f"axo-heartbeat-{self.uri}", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._lock:
+            self._stop.set()
+            self._verdict.set()  # release the waiters
+            thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        self.alive = None
+        self._verdict.clear()
+
+    def beat(self) -> None:
+        """The server just answered: postpone the next probe."""
+        self._last_seen = time.monotonic()
+        if self.alive is not True:
+            self._set(True)
+
+    def wait(self, timeout_s: Optional[float] = None) -> Optional[bool]:
+        """Start if needed and wait for the first verdict; returns :attr:`alive`."""
+        if self.alive is None:
+            self.start()
+            self._verdict.wait(timeout_s)
+        return self.alive
+
+    def backoff(self, failures: int) -> float:
+        return random.uniform(0, min(self.max_backoff_s, self.backoff_base_s * 2 ** (failures - 1)))
+
+    def _set(self, alive: bool) -> None:
+        self.alive = alive
+        self._verdict.set()
+
+    def _run(self) -> None:
+        ctx = zmq.Context()
+        sock: Optional[zmq.Socket] = None
+        failures = 0
+        try:
+            while not self._stop.is_set():
+                due = self._last_seen + self.interval_s - time.monotonic()
+                if self.alive and due > 0:
+                    self._stop.wait(due)
+                    continue
+                if sock is None:
+                    sock = ctx.socket(zmq.DEALER)
+                    sock.setsockopt(zmq.LINGER, 0)
+                    sock.connect(self.uri)
+                self.probes += 1
+                try:
+                    ok = self._probe(sock, self.timeout_s)
+                except Exception:
+                    ok = False
+                if self._stop.is_set():
+                    break
+                if ok:
+                    failures = 0
+                    self.beat()
+                    continue
+                # a fresh socket, so pings queued for a dead peer are not all sent on reconnect
+                sock.close(linger=0)
+                sock = None
+                failures += 1
+                if failures >= self.max_misses:
+                    self._set(False)
+                self._stop.wait(self.backoff(failures))
+        finally:
+            if sock is not None:
+                sock.close(linger=0)
+            ctx.term()
+
+
+__all__ = ["DealerChannel", "Heartbeat", "SocketPool", "dealer_request", "reply_msg_id", "timeout_error"]
@@ -72,8 +72,10 @@ class AxoOperationType(StrEnum):
     PUT_METADATA    = "PUT_METADATA"
     PING            = "PING"
     METHOD_EXEC     = "METHOD_EXEC"
+    METHOD_EXEC_BATCH = "METHOD_EXEC_BATCH"
     TASK_EXEC       = "TASK_EXEC"
     STREAM_EXEC     = "STREAM_EXEC"
+    ELASTICITY      = "ELASTICITY"
     UNKNOWN         = "UNKNOWN"
     CREATE_ENDPOINT = "CREATE_ENDPOINT"
     @classmethod
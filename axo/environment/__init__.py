@@ -2,4 +2,9 @@
 import string
 import os
 ALPHABET    = string.ascii_lowercase + string.digits
-AXO_ID_SIZE = int(os.environ.get("AXO_ID_SIZE", "16"))
\ No newline at end of file
+AXO_ID_SIZE = int(os.environ.get("AXO_ID_SIZE", "16"))
+# ao.batch(): calls per METHOD_EXEC_BATCH message, and seconds a partial batch may wait (0 = until full or closed)
+AXO_BATCH_MAX_SIZE       = int(os.environ.get("AXO_BATCH_MAX_SIZE", "256"))
+AXO_BATCH_FLUSH_INTERVAL = float(os.environ.get("AXO_BATCH_FLUSH_INTERVAL", "0"))
+# DistributedEndpointManager: how calls that name no endpoint are spread (round_robin, least_outstanding, ewma, p2c)
+AXO_BALANCING_POLICY     = os.environ.get("AXO_BALANCING_POLICY", "round_robin")
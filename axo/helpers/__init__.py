@@ -1,6 +1,6 @@
 
 from __future__ import annotations
-from typing import Callable,Optional
+from typing import Callable,Dict,Iterable,Optional
 from nanoid import generate as nanoid
 import re
 from axo.environment import AXO_ID_SIZE,ALPHABET
@@ -9,6 +9,8 @@ from axo.errors import AxoError,AxoErrorType
 from axo.storage.utils import StorageUtils as SU
 from option import Result,Ok,Err
 from axo.serde import serialize_attrs
+from axo.cache import get_class_source
+from axo.serde.lazy import materialize
 
 ALLOWED_PATTERN = re.compile(r"[^a-z0-9_]")
 UNDERSCORE_PATTERN = re.compile(r"_+")
@@ -76,16 +78,19 @@ def serialize_blobs_from_instance(instance, *, bucket_id: str, key: str
 ) -> Result[tuple[AxoObjectBlobs, str], AxoError]:
     """
     Convert an Axo instance into AxoObjectBlobs + class_name.
-    Uses instance.get_raw_parts() -> (attrs, class_code_str).
+    Uses instance.get_raw_parts() -> (attrs, class_code_str); the source bytes
+    and checksum come from the per-class memo, so only attrs are serialized
+    on every call.
     """
     try:
         raw_parts_res = instance.get_raw_parts()
         if raw_parts_res.is_err:
             return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, str(raw_parts_res.unwrap_err())))
-        attrs, class_code_str = raw_parts_res.unwrap()
+        attrs, _ = raw_parts_res.unwrap()
 
         # bytes
-        src_bytes = class_code_str.encode("utf-8")
+        class_source = get_class_source(type(instance))
+        src_bytes = class_source.data
         attr_bytes, attr_ct = serialize_attrs(attrs)
 
         # meta
@@ -98,7 +103,7 @@ def serialize_blobs_from_instance(instance, *, bucket_id: str, key: str
             key          = src_key,
             ball_id      = src_key,
             size         = len(src_bytes),
-            checksum     = SU.sha256_hex(src_bytes),
+            checksum     = class_source.checksum,
             producer_id  = producer_id,
             bucket_id    = bucket_id,
             tags         = {**tags},
@@ -130,3 +135,65 @@ def serialize_blobs_from_instance(instance, *, bucket_id: str, key: str
         return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, f"build_blobs failed: {e}"))
 
 
+
+
+def serialize_attr_blobs_from_instance(instance, *, bucket_id: str, key: str, names: Optional[Iterable[str]] = None
+) -> Result[tuple[AxoObjectBlob, Dict[str, AxoObjectBlob], str], AxoError]:
+    """
+    Per-attribute variant of :func:`serialize_blobs_from_instance`: returns
+    (source blob, {attr name: blob}, class_name). Only *names* are serialized
+    (all attributes when ``None``); names no longer on the instance are skipped.
+    Lazily loaded attributes are only fetched when they are serialized.
+    """
+    try:
+        raw_parts_res = instance.get_raw_parts(materialize_lazy=False)
+        if raw_parts_res.is_err:
+            return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, str(raw_parts_res.unwrap_err())))
+        attrs, _ = raw_parts_res.unwrap()
+
+        class_name = getattr(getattr(instance, "_acx_metadata", None), "axo_class_name", None)
+        if not class_name:
+            return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, "missing axo_class_name in metadata"))
+
+        class_source = get_class_source(type(instance))
+        producer_id = getattr(getattr(instance, "_acx_metadata", None), "producer_id", "") or "axo"
+        tags = instance._acx_metadata.to_tags()
+        src_key = SU.source_key(key)
+        src_blob = AxoObjectBlob(
+            class_source.data,
+            AxoStorageMetadata(
+                key          = src_key,
+                ball_id      = src_key,
+                size         = len(class_source.data),
+                checksum     = class_source.checksum,
+                producer_id  = producer_id,
+                bucket_id    = bucket_id,
+                tags         = {**tags},
+                content_type = "text/plain",
+                is_disabled  = False,
+            )
+        )
+
+        attr_blobs: Dict[str, AxoObjectBlob] = {}
+        for name in (attrs if names is None else names):
+            if name not in attrs:
+                continue
+            data, ct = serialize_attrs(materialize(attrs[name]))
+            attr_key = SU.attr_key(key, name)
+            attr_blobs[name] = AxoObjectBlob(
+                data,
+                AxoStorageMetadata(
+                    key          = attr_key,
+                    ball_id      = attr_key,
+                    size         = len(data),
+                    checksum     = SU.sha256_hex(data),
+                    producer_id  = producer_id,
+                    bucket_id    = bucket_id,
+                    tags         = {},
+                    content_type = ct,
+                    is_disabled  = False,
+                )
+            )
+        return Ok((src_blob, attr_blobs, class_name))
+    except Exception as e:
+        return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, f"build_attr_blobs failed: {e}"))
@@ -1,7 +1,7 @@
 from __future__ import annotations
 import json as J
 import time as T
-from typing import Any, Dict, List, Optional,Annotated,Tuple
+from typing import Any, Callable, Dict, List, NamedTuple, Optional,Annotated,Tuple
 # 
 import cloudpickle as CP
 from pydantic import BaseModel, Field, ValidationError, field_validator,AfterValidator,model_validator
@@ -9,7 +9,7 @@ from option import Ok, Err, Result
 import humanfriendly as HF
 # 
 from axo.helpers import _make_id_validator,_generate_id,_build_axo_uri
-from axo.core.models import MetadataX,AxoContext
+from axo.core.models import MetadataX,AxoContext,CallRef,ResultRef
 from axo.environment import AXO_ID_SIZE
 from axo.errors import AxoError,AxoErrorType
 from axo.enums import TaskStatus,AxoOperationType
@@ -81,6 +81,8 @@ class AxoRequestEnvelope(BaseModel):
     axo_dependencies: List[str]         = Field(default_factory=list)
     axo_uri: Optional[str]              = None          # e.g., "axo://axo/CALC"
     axo_alias:Optional[str]             = None
+    result_mode: Optional[str]          = None          # "ref": keep the result on the endpoint, reply with a ResultRef
+    max_inline_bytes: Optional[int]     = None          # larger results are spilled to the sink bucket (reply: spilled ResultRef)
 
 
     @field_validator("operation")
@@ -126,6 +128,7 @@ class AxoReplyEnvelope(BaseModel):
     axo_uri: Optional[str] = None
     method: Optional[str] = None
     service_time:float = 0
+    result_mode: Optional[str] = None  # "ref": payload[0] is a ResultRef (JSON), not the pickled value
 
     # optional structured error
     error: Optional[Dict[str, Any]] = None
@@ -296,6 +299,8 @@ class MethodExecution(AxoRequestMsg):
         fkwargs: Dict[str, Any] | None = {},
         allow_stale:bool = True,
         task_id: Optional[str] = None,
+        result_mode: Optional[str] = None,
+        max_inline_bytes: Optional[int] = None,
     ):
         _fargs = CP.dumps(fargs or [])
         _fkwargs = CP.dumps(fkwargs or {})
@@ -319,10 +324,181 @@ class MethodExecution(AxoRequestMsg):
             path                 = metadata.path,
             sink_path            = metadata.sink_path,
             source_path          = metadata.source_path,
-            method = method
+            method = method,
+            result_mode          = result_mode,
+            max_inline_bytes     = max_inline_bytes,
         )
 
         super().__init__(envelope=env, payload=[_fargs,_fkwargs])  # no extra frames for PING
+def _error_dict(e: Any) -> Dict[str, Any]:
+    return e.model_dump(mode="json") if isinstance(e, AxoError) else {"message": str(e)}
+
+
+def _error_from_dict(d: Dict[str, Any]) -> AxoError:
+    if "type" in d:
+        return AxoError.model_validate(d)
+    return AxoError.make(msg=d.get("message", "call failed"), error_type=AxoErrorType.INTERNAL_ERROR)
+
+
+class PickledResult(NamedTuple):
+    """A method result already pickled for the reply (server side), so it is not pickled twice."""
+    data: bytes
+
+
+def _result_frame(value: Any) -> bytes:
+    return value.data if isinstance(value, PickledResult) else CP.dumps(value)
+
+
+class BatchCall(NamedTuple):
+    """One call of a :class:`MethodExecutionBatch`."""
+    metadata: MetadataX
+    method: str
+    fargs: List[Any]
+    fkwargs: Dict[str, Any]
+    result_mode: Optional[str] = None
+
+
+def resolve_args(
+    fargs: List[Any],
+    fkwargs: Dict[str, Any],
+    *,
+    results: List[Result[Any, Any]] = (),
+    load: Optional[Callable[[ResultRef], Result[Any, Any]]] = None,
+) -> Result[Tuple[List[Any], Dict[str, Any]], AxoError]:
+    """
+    Replace the top-level :class:`CallRef` arguments by the value of that
+    earlier call (*results*) and the :class:`ResultRef` ones by ``load(ref)``
+    (server side, before invoking the method).
+    """
+    def value(x: Any) -> Any:
+        if isinstance(x, CallRef):
+            if x.index >= len(results):
+                raise _RefError(AxoError.make(AxoErrorType.BAD_REQUEST, f"call {x.index} is not an earlier call of the batch"))
+            r = results[x.index]
+        elif isinstance(x, ResultRef) and load is not None:
+            r = load(x)
+        else:
+            return x
+        if r.is_err:
+            raise _RefError(AxoError.make(AxoErrorType.BAD_REQUEST, f"argument depends on a failed call: {_error_dict(r.unwrap_err()).get('message')}"))
+        return r.unwrap()
+    try:
+        return Ok(([value(a) for a in fargs], {k: value(v) for k, v in fkwargs.items()}))
+    except _RefError as e:
+        return Err(e.error)
+
+
+class _RefError(Exception):
+    def __init__(self, error: AxoError) -> None:
+        super().__init__(error.message)
+        self.error = error
+
+
+class MethodExecutionBatch(AxoRequestMsg):
+    """
+    N method calls, on one or more objects, in one message. Payload frames:
+    a JSON index ``{"objects": [metadata…], "calls": [[object, method,
+    result_mode]…]}`` then ``fargs, fkwargs`` per call; an argument may be a
+    :class:`CallRef` to an earlier call of the message. The reply payload is
+    a JSON list with one ``{"status", "error", "result_mode"}`` per call,
+    then one result frame per call (a :class:`ResultRef` as JSON for
+    ``"ref"`` calls).
+    """
+
+    def __init__(
+        self,
+        *,
+        calls: List[BatchCall],
+        axo_endpoint_id: Optional[str] = None,
+        allow_stale: bool = True,
+        task_id: Optional[str] = None,
+        max_inline_bytes: Optional[int] = None,
+    ):
+        objects: List[MetadataX] = []
+        seen: Dict[int, int] = {}
+        index: List[Tuple[int, str, Optional[str]]] = []
+        frames: List[bytes] = []
+        for call in calls:
+            metadata, method, fargs, fkwargs, result_mode = BatchCall(*call)
+            i = seen.setdefault(id(metadata), len(objects))
+            if i == len(objects):
+                objects.append(metadata)
+            index.append((i, method, result_mode))
+            frames += [CP.dumps(list(fargs or [])), CP.dumps(fkwargs or {})]
+        header = {"objects": [m.model_dump(mode="json") for m in objects], "calls": index}
+        env = AxoRequestEnvelope(
+            msg_id           = _generate_id(size=AXO_ID_SIZE),
+            task_id          = task_id,
+            operation        = AxoOperationType.METHOD_EXEC_BATCH,
+            allow_stale      = allow_stale,
+            axo_endpoint_id  = axo_endpoint_id,
+            max_inline_bytes = max_inline_bytes,
+        )
+        super().__init__(envelope=env, payload=[J.dumps(header).encode("utf-8"), *frames])
+
+    @staticmethod
+    def unpack(payload: List[bytes]) -> Result[List[BatchCall], AxoError]:
+        """The calls of a request payload (server side)."""
+        try:
+            header = J.loads(payload[0])
+            objects = [MetadataX.model_validate(m) for m in header["objects"]]
+            return Ok([
+                BatchCall(objects[entry[0]], entry[1], CP.loads(payload[1 + 2 * n]), CP.loads(payload[2 + 2 * n]), *entry[2:3])
+                for n, entry in enumerate(header["calls"])
+            ])
+        except Exception as e:
+            return Err(AxoError.make(msg=f"Batch parse error: {e}", error_type=AxoErrorType.BAD_REQUEST))
+
+    @staticmethod
+    def reply(msg_id: Optional[str], results: List[Result[Any, Exception]]) -> AxoReplyMsg:
+        """
+        The reply to a batch carrying *results* in call order (server side);
+        an ``Ok(ResultRef)`` is sent as a reference.
+        """
+        status: List[Dict[str, Any]] = []
+        frames: List[bytes] = []
+        for r in results:
+            if r.is_err:
+                status.append({"status": "error", "error": _error_dict(r.unwrap_err())})
+                frames.append(b"")
+            elif isinstance(r.unwrap(), ResultRef):
+                status.append({"status": "ok", "result_mode": "ref"})
+                frames.append(r.unwrap().to_json().encode("utf-8"))
+            else:
+                status.append({"status": "ok"})
+                frames.append(_result_frame(r.unwrap()))
+        return AxoReplyMsg(
+            envelope=AxoReplyEnvelope(msg_id=msg_id, operation=AxoOperationType.METHOD_EXEC_BATCH, status="ok", status_code=0),
+            payload=[J.dumps(status).encode("utf-8"), *frames],
+        )
+
+    @staticmethod
+    def parse_reply(frames: List[bytes], n: int) -> Result[List[Result[Any, AxoError]], AxoError]:
+        """One Result per call, in order, from the reply to a batch of *n* calls."""
+        parsed = AxoReplyMsg.from_frames(frames, expect_operation=AxoOperationType.METHOD_EXEC_BATCH)
+        if parsed.is_err:
+            return Err(parsed.unwrap_err())
+        msg, payload = parsed.unwrap()
+        if msg.envelope.status != "ok":
+            detail = (msg.envelope.error or {}).get("message", "Batch failed")
+            return Err(AxoError.make(msg=detail, error_type=AxoErrorType.INTERNAL_ERROR))
+        try:
+            status = J.loads(payload[0])
+            if len(status) != n or len(payload) != n + 1:
+                return Err(AxoError.make(msg=f"Batch reply has {len(status)} results for {n} calls", error_type=AxoErrorType.BAD_REQUEST))
+            results: List[Result[Any, AxoError]] = []
+            for st, frame in zip(status, payload[1:]):
+                if st.get("status") != "ok":
+                    results.append(Err(_error_from_dict(st.get("error") or {})))
+                elif st.get("result_mode") == "ref":
+                    results.append(Ok(ResultRef.model_validate_json(frame)))
+                else:
+                    results.append(Ok(CP.loads(frame)))
+            return Ok(results)
+        except Exception as e:
+            return Err(AxoError.make(msg=f"Batch reply parse error: {e}", error_type=AxoErrorType.BAD_REQUEST))
+
+
 class TaskExecution(AxoRequestMsg):
     def __init__(
         self,
@@ -410,4 +586,50 @@ class StreamExecution(AxoRequestMsg):
     #     if msg.envelope.status != "ok":
     #         detail = (msg.envelope.error or {}).get("message", "Put metadata failed")
     #         return Err(AxoError.make(msg = detail, error_type=AxoErrorType.INTERNAL_ERROR))
-    #     return Ok(msg.envelope)
\ No newline at end of file
+    #     return Ok(msg.envelope)
+
+class Elasticity(AxoRequestMsg):
+    """
+    ELASTICITY: ask the middleware to run *rf* endpoints. The reply lists the
+    endpoints it runs afterwards, one ``{"endpoint_id", "hostname",
+    "req_res_port", "pub_sub_port"}`` dict each (payload[0], JSON).
+    """
+
+    def __init__(self, *, rf: int, task_id: Optional[str] = None):
+        env = AxoRequestEnvelope(
+            msg_id    = _generate_id(size=AXO_ID_SIZE),
+            task_id   = task_id,
+            operation = AxoOperationType.ELASTICITY,
+        )
+        super().__init__(envelope=env, payload=[J.dumps({"rf": int(rf)}).encode("utf-8")])
+
+    @staticmethod
+    def rf_of(payload: List[bytes]) -> Result[int, AxoError]:
+        try:
+            rf = int(J.loads(payload[0])["rf"])
+            if rf < 0:
+                raise ValueError(f"rf must be >= 0, got {rf}")
+            return Ok(rf)
+        except Exception as e:
+            return Err(AxoError.make(msg=f"Bad ELASTICITY request: {e}", error_type=AxoErrorType.BAD_REQUEST))
+
+    @staticmethod
+    def reply(msg_id: Optional[str], endpoints: List[Dict[str, Any]]) -> AxoReplyMsg:
+        return AxoReplyMsg(
+            envelope = AxoReplyEnvelope(msg_id=msg_id, operation=AxoOperationType.ELASTICITY, status="ok", status_code=0),
+            payload  = [J.dumps(endpoints).encode("utf-8")],
+        )
+
+    @staticmethod
+    def parse_reply(frames: List[bytes]) -> Result[List[Dict[str, Any]], AxoError]:
+        parsed = AxoReplyMsg.from_frames(frames, expect_operation=AxoOperationType.ELASTICITY)
+        if parsed.is_err:
+            return Err(parsed.unwrap_err())
+        msg, payload = parsed.unwrap()
+        if msg.envelope.status != "ok":
+            detail = (msg.envelope.error or {}).get("message", "Elasticity failed")
+            return Err(AxoError.make(msg = detail, error_type=AxoErrorType.ENDPOINT_DEPLOY_FAILED))
+        try:
+            return Ok(J.loads(payload[0]) if payload else [])
+        except Exception as e:
+            return Err(AxoError.make(msg=f"Elasticity reply parse error: {e}", error_type=AxoErrorType.BAD_REQUEST))
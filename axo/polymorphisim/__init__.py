@@ -121,12 +121,14 @@ class ManagerWorkerX(PatternX):
         metadatas = metadatas_result.unwrap()
         n_workers = len(metadatas)
         res = endpoint.elasticity(rf=n_workers)
-        for endpoint in res:
+        for endpoint in (res.unwrap() if res.is_ok else []):
             endpoint_id  = endpoint.get("endpoint_id","")
             req_res_port = int(endpoint.get("req_res_port",0))
             pub_sub_port = int(endpoint.get("pub_sub_port",0))
             if  endpoint_id =="" or req_res_port <=0  or pub_sub_port <= 0:
                 continue
+            if runtime.endpoint_manager.exists(endpoint_id):
+                continue
             runtime.endpoint_manager.add_endpoint(
                 endpoint_id=endpoint_id,
                 protocol="tcp",
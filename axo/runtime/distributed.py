@@ -15,11 +15,12 @@ from axo.scheduler import Scheduler
 from axo.storage.services import MictlanXStorageService,StorageService
 from axo.endpoint.manager import DistributedEndpointManager
 from axo.endpoint.manager import EndpointManagerP
+from axo.endpoint.balancer import affinity_key
 from axo.log import get_logger
 from axo.errors import AxoError,AxoErrorType
 from axo.storage import AxoStorage
 from axo.storage.loader import AxoLoader
-from axo.helpers import serialize_blobs_from_instance
+from axo.storage.constants import AXO_INCREMENTAL_PERSIST
 import os
 
 logger = get_logger(
@@ -44,6 +45,7 @@ class DistributedRuntime(ActiveXRuntime,Thread):
         default_storage_service_params:Dict[str,Any] = {},
         # is_distributed: bool = False,
         runtime_id: str="",
+        incremental_persist: bool = AXO_INCREMENTAL_PERSIST,
     ) -> None:
         super().__init__(daemon=True)
 
@@ -57,6 +59,7 @@ class DistributedRuntime(ActiveXRuntime,Thread):
         self.__scheduler = scheduler
         self.__storage_service = storage_service if storage_service else MictlanXStorageService(client=default_storage_service_params.get("client",None),uri=default_storage_service_params.get("routers_str","") )
         self.__axo_storage = AxoStorage(storage=self.__storage_service)
+        self.__incremental_persist = incremental_persist
         self.__axo_loader = AxoLoader(storage=self.__axo_storage,
             api_globals={**loader_api_globals,"Axo":Axo,"axo_method":axo_method} or {},
             safe_builtins={},
@@ -105,6 +108,9 @@ class DistributedRuntime(ActiveXRuntime,Thread):
     @property
     def axo_loader(self)->AxoLoader:
         return self.__axo_loader
+    @property
+    def incremental_persist(self)->bool:
+        return self.__incremental_persist
 
 
     # ------------------------------------------------------------------ #
@@ -120,7 +126,7 @@ class DistributedRuntime(ActiveXRuntime,Thread):
             # 1) endpoint metadata
             instances_eid = instance.get_endpoint_id()
             # print("INSTANCES_EID", instances_eid)
-            endpoint = self.__endpoint_manager.get_endpoint(instances_eid )
+            endpoint = self.__endpoint_manager.get_endpoint(instances_eid, key=affinity_key(instance))
             # print("ENDPOINT", endpoint, endpoint.endpoint_id)
 
             if not endpoint:
@@ -132,7 +138,9 @@ class DistributedRuntime(ActiveXRuntime,Thread):
                     "key":key,
                 })
                 return Err(AxoError.make(AxoErrorType.NOT_FOUND, f"No endpoint found: {instances_eid}"))
-            
+            if endpoint.endpoint_id != instances_eid:
+                instance.set_endpoint_id(endpoint.endpoint_id)  # later calls go where the metadata is
+
             meta_res = endpoint.put(key=key, value=instance._acx_metadata)
             if meta_res.is_err:
                 logger.error({
@@ -145,16 +153,11 @@ class DistributedRuntime(ActiveXRuntime,Thread):
                 return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, str(meta_res.unwrap_err())))
 
             # 2) blobs via AxoStorage
-            blobs_res = serialize_blobs_from_instance(instance, bucket_id=bucket_id, key=key)
-            if blobs_res.is_err:
-                return Err(blobs_res.unwrap_err())
-            blobs, class_name = blobs_res.unwrap()
-
-            put_res = await self.__axo_storage.put_blobs(
-                bucket_id=bucket_id,
-                key=key,
-                blobs=blobs,
-                class_name=class_name,
+            put_res = await self._put_instance_blobs(
+                instance,
+                bucket_id   = bucket_id,
+                key         = key,
+                incremental = self.__incremental_persist,
             )
             if put_res.is_err:
                 return Err(put_res.unwrap_err())
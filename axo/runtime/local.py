@@ -18,7 +18,8 @@ Because everything runs in‑process, no network calls are performed, making
 
 from __future__ import annotations
 import os
-from typing import TYPE_CHECKING,Dict,Any
+import inspect
+from typing import TYPE_CHECKING,Dict,Any,Callable,FrozenSet
 from weakref import WeakKeyDictionary
 import time as T
 from queue import Queue
@@ -27,6 +28,7 @@ from threading import Thread
 from option import Result,Ok,Err
 
 from axo.core.axo import Axo,axo_method
+from axo.core.decorators import AXO_CALL_KWARGS,accepted_kwargs
 from axo.endpoint.manager import LocalEndpointManager,EndpointManagerP
 from axo.runtime.runtime import ActiveXRuntime
 from axo.scheduler import AxoScheduler,Scheduler
@@ -36,7 +38,7 @@ from axo.storage import AxoStorage
 from axo.log import get_logger
 from axo.models import Task
 from axo.errors import AxoError,AxoErrorType
-from axo.helpers import serialize_blobs_from_instance
+from axo.storage.constants import AXO_INCREMENTAL_PERSIST
 # --------------------------------------------------------------------------- #
 # Logger (module‑local)
 # --------------------------------------------------------------------------- #
@@ -68,6 +70,9 @@ class LocalRuntime(ActiveXRuntime,Thread):
     storage_service :
         Custom storage backend (useful for dependency injection in tests).
         If ``NONE`` (default) a :class:`LocalStorageService` instance is created.
+    incremental_persist :
+        Store objects one blob per attribute and re-upload only the attributes
+        assigned since the previous persist.
     """
 
     def __init__(
@@ -79,6 +84,7 @@ class LocalRuntime(ActiveXRuntime,Thread):
         q_tick_s:int = 1,
         loader_api_globals: Dict[str,Any] = {},
         # safe_builtins: dict | None = None,
+        incremental_persist: bool = AXO_INCREMENTAL_PERSIST,
     ) -> None:
         super().__init__(name=runtime_id,daemon=True)
         self.__runtime_id = runtime_id
@@ -92,12 +98,15 @@ class LocalRuntime(ActiveXRuntime,Thread):
         # Storage backend (provided or default) ----------------------------
         self.__storage_service: StorageService = storage_service
         self.__axo_storage = AxoStorage(storage=self.__storage_service)
+        self.__incremental_persist = incremental_persist
         self.__axo_loader = AxoLoader(
             storage=self.__axo_storage,
             api_globals={**loader_api_globals,"Axo":Axo,"axo_method":axo_method} or {},
             safe_builtins={},
         )
         self.__inmemory_objects = WeakKeyDictionary()
+        # instance -> (where it is served, {accepts: runtime kwargs}) for invoke_local
+        self.__call_kwargs: WeakKeyDictionary = WeakKeyDictionary()
         # .unwrap_or(
             # LocalStorageService(storage_service_id="local-store")
         # )
@@ -134,10 +143,57 @@ class LocalRuntime(ActiveXRuntime,Thread):
     def axo_storage(self) -> AxoStorage: return self.__axo_storage
     @property
     def axo_loader(self) -> AxoLoader: return self.__axo_loader
+    @property
+    def incremental_persist(self) -> bool: return self.__incremental_persist
 
     @property
     def is_running(self)->bool:
         return self.__is_running  
+    def invoke_local(
+        self, instance: Axo, fn: Callable[..., Any], args: tuple, kwargs: dict, accepts: FrozenSet[str] = AXO_CALL_KWARGS
+    ) -> Result[Any, Exception] | None:
+        """
+        Call *fn* in-process, without per-call endpoint lookup or metadata
+        validation. It receives the same kwargs as on the endpoint path: the
+        runtime kwargs in *accepts* plus the caller's.
+        """
+        md = instance._acx_metadata
+        eid = md.axo_endpoint_id
+        if eid not in self.__endpoint_manager.endpoints or "axo_endpoint_id" in kwargs:
+            return None  # first call of this instance / explicit endpoint: generic path
+        if accepts:
+            injected = self._runtime_kwargs(instance, md, eid, accepts)
+            kwargs = {**injected, **accepted_kwargs(kwargs, accepts)} if kwargs else injected
+        elif kwargs:
+            kwargs = accepted_kwargs(kwargs, accepts)
+        fn = getattr(fn, "__func__", fn)  # the decorator passes the bound method
+        spec = type(instance)._acx_dispatch.get(fn.__name__)
+        f = spec.fn if spec is not None and spec.fn is fn else inspect.unwrap(fn)  # e.g. a base class' method via super()
+        try:
+            return Ok(f(instance, *args, **kwargs))
+        except Exception as exc:
+            return Err(exc)
+
+    def _runtime_kwargs(self, instance: Axo, md: Any, eid: str, accepts: FrozenSet[str]) -> Dict[str, Any]:
+        """The runtime kwargs in *accepts*, built once per instance and place it is served from."""
+        where = (eid, md.axo_key, md.axo_bucket_id, md.axo_sink_bucket_id, md.axo_source_bucket_id)
+        cached = self.__call_kwargs.get(instance)
+        if cached is None or cached[0] != where:
+            cached = self.__call_kwargs[instance] = (where, {})
+        by_accepts = cached[1]
+        kwargs = by_accepts.get(accepts)
+        if kwargs is None:
+            kwargs = {
+                "axo_endpoint_id"     : eid,
+                "axo_key"             : md.axo_key,
+                "axo_bucket_id"       : md.axo_bucket_id,
+                "axo_sink_bucket_id"  : md.axo_sink_bucket_id or instance.get_axo_sink_bucket_id(),
+                "axo_source_bucket_id": md.axo_source_bucket_id or instance.get_axo_source_bucket_id(),
+                "storage"             : self.__storage_service,
+            }
+            kwargs = by_accepts[accepts] = {k: v for k, v in kwargs.items() if k in accepts}
+        return kwargs
+
     async def get_active_object(self, *, bucket_id: str, key: str) -> Result[Axo, AxoError]:
         return await self.__axo_loader.load_object(bucket_id=bucket_id, key=key)
 
@@ -156,16 +212,11 @@ class LocalRuntime(ActiveXRuntime,Thread):
                 return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, str(meta_res.unwrap_err())))
 
             # 2) build blobs + store via AxoStorage
-            blobs_res = serialize_blobs_from_instance(instance, bucket_id=bucket_id, key=key)
-            if blobs_res.is_err:
-                return Err(blobs_res.unwrap_err())
-            blobs, class_name = blobs_res.unwrap()
-
-            put_res = await self.__axo_storage.put_blobs(
-                bucket_id=bucket_id,
-                key=key,
-                blobs=blobs,
-                class_name=class_name,
+            put_res = await self._put_instance_blobs(
+                instance,
+                bucket_id   = bucket_id,
+                key         = key,
+                incremental = self.__incremental_persist,
             )
             if put_res.is_err:
                 return Err(put_res.unwrap_err())
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 # ────────────────────────────────────────────────────────────────── stdlib ──
 import os
+import asyncio
+import time as T
 from abc import ABC, abstractmethod
 import json as J
+from dataclasses import dataclass, field
 from queue import Queue
-from typing import Optional,TYPE_CHECKING
+from typing import Any,Callable,Dict,FrozenSet,List,Optional,Sequence,Tuple,TYPE_CHECKING
 from weakref import WeakKeyDictionary
 # ─────────────────────────────────────────────────────────────── 3rd‑party ──
 from option import Result,Err,Ok
@@ -16,9 +19,12 @@ from axo.storage import AxoStorage
 from axo.storage.loader import AxoLoader
 from axo.errors import AxoError,AxoErrorType
 from axo.types import EndpointManagerP
+from axo.endpoint.balancer import affinity_key
 from axo.log import get_logger
 from axo.storage.utils import StorageUtils as SU
 from axo.types import EndpointManagerP  # your protocol
+from axo.helpers import serialize_blobs_from_instance,serialize_attr_blobs_from_instance
+from axo.storage.constants import AXO_PERSIST_CONCURRENCY
 
 if TYPE_CHECKING:
     from axo.core.axo import Axo
@@ -35,6 +41,26 @@ logger = get_logger(
 # ─────────────────────────────────────────────────────────────── typing alias
 
 
+@dataclass
+class PersistManyReport:
+    """Outcome of :meth:`ActiveXRuntime.persistify_many`, in input order."""
+    results: List[Result[str, AxoError]] = field(default_factory=list)
+    elapsed: float = 0.0  # seconds
+
+    @property
+    def ok(self) -> int:
+        return sum(1 for r in self.results if r.is_ok)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.ok
+
+    @property
+    def throughput(self) -> float:
+        """Objects persisted per second."""
+        return self.ok / self.elapsed if self.elapsed > 0 else 0.0
+
+
 # =========================================================================== #
 # Runtime
 # =========================================================================== #
@@ -101,6 +127,171 @@ class ActiveXRuntime(ABC):
     ) -> Result[str, AxoError]:
         ...
 
+    @property
+    def incremental_persist(self) -> bool:
+        return False
+
+    def invoke_local(
+        self, instance: Axo, fn: Callable[..., Any], args: tuple, kwargs: dict, accepts: FrozenSet[str] = frozenset()
+    ) -> Optional[Result]:
+        """
+        In-process fast path for ``@axo_method`` calls. ``None`` means "not
+        handled here": the call goes through the endpoint instead.
+        """
+        return None
+
+    async def persistify_many(
+        self,
+        instances: Sequence[Axo],
+        *,
+        bucket_id: Optional[str] = "axo",
+        keys: Optional[Sequence[Optional[str]]] = None,
+        concurrency: int = AXO_PERSIST_CONCURRENCY,
+    ) -> PersistManyReport:
+        """
+        Persist many objects at once. Metadata is registered in order per
+        endpoint, on the event loop (:meth:`EndpointX.aput`); each object's
+        blob upload starts as soon as its metadata is stored, with at most
+        *concurrency* uploads in flight. Objects without a known endpoint are
+        assigned one each (and pinned to it). A ``None`` *bucket_id* uses
+        each object's own bucket.
+
+        An object succeeds only if both its metadata and its blobs were
+        stored; failures do not stop the others.
+        """
+        t1 = T.perf_counter()
+        n = len(instances)
+        keys = [(keys[i] if keys else None) or instances[i].get_axo_key() for i in range(n)]
+        buckets = [bucket_id or instances[i].get_axo_bucket_id() for i in range(n)]
+        results: List[Optional[Result[str, AxoError]]] = [None] * n
+
+        # 1) one ordered batch per endpoint, resolved per object
+        batches: Dict[str, Tuple[Any, List[int]]] = {}
+        for i, instance in enumerate(instances):
+            eid = instance.get_endpoint_id()
+            endpoint = self.endpoint_manager.get_endpoint(eid, key=affinity_key(instance))
+            if not endpoint:
+                results[i] = Err(AxoError.make(AxoErrorType.NOT_FOUND, f"No endpoint found: {eid}"))
+                continue
+            if endpoint.endpoint_id != eid:
+                instance.set_endpoint_id(endpoint.endpoint_id)
+            batches.setdefault(endpoint.endpoint_id, (endpoint, []))[1].append(i)
+
+        # 2) blobs, bounded, each after its metadata
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def upload(i: int) -> None:
+            async with semaphore:
+                try:
+                    res = await self._put_instance_blobs(
+                        instances[i],
+                        bucket_id   = buckets[i],
+                        key         = keys[i],
+                        incremental = self.incremental_persist,
+                    )
+                except Exception as e:
+                    res = Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, f"persistify failed: {e}"))
+            results[i] = Ok(keys[i]) if res.is_ok else Err(res.unwrap_err())
+
+        async def register(endpoint, indexes: List[int]) -> None:
+            uploads = []
+            for i in indexes:
+                try:
+                    res = await endpoint.aput(key=keys[i], value=instances[i]._acx_metadata)
+                except Exception as e:
+                    res = Err(e)
+                if res.is_err:
+                    results[i] = Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, str(res.unwrap_err())))
+                    continue
+                uploads.append(asyncio.ensure_future(upload(i)))
+            await asyncio.gather(*uploads)
+
+        await asyncio.gather(*(register(endpoint, indexes) for endpoint, indexes in batches.values()))
+
+        report = PersistManyReport(elapsed=T.perf_counter() - t1)
+        for res in results:
+            report.results.append(res if res is not None else Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, "persistify did not complete")))
+        logger.info({
+            "event"      : "PERSISTIFY.MANY",
+            "objects"    : n,
+            "ok"         : report.ok,
+            "failed"     : report.failed,
+            "concurrency": concurrency,
+            "response_time": report.elapsed,
+            "throughput" : report.throughput,
+        })
+        return report
+
+    async def _put_instance_blobs(
+        self, instance: Axo, *, bucket_id: str, key: str, incremental: bool = False
+    ) -> Result[bool, AxoError]:
+        """
+        Write *instance* through :attr:`axo_storage`.
+
+        With *incremental* the object is stored one blob per attribute and
+        only attributes whose content changed are uploaded. Classes declared
+        with ``track_changes=True`` that were last persisted to the same
+        ``bucket_id``/``key`` serialise just the attributes assigned since.
+        """
+        if not incremental:
+            # lazily loaded attributes are fetched here, not by blocking the loop
+            mat = await self.axo_loader.materialize(instance)
+            if mat.is_err:
+                return Err(mat.unwrap_err())
+            blobs_res = serialize_blobs_from_instance(instance, bucket_id=bucket_id, key=key)
+            if blobs_res.is_err:
+                return Err(blobs_res.unwrap_err())
+            blobs, class_name = blobs_res.unwrap()
+            put_res = await self.axo_storage.put_blobs(
+                bucket_id=bucket_id,
+                key=key,
+                blobs=blobs,
+                class_name=class_name,
+            )
+            if put_res.is_err:
+                return Err(put_res.unwrap_err())
+            instance._acx_mark_persisted(None)
+            return Ok(True)
+
+        dirty   = instance.get_dirty_attrs()
+        partial = type(instance)._acx_track_changes and getattr(instance, "_acx_persisted", None) == (bucket_id, key)
+        res     = await self.__put_attrs(instance, bucket_id=bucket_id, key=key, dirty=dirty if partial else None)
+        if res.is_err and partial:
+            # The stored manifest is gone or was replaced: fall back to a full write.
+            res = await self.__put_attrs(instance, bucket_id=bucket_id, key=key, dirty=None)
+            partial = False
+        if res.is_err:
+            return Err(res.unwrap_err())
+        instance._acx_mark_persisted((bucket_id, key), dirty if partial else None)
+        return Ok(True)
+
+    async def __put_attrs(
+        self, instance: Axo, *, bucket_id: str, key: str, dirty: Optional[set]
+    ) -> Result[bool, AxoError]:
+        names = None
+        if dirty is not None:
+            # metadata & runtime flags are small and mutated in place: always sent
+            names = dirty | {k for k in instance.__dict__ if k.startswith("_acx_")}
+        mat = await (self.axo_loader.materialize(instance) if names is None else self.axo_loader.materialize(instance, *names))
+        if mat.is_err:
+            return Err(mat.unwrap_err())
+        blobs_res = serialize_attr_blobs_from_instance(instance, bucket_id=bucket_id, key=key, names=names)
+        if blobs_res.is_err:
+            return Err(blobs_res.unwrap_err())
+        src_blob, attr_blobs, class_name = blobs_res.unwrap()
+        put_res = await self.axo_storage.put_attr_blobs(
+            bucket_id        = bucket_id,
+            key              = key,
+            source_code_blob = src_blob,
+            attr_blobs       = attr_blobs,
+            class_name       = class_name,
+            removed          = [] if dirty is None else [n for n in dirty if n not in attr_blobs],
+            partial          = dirty is not None,
+        )
+        if put_res.is_err:
+            return Err(put_res.unwrap_err())
+        return Ok(True)
+
     # ------------------------------------------------------------------ #
     # Thread lifecycle
     # ------------------------------------------------------------------ #
@@ -1,22 +1,21 @@
-
-import json as J
-from typing import Tuple,Dict,Any
+from typing import Tuple,Dict,Any,Optional
+from axo.serde.codecs import Codec,CodecRegistry,get_codec_registry
 
 def serialize_attrs( attrs:Dict[str,Any]) -> Tuple[bytes, str]:
     """
-    Prefer JSON; fallback to cloudpickle. Returns (bytes, content_type).
+    Encode with the codec registered for the value's type (JSON for
+    JSON-native data, raw buffers for bytes/arrays, pickle for stdlib types,
+    cloudpickle otherwise). Returns (bytes, content_type).
     """
-    # JSON path
-    try:
-        b = J.dumps(attrs, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
-        return b, "application/json"
-    except Exception:
-        pass
-
-    # cloudpickle fallback
     try:
-        import cloudpickle as cp  # local import
-        return cp.dumps(attrs), "application/x-python-cloudpickle"
+        return get_codec_registry().encode(attrs)
     except Exception as e:
         raise RuntimeError(f"attrs not serializable: {e}")
-    
+
+
+def deserialize_attrs(data: bytes, content_type: Optional[str] = None) -> Any:
+    """
+    Inverse of :func:`serialize_attrs`, dispatching on *content_type*; blobs
+    without a known content type are tried as JSON, then cloudpickle.
+    """
+    return get_codec_registry().decode(data, content_type)
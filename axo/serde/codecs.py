@@ -0,0 +1,271 @@
+"""
+axo/serde/codecs.py
+~~~~~~~~~~~~~~~~~~~
+
+Type‑directed codec registry for attribute blobs.
+
+The codec of a value is chosen from its type – once per type for leaf values,
+by walking element types for containers – instead of trying ``json.dumps`` and
+falling back on failure. The codec name travels as the blob's content type,
+so decoding dispatches on it directly.
+
+=============================  ======================================
+content type                   used for
+=============================  ======================================
+``application/json``           JSON‑native scalars/lists/str‑keyed dicts
+``application/x-axo-bytes``    ``bytes`` / ``memoryview`` (raw)
+``application/x-axo-bytearray``  ``bytearray`` (raw)
+``application/x-axo-array``    :class:`array.array` (typecode + raw)
+``application/x-axo-ndarray``  numeric :class:`numpy.ndarray` (header + raw)
+``application/x-python-pickle``  stdlib values (sets, tuples, datetimes…)
+``application/x-python-cloudpickle``  anything else
+=============================  ======================================
+
+Blobs without a known content type (older writes) are sniffed: JSON first,
+then cloudpickle.
+"""
+from __future__ import annotations
+
+import array
+import json as J
+import pickle
+import struct
+import sys
+import threading
+from collections import ChainMap, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+BytesLike = Any  # bytes | bytearray | memoryview
+
+CT_JSON        = "application/json"
+CT_BYTES       = "application/x-axo-bytes"
+CT_BYTEARRAY   = "application/x-axo-bytearray"
+CT_ARRAY       = "application/x-axo-array"
+CT_NDARRAY     = "application/x-axo-ndarray"
+CT_PICKLE      = "application/x-python-pickle"
+CT_CLOUDPICKLE = "application/x-python-cloudpickle"
+
+_HEADER_LEN = struct.Struct("<I")
+
+
+@dataclass(frozen=True)
+class Codec:
+    content_type: str
+    encode: Callable[[Any], bytes]
+    decode: Callable[[BytesLike], Any]
+
+
+# --------------------------------------------------------------------------- #
+# Codecs
+# --------------------------------------------------------------------------- #
+def _json_encode(value: Any) -> bytes:
+    return J.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_decode(data: BytesLike) -> Any:
+    return J.loads(bytes(data).decode("utf-8"))
+
+
+def _array_encode(value: array.array) -> bytes:
+    return value.typecode.encode("ascii") + (b"l" if sys.byteorder == "little" else b"b") + value.tobytes()
+
+
+def _array_decode(data: BytesLike) -> array.array:
+    mv = memoryview(data)
+    out = array.array(bytes(mv[:1]).decode("ascii"))
+    out.frombytes(mv[2:])
+    if bytes(mv[1:2]) != (b"l" if sys.byteorder == "little" else b"b"):
+        out.byteswap()
+    return out
+
+
+def _ndarray_encode(value: Any) -> bytes:
+    import numpy as np
+
+    value = np.ascontiguousarray(value)
+    header = J.dumps({"dtype": value.dtype.str, "shape": list(value.shape)}).encode("utf-8")
+    return b"".join((_HEADER_LEN.pack(len(header)), header, memoryview(value).cast("B")))
+
+
+def _ndarray_decode(data: BytesLike) -> Any:
+    import numpy as np
+
+    mv = memoryview(data)
+    (n,) = _HEADER_LEN.unpack_from(mv, 0)
+    header = J.loads(bytes(mv[_HEADER_LEN.size:_HEADER_LEN.size + n]))
+    body = bytearray(mv[_HEADER_LEN.size + n:])  # writable, owned by the array
+    return np.frombuffer(body, dtype=np.dtype(header["dtype"])).reshape(header["shape"])
+
+
+def _cloudpickle_encode(value: Any) -> bytes:
+    import cloudpickle as cp  # local import
+
+    return cp.dumps(value)
+
+
+JSON        = Codec(CT_JSON, _json_encode, _json_decode)
+RAW_BYTES   = Codec(CT_BYTES, bytes, bytes)
+RAW_BARRAY  = Codec(CT_BYTEARRAY, bytes, bytearray)
+RAW_ARRAY   = Codec(CT_ARRAY, _array_encode, _array_decode)
+RAW_NDARRAY = Codec(CT_NDARRAY, _ndarray_encode, _ndarray_decode)
+PICKLE      = Codec(CT_PICKLE, lambda v: pickle.dumps(v, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads)
+CLOUDPICKLE = Codec(CT_CLOUDPICKLE, _cloudpickle_encode, pickle.loads)
+
+
+# --------------------------------------------------------------------------- #
+# Type resolution
+# --------------------------------------------------------------------------- #
+# Ordered: a container takes the "widest" level among its elements.
+_LEVEL_JSON, _LEVEL_PICKLE, _LEVEL_CLOUDPICKLE = 0, 1, 2
+_LEVEL_CODECS = (JSON, PICKLE, CLOUDPICKLE)
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+# Modules whose types are safe for the stdlib pickler.
+_STDLIB_MODULES = frozenset({
+    "builtins", "datetime", "decimal", "fractions", "collections", "uuid",
+    "pathlib", "ipaddress", "array", "enum",
+})
+
+
+def _is_ndarray(t: type) -> bool:
+    return t.__name__ == "ndarray" and t.__module__ == "numpy"
+
+
+class CodecRegistry:
+    """
+    Maps value types to codecs and content types back to codecs.
+
+    ``register(codec, *types)`` adds leaf codecs (exact type or subclass);
+    :meth:`codec_for` caches the decision per leaf type.
+    """
+
+    def __init__(self) -> None:
+        self._by_type: Dict[type, Codec] = {}
+        self._by_content_type: Dict[str, Codec] = {}
+        self._resolved: Dict[type, int] = {}
+        self._lock = threading.Lock()
+        for codec in (JSON, RAW_BYTES, RAW_BARRAY, RAW_ARRAY, RAW_NDARRAY, PICKLE, CLOUDPICKLE):
+            self._by_content_type[codec.content_type] = codec
+
+    def register(self, codec: Codec, *types: type) -> None:
+        with self._lock:
+            self._by_content_type[codec.content_type] = codec
+            for t in types:
+                self._by_type[t] = codec
+
+    # ----- encode -----
+    def codec_for(self, value: Any) -> Codec:
+        t = type(value)
+        codec = self._by_type.get(t)
+        if codec is not None:
+            return codec
+        for registered, codec in self._by_type.items():
+            if issubclass(t, registered):
+                return codec
+        if t is bytes or t is memoryview:
+            return RAW_BYTES
+        if t is bytearray:
+            return RAW_BARRAY
+        if t is array.array:
+            return RAW_ARRAY
+        if _is_ndarray(t) and not value.dtype.hasobject:
+            return RAW_NDARRAY
+        return _LEVEL_CODECS[self._level(value, depth=0)]
+
+    def _leaf_level(self, t: type) -> int:
+        level = self._resolved.get(t)
+        if level is None:
+            if t in _JSON_SCALARS:
+                level = _LEVEL_JSON
+            elif t.__module__ in _STDLIB_MODULES and t.__module__ != "builtins" or t in (
+                bytes, bytearray, complex, range, slice, type(Ellipsis),
+            ):
+                level = _LEVEL_PICKLE
+            else:
+                level = _LEVEL_CLOUDPICKLE
+            self._resolved[t] = level
+        return level
+
+    def _level(self, value: Any, *, depth: int) -> int:
+        t = type(value)
+        if depth > 32:
+            return _LEVEL_CLOUDPICKLE
+        if t is dict:
+            keys_level = _LEVEL_JSON if all(type(k) is str for k in value) else _LEVEL_PICKLE
+            if keys_level == _LEVEL_PICKLE:
+                keys_level = max((self._level(k, depth=depth + 1) for k in value), default=_LEVEL_PICKLE)
+                keys_level = max(keys_level, _LEVEL_PICKLE)
+            return max(keys_level, self._items_level(value.values(), depth=depth))
+        if t is list:
+            return self._items_level(value, depth=depth)
+        if t in (tuple, set, frozenset):
+            return max(_LEVEL_PICKLE, self._items_level(value, depth=depth))
+        if _is_ndarray(t):
+            return _LEVEL_CLOUDPICKLE if value.dtype.hasobject else _LEVEL_PICKLE
+        if t.__module__ == "collections":
+            return self._collection_level(value, depth=depth)
+        return self._leaf_level(t)
+
+    def _collection_level(self, value: Any, *, depth: int) -> int:
+        # defaultdict/OrderedDict/Counter/deque/…: the stdlib pickler is only
+        # safe if their contents (and default_factory) are.
+        if isinstance(value, dict):
+            level = max(
+                _LEVEL_PICKLE,
+                self._items_level(value.keys(), depth=depth),
+                self._items_level(value.values(), depth=depth),
+            )
+            factory = getattr(value, "default_factory", None)
+            if factory is not None and getattr(factory, "__module__", None) not in _STDLIB_MODULES:
+                level = _LEVEL_CLOUDPICKLE
+            return level
+        if isinstance(value, deque):
+            return max(_LEVEL_PICKLE, self._items_level(value, depth=depth))
+        if isinstance(value, ChainMap):
+            return max(_LEVEL_PICKLE, self._items_level(value.maps, depth=depth))
+        return _LEVEL_CLOUDPICKLE
+
+    def _items_level(self, items: Iterable[Any], *, depth: int) -> int:
+        level = _LEVEL_JSON
+        seen = set()
+        for item in items:
+            t = type(item)
+            if t in _JSON_SCALARS:
+                continue
+            if t in seen and t not in (dict, list, tuple, set, frozenset) and not _is_ndarray(t):
+                continue
+            seen.add(t)
+            level = max(level, self._level(item, depth=depth + 1))
+            if level == _LEVEL_CLOUDPICKLE:
+                break
+        return level
+
+    def encode(self, value: Any) -> Tuple[bytes, str]:
+        codec = self.codec_for(value)
+        if codec is PICKLE:
+            # a stdlib type can still hold something only cloudpickle handles
+            try:
+                return codec.encode(value), codec.content_type
+            except Exception:
+                codec = CLOUDPICKLE
+        return codec.encode(value), codec.content_type
+
+    # ----- decode -----
+    def decode(self, data: BytesLike, content_type: Optional[str] = None) -> Any:
+        codec = self._by_content_type.get(content_type or "")
+        if codec is not None:
+            return codec.decode(data)
+        # Unknown/legacy content type: JSON first, then cloudpickle.
+        try:
+            return _json_decode(data)
+        except Exception:
+            return pickle.loads(data)
+
+
+_registry = CodecRegistry()
+
+
+def get_codec_registry() -> CodecRegistry:
+    """Return the process‑wide :class:`CodecRegistry`."""
+    return _registry
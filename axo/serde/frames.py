@@ -0,0 +1,148 @@
+"""
+axo/serde/frames.py
+~~~~~~~~~~~~~~~~~~~
+
+Zero‑copy frame codec used by :meth:`Axo.to_bytes` / :meth:`Axo.from_bytes`.
+
+Layout (v2)::
+
+    [b"AXF2"][u32 n][u64 len_0 … len_{n-1}][part_0][part_1] … [part_{n-1}]
+
+* ``part_0``      – attrs pickled with protocol 5.
+* ``part_1``      – class source code (utf‑8).
+* ``part_2…n-1``  – pickle protocol 5 *out‑of‑band* buffers (e.g. NumPy arrays),
+  so large attributes are never copied into the pickle stream.
+
+The length table sits in the header, so the total size is known up front and
+every part is copied exactly once into the output (or zero times when the
+caller consumes :func:`frame_buffers` directly). Decoding only slices
+:class:`memoryview` objects over the input.
+
+Legacy frames (``[u32 len][attrs][u32 len][src]``) are still decoded.
+"""
+from __future__ import annotations
+
+import pickle
+import struct
+from typing import Any, List, Sequence, Tuple, Union
+
+import cloudpickle as cp
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+FRAME_MAGIC   = b"AXF2"
+_COUNT        = struct.Struct("<I")
+_LENGTH       = struct.Struct("<Q")
+_LEGACY_LEN   = struct.Struct("I")
+PICKLE_PROTOCOL = 5
+
+
+# --------------------------------------------------------------------------- #
+# Pickle (protocol 5, out-of-band buffers)
+# --------------------------------------------------------------------------- #
+def dumps_oob(obj: Any) -> Tuple[bytes, List[memoryview]]:
+    """
+    Pickle *obj* with protocol 5. Objects that support out‑of‑band buffers
+    (NumPy arrays, :class:`pickle.PickleBuffer`) are returned as raw
+    memoryviews instead of being copied into the payload.
+    """
+    buffers: List[pickle.PickleBuffer] = []
+    payload = cp.dumps(obj, protocol=PICKLE_PROTOCOL, buffer_callback=buffers.append)
+    return payload, [b.raw() for b in buffers]
+
+
+def loads_oob(payload: BytesLike, buffers: Sequence[BytesLike] = (), *, writable: bool = False) -> Any:
+    """
+    Inverse of :func:`dumps_oob`. Buffers are used in place, so arrays
+    decoded from read‑only input (``bytes``) are read‑only too; pass a
+    writable input (``bytearray``) for mutable ones without a copy, or
+    *writable* ``True`` to copy read‑only buffers once.
+    """
+    if writable:
+        buffers = [
+            b if not memoryview(b).readonly else bytearray(b)
+            for b in buffers
+        ]
+    return pickle.loads(payload, buffers=buffers)
+
+
+# --------------------------------------------------------------------------- #
+# Framing
+# --------------------------------------------------------------------------- #
+def _header(parts: Sequence[memoryview]) -> bytes:
+    n = len(parts)
+    header = bytearray(len(FRAME_MAGIC) + _COUNT.size + _LENGTH.size * n)
+    header[: len(FRAME_MAGIC)] = FRAME_MAGIC
+    offset = len(FRAME_MAGIC)
+    _COUNT.pack_into(header, offset, n)
+    offset += _COUNT.size
+    for part in parts:
+        _LENGTH.pack_into(header, offset, part.nbytes)
+        offset += _LENGTH.size
+    return bytes(header)
+
+
+def frame_buffers(parts: Sequence[BytesLike]) -> List[memoryview]:
+    """
+    Return ``[header, part_0, …]`` as memoryviews without copying any part.
+    Suitable for scatter/gather writers (``writelines``, ``send_multipart``).
+    """
+    views = [memoryview(p).cast("B") for p in parts]
+    return [memoryview(_header(views)), *views]
+
+
+def pack_frames(parts: Sequence[BytesLike]) -> bytes:
+    """Concatenate header + parts into one exact-size buffer (one copy per part)."""
+    return b"".join(frame_buffers(parts))
+
+
+def unpack_frames(raw: BytesLike) -> List[memoryview]:
+    """
+    Split *raw* into its parts. Every returned item is a memoryview over
+    *raw*; nothing is copied.
+    """
+    mv = memoryview(raw).cast("B")
+    if mv[: len(FRAME_MAGIC)] == FRAME_MAGIC:
+        offset = len(FRAME_MAGIC)
+        (n,) = _COUNT.unpack_from(mv, offset)
+        offset += _COUNT.size
+        lengths = [_LENGTH.unpack_from(mv, offset + i * _LENGTH.size)[0] for i in range(n)]
+        offset += _LENGTH.size * n
+        parts: List[memoryview] = []
+        for length in lengths:
+            end = offset + length
+            if end > mv.nbytes:
+                raise ValueError(f"Truncated frame: expected {end} bytes, got {mv.nbytes}")
+            parts.append(mv[offset:end])
+            offset = end
+        return parts
+    return _unpack_legacy(mv)
+
+
+def _unpack_legacy(mv: memoryview) -> List[memoryview]:
+    parts: List[memoryview] = []
+    index = 0
+    while index < mv.nbytes:
+        (length,) = _LEGACY_LEN.unpack_from(mv, index)
+        index += _LEGACY_LEN.size
+        parts.append(mv[index:index + length])
+        index += length
+    return parts
+
+
+# --------------------------------------------------------------------------- #
+# Axo object frames
+# --------------------------------------------------------------------------- #
+def encode_object(attrs: Any, class_code: BytesLike) -> List[BytesLike]:
+    """Return the un-framed parts ``[attrs_pickle, class_code, *oob_buffers]``."""
+    payload, buffers = dumps_oob(attrs)
+    return [payload, class_code, *buffers]
+
+
+def decode_object(raw: BytesLike, *, writable: bool = False) -> Tuple[Any, memoryview]:
+    """Return ``(attrs, class_code)``; *class_code* is a memoryview over *raw*."""
+    parts = unpack_frames(raw)
+    if len(parts) < 2:
+        raise ValueError(f"Malformed object frame: expected ≥2 parts, got {len(parts)}")
+    attrs = loads_oob(parts[0], parts[2:], writable=writable)
+    return attrs, parts[1]
@@ -0,0 +1,214 @@
+"""
+axo/serde/lazy.py
+~~~~~~~~~~~~~~~~~
+
+Placeholders for attributes that :class:`AxoLoader` does not download up front.
+
+A :class:`LazyAttr` stands in for one attribute blob of an object stored one
+blob per attribute. The first time it is used (attribute access, operators,
+``len``, iteration, ``np.asarray``, pickling…) it fetches and decodes the blob
+and then replaces itself in the owner's ``__dict__``, so later accesses hit the
+real value with no indirection.
+
+Fetching is asynchronous underneath. From synchronous code every coroutine runs
+on one private event loop (in a daemon thread), so storage clients bound to the
+loop they were first used on keep working. Synchronous access from inside a
+running loop raises :class:`LazyAttrError` instead of blocking it, so coroutines
+must ``await`` :meth:`LazyAttr.aresolve` or :meth:`AxoLoader.materialize` first.
+"""
+from __future__ import annotations
+
+import asyncio
+import operator
+import threading
+import weakref
+from typing import Any, Awaitable, Callable
+
+from option import Result
+
+from axo.enums import AxoErrorType
+from axo.errors import AxoError
+
+Fetch = Callable[[], Awaitable[Result[Any, AxoError]]]
+
+_MISSING = object()
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+class LazyAttrError(Exception):
+    """A lazy attribute could not be fetched or decoded."""
+
+    def __init__(self, name: str, error: AxoError) -> None:
+        super().__init__(f"lazy attribute {name!r} could not be loaded: {error}")
+        self.error = error
+
+
+def _in_running_loop() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def _run(coro: Awaitable[Any]) -> Any:
+    """Run *coro* on the private fetch loop and wait for its result."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="axo-lazy-attr", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+
+
+class LazyAttr:
+    """Transparent proxy for an attribute that is fetched on first use."""
+
+    __slots__ = ("_axo_name", "_axo_size", "_axo_fetch", "_axo_value", "_axo_owner", "_axo_lock")
+
+    def __init__(self, name: str, size: int, fetch: Fetch) -> None:
+        object.__setattr__(self, "_axo_name", name)
+        object.__setattr__(self, "_axo_size", size)
+        object.__setattr__(self, "_axo_fetch", fetch)
+        object.__setattr__(self, "_axo_value", _MISSING)
+        object.__setattr__(self, "_axo_owner", None)
+        object.__setattr__(self, "_axo_lock", threading.Lock())
+
+    # ------------------------------------------------------------------ #
+    # Resolution
+    # ------------------------------------------------------------------ #
+    @property
+    def is_resolved(self) -> bool:
+        return self._axo_value is not _MISSING
+
+    def bind(self, owner: Any) -> None:
+        """Let the proxy swap itself for the value in ``owner.__dict__``."""
+        object.__setattr__(self, "_axo_owner", weakref.ref(owner))
+
+    def _set(self, result: Result[Any, AxoError]) -> Any:
+        if result.is_err:
+            raise LazyAttrError(self._axo_name, result.unwrap_err())
+        object.__setattr__(self, "_axo_value", result.unwrap())
+        object.__setattr__(self, "_axo_fetch", None)
+        owner = self._axo_owner() if self._axo_owner is not None else None
+        if owner is not None and owner.__dict__.get(self._axo_name) is self:
+            # bypasses Axo.__setattr__: loading is not a modification
+            owner.__dict__[self._axo_name] = self._axo_value
+        return self._axo_value
+
+    def resolve(self) -> Any:
+        """Return the value, fetching it (once) if needed."""
+        if self._axo_value is _MISSING:
+            with self._axo_lock:
+                if self._axo_value is _MISSING:
+                    if _in_running_loop():
+                        # blocking here would stall the loop the fetch needs
+                        raise LazyAttrError(self._axo_name, AxoError.make(
+                            AxoErrorType.BAD_REQUEST,
+                            "used synchronously inside a running event loop; "
+                            "await AxoLoader.materialize(obj) or LazyAttr.aresolve() first",
+                        ))
+                    return self._set(_run(self._axo_fetch()))
+        return self._axo_value
+
+    async def aresolve(self) -> Any:
+        """Async :meth:`resolve`."""
+        if self._axo_value is _MISSING:
+            fetch = self._axo_fetch
+            result = await fetch() if fetch is not None else None
+            with self._axo_lock:
+                if self._axo_value is _MISSING:
+                    return self._set(result)
+        return self._axo_value
+
+    # ------------------------------------------------------------------ #
+    # Forwarding
+    # ------------------------------------------------------------------ #
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.resolve(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self.resolve(), name)
+
+    @property
+    def __class__(self):  # isinstance(proxy, type(value)) holds
+        return type(self.resolve())
+
+    def __reduce_ex__(self, protocol: int):
+        # pickles (and copies) as the real value
+        return self.resolve().__reduce_ex__(protocol)
+
+    def __repr__(self) -> str:
+        if self._axo_value is _MISSING:
+            return f"<LazyAttr {self._axo_name} ({self._axo_size} bytes, not loaded)>"
+        return repr(self._axo_value)
+
+    def __dir__(self):
+        return dir(self.resolve())
+
+    def __bool__(self) -> bool:
+        return bool(self.resolve())
+
+    def __hash__(self) -> int:
+        return hash(self.resolve())
+
+
+def _unary(fn: Callable[[Any], Any]):
+    return lambda self: fn(self.resolve())
+
+
+def _binary(fn: Callable[[Any, Any], Any]):
+    return lambda self, other: fn(self.resolve(), other)
+
+
+def _reflected(fn: Callable[[Any, Any], Any]):
+    return lambda self, other: fn(other, self.resolve())
+
+
+def _method(name: str):
+    return lambda self, *args, **kwargs: getattr(self.resolve(), name)(*args, **kwargs)
+
+
+def _array(self, *args, **kwargs):
+    import numpy as np
+
+    return np.asarray(self.resolve(), *args, **kwargs)
+
+
+for _name, _fn in {
+    "str": str, "bytes": bytes, "len": len, "iter": iter, "reversed": reversed,
+    "int": int, "float": float, "complex": complex, "index": operator.index,
+    "neg": operator.neg, "pos": operator.pos, "abs": abs, "invert": operator.invert,
+}.items():
+    setattr(LazyAttr, f"__{_name}__", _unary(_fn))
+
+for _name in ("eq", "ne", "lt", "le", "gt", "ge", "contains", "getitem", "delitem"):
+    setattr(LazyAttr, f"__{_name}__", _binary(getattr(operator, _name)))
+
+for _name in ("add", "sub", "mul", "matmul", "truediv", "floordiv", "mod", "pow",
+              "lshift", "rshift", "and", "xor", "or"):
+    _op = _name + "_" if _name in ("and", "or") else _name
+    setattr(LazyAttr, f"__{_name}__", _binary(getattr(operator, _op)))
+    setattr(LazyAttr, f"__r{_name}__", _reflected(getattr(operator, _op)))
+    setattr(LazyAttr, f"__i{_name}__", _binary(getattr(operator, "i" + _name)))
+
+for _name in ("call", "enter", "exit", "fspath"):
+    setattr(LazyAttr, f"__{_name}__", _method(f"__{_name}__"))
+
+LazyAttr.__setitem__ = lambda self, key, value: operator.setitem(self.resolve(), key, value)
+LazyAttr.__format__  = lambda self, spec: format(self.resolve(), spec)
+LazyAttr.__round__   = lambda self, *args: round(self.resolve(), *args)
+LazyAttr.__array__   = _array
+
+
+def materialize(value: Any) -> Any:
+    """The real value behind *value* if it is a :class:`LazyAttr`, else *value*."""
+    return value.resolve() if type(value) is LazyAttr else value
+
+
+__all__ = ["LazyAttr", "LazyAttrError", "materialize"]
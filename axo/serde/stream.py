@@ -0,0 +1,317 @@
+"""
+axo/serde/stream.py
+~~~~~~~~~~~~~~~~~~~
+
+Streaming codec used by :meth:`Axo.to_stream` / :meth:`Axo.from_stream`.
+
+Unlike :mod:`axo.serde.frames` nothing is materialised up front: attributes
+are pickled (protocol 5) by a producer thread while the consumer pulls
+``chunk_size`` blocks, so peak memory stays around a few chunks. Out‑of‑band
+buffers (NumPy arrays, …) are sliced straight from the live object.
+
+Layout (v1) – a sequence of records after the magic::
+
+    [b"AXS1"] ([u8 kind][u64 len][len bytes])* [END]
+
+* ``SOURCE``  – class source code (utf‑8), always first.
+* ``PICKLE``  – a slice of the attrs pickle stream.
+* ``BUFFER``  – one whole out‑of‑band buffer, in pickling order.
+* ``END``     – terminator (``len == 0``).
+
+The decoder feeds ``PICKLE`` records to :class:`pickle.Unpickler` as a file and
+``BUFFER`` records as its ``buffers`` iterable, so it never holds more than one
+pickle frame plus the buffers being rebuilt. Non‑streamed input (``AXF2`` /
+legacy frames) is accepted and decoded with :func:`frames.decode_object`.
+"""
+from __future__ import annotations
+
+import pickle
+import queue
+import struct
+import threading
+from collections import deque
+from typing import Any, Deque, Iterable, Iterator, List, Optional, Tuple
+
+import cloudpickle as cp
+
+from axo.serde.frames import PICKLE_PROTOCOL, BytesLike, decode_object
+
+STREAM_MAGIC = b"AXS1"
+_RECORD      = struct.Struct("<BQ")
+
+REC_END, REC_SOURCE, REC_PICKLE, REC_BUFFER = 0, 1, 2, 3
+
+# Chunks waiting between the pickling thread and the consumer.
+_QUEUE_DEPTH = 4
+_DONE        = object()
+
+
+# --------------------------------------------------------------------------- #
+# Encoder
+# --------------------------------------------------------------------------- #
+class _Closed(Exception):
+    """The consumer went away; stop pickling."""
+
+
+class _ChunkWriter:
+    """Re-cuts the record stream into exact ``chunk_size`` blocks."""
+
+    def __init__(self, chunk_size: int, emit) -> None:
+        self.chunk_size = chunk_size
+        self.emit = emit
+        self.buf = bytearray()
+
+    def write(self, data: BytesLike) -> None:
+        mv = memoryview(data).cast("B")
+        while mv.nbytes:
+            room = self.chunk_size - len(self.buf)
+            self.buf += mv[:room]
+            mv = mv[room:]
+            if len(self.buf) == self.chunk_size:
+                self.emit(bytes(self.buf))
+                self.buf.clear()
+
+    def record(self, kind: int, data: BytesLike = b"") -> None:
+        self.write(_RECORD.pack(kind, memoryview(data).nbytes))
+        self.write(data)
+
+    def flush(self) -> None:
+        if self.buf:
+            self.emit(bytes(self.buf))
+            self.buf.clear()
+
+
+class _PickleSink:
+    """File object handed to the pickler; every write becomes a PICKLE record."""
+
+    def __init__(self, writer: _ChunkWriter) -> None:
+        self.writer = writer
+
+    def write(self, data: BytesLike) -> int:
+        self.writer.record(REC_PICKLE, data)
+        return memoryview(data).nbytes
+
+
+def iter_encode_object(attrs: Any, class_code: BytesLike, *, chunk_size: int) -> Iterator[bytes]:
+    """
+    Yield the streamed encoding of ``(attrs, class_code)`` in blocks of
+    *chunk_size* bytes (the last one may be shorter).
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+    q: "queue.Queue[Any]" = queue.Queue(maxsize=_QUEUE_DEPTH)
+    closed = threading.Event()
+
+    def emit(chunk: bytes) -> None:
+        while True:
+            if closed.is_set():
+                raise _Closed()
+            try:
+                q.put(chunk, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        writer = _ChunkWriter(chunk_size, emit)
+        try:
+            writer.write(STREAM_MAGIC)
+            writer.record(REC_SOURCE, class_code)
+            pickler = cp.CloudPickler(
+                _PickleSink(writer),
+                protocol        = PICKLE_PROTOCOL,
+                buffer_callback = lambda pb: writer.record(REC_BUFFER, pb.raw()),
+            )
+            pickler.dump(attrs)
+            writer.record(REC_END)
+            writer.flush()
+            emit(_DONE)
+        except _Closed:
+            pass
+        except BaseException as e:  # surfaced in the consumer
+            try:
+                emit(e)
+            except _Closed:
+                pass
+
+    producer = threading.Thread(target=produce, name="axo-stream-encoder", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = q.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        closed.set()
+        producer.join()
+
+
+# --------------------------------------------------------------------------- #
+# Decoder
+# --------------------------------------------------------------------------- #
+class _RecordReader:
+    """Pulls records out of an iterable of arbitrarily cut chunks."""
+
+    def __init__(self, chunks: Iterable[BytesLike]) -> None:
+        self.chunks = iter(chunks)
+        self.buf = bytearray()
+        self.pos = 0
+
+    def _fill(self, n: int) -> bool:
+        while len(self.buf) - self.pos < n:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                return False
+            if self.pos:
+                del self.buf[: self.pos]
+                self.pos = 0
+            self.buf += chunk
+        return True
+
+    def read_exact(self, n: int) -> bytes:
+        if not self._fill(n):
+            raise ValueError(f"Truncated stream: expected {n} more bytes")
+        out = bytes(self.buf[self.pos : self.pos + n])
+        self.pos += n
+        return out
+
+    def read_into(self, n: int) -> bytearray:
+        """Read *n* bytes into a fresh writable buffer (out-of-band data)."""
+        out = bytearray(n)
+        view = memoryview(out)
+        offset = 0
+        while offset < n:
+            if self.pos == len(self.buf) and not self._fill(1):
+                raise ValueError(f"Truncated stream: expected {n - offset} more bytes")
+            take = min(n - offset, len(self.buf) - self.pos)
+            view[offset : offset + take] = self.buf[self.pos : self.pos + take]
+            self.pos += take
+            offset += take
+        return out
+
+    def next_record(self) -> Tuple[int, int]:
+        kind, length = _RECORD.unpack(self.read_exact(_RECORD.size))
+        return kind, length
+
+
+class _Demux:
+    """Splits records between the pickle stream and the buffer iterable."""
+
+    def __init__(self, reader: _RecordReader) -> None:
+        self.reader = reader
+        self.pickle_bytes: Deque[bytes] = deque()
+        self.buffers: Deque[bytearray] = deque()
+        self.ended = False
+
+    def pump(self) -> None:
+        if self.ended:
+            raise ValueError("Truncated stream: END reached while data was still expected")
+        kind, length = self.reader.next_record()
+        if kind == REC_PICKLE:
+            self.pickle_bytes.append(self.reader.read_exact(length))
+        elif kind == REC_BUFFER:
+            self.buffers.append(self.reader.read_into(length))
+        elif kind == REC_END:
+            self.ended = True
+        else:
+            raise ValueError(f"Unexpected stream record kind {kind}")
+
+
+class _PickleSource:
+    """Minimal file object over the PICKLE records, for :class:`pickle.Unpickler`."""
+
+    def __init__(self, demux: _Demux) -> None:
+        self.demux = demux
+        self.current = memoryview(b"")
+
+    def _next(self) -> bool:
+        while not self.demux.pickle_bytes:
+            if self.demux.ended:
+                return False
+            self.demux.pump()
+        self.current = memoryview(self.demux.pickle_bytes.popleft())
+        return True
+
+    def read(self, n: int = -1) -> bytes:
+        parts: List[bytes] = []
+        while n != 0:
+            if not self.current.nbytes and not self._next():
+                break
+            take = self.current.nbytes if n < 0 else min(n, self.current.nbytes)
+            parts.append(bytes(self.current[:take]))
+            self.current = self.current[take:]
+            if n > 0:
+                n -= take
+        return b"".join(parts)
+
+    def readinto(self, b) -> int:
+        data = self.read(memoryview(b).nbytes)
+        memoryview(b)[: len(data)] = data
+        return len(data)
+
+    def readline(self) -> bytes:
+        parts: List[bytes] = []
+        while True:
+            if not self.current.nbytes and not self._next():
+                break
+            idx = bytes(self.current).find(b"\n")
+            take = self.current.nbytes if idx < 0 else idx + 1
+            parts.append(bytes(self.current[:take]))
+            self.current = self.current[take:]
+            if idx >= 0:
+                break
+        return b"".join(parts)
+
+
+def _iter_buffers(demux: _Demux) -> Iterator[bytearray]:
+    while True:
+        while not demux.buffers:
+            if demux.ended:
+                return
+            demux.pump()
+        yield demux.buffers.popleft()
+
+
+def decode_stream(chunks: Iterable[BytesLike]) -> Tuple[Any, bytes]:
+    """
+    Return ``(attrs, class_code)`` from an iterable of chunks produced by
+    :func:`iter_encode_object` (or any non-streamed frame).
+    """
+    reader = _RecordReader(chunks)
+    if not reader._fill(len(STREAM_MAGIC)) or reader.read_exact(len(STREAM_MAGIC)) != STREAM_MAGIC:
+        # Not a stream: materialise and use the framed decoder.
+        rest = bytes(reader.buf) + b"".join(bytes(c) for c in reader.chunks)
+        attrs, code = decode_object(rest)
+        return attrs, bytes(code)
+
+    kind, length = reader.next_record()
+    if kind != REC_SOURCE:
+        raise ValueError(f"Malformed stream: expected SOURCE record, got {kind}")
+    class_code = reader.read_exact(length)
+
+    demux = _Demux(reader)
+    attrs = pickle.Unpickler(_PickleSource(demux), buffers=_iter_buffers(demux)).load()
+    while not demux.ended:
+        demux.pump()
+    return attrs, class_code
+
+
+def is_stream(raw: BytesLike) -> bool:
+    return memoryview(raw)[: len(STREAM_MAGIC)] == STREAM_MAGIC
+
+
+def decode_stream_bytes(raw: BytesLike) -> Tuple[Any, bytes]:
+    return decode_stream([raw])
+
+
+__all__ = [
+    "STREAM_MAGIC",
+    "iter_encode_object",
+    "decode_stream",
+    "decode_stream_bytes",
+    "is_stream",
+]
@@ -6,6 +6,8 @@ from axo.storage.types import (
     AxoStorageMetadata,
     AxoObjectBlobs,
     AxoObjectBlob,
+    AxoAttrsManifest,
+    AxoAttrEntry,
     BucketId,
     ComposedKey,
 )
@@ -13,18 +15,175 @@ from axo.storage.constants import (
     AXO_SOURCE_CODE_SUFFIX,
     AXO_ATTRS_SUFFIX,
     AXO_SCHEMA_VERSION,
+    AXO_CODE_BUCKET_ID,
+    AXO_DEDUP_SOURCE_CODE,
+    AXO_SOURCE_CACHE_SIZE,
+    AXO_MANIFEST_CACHE_SIZE,
+    AXO_MANIFEST_CONTENT_TYPE,
+    AXO_COMPRESSION,
 )
 from axo.storage.utils import StorageUtils as SU
+from axo.storage.compression import (
+    CompressionPolicy,
+    compress,
+    decompress,
+    NONE as NO_COMPRESSION,
+    AXO_COMPRESSION_TAG,
+    AXO_COMPRESSION_LEVEL_TAG,
+    AXO_RAW_SIZE_TAG,
+    AXO_RAW_CHECKSUM_TAG,
+)
+import asyncio
+from collections import OrderedDict
+from typing import Dict,Iterable,Optional,Set,Tuple,Union
+
+# Tags written on attrs blobs that point at a shared, content-addressed source.
+AXO_SOURCE_REF_TAG         = "axo_source_ref"
+AXO_SOURCE_REF_BUCKET_TAG  = "axo_source_ref_bucket_id"
+# Tag on the attrs blob telling whether it holds the attrs or a manifest.
+AXO_ATTRS_LAYOUT_TAG       = "axo_attrs_layout"
+AXO_ATTRS_LAYOUT_MANIFEST  = "manifest"
+# sha256 of the manifest bytes, so a cached manifest can be checked against storage
+AXO_MANIFEST_CHECKSUM_TAG  = "axo_manifest_checksum"
 
 class AxoStorage:
     """
     Knows how to name and tag the two pieces of an Axo object:
         <key>_{AXO_SOURCE_CODE_SUFFIX}, <key>_{AXO_ATTRS_SUFFIX}
     but remains Axo-agnostic (no imports from Axo Core; no exec).
+
+    With ``dedup_source_code=True`` the class source is stored once under its
+    sha256 in ``code_bucket_id`` and the attrs blob references it through the
+    ``axo_source_ref`` tag, so N objects of one class upload the source once.
+    Objects written in either mode can always be read back.
+
+    With ``compression`` (``True`` or a :class:`CompressionPolicy`) blobs are
+    compressed before upload when the policy finds it worthwhile; the codec is
+    recorded in tags and reads always undo it, whatever this flag says.
     """
 
-    def __init__(self, storage: StorageService) -> None:
+    def __init__(
+        self,
+        storage: StorageService,
+        *,
+        dedup_source_code: bool = AXO_DEDUP_SOURCE_CODE,
+        code_bucket_id: str = AXO_CODE_BUCKET_ID,
+        source_cache_size: int = AXO_SOURCE_CACHE_SIZE,
+        compression: Union[bool, CompressionPolicy] = AXO_COMPRESSION,
+    ) -> None:
         self.storage = storage
+        self.compression: Optional[CompressionPolicy] = (
+            compression if isinstance(compression, CompressionPolicy)
+            else CompressionPolicy() if compression else None
+        )
+        self.dedup_source_code = dedup_source_code
+        self.code_bucket_id = code_bucket_id
+        # (bucket_id, checksum) known to exist remotely → skip the upload
+        self._known_sources: Set[Tuple[str, str]] = set()
+        # checksum → source blob, LRU-bounded
+        self._source_cache: "OrderedDict[str, AxoObjectBlob]" = OrderedDict()
+        self._source_cache_size = source_cache_size
+        # (bucket_id, key) → (last manifest written/read, its checksum), LRU-bounded
+        self._manifests: "OrderedDict[Tuple[str, str], Tuple[AxoAttrsManifest, str]]" = OrderedDict()
+
+    # ----- compression -----
+
+    def _pack(self, data: bytes, tags: Dict[str, str]) -> Tuple[bytes, Dict[str, str]]:
+        """Compress *data* for upload; tags keep the codec and raw size/checksum."""
+        if self.compression is None:
+            return data, tags
+        payload, codec, level = compress(data, self.compression)
+        if codec == NO_COMPRESSION:
+            return data, tags
+        return payload, {
+            **tags,
+            AXO_COMPRESSION_TAG:       codec,
+            AXO_COMPRESSION_LEVEL_TAG: str(level),
+            AXO_RAW_SIZE_TAG:          str(len(data)),
+            AXO_RAW_CHECKSUM_TAG:      tags.get("checksum") or SU.sha256_hex(data),
+        }
+
+    @staticmethod
+    def _unpack(data: bytes, md: AxoStorageMetadata) -> Result[AxoObjectBlob, AxoError]:
+        """Undo :meth:`_pack`; size/checksum in the result describe the raw bytes."""
+        tags = md.tags or {}
+        codec = tags.get(AXO_COMPRESSION_TAG)
+        if not codec:
+            return Ok(AxoObjectBlob(data=data, metadata=md))
+        try:
+            raw = decompress(data, codec)
+        except Exception as e:
+            return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"Validation error: {md.key} {codec} decompression failed: {e}"))
+        md = md.model_copy(update={
+            "size":     int(tags.get(AXO_RAW_SIZE_TAG, len(raw))),
+            "checksum": tags.get(AXO_RAW_CHECKSUM_TAG, md.checksum),
+        })
+        return Ok(AxoObjectBlob(data=raw, metadata=md))
+
+    # ----- shared source cache -----
+
+    def _cache_source(self, blob: AxoObjectBlob) -> None:
+        if self._source_cache_size <= 0:
+            return
+        self._source_cache[blob.metadata.checksum] = blob
+        self._source_cache.move_to_end(blob.metadata.checksum)
+        while len(self._source_cache) > self._source_cache_size:
+            self._source_cache.popitem(last=False)
+
+    async def _put_shared_source(
+        self, *, blob: AxoObjectBlob, tags: Dict[str, str], chunk_size: str
+    ) -> Result[str, AxoError]:
+        """Upload *blob* under its checksum unless it is already there."""
+        checksum = blob.metadata.checksum
+        if (self.code_bucket_id, checksum) in self._known_sources:
+            return Ok(checksum)
+        md_res = await self.storage.get_metadata(bucket_id=self.code_bucket_id, key=checksum)
+        if md_res.is_err:
+            shared_md = blob.metadata.model_copy(
+                update={"key": checksum, "ball_id": checksum, "bucket_id": self.code_bucket_id}
+            )
+            data, shared_tags = self._pack(blob.data, SU.to_tags(shared_md, tags))
+            r = await self.storage.put(
+                bucket_id  = self.code_bucket_id,
+                key        = checksum,
+                data       = data,
+                tags       = shared_tags,
+                chunk_size = chunk_size,
+            )
+            if r.is_err:
+                return Err(r.unwrap_err())
+        self._known_sources.add((self.code_bucket_id, checksum))
+        self._cache_source(blob)
+        return Ok(checksum)
+
+    async def _get_shared_source(
+        self, *, bucket_id: str, checksum: str, chunk_size: str
+    ) -> Result[AxoObjectBlob, AxoError]:
+        cached = self._source_cache.get(checksum)
+        if cached is not None:
+            self._source_cache.move_to_end(checksum)
+            return Ok(cached)
+        data_res = await self.storage.get(bucket_id=bucket_id, key=checksum, chunk_size=chunk_size)
+        if data_res.is_err:
+            return Err(data_res.unwrap_err())
+        md_res = await self.storage.get_metadata(bucket_id=bucket_id, key=checksum)
+        if md_res.is_err:
+            return Err(md_res.unwrap_err())
+        blob_res = self._unpack(data_res.unwrap(), md_res.unwrap())
+        if blob_res.is_err:
+            return Err(blob_res.unwrap_err())
+        blob = blob_res.unwrap()
+        # a content-addressed blob must hash to its own key
+        if SU.sha256_hex(blob.data) != checksum:
+            return Err(
+                AxoError.make(
+                    error_type=AxoErrorType.VALIDATION_FAILED,
+                    msg=f"Validation error: shared source {checksum} checksum mismatch"
+                )
+            )
+        self._known_sources.add((bucket_id, checksum))
+        self._cache_source(blob)
+        return Ok(blob)
     # ----- keys -----
 
 
@@ -43,6 +202,8 @@ class AxoStorage:
         Accepts two AxoObjectBlob instances (source_code + attrs) plus class identity.
         Validates metadata vs bytes; writes with metadata-derived tags + Axo tags.
         """
+        # the single attrs blob replaces any per-attribute manifest
+        self._manifests.pop((bucket_id, key), None)
 
         expected_src_key  = SU.source_key(key)
         expected_attr_key = SU.attrs_key(key)
@@ -97,66 +258,343 @@ class AxoStorage:
         src_tags  = SU.to_tags(blobs.source_code_blob.metadata, src_extra)
         attr_tags = SU.to_tags(blobs.attrs_blob.metadata,    attr_extra)
 
-        # 1) put source
-        r1 = await self.storage.put(
-            bucket_id  = bucket_id,
-            key        = expected_src_key,
-            data       = blobs.source_code_blob.data,
-            tags       = src_tags,
-            chunk_size = chunk_size,
+        if self.dedup_source_code:
+            ref_res = await self._put_shared_source(
+                blob       = blobs.source_code_blob,
+                tags       = src_extra,
+                chunk_size = chunk_size,
+            )
+            if ref_res.is_err:
+                return Err(
+                    AxoError.make(
+                        error_type = AxoErrorType.STORAGE_ERROR,
+                        msg        = f"Failed to put shared source {blobs.source_code_blob.metadata.checksum}: {ref_res.unwrap_err()}"
+                    )
+                )
+            attr_tags[AXO_SOURCE_REF_TAG]        = ref_res.unwrap()
+            attr_tags[AXO_SOURCE_REF_BUCKET_TAG] = self.code_bucket_id
+            attr_data, attr_tags = self._pack(blobs.attrs_blob.data, attr_tags)
+            r2 = await self.storage.put(
+                bucket_id  = bucket_id,
+                key        = expected_attr_key,
+                data       = attr_data,
+                tags       = attr_tags,
+                chunk_size = chunk_size,
+            )
+            if r2.is_err:
+                return Err(
+                    AxoError.make(
+                        error_type = AxoErrorType.STORAGE_ERROR,
+                        msg        = f"Failed to put {expected_attr_key}: {r2.unwrap_err()}"
+                    )
+                )
+            return Ok(True)
+
+        # source and attrs are independent: upload both at once
+        src_data, src_tags   = self._pack(blobs.source_code_blob.data, src_tags)
+        attr_data, attr_tags = self._pack(blobs.attrs_blob.data, attr_tags)
+        r1, r2 = await asyncio.gather(
+            self.storage.put(
+                bucket_id  = bucket_id,
+                key        = expected_src_key,
+                data       = src_data,
+                tags       = src_tags,
+                chunk_size = chunk_size,
+            ),
+            self.storage.put(
+                bucket_id  = bucket_id,
+                key        = expected_attr_key,
+                data       = attr_data,
+                tags       = attr_tags,
+                chunk_size = chunk_size,
+            ),
         )
-        if r1.is_err:
+        if r1.is_err or r2.is_err:
+            # do not leave half an object behind
+            failed_key, err = (expected_src_key, r1.unwrap_err()) if r1.is_err else (expected_attr_key, r2.unwrap_err())
+            for written_key, r in ((expected_src_key, r1), (expected_attr_key, r2)):
+                if r.is_ok:
+                    await self.storage.delete(bucket_id=bucket_id, key=written_key)
             return Err(
                 AxoError.make(
                     error_type = AxoErrorType.STORAGE_ERROR,
-                    msg        = f"Failed to put {expected_src_key}: {r1.unwrap_err()}"
+                    msg        = f"Failed to put {failed_key}: {err}"
+                )
+            )
+
+        return Ok(True)
+
+    # -------------------- WRITE (per attribute) --------------------
+
+    def _cache_manifest(self, bucket_id: BucketId, key: ComposedKey, manifest: AxoAttrsManifest, checksum: str) -> None:
+        self._manifests[(bucket_id, key)] = (manifest, checksum)
+        self._manifests.move_to_end((bucket_id, key))
+        while len(self._manifests) > AXO_MANIFEST_CACHE_SIZE:
+            self._manifests.popitem(last=False)
+
+    @staticmethod
+    def is_manifest(md: AxoStorageMetadata) -> bool:
+        return (md.tags or {}).get(AXO_ATTRS_LAYOUT_TAG) == AXO_ATTRS_LAYOUT_MANIFEST
+
+    async def get_manifest(
+        self, *, bucket_id: BucketId, key: ComposedKey
+    ) -> Result[AxoAttrsManifest, AxoError]:
+        """
+        Manifest of an object stored with the per-attribute layout. The cached
+        copy is used only while its checksum matches the stored manifest's, so
+        a manifest rewritten by another writer is read again.
+        """
+        k_attr = SU.attrs_key(key)
+        md_res = await self.storage.get_metadata(bucket_id=bucket_id, key=k_attr)
+        if md_res.is_err:
+            self._manifests.pop((bucket_id, key), None)
+            return Err(md_res.unwrap_err())
+        md = md_res.unwrap()
+        if not self.is_manifest(md):
+            self._manifests.pop((bucket_id, key), None)
+            return Err(
+                AxoError.make(
+                    error_type = AxoErrorType.NOT_FOUND,
+                    msg        = f"{bucket_id}@{key} is not stored per attribute"
                 )
             )
+        cached = self._manifests.get((bucket_id, key))
+        if cached is not None and cached[1] == (md.tags or {}).get(AXO_MANIFEST_CHECKSUM_TAG):
+            return Ok(cached[0])
+        data_res = await self.storage.get(bucket_id=bucket_id, key=k_attr)
+        if data_res.is_err:
+            return Err(data_res.unwrap_err())
+        return self.parse_manifest(bucket_id=bucket_id, key=key, data=data_res.unwrap())
 
-        # 2) put attrs 
-        r2 = await self.storage.put(
+    def parse_manifest(
+        self, *, bucket_id: BucketId, key: ComposedKey, data: bytes
+    ) -> Result[AxoAttrsManifest, AxoError]:
+        try:
+            manifest = AxoAttrsManifest.model_validate_json(data)
+        except Exception as e:
+            return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"invalid manifest for {key}: {e}"))
+        self._cache_manifest(bucket_id, key, manifest, SU.sha256_hex(data))
+        return Ok(manifest)
+
+    async def put_attr_blobs(
+        self,
+        *,
+        bucket_id: BucketId,
+        key: ComposedKey,
+        source_code_blob: AxoObjectBlob,
+        attr_blobs: Dict[str, AxoObjectBlob],
+        class_name: str,
+        removed: Iterable[str] = (),
+        partial: bool = False,
+        chunk_size: str = "1MB",
+    ) -> Result[AxoAttrsManifest, AxoError]:
+        """
+        Store an object one blob per attribute plus a manifest under
+        ``<key>_attrs``. With ``partial=True`` only *attr_blobs* are written and
+        merged into the manifest this storage last wrote or read; if the stored
+        manifest is missing or was rewritten since (another writer), the call
+        fails with ``CONCURRENCY_CONFLICT`` and the caller must write the
+        whole object. A full write skips the source and every attribute whose
+        checksum matches the stored manifest.
+        """
+        base = AxoAttrsManifest(source_checksum="")
+        unchanged: Dict[str, AxoAttrEntry] = {}
+        if partial:
+            seen = self._manifests.get((bucket_id, key))
+            base_res = await self.get_manifest(bucket_id=bucket_id, key=key)
+            if base_res.is_err:
+                return Err(base_res.unwrap_err())
+            base = base_res.unwrap()
+            if seen is None or base is not seen[0]:
+                return Err(AxoError.make(AxoErrorType.CONCURRENCY_CONFLICT, f"{bucket_id}@{key} changed since it was last persisted from here"))
+        else:
+            # a full write replaces whatever manifest is stored
+            previous = await self.get_manifest(bucket_id=bucket_id, key=key)
+            if previous.is_ok:
+                base = previous.unwrap()
+                removed = set(removed) | (set(base.attrs) - set(attr_blobs))
+                unchanged = {
+                    name: entry for name, entry in base.attrs.items()
+                    if name in attr_blobs and entry.checksum == attr_blobs[name].metadata.checksum
+                }
+
+        for blob in (source_code_blob, *attr_blobs.values()):
+            err = SU._validate_blob_integrity(blob)
+            if err:
+                return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"Validation error: {blob.metadata.key} {err}"))
+
+        src_checksum = source_code_blob.metadata.checksum
+        common_extra = {
+            "axo_schema_ver": AXO_SCHEMA_VERSION,
+            "axo_class_name": class_name,
+        }
+        manifest_extra = {
+            **common_extra,
+            "axo_attrs_suffix": AXO_ATTRS_SUFFIX,
+            AXO_ATTRS_LAYOUT_TAG: AXO_ATTRS_LAYOUT_MANIFEST,
+        }
+
+        # 1) source
+        src_extra = {**common_extra, "axo_source_code_suffix": AXO_SOURCE_CODE_SUFFIX}
+        if self.dedup_source_code:
+            ref_res = await self._put_shared_source(blob=source_code_blob, tags=src_extra, chunk_size=chunk_size)
+            if ref_res.is_err:
+                return Err(AxoError.make(AxoErrorType.STORAGE_ERROR, f"Failed to put shared source {src_checksum}: {ref_res.unwrap_err()}"))
+            manifest_extra[AXO_SOURCE_REF_TAG]        = src_checksum
+            manifest_extra[AXO_SOURCE_REF_BUCKET_TAG] = self.code_bucket_id
+        elif base.source_checksum != src_checksum:
+            k_src = SU.source_key(key)
+            src_data, src_tags = self._pack(source_code_blob.data, SU.to_tags(source_code_blob.metadata, src_extra))
+            r = await self.storage.put(
+                bucket_id  = bucket_id,
+                key        = k_src,
+                data       = src_data,
+                tags       = src_tags,
+                chunk_size = chunk_size,
+            )
+            if r.is_err:
+                return Err(AxoError.make(AxoErrorType.STORAGE_ERROR, f"Failed to put {k_src}: {r.unwrap_err()}"))
+
+        # 2) changed attributes
+        entries = dict(base.attrs)
+        for name, blob in attr_blobs.items():
+            if name in unchanged:
+                continue
+            k = SU.attr_key(key, name)
+            data, tags = self._pack(blob.data, SU.to_tags(blob.metadata, {**common_extra, "axo_attr_name": name}))
+            r = await self.storage.put(
+                bucket_id  = bucket_id,
+                key        = k,
+                data       = data,
+                tags       = tags,
+                chunk_size = chunk_size,
+            )
+            if r.is_err:
+                return Err(AxoError.make(AxoErrorType.STORAGE_ERROR, f"Failed to put {k}: {r.unwrap_err()}"))
+            entries[name] = AxoAttrEntry(
+                key          = k,
+                size         = blob.metadata.size,
+                checksum     = blob.metadata.checksum,
+                content_type = blob.metadata.content_type,
+                compression  = tags.get(AXO_COMPRESSION_TAG),
+            )
+        removed = [name for name in removed if name not in attr_blobs]
+        for name in removed:
+            entries.pop(name, None)
+
+        # 3) manifest last, so readers never see entries that are not stored yet
+        manifest = AxoAttrsManifest(source_checksum=src_checksum, attrs=entries)
+        data = manifest.model_dump_json().encode("utf-8")
+        manifest_checksum = SU.sha256_hex(data)
+        manifest_extra[AXO_MANIFEST_CHECKSUM_TAG] = manifest_checksum
+        k_attr = SU.attrs_key(key)
+        manifest_md = AxoStorageMetadata(
+            key          = k_attr,
+            ball_id      = k_attr,
+            size         = len(data),
+            checksum     = manifest_checksum,
+            producer_id  = source_code_blob.metadata.producer_id,
+            bucket_id    = bucket_id,
+            tags         = dict(source_code_blob.metadata.tags or {}),
+            content_type = AXO_MANIFEST_CONTENT_TYPE,
+        )
+        r = await self.storage.put(
             bucket_id  = bucket_id,
-            key        = expected_attr_key,
-            data       = blobs.attrs_blob.data,
-            tags       = attr_tags,
+            key        = k_attr,
+            data       = data,
+            tags       = SU.to_tags(manifest_md, manifest_extra),
             chunk_size = chunk_size,
         )
-        if r2.is_err:
-                res = await self.storage.delete(bucket_id=bucket_id, key=expected_src_key)
-                if res.is_err:
-                    return Err(Exception(f"Failed to put {expected_attr_key}: {r2.unwrap_err()}"))
+        if r.is_err:
+            return Err(AxoError.make(AxoErrorType.STORAGE_ERROR, f"Failed to put {k_attr}: {r.unwrap_err()}"))
+        self._cache_manifest(bucket_id, key, manifest, manifest_checksum)
 
-        return Ok(True)
+        # 4) best effort: drop blobs of deleted attributes
+        for name in removed:
+            await self.storage.delete(bucket_id=bucket_id, key=SU.attr_key(key, name))
+        return Ok(manifest)
+
+    async def get_attr_blobs(
+        self, *, bucket_id: BucketId, manifest: AxoAttrsManifest, chunk_size: str = "1MB"
+    ) -> Result[Dict[str, AxoObjectBlob], AxoError]:
+        """Fetch every attribute listed in *manifest*, validating each checksum."""
+        blobs: Dict[str, AxoObjectBlob] = {}
+        for name, entry in manifest.attrs.items():
+            data_res = await self.storage.get(bucket_id=bucket_id, key=entry.key, chunk_size=chunk_size)
+            if data_res.is_err:
+                return Err(data_res.unwrap_err())
+            try:
+                data = decompress(data_res.unwrap(), entry.compression)
+            except Exception as e:
+                return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"Validation error: {entry.key} decompression failed: {e}"))
+            blob = AxoObjectBlob(
+                data     = data,
+                metadata = AxoStorageMetadata(
+                    key          = entry.key,
+                    ball_id      = entry.key,
+                    size         = entry.size,
+                    checksum     = entry.checksum,
+                    producer_id  = "axo",
+                    bucket_id    = bucket_id,
+                    content_type = entry.content_type,
+                ),
+            )
+            err = SU._validate_blob_integrity(blob)
+            if err:
+                return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"Validation error: {entry.key} {err}"))
+            blobs[name] = blob
+        return Ok(blobs)
 
     # -------------------- READ (to blobs) --------------------
 
+    @staticmethod
+    def _source_ref(md: AxoStorageMetadata) -> Optional[Tuple[str, str]]:
+        """(code_bucket_id, checksum) if *md* references a shared source."""
+        tags = md.tags or {}
+        checksum = tags.get(AXO_SOURCE_REF_TAG)
+        if not checksum:
+            return None
+        return tags.get(AXO_SOURCE_REF_BUCKET_TAG) or AXO_CODE_BUCKET_ID, checksum
+
     async def get_blobs(
         self, *, bucket_id: BucketId, key: ComposedKey, chunk_size: str = "1MB"
     ) -> Result[AxoObjectBlobs, AxoError]:
         """
         Loads both parts and reconstructs AxoObjectBlobs. Validates integrity.
+        Shared sources are resolved through the local source cache first.
         """
         k_src  = SU.source_key(key)
         k_attr = SU.attrs_key(key)
 
-        src_res   = await self.storage.get(bucket_id=bucket_id, key=k_src,  chunk_size=chunk_size)
-        attrs_res = await self.storage.get(bucket_id=bucket_id, key=k_attr, chunk_size=chunk_size)
-        if src_res.is_err:
-            return Err(src_res.unwrap_err())
-        if attrs_res.is_err:
-            return Err(attrs_res.unwrap_err())
-
-   # fetch metadata per key (your new API)
-        src_meta_res  = await self.storage.get_metadata(bucket_id=bucket_id, key=k_src)
         attr_meta_res = await self.storage.get_metadata(bucket_id=bucket_id, key=k_attr)
-        if src_meta_res.is_err:
-            
-            return Err(src_meta_res.unwrap_err())
         if attr_meta_res.is_err:
             return Err(attr_meta_res.unwrap_err())
+        attrs_res = await self.storage.get(bucket_id=bucket_id, key=k_attr, chunk_size=chunk_size)
+        if attrs_res.is_err:
+            return Err(attrs_res.unwrap_err())
+        attr_blob_res = self._unpack(attrs_res.unwrap(), attr_meta_res.unwrap())
+        if attr_blob_res.is_err:
+            return Err(attr_blob_res.unwrap_err())
+        attr_blob = attr_blob_res.unwrap()
 
-        src_blob  = AxoObjectBlob(data=src_res.unwrap(),   metadata=src_meta_res.unwrap())
-        attr_blob = AxoObjectBlob(data=attrs_res.unwrap(), metadata=attr_meta_res.unwrap())
+        source_ref = self._source_ref(attr_blob.metadata)
+        if source_ref:
+            ref_bucket_id, checksum = source_ref
+            shared_res = await self._get_shared_source(bucket_id=ref_bucket_id, checksum=checksum, chunk_size=chunk_size)
+            if shared_res.is_err:
+                return Err(shared_res.unwrap_err())
+            src_blob = shared_res.unwrap()
+        else:
+            src_res      = await self.storage.get(bucket_id=bucket_id, key=k_src,  chunk_size=chunk_size)
+            if src_res.is_err:
+                return Err(src_res.unwrap_err())
+            src_meta_res = await self.storage.get_metadata(bucket_id=bucket_id, key=k_src)
+            if src_meta_res.is_err:
+                return Err(src_meta_res.unwrap_err())
+            src_blob_res = self._unpack(src_res.unwrap(), src_meta_res.unwrap())
+            if src_blob_res.is_err:
+                return Err(src_blob_res.unwrap_err())
+            src_blob = src_blob_res.unwrap()
 
         # integrity validations
         err = SU._validate_blob_integrity(src_blob)
@@ -180,9 +618,23 @@ class AxoStorage:
     # -------------------- DELETE --------------------
 
     async def delete_object(self, *, bucket_id: BucketId, key: ComposedKey) -> Result[bool, AxoError]:
+        """
+        Delete both parts. A shared (content-addressed) source is left in
+        place because other objects may still reference it.
+        """
         k_src  = SU.source_key(key)
         k_attr = SU.attrs_key(key)
-        e1 = await self.storage.delete(bucket_id=bucket_id, key=k_src)
+        attr_meta_res = await self.storage.get_metadata(bucket_id=bucket_id, key=k_attr)
+        if attr_meta_res.is_ok and self._source_ref(attr_meta_res.unwrap()):
+            e1 = Ok(True)
+        else:
+            e1 = await self.storage.delete(bucket_id=bucket_id, key=k_src)
+        if attr_meta_res.is_ok and self.is_manifest(attr_meta_res.unwrap()):
+            manifest_res = await self.get_manifest(bucket_id=bucket_id, key=key)
+            if manifest_res.is_ok:
+                for entry in manifest_res.unwrap().attrs.values():
+                    await self.storage.delete(bucket_id=bucket_id, key=entry.key)
+        self._manifests.pop((bucket_id, key), None)
         e2 = await self.storage.delete(bucket_id=bucket_id, key=k_attr)
         if e1.is_err:
             return Err(e1.unwrap_err())
@@ -1,4 +1,14 @@
 import os
 AXO_SOURCE_CODE_SUFFIX = os.environ.get("AXO_SOURCE_CODE_SUFFIX","source_code")
 AXO_ATTRS_SUFFIX       = os.environ.get("AXO_ATTRS_SUFFIX","attrs")
-AXO_SCHEMA_VERSION         = os.environ.get("AXO_SCHEMA_VERSION","1")              # bump if you change tagging
\ No newline at end of file
+AXO_SCHEMA_VERSION         = os.environ.get("AXO_SCHEMA_VERSION","1")              # bump if you change tagging
+AXO_CODE_BUCKET_ID         = os.environ.get("AXO_CODE_BUCKET_ID","axo-code")       # shared, content-addressed class sources
+AXO_DEDUP_SOURCE_CODE      = os.environ.get("AXO_DEDUP_SOURCE_CODE","0") == "1"
+AXO_SOURCE_CACHE_SIZE      = int(os.environ.get("AXO_SOURCE_CACHE_SIZE","128"))
+AXO_INCREMENTAL_PERSIST    = os.environ.get("AXO_INCREMENTAL_PERSIST","0") == "1"  # one blob per attribute + manifest
+AXO_MANIFEST_CACHE_SIZE    = int(os.environ.get("AXO_MANIFEST_CACHE_SIZE","1024"))
+AXO_MANIFEST_CONTENT_TYPE  = "application/vnd.axo.manifest+json"
+AXO_COMPRESSION            = os.environ.get("AXO_COMPRESSION","0") == "1"          # size-adaptive zlib/lzma/bz2 on put
+AXO_LAZY_LOAD              = os.environ.get("AXO_LAZY_LOAD","0") == "1"            # defer large attribute blobs until first use
+AXO_LAZY_ATTR_THRESHOLD    = int(os.environ.get("AXO_LAZY_ATTR_THRESHOLD",str(1024*1024)))  # bytes
+AXO_PERSIST_CONCURRENCY    = int(os.environ.get("AXO_PERSIST_CONCURRENCY","32"))    # in-flight uploads in persistify_many
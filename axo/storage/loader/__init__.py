@@ -1,14 +1,17 @@
 from __future__ import annotations
-import json
 import types
 from typing import Any, Dict, Optional, Type
 # 
 from option import Ok, Err, Result
 # 
 from axo.storage import AxoStorage
-from axo.storage.types import AxoStorageMetadata
+from axo.storage.types import AxoStorageMetadata,AxoAttrsManifest,AxoAttrEntry
+from axo.storage.constants import AXO_LAZY_LOAD,AXO_LAZY_ATTR_THRESHOLD
+from axo.serde.lazy import LazyAttr,LazyAttrError
 from axo.errors import AxoError, AxoErrorType
 from axo.log import get_logger
+from axo.cache import ClassCache,get_class_cache,namespace_token,set_class_source
+from axo.serde import deserialize_attrs
 
 logger = get_logger(__name__)
 
@@ -30,14 +33,27 @@ class AxoLoader:
         *,
         api_globals: Optional[Dict[str, Any]] = None,
         safe_builtins: Optional[Dict[str, Any]] = None,
+        class_cache: Optional[ClassCache] = None,
+        lazy: bool = AXO_LAZY_LOAD,
+        lazy_threshold: int = AXO_LAZY_ATTR_THRESHOLD,
     ) -> None:
         """
         api_globals: injected symbols visible to user code (e.g., Axo base class, decorators)
         safe_builtins: optionally restrict builtins for exec (pass {} for very restrictive)
+        class_cache: compiled-class cache (defaults to the process-wide one)
+        lazy: leave attribute blobs of at least `lazy_threshold` bytes in storage
+              until first use (objects stored one blob per attribute only)
         """
         self.storage = storage
+        self.lazy = lazy
+        self.lazy_threshold = lazy_threshold
         self.api_globals = dict(api_globals or {})
         self.safe_builtins = dict(safe_builtins or {})
+        self.class_cache = class_cache if class_cache is not None else get_class_cache()
+        self._namespace_token = (
+            namespace_token(self.api_globals),
+            namespace_token(self.safe_builtins),
+        )
 
     # --------------------------- public API ---------------------------
 
@@ -47,9 +63,12 @@ class AxoLoader:
         bucket_id: str,
         key: str,
         class_name: Optional[str] = None,
+        lazy: Optional[bool] = None,
     ) -> Result[Any, AxoError]:
         """
         High-level: returns a fully constructed instance of the class stored under `key`.
+        With `lazy` (defaults to the loader's setting) large attributes are
+        :class:`LazyAttr` proxies fetched on first use.
         """
         blobs_res = await self.storage.get_blobs(bucket_id=bucket_id, key=key)
         if blobs_res.is_err:
@@ -75,7 +94,16 @@ class AxoLoader:
             return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, "missing axo_class_name tag"))
 
         # 2) decode attrs
-        attrs_res = self._decode_attrs(at.data)
+        per_attribute = self.storage.is_manifest(at.metadata)
+        if per_attribute:
+            attrs_res = await self._load_attrs_per_attribute(
+                bucket_id     = bucket_id,
+                key           = key,
+                manifest_data = at.data,
+                lazy          = self.lazy if lazy is None else lazy,
+            )
+        else:
+            attrs_res = self._decode_attrs(at.data, self._content_type(at.metadata))
         if attrs_res.is_err:
             return Err(attrs_res.unwrap_err())
         attrs = attrs_res.unwrap()
@@ -91,12 +119,34 @@ class AxoLoader:
         # 4) construct
         try:
             instance = Cls(**attrs) if isinstance(attrs, dict) else Cls(attrs)
+            for value in getattr(instance, "__dict__", {}).values():
+                if type(value) is LazyAttr:
+                    value.bind(instance)
+            mark_persisted = getattr(instance, "_acx_mark_persisted", None)
+            if callable(mark_persisted):
+                # the stored copy is current; a per-attribute one can be updated in place
+                mark_persisted((bucket_id, key) if per_attribute else None)
             return Ok(instance)
+        except LazyAttrError as e:
+            return Err(e.error)
         except TypeError as e:
             return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"__init__ mismatch: {e}"))
         except Exception as e:
             return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, f"constructor failed: {e}"))
 
+    async def materialize(self, instance: Any, *names: str) -> Result[Any, AxoError]:
+        """
+        Fetch the lazy attributes *names* of *instance* (all of them when
+        none are given) without blocking the event loop.
+        """
+        try:
+            for name, value in list(getattr(instance, "__dict__", {}).items()):
+                if type(value) is LazyAttr and (not names or name in names):
+                    await value.aresolve()
+            return Ok(instance)
+        except LazyAttrError as e:
+            return Err(e.error)
+
     async def load_class(
         self, *, bucket_id: str, key: str, class_name: Optional[str] = None
     ) -> Result[Type[Any], AxoError]:
@@ -125,49 +175,103 @@ class AxoLoader:
         except Exception:
             return None
 
-    def _decode_attrs(self, raw: bytes) -> Result[Dict[str, Any] | Any, AxoError]:
+    async def _load_attrs_per_attribute(
+        self, *, bucket_id: str, key: str, manifest_data: bytes, lazy: bool = False
+    ) -> Result[Dict[str, Any], AxoError]:
+        manifest_res = self.storage.parse_manifest(bucket_id=bucket_id, key=key, data=manifest_data)
+        if manifest_res.is_err:
+            return Err(manifest_res.unwrap_err())
+        manifest = manifest_res.unwrap()
+
+        attrs: Dict[str, Any] = {}
+        if lazy:
+            deferred = {
+                name: entry for name, entry in manifest.attrs.items()
+                if entry.size >= self.lazy_threshold and not name.startswith("_acx_")
+            }
+            for name, entry in deferred.items():
+                attrs[name] = LazyAttr(name, entry.size, self._attr_fetcher(bucket_id, manifest.source_checksum, name, entry))
+            manifest = AxoAttrsManifest(
+                source_checksum = manifest.source_checksum,
+                attrs           = {n: e for n, e in manifest.attrs.items() if n not in deferred},
+            )
+
+        blobs_res = await self.storage.get_attr_blobs(bucket_id=bucket_id, manifest=manifest)
+        if blobs_res.is_err:
+            return Err(blobs_res.unwrap_err())
+        for name, blob in blobs_res.unwrap().items():
+            value_res = self._decode_attrs(blob.data, blob.metadata.content_type)
+            if value_res.is_err:
+                return Err(value_res.unwrap_err())
+            attrs[name] = value_res.unwrap()
+        return Ok(attrs)
+
+    def _attr_fetcher(self, bucket_id: str, source_checksum: str, name: str, entry: AxoAttrEntry):
+        manifest = AxoAttrsManifest(source_checksum=source_checksum, attrs={name: entry})
+
+        async def fetch() -> Result[Any, AxoError]:
+            blobs_res = await self.storage.get_attr_blobs(bucket_id=bucket_id, manifest=manifest)
+            if blobs_res.is_err:
+                return Err(blobs_res.unwrap_err())
+            blob = blobs_res.unwrap()[name]
+            return self._decode_attrs(blob.data, blob.metadata.content_type)
+
+        return fetch
+
+    @staticmethod
+    def _content_type(md: AxoStorageMetadata) -> Optional[str]:
+        # some backends only keep the content type in the tags
+        if md.content_type and md.content_type != "application/octet-stream":
+            return md.content_type
+        return (md.tags or {}).get("content_type", md.content_type)
+
+    def _decode_attrs(self, raw: bytes, content_type: Optional[str] = None) -> Result[Dict[str, Any] | Any, AxoError]:
         """
-        Try JSON first; fallback to cloudpickle; else error.
+        Decode with the codec named by *content_type* (see :mod:`axo.serde.codecs`).
         """
-        # JSON
         try:
-            return Ok(json.loads(raw.decode("utf-8")))
-        except Exception:
-            pass
-
-        # cloudpickle fallback (optional dependency)
-        try:
-            import cloudpickle as cp  # local import to avoid hard dep
-            return Ok(cp.loads(raw))
+            return Ok(deserialize_attrs(raw, content_type))
         except Exception as e:
             return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"attrs decode failed: {e}"))
 
+    @staticmethod
+    def _register_source(Cls: Any, src_bytes: bytes) -> Any:
+        # Classes rebuilt from storage have no file for inspect.getsource
+        if isinstance(Cls, type):
+            set_class_source(Cls, str(src_bytes, "utf-8"))
+        return Cls
+
     def __exec_source_and_resolve_class(
         self, src_bytes: bytes, class_name: str
     ) -> Result[Type[Any], AxoError]:
         """
         Compile + exec in an isolated module dict; then fetch class by name.
+        Results are shared through the process-wide class cache, so a given
+        source is compiled once per (class name, injected globals).
         """
-        try:
-            src = src_bytes.decode("utf-8")
-        except Exception as e:
-            return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"source not utf-8: {e}"))
+        def namespace() -> Dict[str, Any]:
+            mod = types.ModuleType("__axo_dynamic__")
+            # build globals for exec
+            g: Dict[str, Any] = {"__name__": mod.__name__, "__builtins__": self.safe_builtins or __builtins__}
+            g.update(self.api_globals)
+            return g
 
-        mod = types.ModuleType("__axo_dynamic__")
-        # build globals for exec
-        g: Dict[str, Any] = {"__name__": mod.__name__, "__builtins__": self.safe_builtins or __builtins__}
-        g.update(self.api_globals)
         try:
-            exec(compile(src, filename=f"<axo:{class_name}>", mode="exec"), g, g)
+            Cls = self.class_cache.get_or_compile(
+                src_bytes,
+                namespace_factory = namespace,
+                resolve           = lambda g: self._register_source(g[class_name], src_bytes),
+                token             = (class_name, self._namespace_token),
+                filename          = f"<axo:{class_name}>",
+            )
+        except UnicodeDecodeError as e:
+            return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"source not utf-8: {e}"))
         except SyntaxError as e:
             return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"syntax error: {e}"))
-        except Exception as e:
-            return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, f"exec failed: {e}"))
-
-        try:
-            Cls = g[class_name]
         except KeyError:
             return Err(AxoError.make(AxoErrorType.NOT_FOUND, f"class {class_name} not defined"))
+        except Exception as e:
+            return Err(AxoError.make(AxoErrorType.INTERNAL_ERROR, f"exec failed: {e}"))
         if not isinstance(Cls, type):
             return Err(AxoError.make(AxoErrorType.VALIDATION_FAILED, f"{class_name} is not a class"))
         return Ok(Cls)
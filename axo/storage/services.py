@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import os
+import hashlib as H
 import time as T
-from typing import Dict,Optional,List
+from typing import Dict,Optional,List,Iterable
+import humanfriendly as HF
 import tempfile
 from nanoid import generate as nanoid
 from option import Err, Ok, Result
@@ -12,7 +14,7 @@ from mictlanx.utils.index import Utils
 from mictlanx import AsyncClient
 # 
 from axo.log import get_logger
-from axo.storage.types import StorageService,BucketId,BallId,AxoStorageMetadata
+from axo.storage.types import StorageService,BucketId,BallId,AxoStorageMetadata,ChunkIter
 from axo.storage.utils import StorageUtils as SU
 from axo.errors import AxoError,AxoErrorType
 # --------------------------------------------------------------------------- #
@@ -228,6 +230,94 @@ class LocalStorageService(StorageService):
             return Err(_e)
             # return Err(e)
 
+    async def put_chunks(
+        self,
+        *,
+        bucket_id: str,
+        key: str,
+        chunks: Iterable[bytes],
+        tags: Dict[str, str] | None = None,
+        chunk_size: str = "1MB",
+    ) -> Result[str, AxoError]:
+        """
+        Streamed PUT: chunks are hashed and written to a temp file as they
+        arrive (never joined in memory), then renamed into place.
+        """
+        t0   = T.time()
+        key  = key or nanoid()
+        ddir = self._data_dir(bucket_id)
+        os.makedirs(ddir, exist_ok=True)
+        os.makedirs(self._meta_dir(bucket_id), exist_ok=True)
+
+        dpath = self._data_path(bucket_id, key)
+        mpath = self._meta_path(bucket_id, key)
+        _tags = (tags or {})
+
+        h    = H.sha256()
+        size = 0
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=ddir)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    for chunk in chunks:
+                        h.update(chunk)
+                        fh.write(chunk)
+                        size += len(chunk)
+                os.replace(tmp_path, dpath)
+            finally:
+                if os.path.exists(tmp_path):
+                    try:
+                        os.remove(tmp_path)
+                    except Exception:
+                        pass
+        except Exception as e:
+            _e = AxoError.make(error_type=AxoErrorType.PUT_DATA_FAILED,msg=str(e))
+            return Err(_e)
+
+        md = AxoStorageMetadata(
+            key          = key,
+            ball_id      = _tags.get("ball_id", key),
+            size         = size,
+            checksum     = h.hexdigest(),
+            producer_id  = _tags.get("producer_id", ""),
+            bucket_id    = bucket_id,
+            tags         = {**_tags},
+            content_type = _tags.get("content_type", "application/octet-stream"),
+            is_disabled  = False,
+        )
+        try:
+            self._persist_metadata(mpath, md)
+            self._cache_put(md)
+        except Exception as e:
+            try:
+                if os.path.exists(dpath):
+                    os.remove(dpath)
+            finally:
+                _e = AxoError.make(error_type=AxoErrorType.PUT_METADATA_FAILED,msg=str(e))
+                return Err(_e)
+
+        logger.debug("PUT.CHUNKS %s %.3fs", dpath, T.time() - t0)
+        return Ok(dpath)
+
+    async def get_chunks(
+        self, *, bucket_id: str, key: str, chunk_size: str = "1MB"
+    ) -> Result[ChunkIter, AxoError]:
+        """Lazily read the file in *chunk_size* blocks."""
+        dpath = self._data_path(bucket_id, key)
+        if not os.path.exists(dpath):
+            _e = AxoError.make(error_type=AxoErrorType.NOT_FOUND,msg=f"{bucket_id}@{key} not found")
+            return Err(_e)
+        n = HF.parse_size(chunk_size)
+
+        def _read() -> ChunkIter:
+            with open(dpath, "rb") as fh:
+                while True:
+                    chunk = fh.read(n)
+                    if not chunk:
+                        return
+                    yield chunk
+        return Ok(_read())
+
     async def put_data_from_file(
         self,
         *,
@@ -1,6 +1,7 @@
 from abc import ABC,abstractmethod
-from typing import Dict,Iterator,Optional,Any
-from option import Result
+from typing import Dict,Iterable,Iterator,Optional,Any
+from option import Result,Ok,Err
+import humanfriendly as HF
 from pydantic import BaseModel,Field
 from axo.errors import AxoError,AxoErrorType
 from xolo.utils.utils import Utils as XoloUtils
@@ -100,6 +101,24 @@ class AxoObjectBlobs:
         self.attrs_blob = attrs_blob
 
 
+# ---------- per-attribute layout ----------
+
+class AxoAttrEntry(BaseModel):
+    key:str # Key of the blob holding this attribute
+    size:int
+    checksum:str
+    content_type:Optional[str] = "application/octet-stream"
+    compression:Optional[str] = None # codec of the stored bytes (size/checksum are of the raw bytes)
+
+class AxoAttrsManifest(BaseModel):
+    """
+    Stored as the ``<key>_attrs`` blob when an object is persisted one blob
+    per attribute; maps attribute names to their blobs.
+    """
+    source_checksum:str
+    attrs:Dict[str,AxoAttrEntry] = {}
+
+
 
 class StorageService(ABC):
     """
@@ -144,6 +163,44 @@ class StorageService(ABC):
         key:str
     ) -> Result[AxoStorageMetadata, AxoError]:
         ...
+
+    # ------------------------------------------------------------------ #
+    # Streaming (chunks)
+    # ------------------------------------------------------------------ #
+    async def put_chunks(
+        self,
+        *,
+        bucket_id: str,
+        key: str,
+        chunks: Iterable[bytes],
+        tags: Dict[str, str] = {},
+        chunk_size: str = "1MB",
+    ) -> Result[str, AxoError]:
+        """
+        Upload a blob given as an iterable of chunks (e.g. ``Axo.to_stream()``).
+        Backends able to write incrementally override this; the default joins
+        the chunks and calls :meth:`put`.
+        """
+        try:
+            data = b"".join(chunks)
+        except Exception as e:
+            return Err(AxoError.make(error_type=AxoErrorType.PUT_DATA_FAILED, msg=str(e)))
+        return await self.put(bucket_id=bucket_id, key=key, data=data, tags=tags, chunk_size=chunk_size)
+
+    async def get_chunks(
+        self, *, bucket_id: str, key: str, chunk_size: str = "1MB"
+    ) -> Result[ChunkIter, AxoError]:
+        """
+        Download a blob as an iterator of *chunk_size* blocks (e.g. for
+        ``Axo.from_stream``). The default reads the whole blob with :meth:`get`.
+        """
+        res = await self.get(bucket_id=bucket_id, key=key, chunk_size=chunk_size)
+        if res.is_err:
+            return Err(res.unwrap_err())
+        data = memoryview(res.unwrap())
+        n = HF.parse_size(chunk_size)
+        return Ok(bytes(data[i:i + n]) for i in range(0, data.nbytes, n))
+
     @abstractmethod
     async def put_data_from_file(
         self,
@@ -36,6 +36,11 @@ class StorageUtils:
     @staticmethod
     def attrs_key(key: ComposedKey) -> ComposedKey:
         return f"{key}_{AXO_ATTRS_SUFFIX}"
+
+    @staticmethod
+    def attr_key(key: ComposedKey, name: str) -> ComposedKey:
+        """Key of a single attribute in the per-attribute layout."""
+        return f"{key}_{AXO_ATTRS_SUFFIX}_{name}"
     
     # ----- validations -----
     @staticmethod
@@ -14,7 +14,7 @@ class EndpointManagerP(Protocol[E_co]):
     simply by implementing the two methods below.
     """
 
-    def get_endpoint(self, endpoint_id: str = None)->E_co: ...  # noqa: D401 (stub)
+    def get_endpoint(self, endpoint_id: str = None, key: str = None)->E_co: ...  # noqa: D401 (stub)
 
     # Used indirectly by `persistify`; the concrete endpoint must have `put`
     # but we don’t prescribe its full signature here.
@@ -0,0 +1,54 @@
+import pytest
+from axo import Axo, axo_method
+from axo.endpoint.balancer import EndpointLoad
+from axo.endpoint.manager import DistributedEndpointManager
+from tests.objects.fake_endpoint import FakeEndpoint
+
+
+class Adder(Axo):
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+
+class _Stub:
+    def __init__(self, eid, i):
+        self.endpoint_id = eid
+        self.load = EndpointLoad()
+        self.load.ewma_s, self.load.outstanding = 0.001 * (i % 17), i % 5
+
+
+@pytest.mark.parametrize("policy", ["round_robin", "least_outstanding", "ewma", "p2c"])
+@pytest.mark.benchmark(group="balancer_pick_of_1000")
+def test_pick(benchmark, policy):
+    dem = DistributedEndpointManager(endpoints={f"e{i}": _Stub(f"e{i}", i) for i in range(1000)}, policy=policy)
+    assert benchmark(dem.get_endpoint) is not None
+
+
+@pytest.mark.parametrize("n", [50, 1000])
+@pytest.mark.benchmark(group="balancer_rendezvous_pick")
+def test_rendezvous_pick(benchmark, n):
+    dem = DistributedEndpointManager(endpoints={f"e{i}": _Stub(f"e{i}", i) for i in range(n)}, policy="rendezvous")
+    first = dem.get_endpoint(key="bucket:obj")
+    assert benchmark(dem.get_endpoint, key="bucket:obj") is first
+
+
+@pytest.mark.parametrize("policy", ["round_robin", "ewma", "p2c"])
+@pytest.mark.benchmark(group="balancer_20_calls_fast_and_slow_endpoint")
+def test_heterogeneous_fleet(benchmark, policy):
+    fast, slow = FakeEndpoint(delay=0.001), FakeEndpoint(delay=0.02)
+    fast.start(); slow.start()
+    dem = DistributedEndpointManager(endpoints={}, policy=policy)
+    dem.add_endpoint(endpoint_id="fast", hostname="127.0.0.1", req_res_port=fast.port, pubsub_port=-1)
+    dem.add_endpoint(endpoint_id="slow", hostname="127.0.0.1", req_res_port=slow.port, pubsub_port=-1)
+    ao = Adder(axo_endpoint_id="none")
+    try:
+        def calls():
+            return [dem.get_endpoint().method_execution(key="k", fname="add", ao=ao, fargs=[1]) for _ in range(20)]
+        assert all(r.is_ok for r in benchmark(calls))
+    finally:
+        for eid in list(dem.endpoints):
+            dem.del_endpoint(eid).close()
+        for srv in (fast, slow):
+            srv.running = False
+            srv.join()
@@ -0,0 +1,45 @@
+import pytest
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.storage.services import InMemoryStorageService
+from tests.objects.fake_endpoint import FakeEndpoint
+
+N = 1000
+
+
+class Adder(Axo):
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+
+@pytest.fixture
+def adder():
+    srv = FakeEndpoint(delay=0)
+    srv.start()
+    dem = DistributedEndpointManager(endpoints={})
+    dem.add_endpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=srv.port, pubsub_port=-1)
+    with AxoContextManager.distributed(endpoint_manager=dem, storage_service=InMemoryStorageService(storage_service_id="bench")):
+        yield Adder(axo_endpoint_id="e0", _acx_local=False)
+        dem.endpoints["e0"].close()
+    srv.running = False
+    srv.join()
+
+
+def _one_by_one(a):
+    return [a.add(i, 1) for i in range(N)]
+
+
+def _batched(a):
+    with a.batch(max_size=256) as b:
+        calls = [b.add(i, 1) for i in range(N)]
+    return [c.result() for c in calls]
+
+
+@pytest.mark.parametrize("mode", ["one_by_one", "batched"])
+@pytest.mark.benchmark(group="method_exec_1000")
+def test_method_exec_1000(benchmark, adder, mode):
+    run = _one_by_one if mode == "one_by_one" else _batched
+    results = benchmark(run, adder)
+    assert [r.unwrap() for r in results] == [i + 1 for i in range(N)]
@@ -0,0 +1,26 @@
+import pytest
+from axo.endpoint.manager import DistributedEndpointManager
+from tests.objects.fake_endpoint import FakeEndpoint
+
+
+@pytest.mark.parametrize("warm_sockets", [1, 4])
+@pytest.mark.benchmark(group="bootstrap_16_endpoints")
+def test_add_endpoints(benchmark, warm_sockets):
+    servers = [FakeEndpoint(delay=0) for _ in range(16)]
+    for srv in servers:
+        srv.start()
+    descs = [{"endpoint_id": f"e{i}", "hostname": "127.0.0.1", "req_res_port": srv.port, "pubsub_port": -1} for i, srv in enumerate(servers)]
+
+    def bootstrap():
+        dem = DistributedEndpointManager(endpoints={})
+        res = dem.add_endpoints(descs, warm_sockets=warm_sockets)
+        for eid in list(dem.endpoints):
+            dem.del_endpoint(eid).close()
+        return res
+
+    try:
+        assert all(r.is_ok for r in benchmark(bootstrap).values())
+    finally:
+        for srv in servers:
+            srv.running = False
+            srv.join()
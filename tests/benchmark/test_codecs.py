@@ -0,0 +1,31 @@
+import json as J
+import pytest
+import cloudpickle as cp
+from axo.serde import serialize_attrs
+
+np = pytest.importorskip("numpy")
+
+
+# --- Previous encoder (JSON first, cloudpickle on failure) -------------------
+def legacy_serialize(attrs):
+    try:
+        return J.dumps(attrs, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), "application/json"
+    except Exception:
+        return cp.dumps(attrs), "application/x-python-cloudpickle"
+
+
+ATTRS = [
+    {"tags": set(range(100)), "name": "model", "epoch": 3},
+    np.random.rand(10_000),
+    b"x" * 100_000,
+]
+
+
+@pytest.mark.benchmark(group="attr_encode")
+def test_legacy_attr_encode(benchmark):
+    benchmark(lambda: [legacy_serialize(a) for a in ATTRS])
+
+
+@pytest.mark.benchmark(group="attr_encode")
+def test_registry_attr_encode(benchmark):
+    benchmark(lambda: [serialize_attrs(a) for a in ATTRS])
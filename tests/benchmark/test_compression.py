@@ -0,0 +1,55 @@
+import asyncio
+import inspect
+import pytest
+from axo import Axo
+from axo.helpers import serialize_blobs_from_instance
+from axo.storage import AxoStorage
+from axo.storage.services import LocalStorageService
+
+pytest.importorskip("matplotlib")
+from tests.objects import scenario1  # noqa: E402
+
+
+def _objects():
+    classes = [c for _, c in inspect.getmembers(scenario1, inspect.isclass)
+               if issubclass(c, Axo) and c is not Axo and c.__module__ == scenario1.__name__]
+    return [cls(axo_key=f"s1_{cls.__name__.lower()}") for cls in classes]
+
+
+def _blobs(objs):
+    out = []
+    for obj in objs:
+        blobs, class_name = serialize_blobs_from_instance(obj, bucket_id="bench", key=obj.get_axo_key()).unwrap()
+        out.append((obj.get_axo_key(), blobs, class_name))
+    return out
+
+
+async def _roundtrip(axo_storage: AxoStorage, items):
+    for key, blobs, class_name in items:
+        assert (await axo_storage.put_blobs(bucket_id="bench", key=key, blobs=blobs, class_name=class_name)).is_ok
+    for key, _, _ in items:
+        assert (await axo_storage.get_blobs(bucket_id="bench", key=key)).is_ok
+
+
+def _stored_bytes(storage: LocalStorageService, items) -> int:
+    total = 0
+    for key, blobs, _ in items:
+        for md in (blobs.source_code_blob.metadata, blobs.attrs_blob.metadata):
+            total += len(asyncio.run(storage.get(bucket_id="bench", key=md.key)).unwrap())
+    return total
+
+
+@pytest.mark.parametrize("compression", [False, True], ids=["raw", "compressed"])
+@pytest.mark.benchmark(group="scenario1_put_get")
+def test_scenario1_put_get(benchmark, tmp_path, compression):
+    items = _blobs(_objects())
+    storage = LocalStorageService(sink_path=str(tmp_path))
+    axo_storage = AxoStorage(storage=storage, compression=compression)
+
+    benchmark(lambda: asyncio.run(_roundtrip(axo_storage, items)))
+
+    raw = sum(b.source_code_blob.metadata.size + b.attrs_blob.metadata.size for _, b, _ in items)
+    stored = _stored_bytes(storage, items)
+    print(f"\n{len(items)} objects: raw={raw}B stored={stored}B saved={1 - stored / raw:.1%}")
+    if compression:
+        assert stored < raw
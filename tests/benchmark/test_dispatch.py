@@ -0,0 +1,47 @@
+import pytest
+from axo import Axo, axo_method
+from axo.core.decorators import _execute_via_endpoint
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+
+
+class Counter(Axo):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.n = 0
+
+    @axo_method
+    def inc(self, **kwargs):
+        self.n += 1
+        return self.n
+
+    def plain_inc(self):
+        self.n += 1
+        return self.n
+
+
+@pytest.fixture
+def counter():
+    rt = LocalRuntime(storage_service=InMemoryStorageService(storage_service_id="bench"), runtime_id="rt-bench", q_tick_s=0)
+    prev = get_runtime()
+    set_runtime(rt)
+    c = Counter(axo_key="counter")
+    c.inc()  # binds the instance to the local endpoint
+    yield rt, c
+    rt.stop()
+    set_runtime(prev)
+
+
+@pytest.mark.parametrize("path", ["plain", "fast", "endpoint"])
+@pytest.mark.benchmark(group="axo_method_dispatch")
+def test_dispatch_overhead(benchmark, counter, path):
+    rt, c = counter
+    if path == "plain":
+        call = c.plain_inc
+    elif path == "fast":
+        call = c.inc
+    else:  # the per-call path used before the dispatch table
+        fn = Counter._acx_dispatch["inc"].fn
+        call = lambda: _execute_via_endpoint(rt, fn, c, (), {})
+    benchmark(call)
@@ -0,0 +1,75 @@
+import struct
+import tracemalloc
+import pytest
+import cloudpickle as cp
+import axo.serde.frames as FR
+
+np = pytest.importorskip("numpy")
+
+SOURCE = b"class Model(Axo):\n    pass\n"
+
+
+def _attrs():
+    return {"weights": np.random.rand(2_000_000), "name": "model", "epoch": 10}
+
+
+# --- Previous codec (repeated concatenation + slicing) -----------------------
+def legacy_encode(attrs, code: bytes) -> bytes:
+    parts = [cp.dumps(attrs), code]
+    packed = b""
+    for part in parts:
+        packed += struct.pack("I", len(part)) + part
+    return packed
+
+
+def legacy_decode(raw: bytes):
+    parts = []
+    idx = 0
+    while idx < len(raw):
+        length = struct.unpack_from("I", raw, idx)[0]
+        idx += 4
+        parts.append(raw[idx:idx + length])
+        idx += length
+    return cp.loads(parts[0]), parts[1].decode("utf-8")
+
+
+def frames_encode(attrs, code: bytes) -> bytes:
+    return FR.pack_frames(FR.encode_object(attrs, code))
+
+
+def frames_decode(raw: bytes):
+    attrs, code = FR.decode_object(raw)
+    return attrs, str(code, "utf-8")
+
+
+def _peak(fn, *args) -> int:
+    tracemalloc.start()
+    try:
+        fn(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_frames_roundtrip_uses_less_memory():
+    attrs = _attrs()
+    nbytes = attrs["weights"].nbytes
+
+    legacy_peak = _peak(lambda: legacy_decode(legacy_encode(attrs, SOURCE)))
+    frames_peak = _peak(lambda: frames_decode(frames_encode(attrs, SOURCE)))
+    print(f"legacy peak={legacy_peak/nbytes:.2f}x frames peak={frames_peak/nbytes:.2f}x of payload")
+    assert frames_peak < legacy_peak
+
+
+@pytest.mark.benchmark(group="codec_roundtrip")
+def test_legacy_codec_roundtrip(benchmark):
+    attrs = _attrs()
+    got, _ = benchmark(lambda: legacy_decode(legacy_encode(attrs, SOURCE)))
+    assert np.array_equal(got["weights"], attrs["weights"])
+
+
+@pytest.mark.benchmark(group="codec_roundtrip")
+def test_frames_codec_roundtrip(benchmark):
+    attrs = _attrs()
+    got, _ = benchmark(lambda: frames_decode(frames_encode(attrs, SOURCE)))
+    assert np.array_equal(got["weights"], attrs["weights"])
@@ -0,0 +1,46 @@
+import asyncio
+import pytest
+from axo import Axo
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+
+np = pytest.importorskip("numpy")
+
+
+class Weights(Axo, track_changes=True):
+    def __init__(self, weights=None, step: int = 0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.weights = weights if weights is not None else np.random.rand(1_000_000)
+        self.step = step
+
+
+def _persist_step(incremental: bool):
+    rt = LocalRuntime(
+        storage_service     = InMemoryStorageService(storage_service_id="bench"),
+        runtime_id          = "rt-bench",
+        q_tick_s            = 0,
+        incremental_persist = incremental,
+    )
+    set_runtime(rt)
+    loop = asyncio.new_event_loop()
+    obj = Weights(axo_key="w", axo_endpoint_id="axo-endpoint-0")
+    assert loop.run_until_complete(rt.persistify(obj, bucket_id="b", key="w")).is_ok
+
+    def step():
+        obj.step += 1
+        assert loop.run_until_complete(rt.persistify(obj, bucket_id="b", key="w")).is_ok
+    return rt, loop, step
+
+
+@pytest.mark.parametrize("incremental", [False, True], ids=["full", "incremental"])
+@pytest.mark.benchmark(group="persistify_one_counter")
+def test_persistify_after_counter_change(benchmark, incremental):
+    prev = get_runtime()
+    rt, loop, step = _persist_step(incremental)
+    try:
+        benchmark(step)
+    finally:
+        loop.close()
+        rt.stop()
+        set_runtime(prev)
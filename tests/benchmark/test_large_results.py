@@ -0,0 +1,43 @@
+import asyncio
+import pytest
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.storage.services import InMemoryStorageService
+from tests.objects.fake_endpoint import FakeEndpoint
+
+SIZE = 32 << 20
+
+
+class Store(Axo):
+    @axo_method
+    def blob(self, n, **kwargs):
+        return b"x" * n
+
+
+@pytest.fixture(params=["inline", "spilled"])
+def store(request):
+    storage = InMemoryStorageService(storage_service_id="bench")
+    srv = FakeEndpoint(delay=0, storage=storage)
+    srv.start()
+    dem = DistributedEndpointManager(endpoints={})
+    dem.add_endpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=srv.port, pubsub_port=-1)
+    dem.endpoints["e0"]._max_inline_bytes = None if request.param == "inline" else 1 << 20
+    with AxoContextManager.distributed(endpoint_manager=dem, storage_service=storage):
+        yield Store(axo_endpoint_id="e0", _acx_local=False)
+        dem.endpoints["e0"].close()
+    srv.running = False
+    srv.join()
+
+
+def _head(s):
+    # the first kilobyte of a large result
+    res = s.blob(SIZE).unwrap()
+    if isinstance(res, bytes):
+        return res[:1024]
+    return asyncio.run(res.read_range(0, 1024)).unwrap()
+
+
+@pytest.mark.benchmark(group="large_result_32mb")
+def test_large_result_head(benchmark, store):
+    assert benchmark(_head, store) == b"x" * 1024
@@ -0,0 +1,60 @@
+import asyncio
+import tracemalloc
+import pytest
+from axo import Axo, axo_method
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+from axo.storage.loader import AxoLoader
+
+np = pytest.importorskip("numpy")
+
+
+class Weights(Axo):
+    def __init__(self, weights=None, step: int = 0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.weights = weights if weights is not None else np.random.rand(8_000_000)
+        self.step = step
+
+
+@pytest.fixture(scope="module")
+def stored():
+    rt = LocalRuntime(
+        storage_service     = InMemoryStorageService(storage_service_id="bench"),
+        runtime_id          = "rt-bench",
+        q_tick_s            = 0,
+        incremental_persist = True,
+    )
+    prev = get_runtime()
+    set_runtime(rt)
+    loop = asyncio.new_event_loop()
+    obj = Weights(axo_key="w", axo_endpoint_id="axo-endpoint-0")
+    assert loop.run_until_complete(rt.persistify(obj, bucket_id="b", key="w")).is_ok
+    yield rt, loop
+    loop.close()
+    rt.stop()
+    set_runtime(prev)
+
+
+def _loader(rt, lazy: bool) -> AxoLoader:
+    return AxoLoader(rt.axo_storage, api_globals={"Axo": Axo, "axo_method": axo_method}, lazy=lazy)
+
+
+def _read_step(loop, loader):
+    obj = loop.run_until_complete(loader.load_object(bucket_id="b", key="w")).unwrap()
+    return obj.step
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+@pytest.mark.benchmark(group="load_then_read_small_field")
+def test_load_then_read_small_field(benchmark, stored, lazy):
+    rt, loop = stored
+    loader = _loader(rt, lazy)
+    tracemalloc.start()
+    try:
+        _read_step(loop, loader)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    print(f"{'lazy' if lazy else 'eager'} load peak={peak/1e6:.1f}MB")
+    benchmark(_read_step, loop, loader)
@@ -0,0 +1,53 @@
+import pytest
+from axo import Axo, axo_method
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+
+
+class Model(Axo):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.w = [0.5] * 20_000
+
+    @axo_method(read_only=True)
+    def predict(self, x, **kwargs):
+        return sum(w * x for w in self.w)
+
+    @axo_method(cache=True, read_only=True)
+    def predict_cached(self, x, **kwargs):
+        return sum(w * x for w in self.w)
+
+
+@pytest.fixture
+def model():
+    rt = LocalRuntime(storage_service=InMemoryStorageService(storage_service_id="bench"), runtime_id="rt-bench", q_tick_s=0)
+    prev = get_runtime()
+    set_runtime(rt)
+    m = Model(axo_key="model")
+    yield m
+    rt.stop()
+    set_runtime(prev)
+
+
+@pytest.mark.parametrize("mode", ["uncached", "cached"])
+@pytest.mark.benchmark(group="read_only_predict")
+def test_predict(benchmark, model, mode):
+    call = model.predict if mode == "uncached" else model.predict_cached
+    assert benchmark(call, 3).unwrap() == 30_000.0
+
+
+class PlainModel(Axo):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.step = 0
+
+
+@pytest.mark.parametrize("cls", [PlainModel, Model], ids=["plain", "cached"])
+@pytest.mark.benchmark(group="attribute_write")
+def test_attribute_write(benchmark, model, cls):
+    obj = model if cls is Model else PlainModel(axo_key="plain")
+
+    def write():
+        obj.step = 1
+    benchmark(write)
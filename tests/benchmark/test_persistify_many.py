@@ -0,0 +1,55 @@
+import asyncio
+import pytest
+from axo import Axo
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+
+N = 1000
+
+
+class Item(Axo):
+    def __init__(self, value: int = 0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.value = value
+
+
+class RemoteLikeStorage(InMemoryStorageService):
+    """In-memory store with a 1ms round-trip per put."""
+
+    async def put(self, *, bucket_id, key, data, tags=None, chunk_size="1MB"):
+        await asyncio.sleep(0.001)
+        return await super().put(bucket_id=bucket_id, key=key, data=data, tags=tags, chunk_size=chunk_size)
+
+
+@pytest.fixture
+def runtime():
+    rt = LocalRuntime(storage_service=RemoteLikeStorage(storage_service_id="bench"), runtime_id="rt-bench", q_tick_s=0)
+    prev = get_runtime()
+    set_runtime(rt)
+    yield rt
+    rt.stop()
+    set_runtime(prev)
+
+
+async def _sequential(rt, items):
+    for item in items:
+        assert (await rt.persistify(item, bucket_id="b")).is_ok
+
+
+async def _many(rt, items):
+    report = await rt.persistify_many(items, bucket_id="b", concurrency=64)
+    assert report.failed == 0
+    print(f"persistify_many: {report.ok} objects, {report.throughput:.0f} obj/s")
+
+
+@pytest.mark.parametrize("mode", ["sequential", "many"])
+@pytest.mark.benchmark(group="persistify_1000")
+def test_persistify_1000(benchmark, runtime, mode):
+    items = [Item(value=i, axo_key=f"it{i}", axo_endpoint_id="axo-endpoint-0") for i in range(N)]
+    run = _sequential if mode == "sequential" else _many
+    loop = asyncio.new_event_loop()
+    try:
+        benchmark.pedantic(lambda: loop.run_until_complete(run(runtime, items)), rounds=3, iterations=1)
+    finally:
+        loop.close()
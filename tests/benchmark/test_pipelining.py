@@ -0,0 +1,52 @@
+import pytest
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.storage.services import InMemoryStorageService
+from tests.objects.fake_endpoint import FakeEndpoint
+
+SIZE = 8 << 20
+
+
+class Store(Axo):
+    @axo_method
+    def blob(self, n, **kwargs):
+        return b"x" * n
+
+    @axo_method
+    def length(self, data, **kwargs):
+        return len(data)
+
+
+@pytest.fixture
+def store():
+    srv = FakeEndpoint(delay=0)
+    srv.start()
+    dem = DistributedEndpointManager(endpoints={})
+    dem.add_endpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=srv.port, pubsub_port=-1)
+    with AxoContextManager.distributed(endpoint_manager=dem, storage_service=InMemoryStorageService(storage_service_id="bench")):
+        yield Store(axo_endpoint_id="e0", _acx_local=False)
+        dem.endpoints["e0"].close()
+    srv.running = False
+    srv.join()
+
+
+def _through_client(s):
+    return s.length(s.blob(SIZE).unwrap())
+
+
+def _by_reference(s):
+    return s.length(s.blob.ref(SIZE).unwrap())
+
+
+def _pipelined(s):
+    with s.batch() as b:
+        n = b.length(b.blob(SIZE))
+    return n.result()
+
+
+@pytest.mark.parametrize("mode", ["through_client", "by_reference", "pipelined"])
+@pytest.mark.benchmark(group="chained_8mb")
+def test_chained_calls(benchmark, store, mode):
+    run = {"through_client": _through_client, "by_reference": _by_reference, "pipelined": _pipelined}[mode]
+    assert benchmark(run, store).unwrap() == SIZE
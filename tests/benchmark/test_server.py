@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.endpoint.server import AxoEndpointServer
+from axo.storage.services import InMemoryStorageService
+
+
+class Echo(Axo):
+    @axo_method(read_only=True)
+    def echo(self, x, **kwargs):
+        return x
+
+    @axo_method(read_only=True)
+    def nap(self, s, **kwargs):
+        import time
+        time.sleep(s)
+        return s
+
+
+def _serve(max_workers, n_objects=1):
+    storage = InMemoryStorageService(storage_service_id="bench")
+    srv = AxoEndpointServer(storage=storage, endpoint_id="e0", max_workers=max_workers).start()
+    dem = DistributedEndpointManager(endpoints={})
+    dem.add_endpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=srv.port, pubsub_port=-1)
+    cm = AxoContextManager.distributed(endpoint_manager=dem, storage_service=storage)
+    cm.__enter__()
+    objs = [Echo(axo_endpoint_id="e0", axo_key=f"echo-{i}") for i in range(n_objects)]
+    for o in objs:
+        assert asyncio.run(o.persistify()).is_ok
+        assert o.echo(0).is_ok  # loaded
+
+    def close():
+        dem.endpoints["e0"].close()
+        cm.__exit__(None, None, None)
+        srv.stop()
+    return objs, close
+
+
+@pytest.fixture
+def echo():
+    objs, close = _serve(max_workers=1)
+    yield objs[0]
+    close()
+
+
+@pytest.mark.parametrize("size", [0, 1 << 10, 1 << 20], ids=["empty", "1kb", "1mb"])
+@pytest.mark.benchmark(group="server_roundtrip")
+def test_roundtrip(benchmark, echo, size):
+    payload = b"x" * size
+    assert benchmark(echo.echo, payload).unwrap() == payload
+
+
+@pytest.mark.parametrize("max_workers", [1, 2, 4, 8])
+@pytest.mark.benchmark(group="server_scaling_32_calls_of_10ms")
+def test_worker_scaling(benchmark, max_workers):
+    objs, close = _serve(max_workers=max_workers, n_objects=8)
+    try:
+        async def burst():
+            return await asyncio.gather(*(objs[i % 8].nap.aio(0.01) for i in range(32)))
+        results = benchmark(lambda: asyncio.run(burst()))
+        assert all(r.is_ok for r in results)
+    finally:
+        close()
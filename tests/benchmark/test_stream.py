@@ -0,0 +1,41 @@
+import tracemalloc
+import pytest
+from axo import Axo
+
+np = pytest.importorskip("numpy")
+
+
+class Big(Axo):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.weights = np.random.rand(4_000_000)  # 32 MB
+        self.blob = b"x" * 16_000_000               # in-band bytes
+
+
+def _peak(fn) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _drain(chunks) -> int:
+    return sum(len(c) for c in chunks)
+
+
+def test_to_stream_peak_is_bounded_by_chunks():
+    obj = Big()
+    size = obj.weights.nbytes + len(obj.blob)
+    old_peak = _peak(lambda: _drain(obj.to_bytes().unwrap()[i:i + (1 << 20)] for i in range(0, size, 1 << 20)))
+    new_peak = _peak(lambda: _drain(obj.to_stream(chunk_size="1MB")))
+    print(f"to_bytes+slice peak={old_peak/1e6:.1f}MB to_stream peak={new_peak/1e6:.1f}MB object={size/1e6:.1f}MB")
+    assert new_peak < size / 4
+
+
+@pytest.mark.benchmark(group="stream_roundtrip")
+def test_stream_roundtrip(benchmark):
+    obj = Big()
+    got = benchmark(lambda: Axo.from_stream(obj.to_stream(chunk_size="1MB")).unwrap())
+    assert np.array_equal(got.weights, obj.weights)
@@ -0,0 +1,128 @@
+import asyncio
+import heapq
+import threading
+import time
+import cloudpickle as cp
+import zmq
+from axo.enums import AxoOperationType
+from option import Err, Ok
+from axo.core.models import ResultRef, encode_result
+from axo.models import AxoReplyEnvelope, AxoReplyMsg, AxoRequestMsg, MethodExecutionBatch, resolve_args
+
+
+METHODS = {
+    "add": lambda *xs: sum(xs),
+    "blob": lambda n: b"x" * n,
+    "length": lambda data: len(data),
+}
+
+
+class FakeEndpoint(threading.Thread):
+    """
+    ROUTER that answers PING, PUT_METADATA and METHOD_EXEC(_BATCH) of the
+    ``METHODS`` after ``delay`` seconds (or ``delay(request)``), many at a
+    time. PINGs are answered at once. ``result_mode="ref"`` results are kept
+    in ``kept`` and resolved when passed back as arguments; with a ``storage``,
+    results over the request's ``max_inline_bytes`` are spilled to it.
+    """
+
+    def __init__(self, delay=0.05, kept=None, storage=None):
+        super().__init__(daemon=True)
+        self.delay = delay
+        self.ctx = zmq.Context()
+        self.sock = self.ctx.socket(zmq.ROUTER)
+        self.port = self.sock.bind_to_random_port("tcp://127.0.0.1")
+        self.running = True
+        self.served = 0
+        self.ops = []
+        self.idents = set()
+        self.kept = {} if kept is None else kept  # share it to play a common storage
+        self.storage = storage
+        self.reply_bytes = 0
+
+    def load(self, ref: ResultRef):
+        if ref.key in self.kept:
+            return Ok(self.kept[ref.key])
+        if self.storage is not None:
+            return asyncio.run(ref.aget(self.storage))
+        return Err(Exception(f"no result {ref.key}"))
+
+    def run_call(self, msg_id, metadata, method, fargs, fkwargs, result_mode, results=(), max_inline_bytes=None):
+        args = resolve_args(fargs, fkwargs, results=results, load=self.load)
+        if args.is_err:
+            return args, args
+        fargs, _ = args.unwrap()
+        if method not in METHODS:
+            err = Err(Exception(f"no method {method}"))
+            return err, err
+        try:
+            value = METHODS[method](*fargs)
+        except Exception as e:
+            return Err(e), Err(e)
+        key = f"{msg_id}-{len(results)}"
+        if result_mode == "ref":
+            self.kept[key] = value
+            data, content_type = encode_result(value)
+            return Ok(value), Ok(ResultRef.for_data(data, content_type, bucket_id=metadata.axo_sink_bucket_id, key=key))
+        if self.storage is not None and max_inline_bytes is not None:
+            data, content_type = encode_result(value)
+            if len(data) > max_inline_bytes:
+                asyncio.run(self.storage.put(bucket_id=metadata.axo_sink_bucket_id, key=key, data=data, tags={"content_type": content_type}))
+                return Ok(value), Ok(ResultRef.for_data(data, content_type, bucket_id=metadata.axo_sink_bucket_id, key=key, spilled=True))
+        return Ok(value), Ok(value)
+
+    def send(self, ident, msg):
+        frames = msg.to_frames()
+        self.reply_bytes += sum(len(f) for f in frames)
+        self.sock.send_multipart([ident, b"", *frames])
+        self.served += 1
+
+    def reply(self, ident, req: AxoRequestMsg):
+        env = req.envelope
+        self.ops.append(env.operation)
+        if env.operation == AxoOperationType.METHOD_EXEC_BATCH:
+            values, replies = [], []
+            for call in MethodExecutionBatch.unpack(req.payload).unwrap():
+                value, reply = self.run_call(env.msg_id, *call, results=values, max_inline_bytes=env.max_inline_bytes)
+                values.append(value)
+                replies.append(reply)
+            return self.send(ident, MethodExecutionBatch.reply(env.msg_id, replies))
+        op = "PONG" if env.operation == "PING" else env.operation
+        payload = []
+        error = None
+        result_mode = env.result_mode
+        if env.operation == AxoOperationType.METHOD_EXEC:
+            _, res = self.run_call(env.msg_id, env.get_metadatax(), env.method, cp.loads(req.payload[0]), cp.loads(req.payload[1]), env.result_mode,
+                                   max_inline_bytes=env.max_inline_bytes)
+            if res.is_err:
+                error = {"message": str(res.unwrap_err())}
+            elif isinstance(res.unwrap(), ResultRef):
+                result_mode = "ref"
+                payload = [res.unwrap().to_json().encode("utf-8")]
+            else:
+                payload = [cp.dumps(res.unwrap())]
+        msg = AxoReplyMsg(
+            envelope=AxoReplyEnvelope(msg_id=env.msg_id, operation=op, status="ok" if error is None else "error", status_code=0 if error is None else -500,
+                                      method=env.method, error=error, result_mode=result_mode),
+            payload=payload,
+        )
+        self.send(ident, msg)
+
+    def run(self):
+        pending = []
+        while self.running:
+            timeout = max(0, (pending[0][0] - time.monotonic()) * 1000) if pending else 10
+            if self.sock.poll(timeout):
+                ident, _, *frames = self.sock.recv_multipart()
+                req, _ = AxoRequestMsg.from_frames(frames).unwrap()
+                if req.envelope.operation == "PING":
+                    delay = 0
+                else:
+                    self.idents.add(ident)  # sockets requests came from (pings have their own)
+                    delay = self.delay(req) if callable(self.delay) else self.delay
+                heapq.heappush(pending, (time.monotonic() + delay, id(req), ident, req))
+            while pending and pending[0][0] <= time.monotonic():
+                _, _, ident, req = heapq.heappop(pending)
+                self.reply(ident, req)
+        self.sock.close(linger=0)
+        self.ctx.term()
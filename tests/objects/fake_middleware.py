@@ -0,0 +1,76 @@
+import multiprocessing as mp
+import threading
+import time
+import zmq
+from axo.enums import AxoOperationType
+from axo.models import AxoReplyEnvelope, AxoReplyMsg, AxoRequestMsg, Elasticity
+
+
+def serve_endpoint(endpoint_id, port, sink_path, ready):
+    """Child process: one AxoEndpointServer on a LocalStorageService shared by all of them."""
+    from axo.endpoint.server import AxoEndpointServer
+    from axo.storage.services import LocalStorageService
+    srv = AxoEndpointServer(storage=LocalStorageService(sink_path=sink_path), endpoint_id=endpoint_id, req_res_port=port)
+    srv.start()
+    ready.set()
+    while True:
+        time.sleep(1)
+
+
+class FakeMiddleware(threading.Thread):
+    """
+    ROUTER that answers PING and ELASTICITY: it runs ``rf`` endpoint
+    processes on loopback ports from ``ports()`` (e.g. a manager's
+    ``get_available_req_res_port``), starting new ones or stopping the
+    newest, and replies with the endpoints it runs.
+    """
+
+    def __init__(self, ports, sink_path):
+        super().__init__(daemon=True)
+        self.ports = ports
+        self.sink_path = sink_path
+        self.ctx = zmq.Context()
+        self.sock = self.ctx.socket(zmq.ROUTER)
+        self.port = self.sock.bind_to_random_port("tcp://127.0.0.1")
+        self.running = True
+        self.procs = {}  # endpoint_id -> (process, port), oldest first
+        self.requests = []
+        self._n = 0
+        self._mp = mp.get_context("spawn")
+
+    def scale(self, rf):
+        while len(self.procs) > rf:
+            eid = next(reversed(self.procs))
+            proc, _ = self.procs.pop(eid)
+            proc.terminate()
+            proc.join()
+        while len(self.procs) < rf:
+            eid, port, ready = f"elastic-{self._n}", self.ports(), self._mp.Event()
+            self._n += 1
+            proc = self._mp.Process(target=serve_endpoint, args=(eid, port, self.sink_path, ready), daemon=True)
+            proc.start()
+            if ready.wait(30):
+                self.procs[eid] = (proc, port)
+            else:
+                proc.terminate()
+                break
+        return [{"endpoint_id": eid, "hostname": "127.0.0.1", "req_res_port": port, "pub_sub_port": -1}
+                for eid, (_, port) in self.procs.items()]
+
+    def run(self):
+        while self.running:
+            if not self.sock.poll(10):
+                continue
+            ident, _, *frames = self.sock.recv_multipart()
+            req, payload = AxoRequestMsg.from_frames(frames).unwrap()
+            env = req.envelope
+            if env.operation == AxoOperationType.ELASTICITY:
+                rf = Elasticity.rf_of(payload).unwrap()
+                self.requests.append(rf)
+                reply = Elasticity.reply(env.msg_id, self.scale(rf))
+            else:
+                reply = AxoReplyMsg(envelope=AxoReplyEnvelope(msg_id=env.msg_id, operation="PONG", status="ok", status_code=0))
+            self.sock.send_multipart([ident, b"", *reply.to_frames()])
+        self.scale(0)
+        self.sock.close(linger=0)
+        self.ctx.term()
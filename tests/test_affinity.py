@@ -0,0 +1,81 @@
+import asyncio
+from collections import Counter as Tally
+from types import SimpleNamespace
+import pytest
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.endpoint.balancer import Rendezvous, affinity_key
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.endpoint.server import AxoEndpointServer
+from axo.storage.services import InMemoryStorageService
+
+KEYS = [f"bucket:obj-{i}" for i in range(3000)]
+
+
+class Counter(Axo):
+    def __init__(self, n: int = 0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.n = n
+
+    @axo_method
+    def inc(self, k=1, **kwargs):
+        self.n += k
+        return self.n
+
+
+def _placement(ids):
+    policy = Rendezvous()
+    endpoints = {eid: SimpleNamespace(endpoint_id=eid) for eid in ids}
+    return {key: policy.pick(ids, endpoints, key) for key in KEYS}
+
+
+def test_rendezvous_moves_only_what_it_must():
+    ids = [f"e{i}" for i in range(10)]
+    before = _placement(ids)
+    assert max(Tally(before.values()).values()) < 2 * len(KEYS) / len(ids)  # spread out
+
+    shrunk = _placement([eid for eid in ids if eid != "e3"])
+    moved = {k for k in KEYS if shrunk[k] != before[k]}
+    assert moved == {k for k in KEYS if before[k] == "e3"}                  # only e3's objects
+
+    grown = _placement(ids + ["e10"])
+    moved = {k for k in KEYS if grown[k] != before[k]}
+    assert all(grown[k] == "e10" for k in moved)                             # only to the new one
+    assert 0.5 < len(moved) / (len(KEYS) / 11) < 1.5
+
+    assert _placement(list(reversed(ids))) == before                         # order-independent
+
+
+def test_calls_without_a_key_use_the_fallback():
+    dem = DistributedEndpointManager(endpoints={eid: SimpleNamespace(endpoint_id=eid) for eid in "ab"}, policy="rendezvous")
+    assert [dem.get_endpoint().endpoint_id for _ in range(3)] == ["a", "b", "a"]
+    assert len({dem.get_endpoint(key="bucket:x").endpoint_id for _ in range(5)}) == 1
+
+
+@pytest.fixture
+def fleet():
+    storage = InMemoryStorageService(storage_service_id="affinity")
+    servers = {f"e{i}": AxoEndpointServer(storage=storage, endpoint_id=f"e{i}").start() for i in range(3)}
+    dem = DistributedEndpointManager(endpoints={}, policy="rendezvous")
+    for eid, srv in servers.items():
+        dem.add_endpoint(endpoint_id=eid, hostname="127.0.0.1", req_res_port=srv.port, pubsub_port=-1)
+    with AxoContextManager.distributed(endpoint_manager=dem, storage_service=storage):
+        yield dem, servers
+        for ep in dem.endpoints.values():
+            ep.close()
+    for srv in servers.values():
+        srv.stop()
+
+
+def test_objects_stay_on_their_warm_endpoint(fleet):
+    dem, servers = fleet
+    objs = [Counter(axo_key=f"c{i}", axo_bucket_id="affinity") for i in range(12)]
+    for o in objs:
+        assert asyncio.run(o.persistify()).is_ok
+    assert len({o.get_endpoint_id() for o in objs}) > 1
+    for o in objs:
+        assert o.inc().unwrap() == 1                       # where its metadata went
+        assert [eid for eid, srv in servers.items() if o.get_axo_key() in srv.metadata] == [o.get_endpoint_id()]
+
+        fresh = Counter(axo_key=o.get_axo_key(), axo_bucket_id="affinity")  # another client's handle
+        assert dem.get_endpoint(fresh.get_endpoint_id(), key=affinity_key(fresh)).endpoint_id == o.get_endpoint_id()
@@ -0,0 +1,78 @@
+import asyncio
+import time
+import pytest
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.endpoint.endpoint import DistributedEndpoint
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.enums import AxoOperationType
+from axo.errors import AxoErrorType
+from axo.runtime import get_runtime
+from axo.storage.services import InMemoryStorageService
+from .objects.fake_endpoint import FakeEndpoint
+
+
+class Adder(Axo):
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+    @axo_method
+    def missing(self, **kwargs):
+        return None
+
+
+@pytest.fixture
+def server():
+    srv = FakeEndpoint(delay=0.05)
+    srv.start()
+    yield srv
+    srv.running = False
+    srv.join()
+
+
+@pytest.fixture
+def adder(server):
+    dem = DistributedEndpointManager(endpoints={})
+    dem.add_endpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=server.port, pubsub_port=-1)
+    with AxoContextManager.distributed(endpoint_manager=dem, storage_service=InMemoryStorageService(storage_service_id="aio")):
+        a = Adder(axo_endpoint_id="e0", _acx_local=False)
+        yield a
+        dem.endpoints["e0"].close()
+
+
+@pytest.mark.asyncio
+async def test_aio_matches_blocking_call(adder):
+    assert adder.add(1, 2).unwrap() == 3
+    assert (await adder.add.aio(1, 2)).unwrap() == 3
+    res = await adder.missing.aio()
+    assert res.is_err and res.unwrap_err().type == AxoErrorType.INTERNAL_ERROR
+    assert adder.missing().is_err
+
+
+@pytest.mark.asyncio
+async def test_aio_calls_overlap_on_one_loop(adder, server):
+    t1 = time.monotonic()
+    results = await asyncio.gather(*(adder.add.aio(i, 1) for i in range(100)))
+    elapsed = time.monotonic() - t1
+    assert [r.unwrap() for r in results] == [i + 1 for i in range(100)]
+    assert elapsed < 100 * server.delay / 4  # sequential would take 100 * delay
+
+
+@pytest.mark.asyncio
+async def test_aio_timeout_is_an_err(adder, server):
+    server.delay = 1.0
+    get_runtime().endpoint_manager.get_endpoint("e0")._recv_timeout_ms = 100
+    res = await adder.add.aio(1)
+    assert res.is_err and res.unwrap_err().type == AxoErrorType.TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_aio_pings_before_first_call(server):
+    ep = DistributedEndpoint(endpoint_id="e1", hostname="127.0.0.1", req_res_port=server.port, pubsub_port=-1)
+    try:
+        res = await ep.amethod_execution(key="k", fname="add", ao=Adder(axo_endpoint_id="e1"), fargs=[2, 3])
+        assert res.unwrap() == 5
+        assert server.ops == ["PING", AxoOperationType.METHOD_EXEC]
+    finally:
+        ep.close()
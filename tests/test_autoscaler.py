@@ -0,0 +1,126 @@
+import asyncio
+import contextvars
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.endpoint.autoscaler import Autoscaler
+from axo.endpoint.balancer import EndpointLoad
+from axo.endpoint.endpoint import DistributedEndpoint
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.endpoint.server import AxoEndpointServer
+from axo.errors import AxoErrorType
+from axo.storage.services import InMemoryStorageService, LocalStorageService
+from .objects.fake_middleware import FakeMiddleware
+
+
+class Napper(Axo):
+    @axo_method(read_only=True)
+    def nap(self, s, **kwargs):
+        import time
+        time.sleep(s)
+        return s
+
+
+def _ep(eid, outstanding=0, latencies=()):
+    load = EndpointLoad()
+    for lat in latencies:
+        load.begin()
+        load.end(lat)
+    load.outstanding = outstanding
+    return SimpleNamespace(endpoint_id=eid, load=load, queued=0)
+
+
+def _scaler(*eps, **kwargs):
+    dem = DistributedEndpointManager(endpoints={ep.endpoint_id: ep for ep in eps})
+    return Autoscaler(dem, min_endpoints=1, max_endpoints=4, target_outstanding=2, max_latency="100ms", **kwargs)
+
+
+def test_latency_percentiles():
+    load = _ep("a", latencies=[i / 100 for i in range(1, 101)]).load
+    assert load.percentile(50) == 0.5 and load.percentile(99) == 0.99 and load.percentile(100) == 1.0
+    assert EndpointLoad().percentile(99) is None
+
+
+def test_pool_size_follows_load_and_latency():
+    scaler = _scaler(_ep("a", outstanding=3), _ep("b", outstanding=4))
+    assert scaler.desired(scaler.metrics()) == 4                # ceil(7 / 2)
+    scaler = _scaler(_ep("a", outstanding=20), _ep("b"))
+    assert scaler.desired(scaler.metrics()) == 4                # max_endpoints
+    scaler = _scaler(_ep("a"), _ep("b"))
+    assert scaler.desired(scaler.metrics()) == 1                # min_endpoints
+    scaler = _scaler(_ep("a", latencies=[0.01] * 50 + [0.3]), _ep("b"), window="50ms")
+    assert scaler.metrics()["a"].p99_s == 0.3
+    assert scaler.desired(scaler.metrics()) == 3                # slow: one more
+    time.sleep(0.1)
+    assert scaler.desired(scaler.metrics()) == 1                # old samples age out
+
+
+def test_elasticity_needs_a_middleware():
+    with AxoEndpointServer(storage=InMemoryStorageService(storage_service_id="no-mw")) as srv:
+        ep = DistributedEndpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=srv.port, pubsub_port=-1)
+        try:
+            res = ep.elasticity(rf=2)
+            assert res.is_err and "ELASTICITY" in res.unwrap_err().message
+            assert ep.elasticity(rf=-1).unwrap_err().type == AxoErrorType.BAD_REQUEST
+        finally:
+            ep.close()
+
+
+@pytest.fixture
+def fleet(tmp_path):
+    dem = DistributedEndpointManager(endpoints={})
+    mw = FakeMiddleware(dem.get_available_req_res_port, str(tmp_path))
+    mw.start()
+    controller = DistributedEndpoint(endpoint_id="middleware", hostname="127.0.0.1", req_res_port=mw.port, pubsub_port=-1)
+    storage = LocalStorageService(storage_service_id="elastic", sink_path=str(tmp_path))
+    try:
+        with AxoContextManager.distributed(endpoint_manager=dem, storage_service=storage):
+            yield dem, mw, controller
+    finally:
+        for eid in list(dem.endpoints):
+            dem.del_endpoint(eid).close()
+        controller.close()
+        mw.running = False
+        mw.join()
+
+
+def test_scales_out_under_load_and_back_in_with_cooldowns(fleet):
+    dem, mw, controller = fleet
+    scaler = Autoscaler(dem, controller=controller, min_endpoints=1, max_endpoints=3, target_outstanding=2,
+                        max_latency="10s", scale_up_cooldown="0.2s", scale_down_cooldown="1s")
+    assert scaler.step().unwrap() == 1                          # bootstrap to min_endpoints
+    objs = [Napper(axo_key=f"n{i}") for i in range(5)]
+    for o in objs:
+        assert asyncio.run(o.persistify()).is_ok
+    assert {o.get_endpoint_id() for o in objs} == {"elastic-0"}
+
+    results = []
+    threads = [threading.Thread(target=contextvars.copy_context().run, args=(lambda o=o: results.append(o.nap(0.8)),))
+               for o in objs]                                   # the runtime is a context variable
+    for t in threads:
+        t.start()
+    time.sleep(0.3)
+    assert scaler.metrics()["elastic-0"].outstanding == 5
+    assert scaler.step().unwrap() == 3                          # ceil(5 / 2)
+    assert sorted(dem.endpoints) == ["elastic-0", "elastic-1", "elastic-2"]
+    for t in threads:
+        t.join()
+    assert [r.unwrap() for r in results] == [0.8] * 5
+
+    new = Napper(axo_key="fresh", axo_endpoint_id="elastic-2")  # a new endpoint serves from the shared storage
+    assert asyncio.run(new.persistify()).is_ok
+    assert new.nap(0).unwrap() == 0
+
+    assert scaler.step().unwrap() == 3                          # idle, but cooling down
+    time.sleep(1.1)
+    assert scaler.step().unwrap() == 2                          # one at a time
+    assert scaler.step().unwrap() == 2
+    time.sleep(1.1)
+    assert scaler.step().unwrap() == 1
+    time.sleep(1.1)
+    assert scaler.step().unwrap() == 1                          # min_endpoints
+    assert mw.requests == [1, 3, 2, 1] and list(mw.procs) == ["elastic-0"]
+    assert sorted(dem.endpoints) == ["elastic-0"]
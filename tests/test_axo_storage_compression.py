@@ -0,0 +1,94 @@
+import os
+import pytest
+from axo.storage import AxoStorage
+from axo.storage.compression import (
+    CompressionPolicy, compress, decompress, AXO_COMPRESSION_TAG, AXO_RAW_CHECKSUM_TAG,
+)
+from axo.storage.services import InMemoryStorageService, LocalStorageService
+from axo.storage.types import AxoObjectBlob, AxoObjectBlobs, AxoStorageMetadata
+from axo.storage.utils import StorageUtils as SU
+
+TEXT = b"".join(b"class Model(Axo):  # line %d\n    pass\n" % i for i in range(2000))
+
+
+def make_blobs(key: str, src: bytes, attrs: bytes) -> AxoObjectBlobs:
+    def blob(k, data, ct):
+        return AxoObjectBlob(data, AxoStorageMetadata(
+            key=k, ball_id=k, size=len(data), checksum=SU.sha256_hex(data),
+            producer_id="pytest", bucket_id="b", tags={}, content_type=ct,
+        ))
+    return AxoObjectBlobs(
+        source_code_blob = blob(SU.source_key(key), src, "text/plain"),
+        attrs_blob       = blob(SU.attrs_key(key), attrs, "application/json"),
+    )
+
+
+@pytest.fixture(params=["memory", "local"])
+def storage_service(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryStorageService()
+    return LocalStorageService(sink_path=str(tmp_path))
+
+
+def test_policy_choices():
+    policy = CompressionPolicy()
+    assert policy.choose(b"x" * 100)[0] == "none"             # too small
+    assert policy.choose(os.urandom(200_000))[0] == "none"   # incompressible
+    assert policy.choose(TEXT[:10_000]) == ("zlib", 9)        # small
+    assert policy.choose(TEXT * 10) == ("zlib", 6)            # medium
+    assert CompressionPolicy(codec="lzma").choose(TEXT)[0] == "lzma"
+    assert CompressionPolicy(codec="bz2").choose(TEXT) == ("bz2", 9)
+
+    payload, codec, _ = compress(TEXT, policy)
+    assert len(payload) < len(TEXT) and decompress(payload, codec) == TEXT
+
+
+@pytest.mark.asyncio
+async def test_compressed_roundtrip(storage_service):
+    axo_storage = AxoStorage(storage=storage_service, compression=True)
+    attrs = b'{"xs":[' + b",".join(b"1" for _ in range(50_000)) + b"]}"
+    blobs = make_blobs("obj", TEXT, attrs)
+    assert (await axo_storage.put_blobs(bucket_id="b", key="obj", blobs=blobs, class_name="Model")).is_ok
+
+    stored = (await storage_service.get(bucket_id="b", key=SU.attrs_key("obj"))).unwrap()
+    assert len(stored) < len(attrs) / 10
+    md = (await storage_service.get_metadata(bucket_id="b", key=SU.attrs_key("obj"))).unwrap()
+    assert md.tags[AXO_COMPRESSION_TAG] == "zlib"
+    assert md.tags[AXO_RAW_CHECKSUM_TAG] == SU.sha256_hex(attrs)
+
+    # readers decompress regardless of their own setting
+    for reader in (axo_storage, AxoStorage(storage=storage_service)):
+        got = (await reader.get_blobs(bucket_id="b", key="obj")).unwrap()
+        assert got.source_code_blob.data == TEXT
+        assert got.attrs_blob.data == attrs
+        assert got.attrs_blob.metadata.size == len(attrs)
+
+
+@pytest.mark.asyncio
+async def test_corrupted_payload_fails_validation():
+    storage_service = InMemoryStorageService()
+    axo_storage = AxoStorage(storage=storage_service, compression=CompressionPolicy(codec="zlib"))
+    assert (await axo_storage.put_blobs(bucket_id="b", key="obj", blobs=make_blobs("obj", TEXT, TEXT), class_name="M")).is_ok
+
+    k = SU.attrs_key("obj")
+    storage_service.buckets["b"][k] = storage_service.buckets["b"][k][:-5]
+    assert (await axo_storage.get_blobs(bucket_id="b", key="obj")).is_err
+
+
+@pytest.mark.asyncio
+async def test_compressed_attr_blobs_and_shared_source(storage_service):
+    axo_storage = AxoStorage(storage=storage_service, compression=True, dedup_source_code=True, code_bucket_id="code")
+    src = make_blobs("o", TEXT, b"").source_code_blob
+    attr = make_blobs("o", b"", TEXT[:5000]).attrs_blob
+    put = await axo_storage.put_attr_blobs(
+        bucket_id="b", key="o", source_code_blob=src, attr_blobs={"text": attr}, class_name="M",
+    )
+    assert put.is_ok
+    assert put.unwrap().attrs["text"].compression == "zlib"
+
+    fresh = AxoStorage(storage=storage_service)
+    blobs = (await fresh.get_blobs(bucket_id="b", key="o")).unwrap()
+    assert blobs.source_code_blob.data == TEXT
+    manifest = fresh.parse_manifest(bucket_id="b", key="o", data=blobs.attrs_blob.data).unwrap()
+    got = (await fresh.get_attr_blobs(bucket_id="b", manifest=manifest)).unwrap()
+    assert got["text"].data == TEXT[:5000]
@@ -0,0 +1,86 @@
+import pytest
+from axo.storage import AxoStorage, AXO_SOURCE_REF_TAG
+from axo.storage.services import InMemoryStorageService, LocalStorageService
+from axo.storage.utils import StorageUtils as SU
+from tests.test_axo_storage_memory import make_blobs
+
+
+@pytest.fixture(params=["memory", "local"])
+def storage_service(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryStorageService()
+    return LocalStorageService(sink_path=str(tmp_path))
+
+
+class CountingStorage:
+    """Wraps a storage service and counts puts per bucket."""
+    def __init__(self, inner):
+        self.inner = inner
+        self.puts  = []
+
+    def __getattr__(self, name):
+        return getattr(self.inner, name)
+
+    async def put(self, *, bucket_id, key, data, tags=None, chunk_size="1MB"):
+        self.puts.append((bucket_id, key))
+        return await self.inner.put(bucket_id=bucket_id, key=key, data=data, tags=tags, chunk_size=chunk_size)
+
+
+@pytest.mark.asyncio
+async def test_source_is_uploaded_once(storage_service):
+    storage = CountingStorage(storage_service)
+    axo_storage = AxoStorage(storage=storage, dedup_source_code=True, code_bucket_id="code")
+
+    for i in range(5):
+        res = await axo_storage.put_blobs(bucket_id="b", key=f"obj-{i}", blobs=make_blobs(f"obj-{i}"), class_name="X")
+        assert res.is_ok, res
+
+    code_puts = [p for p in storage.puts if p[0] == "code"]
+    assert len(code_puts) == 1
+    assert code_puts[0][1] == make_blobs("obj-0").source_code_blob.metadata.checksum
+    assert len(storage.puts) == 6
+
+
+@pytest.mark.asyncio
+async def test_known_source_is_not_reuploaded_by_new_storage(storage_service):
+    first = AxoStorage(storage=storage_service, dedup_source_code=True, code_bucket_id="code")
+    assert (await first.put_blobs(bucket_id="b", key="a", blobs=make_blobs("a"), class_name="X")).is_ok
+
+    storage = CountingStorage(storage_service)
+    second = AxoStorage(storage=storage, dedup_source_code=True, code_bucket_id="code")
+    assert (await second.put_blobs(bucket_id="b", key="c", blobs=make_blobs("c"), class_name="X")).is_ok
+    assert storage.puts == [("b", SU.attrs_key("c"))]
+
+
+@pytest.mark.asyncio
+async def test_dedup_roundtrip_and_legacy_read(storage_service):
+    axo_storage = AxoStorage(storage=storage_service, dedup_source_code=True, code_bucket_id="code")
+    legacy = AxoStorage(storage=storage_service)
+
+    assert (await axo_storage.put_blobs(bucket_id="b", key="new", blobs=make_blobs("new"), class_name="X")).is_ok
+    assert (await legacy.put_blobs(bucket_id="b", key="old", blobs=make_blobs("old"), class_name="X")).is_ok
+
+    for reader in (axo_storage, legacy):
+        for key in ("new", "old"):
+            got = (await reader.get_blobs(bucket_id="b", key=key)).unwrap()
+            expected = make_blobs(key)
+            assert got.source_code_blob.data == expected.source_code_blob.data
+            assert got.attrs_blob.data == expected.attrs_blob.data
+
+    md = (await storage_service.get_metadata(bucket_id="b", key=SU.attrs_key("new"))).unwrap()
+    assert md.tags[AXO_SOURCE_REF_TAG] == make_blobs("new").source_code_blob.metadata.checksum
+    assert (await storage_service.get_metadata(bucket_id="b", key=SU.source_key("new"))).is_err
+
+
+@pytest.mark.asyncio
+async def test_delete_keeps_shared_source(storage_service):
+    axo_storage = AxoStorage(storage=storage_service, dedup_source_code=True, code_bucket_id="code")
+    for key in ("a", "b"):
+        assert (await axo_storage.put_blobs(bucket_id="b", key=key, blobs=make_blobs(key), class_name="X")).is_ok
+
+    assert (await axo_storage.delete_object(bucket_id="b", key="a")).is_ok
+    assert (await axo_storage.get_blobs(bucket_id="b", key="a")).is_err
+
+    fresh = AxoStorage(storage=storage_service)
+    got = (await fresh.get_blobs(bucket_id="b", key="b")).unwrap()
+    assert got.source_code_blob.data == make_blobs("b").source_code_blob.data
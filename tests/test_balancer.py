@@ -0,0 +1,80 @@
+import random
+from collections import Counter
+from types import SimpleNamespace
+import pytest
+from axo import Axo, axo_method
+from axo.endpoint.balancer import EndpointLoad, PowerOfTwoChoices, make_policy
+from axo.endpoint.manager import DistributedEndpointManager
+from .objects.fake_endpoint import FakeEndpoint
+
+
+class Adder(Axo):
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+
+def _ep(eid, outstanding=0, ewma_s=None):
+    load = EndpointLoad()
+    load.outstanding, load.ewma_s = outstanding, ewma_s
+    return SimpleNamespace(endpoint_id=eid, load=load)
+
+
+def _manager(policy, *eps):
+    return DistributedEndpointManager(endpoints={ep.endpoint_id: ep for ep in eps}, policy=policy)
+
+
+def test_policies_pick_by_load():
+    rr = _manager("round_robin", _ep("a"), _ep("b"), _ep("c"))
+    assert [rr.get_endpoint().endpoint_id for _ in range(4)] == ["a", "b", "c", "a"]
+    assert rr.get_endpoint("b").endpoint_id == "b"  # a known ID bypasses the policy
+
+    lo = _manager("least_outstanding", _ep("a", outstanding=3), _ep("b", outstanding=1), _ep("c", outstanding=2))
+    assert lo.get_endpoint().endpoint_id == "b"
+
+    ewma = _manager("ewma", _ep("a", ewma_s=0.2), _ep("b", ewma_s=0.01), _ep("c", ewma_s=0.05))
+    assert ewma.get_endpoint().endpoint_id == "b"
+    ewma.endpoints["d"] = _ep("d")                      # unmeasured: tried first
+    assert ewma.get_endpoint().endpoint_id == "d"
+
+    with pytest.raises(ValueError):
+        make_policy("fastest")
+
+
+def test_p2c_never_picks_the_worst_of_three():
+    eps = [_ep("a", ewma_s=0.01), _ep("b", ewma_s=0.01, outstanding=4), _ep("c", ewma_s=0.5)]
+    dem = _manager(PowerOfTwoChoices(rng=random.Random(7)), *eps)
+    picks = Counter(dem.get_endpoint().endpoint_id for _ in range(3000))
+    assert picks["c"] == 0
+    assert picks["a"] > picks["b"] > 0              # a wins both of its pairs, b only against c
+
+
+def test_endpoint_set_changes_reach_the_policy():
+    dem = _manager("round_robin", _ep("a"))
+    assert dem.del_endpoint("a").endpoint_id == "a"
+    assert dem.get_endpoint() is None
+    dem.endpoints["b"] = _ep("b")                       # changed without the manager
+    assert dem.get_endpoint().endpoint_id == "b"
+
+
+@pytest.mark.parametrize("policy", ["ewma", "p2c"])
+def test_latency_aware_policies_prefer_the_fast_endpoint(policy):
+    fast, slow = FakeEndpoint(delay=0.002), FakeEndpoint(delay=0.05)
+    fast.start(); slow.start()
+    dem = DistributedEndpointManager(endpoints={}, policy=policy)
+    try:
+        dem.add_endpoint(endpoint_id="fast", hostname="127.0.0.1", req_res_port=fast.port, pubsub_port=-1)
+        dem.add_endpoint(endpoint_id="slow", hostname="127.0.0.1", req_res_port=slow.port, pubsub_port=-1)
+        ao = Adder(axo_endpoint_id="none")
+        for _ in range(40):
+            ep = dem.get_endpoint()
+            assert ep.method_execution(key="k", fname="add", ao=ao, fargs=[1, 2]).unwrap() == 3
+        assert fast.served > 4 * slow.served
+        load = dem.endpoints["slow"].load
+        assert load.outstanding == 0 and load.requests >= 1 and load.ewma_s >= 0.05
+    finally:
+        for eid in list(dem.endpoints):
+            dem.del_endpoint(eid).close()
+        for srv in (fast, slow):
+            srv.running = False
+            srv.join()
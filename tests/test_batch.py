@@ -0,0 +1,101 @@
+import time
+import pytest
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.enums import AxoOperationType
+from axo.errors import AxoErrorType
+from axo.models import MethodExecutionBatch
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+from .objects.fake_endpoint import FakeEndpoint
+
+
+class Adder(Axo):
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+    @axo_method
+    def missing(self, **kwargs):
+        return None
+
+    def plain(self):
+        return 1
+
+
+@pytest.fixture
+def server():
+    srv = FakeEndpoint(delay=0)
+    srv.start()
+    yield srv
+    srv.running = False
+    srv.join()
+
+
+@pytest.fixture
+def remote(server):
+    dem = DistributedEndpointManager(endpoints={})
+    dem.add_endpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=server.port, pubsub_port=-1)
+    with AxoContextManager.distributed(endpoint_manager=dem, storage_service=InMemoryStorageService(storage_service_id="batch")):
+        yield [Adder(axo_endpoint_id="e0", _acx_local=False) for _ in range(2)]
+        dem.endpoints["e0"].close()
+
+
+def test_calls_are_packed_into_batch_messages(remote, server):
+    a, _ = remote
+    with a.batch(max_size=100) as b:
+        calls = [b.add(i, 1) for i in range(1000)]
+        assert b.messages == 10  # sent as each batch filled up
+    assert [c.result().unwrap() for c in calls] == [i + 1 for i in range(1000)]
+    assert server.ops.count(AxoOperationType.METHOD_EXEC_BATCH) == 10
+    assert AxoOperationType.METHOD_EXEC not in server.ops
+
+
+def test_results_and_errors_come_back_in_order(remote, server):
+    a, c = remote
+    with a.batch() as b:
+        b.add(1)
+        b.missing()
+        b.of(c).add(2, 2)
+        b.plain()
+    res = b.results
+    assert res[0].unwrap() == 1 and res[2].unwrap() == 4
+    assert res[1].unwrap_err().type == AxoErrorType.INTERNAL_ERROR
+    assert res[3].unwrap_err().type == AxoErrorType.BAD_REQUEST  # not an axo_method: never sent
+    assert server.ops.count(AxoOperationType.METHOD_EXEC_BATCH) == 1
+
+
+def test_partial_batches_leave_after_the_flush_interval(remote, server):
+    a, _ = remote
+    b = a.batch(max_size=100, flush_interval=0.05)
+    calls = [b.add(i) for i in range(3)]
+    time.sleep(0.3)
+    assert all(c.done for c in calls) and b.messages == 1
+    assert [c.result().unwrap() for c in calls] == [0, 1, 2]
+
+
+def test_in_process_calls_run_right_away():
+    rt = LocalRuntime(storage_service=InMemoryStorageService(storage_service_id="batch-local"), runtime_id="rt-batch", q_tick_s=0)
+    prev = get_runtime()
+    set_runtime(rt)
+    try:
+        a = Adder(axo_key="adder")
+        with a.batch() as b:
+            call = b.add(2, 3)
+            assert call.done and call.result().unwrap() == 5
+        assert b.messages == 0
+    finally:
+        rt.stop()
+        set_runtime(prev)
+
+
+def test_batch_message_round_trip():
+    a, c = Adder(axo_key="a"), Adder(axo_key="c")
+    msg = MethodExecutionBatch(calls=[(a._acx_metadata, "add", [1, 2], {}), (c._acx_metadata, "add", [3], {"k": 1}), (a._acx_metadata, "x", [], {}, "ref")])
+    calls = MethodExecutionBatch.unpack(msg.payload).unwrap()
+    assert [(m.axo_key, f, args, kw, mode) for m, f, args, kw, mode in calls] == [
+        ("a", "add", [1, 2], {}, None), ("c", "add", [3], {"k": 1}, None), ("a", "x", [], {}, "ref"),
+    ]
+    assert len(msg.payload) == 1 + 2 * 3
@@ -0,0 +1,74 @@
+import socket
+import time
+import pytest
+from axo import Axo, axo_method
+from axo.endpoint.breaker import OPEN
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.errors import AxoErrorType
+from .objects.fake_endpoint import FakeEndpoint
+
+
+class Adder(Axo):
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+
+def _dead_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _desc(eid, port):
+    return {"endpoint_id": eid, "hostname": "127.0.0.1", "req_res_port": port, "pubsub_port": -1}
+
+
+@pytest.fixture
+def fleet():
+    servers = [FakeEndpoint(delay=0) for _ in range(6)]
+    for srv in servers:
+        srv.start()
+    dem = DistributedEndpointManager(endpoints={})
+    try:
+        yield dem, servers
+    finally:
+        for eid in list(dem.endpoints):
+            dem.del_endpoint(eid).close()
+        for srv in servers:
+            srv.running = False
+            srv.join()
+
+
+def test_connects_in_parallel_within_the_deadline(fleet):
+    dem, servers = fleet
+    descs = [_desc(f"up-{i}", srv.port) for i, srv in enumerate(servers)] + [_desc(f"down-{i}", _dead_port()) for i in range(3)]
+    t1 = time.monotonic()
+    res = dem.add_endpoints(descs, timeout="300ms", warm_sockets=2)
+    elapsed = time.monotonic() - t1
+    assert elapsed < 0.6                                       # one deadline, not one per dead endpoint
+    assert sorted(dem.endpoints) == sorted(d["endpoint_id"] for d in descs)
+    for i in range(6):
+        assert 0 < res[f"up-{i}"].unwrap() < elapsed
+        assert dem.endpoints[f"up-{i}"].available
+    for i in range(3):
+        assert res[f"down-{i}"].unwrap_err().type == AxoErrorType.TIMEOUT
+        ep = dem.endpoints[f"down-{i}"]
+        assert ep.breaker.state == OPEN and not ep.available   # registered, but skipped until it answers
+    assert {dem.get_endpoint().endpoint_id for _ in range(12)} == {f"up-{i}" for i in range(6)}
+
+
+def test_first_call_finds_a_warm_socket(fleet):
+    dem, servers = fleet
+    dem.add_endpoints([_desc("e0", servers[0].port)], warm_sockets=3)
+    ep = dem.endpoints["e0"]
+    assert ep._pool.size == ep._pool.idle == 3                 # each one answered a PING
+    ao = Adder(axo_endpoint_id="e0")
+    assert ep.method_execution(key="k", fname="add", ao=ao, fargs=[1, 2]).unwrap() == 3
+    assert ep._pool.size == 3                                  # no new connection
+
+
+def test_add_endpoint_is_a_fleet_of_one(fleet):
+    dem, servers = fleet
+    dem.add_endpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=servers[0].port, pubsub_port=-1)
+    assert dem.endpoints["e0"]._ensure_connection() and dem.endpoints["e0"]._pool.idle == 1
@@ -0,0 +1,114 @@
+import time
+from types import SimpleNamespace
+import pytest
+from axo import Axo, axo_method
+from axo.endpoint.balancer import Rendezvous
+from axo.endpoint.breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from axo.endpoint.endpoint import DistributedEndpoint
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.errors import AxoErrorType
+from .objects.fake_endpoint import FakeEndpoint
+
+
+class Adder(Axo):
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+
+def _wait_for(cond, timeout_s=2):
+    t_end = time.monotonic() + timeout_s
+    while not cond() and time.monotonic() < t_end:
+        time.sleep(0.01)
+    return cond()
+
+
+def test_breaker_states():
+    probes = []
+    cb = CircuitBreaker(lambda: probes.append(1) or len(probes) >= 2, min_calls=4, window=10, open_for="50ms")
+    for ok in (True, True, False):
+        cb.record(ok)
+    assert cb.state == CLOSED                                  # 3 calls: too few to judge
+    cb.record(False)
+    assert cb.state == OPEN and not cb.allow() and cb.retry_after_s() > 0
+    assert _wait_for(lambda: cb.state == HALF_OPEN)            # the first probe failed, the second did not
+    assert len(probes) == 2
+    cb.record(True)
+    assert cb.state == HALF_OPEN
+    cb.record(True)
+    assert cb.state == CLOSED
+
+    for ok in (False, False, False, False):
+        cb.record(ok)
+    assert _wait_for(lambda: cb.state == HALF_OPEN)
+    cb.record(False)                                           # a failed trial opens it again
+    assert cb.state == OPEN and cb.trips == 3
+    cb.close()
+
+
+def test_failures_age_out_of_the_window():
+    cb = CircuitBreaker(min_calls=4, window=4)
+    for ok in [False, True, True, True, True, False]:
+        cb.record(ok)
+    assert cb.state == CLOSED                                  # 1 of the last 4, the first one is gone
+    cb.record(False)
+    assert cb.state == OPEN
+    cb.close()
+
+
+def _ep(eid, up=True):
+    return SimpleNamespace(endpoint_id=eid, available=up)
+
+
+@pytest.mark.parametrize("policy", ["round_robin", "least_outstanding", "ewma", "p2c"])
+def test_policies_skip_unavailable_endpoints(policy):
+    dem = DistributedEndpointManager(endpoints={"a": _ep("a", up=False), "b": _ep("b"), "c": _ep("c", up=False)}, policy=policy)
+    assert {dem.get_endpoint().endpoint_id for _ in range(20)} == {"b"}
+    assert dem.get_endpoint("a").endpoint_id == "a"            # a pinned object still goes home
+    dem.endpoints["b"].available = False
+    assert dem.get_endpoint() is not None                      # none is up: the request will fail fast
+
+
+def test_rendezvous_fails_over_like_a_removal():
+    ids = [f"e{i}" for i in range(6)]
+    keys = [f"b:k{i}" for i in range(500)]
+    policy = Rendezvous()
+    down = {eid: _ep(eid, up=eid != "e2") for eid in ids}
+    without = {eid: _ep(eid) for eid in ids if eid != "e2"}
+    assert [policy.pick(ids, down, k) for k in keys] == [policy.pick(list(without), without, k) for k in keys]
+
+
+def test_open_circuit_fails_fast_and_recovers_in_the_background():
+    hung, healthy = FakeEndpoint(delay=1), FakeEndpoint(delay=0)   # PINGs are answered at once by both
+    hung.start(); healthy.start()
+    dem = DistributedEndpointManager(endpoints={}, policy="round_robin")
+    try:
+        dem.endpoints["hung"] = DistributedEndpoint(
+            endpoint_id="hung", hostname="127.0.0.1", req_res_port=hung.port, pubsub_port=-1, max_recv_timeout="100ms",
+            circuit_breaker=CircuitBreaker(min_calls=3, open_for="200ms", half_open_successes=1),
+        )
+        dem.add_endpoint(endpoint_id="healthy", hostname="127.0.0.1", req_res_port=healthy.port, pubsub_port=-1)
+        ep = dem.endpoints["hung"]
+        ao = Adder(axo_endpoint_id="hung")
+        for _ in range(3):
+            res = ep.method_execution(key="k", fname="add", ao=ao, fargs=[1])
+            assert res.unwrap_err().type == AxoErrorType.TIMEOUT
+        assert ep.breaker.state == OPEN and not ep.available
+
+        t1 = time.monotonic()
+        res = ep.method_execution(key="k", fname="add", ao=ao, fargs=[1])
+        assert time.monotonic() - t1 < 0.01
+        assert "circuit open" in res.unwrap_err().message and res.unwrap_err().retry_after_ms > 0
+        assert {dem.get_endpoint().endpoint_id for _ in range(6)} == {"healthy"}
+
+        hung.delay = 0                                           # it recovers
+        assert _wait_for(lambda: ep.breaker.state == HALF_OPEN)  # probed off the request path
+        assert ep.method_execution(key="k", fname="add", ao=ao, fargs=[1, 2]).unwrap() == 3
+        assert ep.breaker.state == CLOSED
+        assert {dem.get_endpoint().endpoint_id for _ in range(4)} == {"hung", "healthy"}
+    finally:
+        for eid in list(dem.endpoints):
+            dem.del_endpoint(eid).close()
+        for srv in (hung, healthy):
+            srv.running = False
+            srv.join()
@@ -0,0 +1,107 @@
+import pytest
+from axo import Axo
+from axo.cache import ClassCache,get_class_cache,get_class_source,invalidate_class_source,source_checksum
+from axo.storage import AxoStorage
+from axo.storage.loader import AxoLoader
+from axo.storage.services import InMemoryStorageService
+from axo.storage.types import AxoObjectBlob
+from .objects import Dog
+
+SOURCE = "class Greeter:\n    def __init__(self, greeting='hola', **kwargs):\n        self.greeting = greeting\n"
+
+
+def _compile(cache: ClassCache, source: str):
+    return cache.get_or_compile(
+        source,
+        namespace_factory = dict,
+        resolve           = lambda ns: ns["Greeter"],
+    )
+
+
+def test_class_cache_hit_and_miss():
+    cache = ClassCache(maxsize=4)
+    c1 = _compile(cache, SOURCE)
+    c2 = _compile(cache, SOURCE)
+    assert c1 is c2
+    stats = cache.stats()
+    assert stats.misses == 1
+    assert stats.hits == 1
+    assert stats.size == 1
+
+
+def test_class_cache_lru_eviction():
+    cache = ClassCache(maxsize=2)
+    sources = [SOURCE + f"\nX = {i}\n" for i in range(3)]
+    for src in sources:
+        _compile(cache, src)
+    assert len(cache) == 2
+    assert cache.stats().evictions == 1
+    # first entry was evicted, last one is still there
+    assert cache.get(source_checksum(sources[0])) is None
+    assert cache.get(source_checksum(sources[2])) is not None
+
+
+def test_class_cache_does_not_store_failures():
+    cache = ClassCache()
+    with pytest.raises(KeyError):
+        cache.get_or_compile("X = 1\n", namespace_factory=dict, resolve=lambda ns: ns["Greeter"])
+    assert len(cache) == 0
+
+
+def test_from_bytes_reuses_class():
+    raw   = Dog(name="Rex").to_bytes().unwrap()
+    first = Axo.from_bytes(raw).unwrap()
+    before = get_class_cache().stats()
+    second = Axo.from_bytes(raw).unwrap()
+    after  = get_class_cache().stats()
+    assert type(first) is type(second)
+    assert after.hits == before.hits + 1
+    assert after.misses == before.misses
+
+
+@pytest.mark.asyncio
+async def test_loader_uses_class_cache():
+    cache   = ClassCache()
+    storage = AxoStorage(storage=InMemoryStorageService())
+    loader  = AxoLoader(storage, class_cache=cache)
+    for key in ["g1", "g2"]:
+        blobs = AxoObjectBlob.from_code_and_attrs(bucket_id="b", key=key, code=SOURCE, attrs={"greeting": key})
+        res = await storage.put_blobs(bucket_id="b", key=key, blobs=blobs, class_name="Greeter")
+        assert res.is_ok
+
+    g1 = (await loader.load_object(bucket_id="b", key="g1")).unwrap()
+    g2 = (await loader.load_object(bucket_id="b", key="g2")).unwrap()
+    assert type(g1) is type(g2)
+    assert g2.greeting == "g2"
+    assert cache.stats().misses == 1
+    assert cache.stats().hits == 1
+
+
+def test_class_source_is_memoized():
+    src1 = get_class_source(Dog)
+    src2 = get_class_source(Dog)
+    assert src1 is src2
+    assert src1.data == src1.source.encode("utf-8")
+    assert src1.checksum == source_checksum(src1.data)
+
+
+def test_class_source_invalidated_with_class():
+    class Cat(Axo):
+        pass
+    first = get_class_source(Cat)
+
+    class Cat(Axo):  # noqa: F811 — redefinition is the point
+        lives = 9
+    second = get_class_source(Cat)
+    assert first is not second
+
+    invalidate_class_source(Cat)
+    assert get_class_source(Cat) is not second
+
+
+def test_rebuilt_class_keeps_its_source():
+    raw = Dog(name="Rex").to_bytes().unwrap()
+    rebuilt = Axo.from_bytes(raw).unwrap()
+    # inspect.getsource cannot see exec'd classes; the memo can
+    again = Axo.from_bytes(rebuilt.to_bytes().unwrap()).unwrap()
+    assert again.name == "Rex"
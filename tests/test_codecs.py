@@ -0,0 +1,97 @@
+import array
+import datetime as dt
+from collections import Counter, OrderedDict, defaultdict, deque
+import pytest
+from axo.serde import serialize_attrs, deserialize_attrs
+from axo.serde.codecs import (
+    Codec, CodecRegistry,
+    CT_JSON, CT_BYTES, CT_BYTEARRAY, CT_ARRAY, CT_NDARRAY, CT_PICKLE, CT_CLOUDPICKLE,
+)
+from .objects import Dog
+
+
+@pytest.mark.parametrize("value,content_type", [
+    ({"a": 1, "b": [1.5, "x", None, True]}, CT_JSON),
+    ("hello", CT_JSON),
+    (b"\x00\x01raw", CT_BYTES),
+    (bytearray(b"abc"), CT_BYTEARRAY),
+    (array.array("d", [1.0, 2.0]), CT_ARRAY),
+    ({1, 2, 3}, CT_PICKLE),
+    ((1, "a"), CT_PICKLE),
+    ({1: "int keys"}, CT_PICKLE),
+    ({"when": dt.datetime(2024, 1, 1), "tags": {"x"}}, CT_PICKLE),
+    ({"fn": lambda x: x}, CT_CLOUDPICKLE),
+])
+def test_codec_is_chosen_by_type(value, content_type):
+    data, ct = serialize_attrs(value)
+    assert ct == content_type
+    got = deserialize_attrs(data, ct)
+    if content_type == CT_CLOUDPICKLE:
+        assert got["fn"](3) == 3
+    else:
+        assert got == value
+        assert type(got) is type(value)
+
+
+def test_stdlib_containers_are_checked_by_content():
+    Main = type("Main", (), {"__module__": "__main__"})  # not importable by reference
+
+    for value in (defaultdict(int, a=1), OrderedDict(a=1), Counter("abc"), deque([1, dt.date(2024, 1, 1)])):
+        data, ct = serialize_attrs({"v": value})
+        assert ct == CT_PICKLE
+        assert deserialize_attrs(data, ct)["v"] == value
+
+    data, ct = serialize_attrs({"d": defaultdict(lambda: 0, a=1)})
+    assert ct == CT_CLOUDPICKLE
+    d = deserialize_attrs(data, ct)["d"]
+    assert d["a"] == 1 and d["missing"] == 0
+
+    data, ct = serialize_attrs({"q": deque([Main(), Main()])})
+    assert ct == CT_CLOUDPICKLE
+    assert all(type(x).__name__ == "Main" for x in deserialize_attrs(data, ct)["q"])
+    _, ct = serialize_attrs(OrderedDict(k=Main()))
+    assert ct == CT_CLOUDPICKLE
+
+
+def test_ndarray_raw_roundtrip():
+    np = pytest.importorskip("numpy")
+    x = np.arange(12, dtype=np.int32).reshape(3, 4)[:, 1:]  # non-contiguous
+    data, ct = serialize_attrs(x)
+    assert ct == CT_NDARRAY
+    got = deserialize_attrs(data, ct)
+    assert np.array_equal(got, x) and got.dtype == x.dtype
+    got[0, 0] = 99  # writable
+
+    _, ct = serialize_attrs(np.array([object()], dtype=object))
+    assert ct == CT_CLOUDPICKLE
+    _, ct = serialize_attrs({"w": x})
+    assert ct == CT_PICKLE
+
+
+def test_legacy_blobs_without_content_type():
+    import cloudpickle as cp
+    assert deserialize_attrs(b'{"a":1}') == {"a": 1}
+    assert deserialize_attrs(cp.dumps({"a": {1, 2}}), "application/octet-stream") == {"a": {1, 2}}
+
+
+def test_axo_attrs_use_cloudpickle_only_for_dynamic_parts():
+    attrs, _ = Dog(name="Rex").get_raw_parts().unwrap()
+    data, ct = serialize_attrs(attrs)
+    assert ct == CT_CLOUDPICKLE  # MetadataX is not a stdlib type
+    assert deserialize_attrs(data, ct)["name"] == "Rex"
+
+
+def test_register_custom_codec():
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    registry = CodecRegistry()
+    registry.register(
+        Codec("application/x-point", lambda p: f"{p.x},{p.y}".encode(), lambda b: Point(*map(int, bytes(b).split(b",")))),
+        Point,
+    )
+    data, ct = registry.encode(Point(1, 2))
+    assert ct == "application/x-point"
+    p = registry.decode(data, ct)
+    assert (p.x, p.y) == (1, 2)
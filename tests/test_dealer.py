@@ -0,0 +1,131 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+import cloudpickle as cp
+import pytest
+from axo import Axo, axo_method
+from axo.endpoint.endpoint import DistributedEndpoint
+from axo.endpoint.transport import SocketPool
+from axo.errors import AxoErrorType
+from .objects.fake_endpoint import FakeEndpoint
+
+
+class Adder(Axo):
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+
+@pytest.fixture
+def server():
+    srv = FakeEndpoint(delay=0)
+    srv.start()
+    yield srv
+    srv.running = False
+    srv.join()
+
+
+@pytest.fixture
+def endpoint(server):
+    ep = DistributedEndpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=server.port, pubsub_port=-1)
+    yield ep
+    ep.close()
+
+
+def _add(ep, *xs):
+    return ep.method_execution(key="k", fname="add", ao=Adder(axo_endpoint_id="e0"), fargs=list(xs))
+
+
+@pytest.mark.asyncio
+async def test_outstanding_requests_share_one_socket(endpoint, server):
+    # later requests are answered first: replies arrive out of order
+    server.delay = lambda req: 0.2 - 0.002 * cp.loads(req.payload[0])[0]
+    ao = Adder(axo_endpoint_id="e0")
+    results = await asyncio.gather(*(
+        endpoint.amethod_execution(key="k", fname="add", ao=ao, fargs=[i, 1000]) for i in range(50)
+    ))
+    assert [r.unwrap() for r in results] == [i + 1000 for i in range(50)]
+    assert len(server.idents) == 1
+    assert len(endpoint._channels) == 1
+
+
+def test_timeout_does_not_tear_down_the_connection(endpoint, server):
+    assert _add(endpoint, 1, 1).unwrap() == 2
+    sock = endpoint._pool._idle[-1][1]
+
+    endpoint._recv_timeout_ms = 50
+    server.delay = 0.15
+    res = _add(endpoint, 1, 2)
+    assert res.is_err and res.unwrap_err().type == AxoErrorType.TIMEOUT
+    time.sleep(0.2)  # the late reply (3) is now queued on the socket
+
+    server.delay = 0
+    assert _add(endpoint, 1, 3).unwrap() == 4  # the stale reply is skipped
+    assert endpoint._pool.size == 1 and endpoint._pool._idle[-1][1] is sock
+
+
+@pytest.mark.asyncio
+async def test_async_timeout_keeps_the_channel(endpoint, server):
+    ao = Adder(axo_endpoint_id="e0")
+    assert (await endpoint.amethod_execution(key="k", fname="add", ao=ao, fargs=[1])).unwrap() == 1
+    channel = next(iter(endpoint._channels.values()))
+
+    endpoint._recv_timeout_ms = 50
+    server.delay = 0.15
+    res = await endpoint.amethod_execution(key="k", fname="add", ao=ao, fargs=[2])
+    assert res.unwrap_err().type == AxoErrorType.TIMEOUT
+    server.delay = 0
+    endpoint._recv_timeout_ms = 1000
+    assert (await endpoint.amethod_execution(key="k", fname="add", ao=ao, fargs=[3])).unwrap() == 3
+    assert next(iter(endpoint._channels.values())) is channel and channel.outstanding == 0
+
+
+def test_threads_call_in_parallel_on_pooled_sockets(endpoint, server):
+    server.delay = 0.05
+    t1 = time.monotonic()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda i: _add(endpoint, i, 1), range(32)))
+    elapsed = time.monotonic() - t1
+    assert [r.unwrap() for r in results] == [i + 1 for i in range(32)]
+    assert elapsed < 32 * server.delay / 4  # one shared socket would serialize them
+    assert endpoint._pool.size <= 8
+    assert server.ops.count("PING") == 1  # health is shared by the pool
+
+
+def test_socket_pool_is_bounded_and_drops_idle_sockets(server):
+    pool = SocketPool(f"tcp://127.0.0.1:{server.port}", maxsize=2, idle_timeout_s=0.05)
+    try:
+        a, b = pool.acquire().unwrap(), pool.acquire().unwrap()
+        res = pool.acquire(timeout_s=0.02)
+        assert res.is_err and res.unwrap_err().type == AxoErrorType.TIMEOUT
+        pool.release(a)
+        assert pool.acquire(timeout_s=0.02).unwrap() is a
+        pool.release(a)
+        pool.release(b, discard=True)
+        assert pool.size == 1 and pool.idle == 1
+        time.sleep(0.1)
+        c = pool.acquire().unwrap()
+        assert c is not a and pool.size == 1  # the idle one was closed
+        pool.release(c)
+    finally:
+        pool.close()
+
+
+def test_waiting_for_a_socket_counts_against_the_deadline(server):
+    ep = DistributedEndpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=server.port, pubsub_port=-1, max_sockets=1, max_recv_timeout="200ms")
+    try:
+        assert _add(ep, 1).unwrap() == 1
+        server.delay = 0.15
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            busy = pool.submit(_add, ep, 2)        # holds the only socket
+            time.sleep(0.05)
+            assert ep.queued == 0 and ep.load.outstanding == 1
+            t1 = time.monotonic()
+            res = _add(ep, 3)
+            elapsed = time.monotonic() - t1
+            assert busy.result().unwrap() == 2
+        assert res.unwrap_err().type == AxoErrorType.TIMEOUT
+        assert elapsed < 0.3                       # one deadline, not the wait plus a full timeout
+        assert ep.load.outstanding == 0
+    finally:
+        ep.close()
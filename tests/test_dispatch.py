@@ -0,0 +1,113 @@
+import pytest
+from axo import Axo, axo_method
+from axo.core.decorators import AXO_CALL_KWARGS
+from axo.core.decorators import _execute_via_endpoint
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+
+
+class Calc(Axo):
+    def __init__(self, x: int = 1, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.x = x
+
+    @axo_method
+    def add(self, y, **kwargs):
+        return self.x + y
+
+    @axo_method
+    def context(self, **kwargs):
+        return kwargs
+
+    @axo_method
+    def uses_storage(self, storage=None, **kwargs):
+        return storage
+
+    @axo_method
+    def exact(self, y):
+        return self.x * y
+
+    @axo_method
+    def named(self, y, axo_key=None):
+        return axo_key
+
+    @axo_method
+    def boom(self, **kwargs):
+        raise ValueError("boom")
+
+    def plain(self):
+        return self.x
+
+
+class Child(Calc):
+    def add(self, y, **kwargs):  # no longer an axo_method
+        return y
+
+    @axo_method
+    def twice(self, **kwargs):
+        return 2 * self.x
+
+
+@pytest.fixture
+def runtime():
+    rt = LocalRuntime(storage_service=InMemoryStorageService(storage_service_id="dispatch"), runtime_id="rt-dispatch", q_tick_s=0)
+    prev = get_runtime()
+    set_runtime(rt)
+    yield rt
+    rt.stop()
+    set_runtime(prev)
+
+
+def test_dispatch_table_is_built_per_class():
+    assert set(Calc._acx_dispatch) == {"add", "context", "uses_storage", "exact", "named", "boom"}
+    assert set(Child._acx_dispatch) == {"context", "uses_storage", "exact", "named", "boom", "twice"}
+    assert Calc._acx_dispatch["add"].inject == AXO_CALL_KWARGS
+    assert Calc._acx_dispatch["exact"].inject == frozenset()
+    assert Calc._acx_dispatch["named"].inject == {"axo_key"}
+    assert Calc._acx_dispatch["add"].fn(Calc(x=2), 3) == 5
+
+
+def test_fast_path_matches_endpoint_path(runtime: LocalRuntime):
+    c = Calc(x=2, axo_key="c1")
+    slow = _execute_via_endpoint(runtime, Calc._acx_dispatch["context"].fn, c, (), {}).unwrap()
+    fast_res = runtime.invoke_local(c, Calc._acx_dispatch["context"].fn, (), {}, AXO_CALL_KWARGS)
+    assert fast_res is not None
+    assert fast_res.unwrap() == slow
+    assert c.add(3).unwrap() == 5
+    assert c.uses_storage().unwrap() is runtime.storage_service
+    assert c.context(axo_key="override").unwrap()["axo_key"] == "override"
+
+
+def test_fast_path_errors_and_fallbacks(runtime: LocalRuntime):
+    c = Calc(axo_key="c2")
+    add = Calc._acx_dispatch["add"].fn
+    c.set_endpoint_id("elsewhere")
+    assert runtime.invoke_local(c, add, (1,), {}, AXO_CALL_KWARGS) is None
+    # the generic path assigns a known endpoint; the next calls take the fast path
+    assert c.add(1).unwrap() == 2
+    assert c.get_endpoint_id() == "axo-endpoint-0"
+    assert runtime.invoke_local(c, add, (1,), {}, AXO_CALL_KWARGS) is not None
+
+    res = c.boom()
+    assert res.is_err and isinstance(res.unwrap_err(), ValueError)
+
+
+def test_both_paths_pass_the_same_kwargs(runtime: LocalRuntime):
+    # the first call of an instance takes the endpoint path, later ones the fast path
+    for method, expected in (("exact", 6), ("named", "c3")):
+        c = Calc(x=2, axo_key="c3")
+        c.set_endpoint_id("unassigned")
+        first, second = getattr(c, method)(3), getattr(c, method)(3)
+        assert first.unwrap() == second.unwrap() == expected
+    assert c.exact(3, axo_key="ignored").unwrap() == 6
+
+
+def test_fast_path_kwargs_follow_the_object(runtime: LocalRuntime):
+    c = Calc(axo_key="c4")
+    c.add(1)
+    first = c.context().unwrap()
+    assert c.context().unwrap() == first and c.context(y=1).unwrap() == {**first, "y": 1}
+    c.set_sink_bucket_id("elsewhere")
+    assert c.context().unwrap()["axo_sink_bucket_id"] == "elsewhere"
+    assert "y" not in c.context().unwrap()  # the caller's kwargs are not kept
@@ -0,0 +1,91 @@
+import struct
+import pytest
+import cloudpickle as cp
+import axo.serde.frames as FR
+from axo import Axo
+from .objects import Dog
+
+
+def test_pack_unpack_roundtrip():
+    parts = [b"attrs", b"class X: pass", b"", b"\x00" * 10]
+    raw   = FR.pack_frames(parts)
+    assert isinstance(raw, bytes)
+    assert raw.startswith(FR.FRAME_MAGIC)
+
+    got = FR.unpack_frames(raw)
+    assert [bytes(p) for p in got] == parts
+    # parts are views over the input, not copies
+    assert all(isinstance(p, memoryview) and p.obj is raw for p in got)
+
+
+def test_frame_buffers_do_not_copy_parts():
+    payload = bytearray(b"x" * 1024)
+    bufs = FR.frame_buffers([payload, b"src"])
+    assert len(bufs) == 3
+    payload[0] = ord("y")
+    assert bytes(bufs[1][:1]) == b"y"
+    assert b"".join(bufs) == FR.pack_frames([payload, b"src"])
+
+
+def test_unpack_legacy_frames():
+    attrs = {"name": "Rex"}
+    parts = [cp.dumps(attrs), b"class Dog: pass"]
+    legacy = b""
+    for part in parts:
+        legacy += struct.pack("I", len(part)) + part
+
+    got_attrs, code = FR.decode_object(legacy)
+    assert got_attrs == attrs
+    assert bytes(code) == parts[1]
+
+
+def test_unpack_truncated_frame():
+    raw = FR.pack_frames([b"abc", b"def"])
+    with pytest.raises(ValueError):
+        FR.unpack_frames(raw[:-1])
+
+
+def test_oob_buffers_roundtrip():
+    np = pytest.importorskip("numpy")
+    x = np.arange(1024, dtype=np.float64)
+    payload, buffers = FR.dumps_oob({"x": x})
+    assert len(buffers) == 1
+    assert len(payload) < x.nbytes
+
+    raw = FR.pack_frames([payload, b"", *buffers])
+    attrs, _ = FR.decode_object(raw)
+    assert np.array_equal(attrs["x"], x)
+    # decoded in place: the array is a view over the input
+    assert np.shares_memory(attrs["x"], np.frombuffer(raw, dtype=np.uint8))
+    assert not attrs["x"].flags.writeable
+
+    mutable = bytearray(raw)
+    attrs, _ = FR.decode_object(mutable)
+    assert attrs["x"].flags.writeable
+    assert np.shares_memory(attrs["x"], np.frombuffer(mutable, dtype=np.uint8))
+
+    # asked for: read-only input is copied once so the array can be mutated
+    attrs, _ = FR.decode_object(raw, writable=True)
+    attrs["x"][0] = 42.0
+    assert not np.shares_memory(attrs["x"], np.frombuffer(raw, dtype=np.uint8))
+
+
+def test_axo_from_legacy_bytes():
+    dog   = Dog(name="Rex")
+    attrs, code = dog.get_raw_parts().unwrap()
+    legacy = b""
+    for part in [cp.dumps(attrs), code.encode("utf-8")]:
+        legacy += struct.pack("I", len(part)) + part
+
+    res = Axo.from_bytes(legacy)
+    assert res.is_ok
+    assert res.unwrap().name == "Rex"
+
+
+def test_axo_to_buffers():
+    dog  = Dog(name="Rex")
+    bufs = dog.to_buffers()
+    assert bufs.is_ok
+    raw  = b"".join(bufs.unwrap())
+    assert raw == dog.to_bytes().unwrap()
+    assert Axo.from_bytes(memoryview(raw)).unwrap().name == "Rex"
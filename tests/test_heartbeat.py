@@ -0,0 +1,81 @@
+import socket
+import threading
+import time
+import pytest
+from axo import Axo, axo_method
+from axo.endpoint.endpoint import DistributedEndpoint
+from axo.endpoint.transport import Heartbeat
+from .objects.fake_endpoint import FakeEndpoint
+
+
+class Adder(Axo):
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+
+@pytest.fixture
+def server():
+    srv = FakeEndpoint(delay=0)
+    srv.start()
+    yield srv
+    srv.running = False
+    srv.join()
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_requests_to_a_healthy_endpoint_never_ping(server):
+    ep = DistributedEndpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=server.port, pubsub_port=-1, heartbeat_interval="100ms")
+    try:
+        ao = Adder(axo_endpoint_id="e0")
+        t_end = time.monotonic() + 0.4
+        while time.monotonic() < t_end:  # replies count as beats
+            assert ep.method_execution(key="k", fname="add", ao=ao, fargs=[1, 2]).unwrap() == 3
+        assert server.ops.count("PING") == 1
+        time.sleep(0.35)                   # idle: the heartbeat pings in the background
+        assert server.ops.count("PING") >= 2
+    finally:
+        ep.close()
+    assert ep._heartbeat.alive is None and ep._heartbeat._thread is None
+
+
+def test_down_endpoint_fails_fast():
+    ep = DistributedEndpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=_free_port(), pubsub_port=-1,
+                             heartbeat_timeout="50ms", max_retries=2, max_backoff="50ms")
+    try:
+        ao = Adder(axo_endpoint_id="e0")
+        t1 = time.monotonic()
+        assert ep.method_execution(key="k", fname="add", ao=ao, fargs=[1]).is_err  # waits for the first verdict
+        assert time.monotonic() - t1 < 1
+        t1 = time.monotonic()
+        assert ep.method_execution(key="k", fname="add", ao=ao, fargs=[1]).is_err
+        assert time.monotonic() - t1 < 0.05  # no ping in the request path
+    finally:
+        ep.close()
+
+
+def test_reconnects_with_jittered_backoff():
+    up = threading.Event()
+    hb = Heartbeat("tcp://127.0.0.1:1", lambda sock, timeout_s: up.is_set(),
+                   interval_s=10, max_misses=2, backoff_base_s=0.01, max_backoff_s=0.04)
+    for failures in range(1, 12):
+        assert 0 <= hb.backoff(failures) <= min(0.04, 0.01 * 2 ** (failures - 1))
+    try:
+        assert hb.wait() is False
+        time.sleep(0.3)
+        assert 5 < hb.probes < 100  # retried, but not in a tight loop
+        up.set()
+        t_end = time.monotonic() + 1
+        while hb.alive is not True and time.monotonic() < t_end:
+            time.sleep(0.01)
+        assert hb.alive is True
+        probes = hb.probes
+        time.sleep(0.1)
+        assert hb.probes == probes  # healthy: next probe in interval_s
+    finally:
+        hb.stop()
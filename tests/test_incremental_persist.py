@@ -0,0 +1,167 @@
+import pytest
+from axo import Axo, axo_method
+from axo.helpers import serialize_attr_blobs_from_instance
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage import AxoStorage
+from axo.storage.services import InMemoryStorageService
+from axo.storage.utils import StorageUtils as SU
+
+
+class Model(Axo, track_changes=True):
+    def __init__(self, weights=None, counter: int = 0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.weights = weights if weights is not None else list(range(1000))
+        self.counter = counter
+
+    @axo_method
+    def bump(self, **kwargs):
+        self.counter += 1
+        return self.counter
+
+
+class Untracked(Axo):
+    def __init__(self, weights=None, counter: int = 0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.weights = weights if weights is not None else list(range(1000))
+        self.counter = counter
+
+
+class CountingStorage(InMemoryStorageService):
+    def __init__(self):
+        super().__init__(storage_service_id="counting")
+        self.puts = []
+
+    async def put(self, *, bucket_id, key, data, tags=None, chunk_size="1MB"):
+        self.puts.append(key)
+        return await super().put(bucket_id=bucket_id, key=key, data=data, tags=tags, chunk_size=chunk_size)
+
+
+@pytest.fixture
+def storage():
+    return CountingStorage()
+
+
+@pytest.fixture
+def runtime(storage):
+    rt = LocalRuntime(storage_service=storage, runtime_id="rt-incremental", q_tick_s=0, incremental_persist=True)
+    prev = get_runtime()
+    set_runtime(rt)
+    yield rt
+    rt.stop()
+    set_runtime(prev)
+
+
+def test_assignments_are_tracked():
+    m = Model(axo_key="m0")
+    assert {"weights", "counter"} <= m.get_dirty_attrs()
+    assert not any(k.startswith("_acx_") for k in m.get_dirty_attrs())
+    m._acx_mark_persisted(("b", "m0"))
+    assert m.get_dirty_attrs() == set()
+
+    m.counter = 5
+    m.weights.append(1)
+    m.mark_dirty("weights")
+    assert m.get_dirty_attrs() == {"counter", "weights"}
+
+    attrs, _ = m.get_raw_parts().unwrap()
+    assert "_acx_dirty" not in attrs and "_acx_persisted" not in attrs
+
+    u = Untracked(axo_key="u0")
+    u.counter = 1
+    assert u.get_dirty_attrs() == set()
+    assert Untracked.__setattr__ is object.__setattr__  # no per-write hook
+
+
+@pytest.mark.asyncio
+async def test_second_persist_writes_only_changed_attrs(runtime: LocalRuntime, storage: CountingStorage):
+    m = Model(axo_key="m1", axo_endpoint_id="axo-endpoint-0")
+    assert (await runtime.persistify(m, bucket_id="b", key="m1")).is_ok
+    assert SU.attr_key("m1", "weights") in storage.puts
+    assert SU.source_key("m1") in storage.puts
+
+    storage.puts.clear()
+    m.counter = 42
+    assert (await runtime.persistify(m, bucket_id="b", key="m1")).is_ok
+    assert SU.attr_key("m1", "counter") in storage.puts
+    assert SU.attr_key("m1", "weights") not in storage.puts
+    assert SU.source_key("m1") not in storage.puts
+    assert m.get_dirty_attrs() == set()
+
+    loaded = (await runtime.get_active_object(bucket_id="b", key="m1")).unwrap()
+    assert loaded.counter == 42
+    assert loaded.weights == list(range(1000))
+
+
+@pytest.mark.asyncio
+async def test_loaded_objects_start_clean(runtime: LocalRuntime, storage: CountingStorage):
+    m = Model(axo_key="m6", axo_endpoint_id="axo-endpoint-0")
+    assert (await runtime.persistify(m, bucket_id="b", key="m6")).is_ok
+    copy = Axo.from_bytes(m.to_bytes().unwrap()).unwrap()
+    loaded = (await runtime.get_active_object(bucket_id="b", key="m6")).unwrap()
+    assert copy.get_dirty_attrs() == loaded.get_dirty_attrs() == set()
+    storage.puts.clear()
+    for obj in (copy, loaded):
+        assert (await runtime.persistify(obj, bucket_id="b", key="m6")).is_ok
+    assert SU.attr_key("m6", "weights") not in storage.puts
+    assert SU.attr_key("m6", "counter") not in storage.puts
+
+
+@pytest.mark.asyncio
+async def test_deleted_attribute_is_dropped(runtime: LocalRuntime, storage: CountingStorage):
+    m = Model(axo_key="m2", axo_endpoint_id="axo-endpoint-0")
+    m.extra = "x"
+    assert (await runtime.persistify(m, bucket_id="b", key="m2")).is_ok
+    del m.extra
+    assert (await runtime.persistify(m, bucket_id="b", key="m2")).is_ok
+
+    manifest = (await runtime.axo_storage.get_manifest(bucket_id="b", key="m2")).unwrap()
+    assert "extra" not in manifest.attrs
+    assert (await storage.get_metadata(bucket_id="b", key=SU.attr_key("m2", "extra"))).is_err
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_full_write_when_layout_changed(runtime: LocalRuntime, storage: CountingStorage):
+    m = Model(axo_key="m3", axo_endpoint_id="axo-endpoint-0")
+    assert (await runtime.persistify(m, bucket_id="b", key="m3")).is_ok
+    # somebody rewrites the object with the single-blob layout
+    full = await runtime._put_instance_blobs(Model(counter=7, axo_key="m3"), bucket_id="b", key="m3")
+    assert full.is_ok
+
+    m.counter = 1
+    assert (await runtime.persistify(m, bucket_id="b", key="m3")).is_ok
+    loaded = (await runtime.get_active_object(bucket_id="b", key="m3")).unwrap()
+    assert loaded.counter == 1
+    assert loaded.weights == list(range(1000))
+
+
+@pytest.mark.asyncio
+async def test_untracked_class_skips_unchanged_content(runtime: LocalRuntime, storage: CountingStorage):
+    u = Untracked(axo_key="u1", axo_endpoint_id="axo-endpoint-0")
+    assert (await runtime.persistify(u, bucket_id="b", key="u1")).is_ok
+    storage.puts.clear()
+    u.counter = 3
+    assert (await runtime.persistify(u, bucket_id="b", key="u1")).is_ok
+    assert SU.attr_key("u1", "counter") in storage.puts
+    assert SU.attr_key("u1", "weights") not in storage.puts
+    loaded = (await runtime.get_active_object(bucket_id="b", key="u1")).unwrap()
+    assert loaded.counter == 3 and loaded.weights == list(range(1000))
+
+
+@pytest.mark.asyncio
+async def test_manifest_rewritten_by_another_writer_forces_full_write(runtime: LocalRuntime, storage: CountingStorage):
+    m = Model(axo_key="m4", axo_endpoint_id="axo-endpoint-0")
+    assert (await runtime.persistify(m, bucket_id="b", key="m4")).is_ok
+    # another process, with its own AxoStorage, replaces the weights
+    other = Model(weights=[0], axo_key="m4")
+    src, attrs, class_name = serialize_attr_blobs_from_instance(other, bucket_id="b", key="m4").unwrap()
+    put = await AxoStorage(storage=storage).put_attr_blobs(
+        bucket_id="b", key="m4", source_code_blob=src, attr_blobs=attrs, class_name=class_name
+    )
+    assert put.is_ok
+
+    m.counter = 1  # a partial write merged into the cached manifest would keep weights=[0]
+    assert (await runtime.persistify(m, bucket_id="b", key="m4")).is_ok
+    loaded = (await runtime.get_active_object(bucket_id="b", key="m4")).unwrap()
+    assert loaded.counter == 1
+    assert loaded.weights == list(range(1000))
@@ -0,0 +1,84 @@
+import asyncio
+import pytest
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.core.models import AxoPointer, ResultRef, decode_result, encode_result
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.storage.services import InMemoryStorageService
+from .objects.fake_endpoint import FakeEndpoint
+
+MB = 1 << 20
+
+
+class Store(Axo):
+    @axo_method
+    def blob(self, n, **kwargs):
+        return b"x" * n
+
+    @axo_method
+    def length(self, data, **kwargs):
+        return len(data)
+
+
+@pytest.fixture
+def storage():
+    return InMemoryStorageService(storage_service_id="large")
+
+
+@pytest.fixture
+def server(storage):
+    srv = FakeEndpoint(delay=0, storage=storage)  # the endpoint spills to the runtime's storage
+    srv.start()
+    yield srv
+    srv.running = False
+    srv.join()
+
+
+@pytest.fixture
+def store(server, storage):
+    dem = DistributedEndpointManager(endpoints={})
+    dem.add_endpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=server.port, pubsub_port=-1)
+    dem.endpoints["e0"]._max_inline_bytes = 64 * 1024
+    with AxoContextManager.distributed(endpoint_manager=dem, storage_service=storage):
+        yield Store(axo_endpoint_id="e0", _acx_local=False)
+        dem.endpoints["e0"].close()
+
+
+def test_small_results_stay_inline(store):
+    assert store.blob(1024).unwrap() == b"x" * 1024
+    assert store.length(b"abc").unwrap() == 3
+
+
+def test_large_result_comes_back_as_a_pointer(store, server, tmp_path):
+    res = store.blob(MB)
+    ptr = res.unwrap()
+    assert isinstance(ptr, AxoPointer) and ptr.meta.size == MB
+    assert server.reply_bytes < 10_000  # only the reference came back
+    assert asyncio.run(ptr.read_range(10, 20, chunk_size="64KB")).unwrap() == b"x" * 10
+    assert asyncio.run(ptr.value()).unwrap() == b"x" * MB
+    path = asyncio.run(ptr.into_file(str(tmp_path / "blob.bin"))).unwrap()
+    with open(path, "rb") as fh:
+        assert len(fh.read()) == MB
+
+
+def test_spilled_results_feed_later_calls(store):
+    ptr = store.blob(MB).unwrap()
+    assert store.length(ptr.meta).unwrap() == MB  # resolved on the endpoint, from storage
+
+    with store.batch() as batch:
+        big, small = batch.blob(MB), batch.blob(10)
+    assert isinstance(big.result().unwrap(), AxoPointer)
+    assert small.result().unwrap() == b"x" * 10
+
+
+def test_pointer_ranges_and_result_encoding(storage):
+    data, content_type = encode_result({"a": [1, 2, 3]})
+    assert decode_result(data, content_type) == {"a": [1, 2, 3]}
+    assert encode_result(b"raw") == (b"raw", "application/octet-stream")
+
+    payload = bytes(range(256)) * 10
+    asyncio.run(storage.put(bucket_id="b", key="k", data=payload))
+    ptr = ResultRef.for_data(payload, "application/octet-stream", bucket_id="b", key="k", spilled=True).to_pointer(storage)
+    assert asyncio.run(ptr.read_range(250, 1030, chunk_size="100B")).unwrap() == payload[250:1030]
+    assert asyncio.run(ptr.read_range(2000)).unwrap() == payload[2000:]
+    assert asyncio.run(ptr.read_range(5, 2)).is_err
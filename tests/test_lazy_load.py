@@ -0,0 +1,176 @@
+import asyncio
+import pytest
+from axo import Axo, axo_method
+from axo.errors import AxoErrorType
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+from axo.storage.loader import AxoLoader
+from axo.serde.lazy import LazyAttr, LazyAttrError
+from axo.storage.utils import StorageUtils as SU
+from option import Ok
+
+
+class Big(Axo, track_changes=True):
+    def __init__(self, weights=None, counter: int = 0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.weights = weights if weights is not None else list(range(50_000))
+        self.counter = counter
+
+    @axo_method
+    def total(self, **kwargs):
+        return sum(self.weights)
+
+
+class CountingStorage(InMemoryStorageService):
+    def __init__(self):
+        super().__init__(storage_service_id="counting")
+        self.gets = []
+        self.puts = []
+
+    async def get(self, *, bucket_id, key, chunk_size="1MB"):
+        self.gets.append(key)
+        return await super().get(bucket_id=bucket_id, key=key, chunk_size=chunk_size)
+
+    async def put(self, *, bucket_id, key, data, tags=None, chunk_size="1MB"):
+        self.puts.append(key)
+        return await super().put(bucket_id=bucket_id, key=key, data=data, tags=tags, chunk_size=chunk_size)
+
+
+@pytest.fixture
+def storage():
+    return CountingStorage()
+
+
+@pytest.fixture
+def runtime(storage):
+    rt = LocalRuntime(storage_service=storage, runtime_id="rt-lazy", q_tick_s=0, incremental_persist=True)
+    prev = get_runtime()
+    set_runtime(rt)
+    yield rt
+    rt.stop()
+    set_runtime(prev)
+
+
+@pytest.fixture
+def loader(runtime: LocalRuntime):
+    return AxoLoader(
+        runtime.axo_storage,
+        api_globals={"Axo": Axo, "axo_method": axo_method},
+        lazy=True,
+        lazy_threshold=1024,
+    )
+
+
+async def _stored(runtime, key):
+    obj = Big(counter=3, axo_key=key, axo_endpoint_id="axo-endpoint-0")
+    assert (await runtime.persistify(obj, bucket_id="b", key=key)).is_ok
+    return obj
+
+
+def test_large_attribute_is_fetched_on_first_use(runtime, storage, loader):
+    asyncio.run(_stored(runtime, "l1"))
+    storage.gets.clear()
+
+    obj = asyncio.run(loader.load_object(bucket_id="b", key="l1")).unwrap()
+    assert SU.attr_key("l1", "weights") not in storage.gets
+    assert obj.counter == 3
+    assert type(obj.__dict__["weights"]) is LazyAttr
+
+    assert len(obj.weights) == 50_000
+    assert storage.gets.count(SU.attr_key("l1", "weights")) == 1
+    # the proxy replaced itself with the value, without marking it dirty
+    assert type(obj.__dict__["weights"]) is list
+    assert obj.get_dirty_attrs() == set()
+    assert obj.weights[:3] == [0, 1, 2]
+    assert storage.gets.count(SU.attr_key("l1", "weights")) == 1
+
+
+@pytest.mark.asyncio
+async def test_incremental_persist_leaves_lazy_attributes_in_storage(runtime, storage, loader):
+    await _stored(runtime, "l2")
+    obj = (await loader.load_object(bucket_id="b", key="l2")).unwrap()
+    storage.gets.clear()
+    storage.puts.clear()
+
+    obj.counter = 10
+    assert (await runtime.persistify(obj, bucket_id="b", key="l2")).is_ok
+    assert SU.attr_key("l2", "weights") not in storage.gets + storage.puts
+
+    eager = (await runtime.get_active_object(bucket_id="b", key="l2")).unwrap()
+    assert eager.counter == 10 and eager.weights == list(range(50_000))
+
+
+def test_full_serialization_materializes(runtime, loader):
+    asyncio.run(_stored(runtime, "l3"))
+    obj = asyncio.run(loader.load_object(bucket_id="b", key="l3")).unwrap()
+    attrs, _ = obj.get_raw_parts().unwrap()
+    assert type(attrs["weights"]) is list
+
+    copy = Axo.from_bytes(obj.to_bytes().unwrap()).unwrap()
+    assert copy.weights == list(range(50_000))
+
+
+@pytest.mark.asyncio
+async def test_sync_access_inside_a_loop_is_an_error(runtime, loader):
+    await _stored(runtime, "l6")
+    obj = (await loader.load_object(bucket_id="b", key="l6")).unwrap()
+    with pytest.raises(LazyAttrError, match="running event loop"):
+        len(obj.weights)
+    assert obj.to_bytes().is_err
+
+    # persisting elsewhere needs every attribute: the runtime awaits them
+    assert (await runtime.persistify(obj, bucket_id="b", key="l6-copy")).is_ok
+    assert type(obj.__dict__["weights"]) is list
+    copy = (await runtime.get_active_object(bucket_id="b", key="l6-copy")).unwrap()
+    assert copy.weights == list(range(50_000))
+
+
+@pytest.mark.asyncio
+async def test_materialize_and_missing_blob(runtime, storage, loader):
+    await _stored(runtime, "l4")
+    obj = (await loader.load_object(bucket_id="b", key="l4")).unwrap()
+    assert (await loader.materialize(obj)).is_ok
+    assert type(obj.__dict__["weights"]) is list
+
+    obj = (await loader.load_object(bucket_id="b", key="l4")).unwrap()
+    await storage.delete(bucket_id="b", key=SU.attr_key("l4", "weights"))
+    res = await loader.materialize(obj)
+    assert res.is_err and res.unwrap_err().type == AxoErrorType.NOT_FOUND
+    assert (await runtime.persistify(obj, bucket_id="b", key="l4-copy")).is_err
+
+
+@pytest.mark.asyncio
+async def test_eager_by_default(runtime, storage):
+    await _stored(runtime, "l5")
+    obj = (await runtime.get_active_object(bucket_id="b", key="l5")).unwrap()
+    assert type(obj.__dict__["weights"]) is list
+
+
+def test_proxy_is_transparent():
+    async def fetch():
+        return Ok([3, 1, 2])
+
+    proxy = LazyAttr("xs", 0, fetch)
+    assert "not loaded" in repr(proxy)
+    assert isinstance(proxy, LazyAttr)
+    assert not proxy.is_resolved
+    assert isinstance(proxy, list)
+    assert proxy == [3, 1, 2] and len(proxy) == 3 and 2 in proxy
+    assert proxy + [4] == [3, 1, 2, 4] and [0] + proxy == [0, 3, 1, 2]
+    assert sorted(proxy) == [1, 2, 3] and proxy.index(2) == 2
+
+
+def test_sync_fetches_share_one_loop():
+    loops = []
+
+    async def fetch():
+        # like an HTTP session: bound to the loop it was first used on
+        loop = asyncio.get_running_loop()
+        if loops and loops[0] is not loop:
+            raise RuntimeError("client used on another event loop")
+        loops.append(loop)
+        return Ok([1, 2])
+
+    assert [len(LazyAttr(f"a{i}", 0, fetch)) for i in range(3)] == [2, 2, 2]
+    assert len(loops) == 3
@@ -0,0 +1,145 @@
+import time
+import pytest
+from axo import Axo, axo_method
+from axo.cache import MethodCache, args_digest, get_method_cache, invalidate_method_cache
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+
+cache = get_method_cache()
+
+
+class Perceptron(Axo):
+    def __init__(self, w: float = 2.0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.w = w
+        self._acx_calls = 0
+
+    @axo_method(cache=True, read_only=True)
+    def predict(self, x, **kwargs):
+        self._acx_calls += 1
+        if x is None:
+            raise ValueError("x is None")
+        return self.w * x
+
+    @axo_method(cache=True)
+    def score(self, x, **kwargs):  # cached only while the object is read-only
+        self._acx_calls += 1
+        return self.w + x
+
+    @axo_method
+    def fit(self, w, **kwargs):
+        self.w = w
+        return w
+
+
+class Plain(Axo):
+    def __init__(self, w: float = 2.0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.w = w
+
+    @axo_method
+    def predict(self, x, **kwargs):
+        return self.w * x
+
+
+@pytest.fixture
+def runtime():
+    cache.clear()
+    rt = LocalRuntime(storage_service=InMemoryStorageService(storage_service_id="mcache"), runtime_id="rt-mcache", q_tick_s=0)
+    prev = get_runtime()
+    set_runtime(rt)
+    yield rt
+    rt.stop()
+    set_runtime(prev)
+
+
+def test_method_cache_lru_bytes_and_ttl():
+    c = MethodCache(maxsize=2, max_bytes=0)
+    keys = [MethodCache.key("k", 0, "m", (i,), {}) for i in range(3)]
+    for i, key in enumerate(keys):
+        c.put(key, i)
+    assert c.get(keys[0], "miss") == "miss" and c.get(keys[2]) == 2
+    assert c.stats().evictions == 1
+
+    c = MethodCache(maxsize=0, max_bytes=300)
+    assert not c.put(keys[0], b"x" * 1000)  # larger than the whole budget
+    c.put(keys[0], b"x" * 100)
+    c.put(keys[1], b"x" * 100)
+    c.put(keys[2], b"x" * 100)
+    assert len(c) == 2 and c.nbytes <= 300
+
+    c = MethodCache(ttl=0.01)
+    c.put(keys[0], 1)
+    time.sleep(0.02)
+    assert c.get(keys[0], "miss") == "miss" and c.stats().expirations == 1
+
+    assert args_digest((1,), {}) != args_digest((True,), {}) != args_digest((1.0,), {})
+    assert args_digest((1,), {"a": 1, "b": 2}) == args_digest((1,), {"b": 2, "a": 1})
+    assert args_digest((lambda: 1,), {}) is None
+
+
+def test_invalidate_reports_what_it_dropped():
+    c = MethodCache()
+    for i in range(3):
+        c.put(MethodCache.key("a", 0, "m", (i,), {}), i)
+    c.put(MethodCache.key("b", 0, "m", (0,), {}), 0)
+    assert c.invalidate("a") == 3 and len(c) == 1
+    assert c.invalidate("a") == 0
+    assert invalidate_method_cache("b") == 1 and len(c) == 0
+
+
+def test_read_only_results_are_memoized_and_invalidated(runtime):
+    p = Perceptron(axo_key="p1")
+    assert p.predict(3).unwrap() == 6
+    assert p.predict(3).unwrap() == 6
+    assert p._acx_calls == 1
+    assert p.predict(None).is_err and p.predict(None).is_err  # errors are not cached
+    assert p._acx_calls == 3
+
+    p.fit(5)                    # a mutating method drops the entries
+    assert p.predict(3).unwrap() == 15
+    p.w = 1                     # so does a plain assignment
+    assert p.predict(3).unwrap() == 3
+    assert p._acx_calls == 5
+
+    p.score(1); p.score(1)      # not read-only: never served from the cache
+    assert p._acx_calls == 7
+    p._acx_metadata.axo_is_read_only = True
+    p.score(1); p.score(1)
+    assert p._acx_calls == 8
+
+
+def test_restoring_a_copy_keeps_cached_results(runtime):
+    p = Perceptron(axo_key="p4")
+    p.predict(2)
+    assert len(cache) == 1
+    copy = Axo.from_bytes(p.to_bytes().unwrap()).unwrap()
+    assert copy.w == 2.0 and len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_persisting_a_new_version_invalidates(runtime):
+    p = Perceptron(axo_key="p2")
+    assert (await p.persistify(bucket_id="b")).is_ok
+    assert p._acx_metadata.axo_version == 0
+    p.predict(2)
+    assert len(cache) == 1
+
+    assert (await p.persistify(bucket_id="b")).is_ok
+    assert p._acx_metadata.axo_version == 1
+    assert len(cache) == 0
+
+    loaded = (await runtime.get_active_object(bucket_id="b", key="p2")).unwrap()
+    assert loaded._acx_metadata.axo_version == 1
+    assert loaded.predict(2).unwrap() == 4
+
+
+@pytest.mark.asyncio
+async def test_classes_without_cached_methods_pay_nothing(runtime):
+    assert Perceptron._acx_cached and not Plain._acx_cached
+    assert Plain.__setattr__ is object.__setattr__
+    p = Plain(axo_key="p3")
+    assert (await p.persistify(bucket_id="b")).is_ok
+    assert (await p.persistify(bucket_id="b")).is_ok
+    assert p._acx_metadata.axo_version == 0  # no cache entries to retire
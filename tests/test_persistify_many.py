@@ -0,0 +1,135 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+import pytest
+from option import Err
+from axo import Axo, axo_method
+from axo.runtime import get_runtime, set_runtime
+from axo.endpoint.endpoint import LocalEndpoint
+from axo.runtime.local import LocalRuntime
+from axo.storage import AxoStorage
+from axo.storage.services import InMemoryStorageService
+from axo.storage.utils import StorageUtils as SU
+from axo.errors import AxoError, AxoErrorType
+from axo.helpers import serialize_blobs_from_instance
+
+
+class Item(Axo):
+    def __init__(self, value: int = 0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.value = value
+
+    @axo_method
+    def get(self, **kwargs):
+        return self.value
+
+
+class SlowStorage(InMemoryStorageService):
+    """Tracks concurrent puts and fails the keys it is told to."""
+
+    def __init__(self, fail_keys=()):
+        super().__init__(storage_service_id="slow")
+        self.fail_keys = set(fail_keys)
+        self.inflight = 0
+        self.max_inflight = 0
+
+    async def put(self, *, bucket_id, key, data, tags=None, chunk_size="1MB"):
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(0.001)
+            if key in self.fail_keys:
+                return Err(AxoError.make(AxoErrorType.PUT_DATA_FAILED, f"refused {key}"))
+            return await super().put(bucket_id=bucket_id, key=key, data=data, tags=tags, chunk_size=chunk_size)
+        finally:
+            self.inflight -= 1
+
+
+class RecordingEndpoint(LocalEndpoint):
+    """Remembers the thread of every metadata put and refuses *fail_keys*."""
+
+    def __init__(self, endpoint_id, fail_keys=()):
+        super().__init__(endpoint_id=endpoint_id)
+        self.fail_keys = set(fail_keys)
+        self.threads = set()
+
+    def put(self, key, value):
+        self.threads.add(threading.current_thread())
+        if key in self.fail_keys:
+            return Err(Exception(f"refused {key}"))
+        return super().put(key, value)
+
+
+@contextmanager
+def _runtime(storage):
+    prev = get_runtime()
+    rt = LocalRuntime(storage_service=storage, runtime_id="rt-many", q_tick_s=0)
+    set_runtime(rt)
+    try:
+        yield rt
+    finally:
+        rt.stop()
+        set_runtime(prev)
+
+
+def _items(n, prefix="it"):
+    return [Item(value=i, axo_key=f"{prefix}{i}", axo_endpoint_id="axo-endpoint-0") for i in range(n)]
+
+
+@pytest.mark.asyncio
+async def test_persistify_many_bounded_and_ordered():
+    storage = SlowStorage()
+    with _runtime(storage) as rt:
+        items = _items(40)
+        report = await rt.persistify_many(items, bucket_id="b", concurrency=4)
+        assert [r.unwrap() for r in report.results] == [f"it{i}" for i in range(40)]
+        assert report.ok == 40 and report.failed == 0 and report.throughput > 0
+        # two puts (source + attrs) per object in flight
+        assert 2 < storage.max_inflight <= 8
+
+        loaded = (await rt.get_active_object(bucket_id="b", key="it7")).unwrap()
+        assert loaded.value == 7
+
+
+@pytest.mark.asyncio
+async def test_persistify_many_reports_failures_per_object():
+    storage = SlowStorage(fail_keys={SU.attrs_key("it3")})
+    with _runtime(storage) as rt:
+        items = _items(6)
+        res = await Axo.persistify_many(items, bucket_id="b")
+        report = res.unwrap()
+        assert [r.is_ok for r in report.results] == [True, True, True, False, True, True]
+        assert report.results[3].unwrap_err().type == AxoErrorType.STORAGE_ERROR
+        assert items[0]._acx_remote and not items[3]._acx_remote
+        # the failed object left nothing behind
+        assert (await storage.get_metadata(bucket_id="b", key=SU.source_key("it3"))).is_err
+
+
+@pytest.mark.asyncio
+async def test_put_blobs_fails_when_attrs_put_fails():
+    storage = SlowStorage(fail_keys={SU.attrs_key("k")})
+    axo_storage = AxoStorage(storage=storage)
+    blobs, class_name = serialize_blobs_from_instance(Item(axo_key="k"), bucket_id="b", key="k").unwrap()
+    assert (await axo_storage.put_blobs(bucket_id="b", key="k", blobs=blobs, class_name=class_name)).is_err
+    assert (await storage.get_metadata(bucket_id="b", key=SU.source_key("k"))).is_err
+
+
+@pytest.mark.asyncio
+async def test_persistify_many_spreads_unpinned_objects_and_pins_them():
+    storage = SlowStorage()
+    with _runtime(storage) as rt:
+        endpoints = rt.endpoint_manager.endpoints
+        endpoints.clear()
+        for eid in ("e0", "e1"):
+            endpoints[eid] = RecordingEndpoint(eid, fail_keys={"un2"})
+        items = [Item(value=i, axo_key=f"un{i}") for i in range(6)]
+        report = await rt.persistify_many(items, bucket_id="b")
+
+        assert [r.is_ok for r in report.results] == [True, True, False, True, True, True]
+        assert {item.get_endpoint_id() for item in items} == {"e0", "e1"}
+        for item in items:
+            stored = endpoints[item.get_endpoint_id()]._db
+            assert (item.get_axo_key() in stored) == (item.get_axo_key() != "un2")
+        # metadata goes out on the loop thread and a refused object uploads nothing
+        assert all(ep.threads == {threading.current_thread()} for ep in endpoints.values())
+        assert (await storage.get_metadata(bucket_id="b", key=SU.source_key("un2"))).is_err
@@ -0,0 +1,112 @@
+import pytest
+from option import Ok
+from axo import Axo, axo_method
+from axo.contextmanager import AxoContextManager
+from axo.core.models import CallRef, ResultRef
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.enums import AxoOperationType
+from axo.errors import AxoErrorType
+from axo.models import resolve_args
+from axo.runtime import get_runtime, set_runtime
+from axo.runtime.local import LocalRuntime
+from axo.storage.services import InMemoryStorageService
+from .objects.fake_endpoint import FakeEndpoint
+
+MB = 1 << 20
+
+
+class Store(Axo):
+    @axo_method
+    def blob(self, n, **kwargs):
+        return b"x" * n
+
+    @axo_method
+    def length(self, data, **kwargs):
+        return len(data)
+
+    @axo_method
+    def add(self, *xs, **kwargs):
+        return sum(xs)
+
+
+@pytest.fixture
+def servers():
+    kept = {}  # the storage both endpoints read references from
+    srvs = [FakeEndpoint(delay=0, kept=kept), FakeEndpoint(delay=0, kept=kept)]
+    for srv in srvs:
+        srv.start()
+    yield srvs
+    for srv in srvs:
+        srv.running = False
+        srv.join()
+
+
+@pytest.fixture
+def stores(servers):
+    dem = DistributedEndpointManager(endpoints={})
+    for i, srv in enumerate(servers):
+        dem.add_endpoint(endpoint_id=f"e{i}", hostname="127.0.0.1", req_res_port=srv.port, pubsub_port=-1)
+    with AxoContextManager.distributed(endpoint_manager=dem, storage_service=InMemoryStorageService(storage_service_id="pipe")):
+        yield [Store(axo_endpoint_id=f"e{i}", _acx_local=False) for i in range(len(servers))]
+        for ep in dem.endpoints.values():
+            ep.close()
+
+
+def test_ref_results_stay_on_the_endpoint(stores, servers):
+    a, _ = stores
+    ref = a.blob.ref(MB).unwrap()
+    assert isinstance(ref, ResultRef) and ref.size == MB  # raw bytes are stored as is
+    assert a.length(ref).unwrap() == MB
+    assert servers[0].reply_bytes < 10_000  # the megabyte never came back
+
+
+def test_dependent_calls_travel_in_one_message(stores, servers):
+    a, _ = stores
+    with a.batch() as b:
+        data = b.blob(MB)
+        n = b.length(data)
+        total = b.add(n, 1)
+    assert total.result().unwrap() == MB + 1
+    assert isinstance(data.result().unwrap(), ResultRef)
+    assert servers[0].ops.count(AxoOperationType.METHOD_EXEC_BATCH) == 1
+    assert servers[0].reply_bytes < 10_000
+
+
+def test_dependencies_on_another_endpoint_are_passed_by_reference(stores, servers):
+    a, c = stores
+    with a.batch() as b:
+        data = b.blob(10)
+        n = b.of(c).length(data)
+    assert n.result().unwrap() == 10
+    assert isinstance(data.result().unwrap(), ResultRef)
+    assert servers[0].reply_bytes < 1_000 and servers[1].ops == ["PING", AxoOperationType.METHOD_EXEC_BATCH]
+
+
+def test_a_failed_dependency_fails_its_dependents(stores):
+    a, _ = stores
+    with a.batch() as b:
+        bad = b.length(None)
+        n = b.add(bad, 1)
+    assert bad.result().is_err
+    assert n.result().unwrap_err().type == AxoErrorType.BAD_REQUEST
+
+
+def test_resolve_args():
+    ok = resolve_args([CallRef(index=0), 2], {"k": CallRef(index=1)}, results=[Ok(1), Ok(5)])
+    assert ok.unwrap() == ([1, 2], {"k": 5})
+    assert resolve_args([CallRef(index=3)], {}, results=[]).unwrap_err().type == AxoErrorType.BAD_REQUEST
+
+
+def test_in_process_ref_returns_the_value():
+    rt = LocalRuntime(storage_service=InMemoryStorageService(storage_service_id="pipe-local"), runtime_id="rt-pipe", q_tick_s=0)
+    prev = get_runtime()
+    set_runtime(rt)
+    try:
+        s = Store(axo_key="store")
+        assert s.blob.ref(3).unwrap() == b"xxx"
+        with s.batch() as b:
+            n = b.length(b.blob(4))
+        assert n.result().unwrap() == 4
+    finally:
+        rt.stop()
+        set_runtime(prev)
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from types import SimpleNamespace
+import pytest
+from axo import Axo, axo_method, axo_task
+from axo.contextmanager import AxoContextManager
+from axo.core.models import AxoPointer, BallRef, ResultRef
+from axo.endpoint.manager import DistributedEndpointManager
+from axo.endpoint.server import AxoEndpointServer
+from axo.errors import AxoErrorType
+from axo.models import AxoReplyMsg, StreamExecution
+from axo.storage.services import InMemoryStorageService
+
+MB = 1 << 20
+
+
+class Counter(Axo):
+    def __init__(self, n: int = 0, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.n = n
+
+    @axo_method
+    def inc(self, k=1, **kwargs):
+        self.n += k
+        return self.n
+
+    @axo_method
+    def fail(self, **kwargs):
+        raise ValueError("boom")
+
+    @axo_method(read_only=True)
+    def blob(self, size, **kwargs):
+        return b"x" * size
+
+    @axo_method(read_only=True)
+    def length(self, data, **kwargs):
+        return len(data)
+
+    @axo_method(read_only=True)
+    def nap(self, s, **kwargs):
+        import time  # the class is rebuilt from its source alone
+        time.sleep(s)
+        return s
+
+    @axo_method
+    def locked_nap(self, s, **kwargs):
+        import time
+        time.sleep(s)
+        return s
+
+    @axo_task()
+    def snapshot(self, *, ctx=None, **kwargs):
+        return {"n": self.n, "kind": ctx.kind}
+
+
+@pytest.fixture
+def storage():
+    return InMemoryStorageService(storage_service_id="server")
+
+
+@pytest.fixture
+def server(storage):
+    with AxoEndpointServer(storage=storage, endpoint_id="e0", max_workers=4) as srv:
+        yield srv
+
+
+@pytest.fixture
+def dem(server, storage):
+    dem = DistributedEndpointManager(endpoints={})
+    dem.add_endpoint(endpoint_id="e0", hostname="127.0.0.1", req_res_port=server.port, pubsub_port=-1)
+    with AxoContextManager.distributed(endpoint_manager=dem, storage_service=storage):
+        yield dem
+        dem.endpoints["e0"].close()
+
+
+def _persisted(key, n=0):
+    c = Counter(n=n, axo_endpoint_id="e0", axo_key=key)
+    assert asyncio.run(c.persistify()).is_ok
+    return c
+
+
+def test_method_calls_run_on_the_loaded_object(dem, server):
+    c = _persisted("c1", n=5)
+    assert server.metadata["c1"].axo_class_name == "Counter"
+    assert c.inc(2).unwrap() == 7
+    assert c.inc(3).unwrap() == 10  # state is kept by the server
+    assert c.n == 5                  # not by the client's copy
+
+    res = c.fail()
+    assert res.is_err and "ValueError: boom" in res.unwrap_err().message
+    res = dem.endpoints["e0"].method_execution(key="c1", fname="missing", ao=c, fargs=[])
+    assert res.is_err and "no @axo_method missing" in res.unwrap_err().message
+
+
+def test_refs_batches_and_spilled_results(dem):
+    c = _persisted("c2")
+    ref = c.blob.ref(MB).unwrap()
+    assert isinstance(ref, ResultRef) and ref.endpoint_id == "e0"
+    assert c.length(ref).unwrap() == MB
+
+    with c.batch() as b:
+        n = b.length(b.blob(MB))
+        k = b.inc(1)
+    assert n.result().unwrap() == MB and k.result().unwrap() == 1
+
+    dem.endpoints["e0"]._max_inline_bytes = 64 * 1024
+    ptr = c.blob(MB).unwrap()
+    assert isinstance(ptr, AxoPointer)
+    assert asyncio.run(ptr.read_range(0, 4)).unwrap() == b"xxxx"
+
+
+def test_inline_results_are_pickled_once(dem, monkeypatch):
+    import cloudpickle
+    import axo.endpoint.server as server_module
+    c = _persisted("c4", n=1)
+    assert c.inc(1).unwrap() == 2                                # loaded before counting
+    import axo.core.models as core_models_module
+    import axo.models as models_module
+    pickled = []
+    counting = SimpleNamespace(loads=cloudpickle.loads, dumps=lambda v: pickled.append(v) or cloudpickle.dumps(v))
+    monkeypatch.setattr(server_module, "CP", counting)
+    monkeypatch.setattr(models_module, "CP", counting)
+    monkeypatch.setattr(core_models_module, "CP", counting)
+    assert c.inc(1).unwrap() == 3
+    with c.batch() as b:
+        k = b.inc(1)
+    assert k.result().unwrap() == 4
+    assert [v for v in pickled if isinstance(v, int)] == [3, 4]  # sized and sent from the same bytes
+
+
+def test_task_result_goes_to_the_sink_bucket(dem, storage):
+    c = _persisted("c3", n=2)
+    ref = c.snapshot().unwrap()
+    assert isinstance(ref, BallRef) and ref.bucket_id == c.get_axo_sink_bucket_id()
+    assert asyncio.run(ref.to_pointer(storage).value()).unwrap() == {"n": 2, "kind": "task"}
+
+
+@pytest.mark.asyncio
+async def test_calls_run_on_the_worker_pool(dem):
+    objs = [Counter(axo_endpoint_id="e0", axo_key=f"p{i}") for i in range(4)]
+    for o in objs:
+        assert (await o.persistify()).is_ok
+    await asyncio.gather(*(o.nap.aio(0) for o in objs))  # load them
+
+    t1 = time.monotonic()
+    results = await asyncio.gather(*(o.nap.aio(0.2) for o in objs))
+    assert time.monotonic() - t1 < 0.6          # 4 workers
+    assert all(r.unwrap() == 0.2 for r in results)
+
+    t1 = time.monotonic()
+    results = await asyncio.gather(*(objs[0].locked_nap.aio(0.1) for _ in range(3)))
+    assert all(r.is_ok for r in results)
+    assert time.monotonic() - t1 >= 0.3         # one mutating call per object at a time
+
+
+def test_unserved_operations_are_errors(server):
+    c = Counter(axo_key="c4")
+    reply = server.handle(StreamExecution(method="inc", metadata=c._acx_metadata).to_frames())
+    assert reply.envelope.status == "error"
+    assert reply.envelope.error["type"] == AxoErrorType.UNKNOWN_OPERATION
+    reply, _ = AxoReplyMsg.from_frames(server.handle([b"junk"] * 5).to_frames()).unwrap()
+    assert reply.envelope.status == "error" and reply.envelope.operation == "UNKNOWN"
+    assert server.handle([]).envelope.error["type"] == AxoErrorType.BAD_REQUEST
@@ -0,0 +1,79 @@
+import pytest
+import axo.serde.stream as SS
+import axo.serde.frames as FR
+from axo import Axo
+from axo.storage.services import InMemoryStorageService, LocalStorageService
+from axo.storage.utils import StorageUtils as SU
+from .objects import Dog
+
+
+def test_encode_decode_roundtrip_with_odd_chunking():
+    attrs = {"name": "Rex", "blob": b"x" * 100_000, "xs": list(range(1000))}
+    chunks = list(SS.iter_encode_object(attrs, b"class X: pass", chunk_size=4096))
+    assert chunks[0].startswith(SS.STREAM_MAGIC)
+    assert all(len(c) == 4096 for c in chunks[:-1])
+
+    raw = b"".join(chunks)
+    got, code = SS.decode_stream(raw[i:i + 777] for i in range(0, len(raw), 777))
+    assert got == attrs
+    assert code == b"class X: pass"
+
+
+def test_oob_buffers_are_streamed():
+    np = pytest.importorskip("numpy")
+    x = np.random.rand(100_000)
+    chunks = SS.iter_encode_object({"x": x}, b"", chunk_size=1024)
+    got, _ = SS.decode_stream(chunks)
+    assert np.array_equal(got["x"], x)
+    assert got["x"].flags.writeable
+
+
+def test_decode_accepts_framed_bytes():
+    raw = FR.pack_frames(FR.encode_object({"a": 1}, b"src"))
+    assert SS.decode_stream([raw]) == ({"a": 1}, b"src")
+
+
+def test_truncated_stream_raises():
+    raw = b"".join(SS.iter_encode_object({"a": b"x" * 1000}, b"src", chunk_size=64))
+    with pytest.raises(Exception):
+        SS.decode_stream([raw[:-20]])
+
+
+def test_encoder_errors_and_early_close():
+    class Bad:
+        def __reduce__(self):
+            raise RuntimeError("not picklable")
+
+    with pytest.raises(RuntimeError):
+        list(SS.iter_encode_object({"x": Bad()}, b"", chunk_size=16))
+
+    gen = SS.iter_encode_object({"x": b"y" * 1_000_000}, b"", chunk_size=1024)
+    next(gen)
+    gen.close()  # must not hang on the producer thread
+
+
+def test_axo_to_stream_from_stream():
+    dog = Dog(name="Rex")
+    res = Axo.from_stream(dog.to_stream(chunk_size="1KB"))
+    assert res.is_ok
+    assert res.unwrap().name == "Rex"
+    # a joined stream is accepted by from_bytes too
+    assert Axo.from_bytes(b"".join(dog.to_stream())).unwrap().name == "Rex"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("kind", ["memory", "local"])
+async def test_put_and_get_chunks(kind, tmp_path):
+    storage = InMemoryStorageService() if kind == "memory" else LocalStorageService(sink_path=str(tmp_path))
+    dog = Dog(name="Rex")
+
+    put = await storage.put_chunks(bucket_id="b", key="dog", chunks=dog.to_stream(chunk_size="1KB"))
+    assert put.is_ok
+
+    raw = b"".join(dog.to_stream())
+    md = (await storage.get_metadata(bucket_id="b", key="dog")).unwrap()
+    assert md.size == len(raw)
+    assert md.checksum == SU.sha256_hex(raw)
+
+    chunks = (await storage.get_chunks(bucket_id="b", key="dog", chunk_size="1KB")).unwrap()
+    assert Axo.from_stream(chunks).unwrap().name == "Rex"